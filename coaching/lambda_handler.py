@@ -1,6 +1,10 @@
-"""Lambda handler - imports from coaching.src.api.main."""
+"""Lambda handler - imports from coaching.src.api.lambda_entry.
 
-from coaching.src.api.main import lambda_handler as handler
+The entry point routes EventBridge events without importing the FastAPI app;
+HTTP events load ``coaching.src.api.main`` on first use (see COLD_START_MODE).
+"""
+
+from coaching.src.api.lambda_entry import handler
 
 # Re-export for Lambda
 __all__ = ["handler"]
@@ -177,6 +177,7 @@ aws.iam.RolePolicy(
                             "dynamodb:PutItem",
                             "dynamodb:UpdateItem",
                             "dynamodb:DeleteItem",
+                            "dynamodb:BatchWriteItem",
                             "dynamodb:Query",
                             "dynamodb:Scan",
                         ],
@@ -360,6 +361,22 @@ image = docker.Image(
 # NOTE: Using repo_digest instead of image_name to ensure Lambda updates when image changes.
 # image_name uses the tag (e.g., :dev) which doesn't change, so Pulumi doesn't detect updates.
 # repo_digest uses the SHA256 digest which changes with each new image push.
+lambda_environment_variables = {
+    "PROMPTS_BUCKET": prompts_bucket,
+    "STAGE": stack,
+    "LOG_LEVEL": stack_config["log_level"],
+    "JWT_SECRET_NAME": stack_config["jwt_secret"],
+    "JWT_ISSUER": stack_config["jwt_issuer"],
+    "JWT_AUDIENCE": stack_config["jwt_audience"],
+    "OPENAI_API_KEY_SECRET": stack_config["openai_api_key_secret"],
+    "GOOGLE_VERTEX_CREDENTIALS_SECRET": stack_config["google_vertex_credentials_secret"],
+    "ACCOUNT_API_URL": stack_config["account_api_url"],
+    "BUSINESS_API_BASE_URL": stack_config["business_api_base_url"],
+    "AI_DEBUG_LOGGING": stack_config.get(
+        "ai_debug_logging", "false"
+    ),  # Optional, defaults to false
+}
+
 coaching_lambda = aws.lambda_.Function(
     "coaching-api",
     package_type="Image",
@@ -367,23 +384,57 @@ coaching_lambda = aws.lambda_.Function(
     image_uri=image.repo_digest,
     timeout=300,
     memory_size=1024,
-    environment=aws.lambda_.FunctionEnvironmentArgs(
-        variables={
-            "PROMPTS_BUCKET": prompts_bucket,
-            "STAGE": stack,
-            "LOG_LEVEL": stack_config["log_level"],
-            "JWT_SECRET_NAME": stack_config["jwt_secret"],
-            "JWT_ISSUER": stack_config["jwt_issuer"],
-            "JWT_AUDIENCE": stack_config["jwt_audience"],
-            "OPENAI_API_KEY_SECRET": stack_config["openai_api_key_secret"],
-            "GOOGLE_VERTEX_CREDENTIALS_SECRET": stack_config["google_vertex_credentials_secret"],
-            "ACCOUNT_API_URL": stack_config["account_api_url"],
-            "BUSINESS_API_BASE_URL": stack_config["business_api_base_url"],
-            "AI_DEBUG_LOGGING": stack_config.get(
-                "ai_debug_logging", "false"
-            ),  # Optional, defaults to false
-        }
+    environment=aws.lambda_.FunctionEnvironmentArgs(variables=lambda_environment_variables),
+)
+
+# Streaming endpoints (/ai/execute/stream, /ai/coaching/message/stream)
+# API Gateway and Mangum buffer the whole response, so SSE events would all arrive
+# at the end. The same app is also deployed behind a Lambda Function URL with
+# InvokeMode=RESPONSE_STREAM; Lambda Web Adapter (see Dockerfile.stream) runs it
+# under uvicorn and forwards the body as it is written. Clients call the stream
+# routes on the streamUrl output, with the usual JWT bearer token.
+stream_image = docker.Image(
+    "coaching-stream-image",
+    build=docker.DockerBuildArgs(
+        context=str(project_root),
+        dockerfile=str(project_root / "coaching" / "Dockerfile.stream"),
+        platform="linux/amd64",
+        args={
+            "BUILD_TIMESTAMP": build_timestamp,
+        },
+    ),
+    image_name=pulumi.Output.concat(ecr_repository_url, ":", stack, "-stream"),
+    registry=docker.RegistryArgs(
+        server=ecr_repository_url, username=auth_token.user_name, password=auth_token.password
     ),
+    skip_push=False,
+)
+
+coaching_stream_lambda = aws.lambda_.Function(
+    "coaching-stream",
+    package_type="Image",
+    role=lambda_role.arn,
+    image_uri=stream_image.repo_digest,
+    timeout=300,
+    memory_size=1024,
+    environment=aws.lambda_.FunctionEnvironmentArgs(variables=lambda_environment_variables),
+)
+
+# Authentication is the app's JWT check, as behind API Gateway. CORS is left to the
+# app's CORSMiddleware; a Function URL CORS config would replace its headers.
+coaching_stream_url = aws.lambda_.FunctionUrl(
+    "coaching-stream-url",
+    function_name=coaching_stream_lambda.name,
+    authorization_type="NONE",
+    invoke_mode="RESPONSE_STREAM",
+)
+
+aws.lambda_.Permission(
+    "coaching-stream-url-permission",
+    action="lambda:InvokeFunctionUrl",
+    function=coaching_stream_lambda.name,
+    principal="*",
+    function_url_auth_type="NONE",
 )
 
 # API Gateway HTTP API
@@ -465,9 +516,7 @@ ai_job_executor_rule = aws.cloudwatch.EventRule(
         {
             "source": ["purposepath.ai"],
             "detail-type": ["ai.job.created", "ai.message.created"],
-            "detail": {
-                "stage": [stack]  # Filter by environment to prevent cross-stage execution
-            },
+            "detail": {"stage": [stack]},  # Filter by environment to prevent cross-stage execution
         }
     ),
     tags={"Environment": stack, "Service": "coaching-ai"},
@@ -490,6 +539,70 @@ aws.lambda_.Permission(
     source_arn=ai_job_executor_rule.arn,
 )
 
+# Scheduled sweep that pauses coaching sessions idle past the threshold
+# The target sends a fixed coaching.sessions.sweep event, routed by eventbridge_handler
+session_sweep_rule = aws.cloudwatch.EventRule(
+    "coaching-session-sweep-rule",
+    name=f"coaching-session-sweep-{stack}",
+    description="Pauses inactive coaching sessions",
+    schedule_expression="rate(10 minutes)",
+    tags={"Environment": stack, "Service": "coaching-ai"},
+)
+
+aws.cloudwatch.EventTarget(
+    "coaching-session-sweep-target",
+    rule=session_sweep_rule.name,
+    arn=coaching_lambda.arn,
+    input=json.dumps(
+        {
+            "source": "purposepath.ai",
+            "detail-type": "coaching.sessions.sweep",
+            "detail": {"stage": stack, "inactivityThresholdMinutes": 30},
+        }
+    ),
+)
+
+aws.lambda_.Permission(
+    "eventbridge-session-sweep-permission",
+    action="lambda:InvokeFunction",
+    function=coaching_lambda.name,
+    principal="events.amazonaws.com",
+    source_arn=session_sweep_rule.arn,
+)
+
+# EventBridge rule to drop cached Business API responses when business data changes
+# The event comes from the Business API (any source); only the Lambda container that
+# receives it is invalidated, so the per-endpoint cache TTL remains the freshness bound
+# for other warm containers (see coaching/src/infrastructure/external/business_api_cache.py)
+business_data_changed_rule = aws.cloudwatch.EventRule(
+    "business-data-changed-rule",
+    name=f"coaching-business-data-changed-{stack}",
+    description="Invalidates cached Business API responses for a tenant",
+    event_bus_name="default",
+    event_pattern=json.dumps(
+        {
+            "detail-type": ["business.data.changed"],
+            "detail": {"stage": [stack]},
+        }
+    ),
+    tags={"Environment": stack, "Service": "coaching-ai"},
+)
+
+aws.cloudwatch.EventTarget(
+    "business-data-changed-target",
+    rule=business_data_changed_rule.name,
+    arn=coaching_lambda.arn,
+    event_bus_name="default",
+)
+
+aws.lambda_.Permission(
+    "eventbridge-business-data-changed-permission",
+    action="lambda:InvokeFunction",
+    function=coaching_lambda.name,
+    principal="events.amazonaws.com",
+    source_arn=business_data_changed_rule.arn,
+)
+
 # Parameter Store - Default Model Configuration
 # These parameters control default model codes for topic creation fallback
 default_basic_model_param = aws.ssm.Parameter(
@@ -541,6 +654,8 @@ pulumi.export(
     "customDomainUrl", pulumi.Output.concat("https://", stack_config["api_domain"], "/coaching")
 )
 pulumi.export("lambdaArn", coaching_lambda.arn)
+pulumi.export("streamLambdaArn", coaching_stream_lambda.arn)
+pulumi.export("streamUrl", coaching_stream_url.function_url)
 pulumi.export("aiJobsTable", ai_jobs_dynamodb_table.name)
 pulumi.export("aiJobsTableArn", ai_jobs_dynamodb_table.arn)
 pulumi.export("defaultBasicModelParam", default_basic_model_param.name)
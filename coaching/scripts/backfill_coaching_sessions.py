@@ -0,0 +1,62 @@
+"""One-off backfills for coaching session items written before a schema change.
+
+Tasks:
+    active-index  Add active sessions to the sparse ``active-activity-index``
+                  (needed once after the index is deployed; new writes
+                  maintain it)
+    turn-count    Store ``turn_count`` on sessions written before session
+                  summaries read it (listings load those sessions in full)
+
+Reads the stage and table names from the usual settings (``STAGE``,
+``AWS_REGION``). Backfills are idempotent and can be re-run safely.
+
+Usage (from the repository root):
+
+    export STAGE=prod PYTHONPATH=.
+    python coaching/scripts/backfill_coaching_sessions.py active-index --segments 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+
+async def _backfill_active_index(segments: int) -> int:
+    from coaching.src.api.dependencies.coaching_message_job import get_session_repository
+
+    repository = await get_session_repository()
+    return await repository.backfill_active_index(total_segments=segments)
+
+
+async def _backfill_turn_count(segments: int) -> int:
+    from coaching.src.api.dependencies.coaching_message_job import get_session_repository
+
+    repository = await get_session_repository()
+    return await repository.backfill_turn_count(total_segments=segments)
+
+
+TASKS = {
+    "active-index": _backfill_active_index,
+    "turn-count": _backfill_turn_count,
+}
+
+
+def main() -> int:
+    """Run the requested backfill and print how many sessions it updated."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("task", choices=sorted(TASKS))
+    parser.add_argument("--segments", type=int, default=4, help="Parallel scan segments")
+    args = parser.parse_args()
+
+    from coaching.src.core.config_multitenant import settings
+
+    print(f"Backfilling {args.task} on {settings.coaching_sessions_table}...")
+    updated = asyncio.run(TASKS[args.task](args.segments))
+    print(f"Updated {updated} sessions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Import-time profile of the Lambda entry points.
+
+Runs ``python -X importtime`` in a fresh interpreter for each target module and
+reports the total import time and the slowest modules, so cold-start
+regressions can be traced to the import that caused them.
+
+Usage (from the repository root):
+
+    python coaching/scripts/import_profile.py
+    python coaching/scripts/import_profile.py coaching.src.api.main --top 30
+    python coaching/scripts/import_profile.py --budget-ms 3000
+
+Exits with status 1 when ``--budget-ms`` is given and any target exceeds it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+
+DEFAULT_TARGETS = [
+    "coaching.src.api.lambda_entry",
+    "coaching.src.api.main",
+]
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of ``-X importtime`` output (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def profile_import(module: str) -> list[ImportRecord]:
+    """Import a module in a fresh interpreter and collect its import times."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse ``-X importtime`` stderr into records."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        records.append(
+            ImportRecord(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=depth,
+            )
+        )
+    return records
+
+
+def _report(module: str, records: list[ImportRecord], top: int) -> float:
+    total_ms = sum(r.self_us for r in records) / 1000
+    packages: dict[str, int] = {}
+    for record in records:
+        root = record.module.split(".")[0]
+        packages[root] = packages.get(root, 0) + record.self_us
+
+    print(f"\n=== {module}: {total_ms:.0f} ms, {len(records)} modules ===")
+    print(f"\nTop {top} by cumulative time:")
+    for record in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]:
+        print(f"  {record.cumulative_us / 1000:8.1f} ms  {record.module}")
+    print(f"\nTop {top} by self time:")
+    for record in sorted(records, key=lambda r: r.self_us, reverse=True)[:top]:
+        print(f"  {record.self_us / 1000:8.1f} ms  {record.module}")
+    print(f"\nTop {top} top-level packages by self time:")
+    for name, self_us in sorted(packages.items(), key=lambda p: p[1], reverse=True)[:top]:
+        print(f"  {self_us / 1000:8.1f} ms  {name}")
+    return total_ms
+
+
+def main() -> int:
+    """Profile the requested modules and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_TARGETS)
+    parser.add_argument("--top", type=int, default=15, help="Rows per table")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail above this total")
+    args = parser.parse_args()
+
+    over_budget = []
+    for module in args.modules:
+        total_ms = _report(module, profile_import(module), args.top)
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            over_budget.append(f"{module}: {total_ms:.0f} ms > {args.budget_ms:.0f} ms")
+
+    if over_budget:
+        print("\nImport budget exceeded:\n  " + "\n  ".join(over_budget))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,34 +2,45 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Callable
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from fastapi import Depends, Header, HTTPException
-from jose import JWTError, jwt
+from jose import ExpiredSignatureError, JWTError, jwt
+from jose.exceptions import JWTClaimsError
 
 if TYPE_CHECKING:
     from mypy_boto3_secretsmanager import SecretsManagerClient
 
 from coaching.src.api.models.auth import UserContext
 from coaching.src.core.config_multitenant import settings
+from coaching.src.infrastructure.jwt_secret_provider import JwtSecretProvider
 from shared.models.multitenant import Permission, RequestContext, SubscriptionTier, UserRole
 from shared.services.aws_helpers import get_secretsmanager_client
 
 logger = logging.getLogger(__name__)
 
+_DEV_FALLBACK_SECRET = "change-me-in-prod"
 
-def _get_jwt_secret() -> str:
-    """Get JWT secret from settings or AWS Secrets Manager with safe fallback.
+
+def _load_jwt_secret() -> str:
+    """Load the JWT secret from settings or AWS Secrets Manager.
 
     Priority:
     1. JWT_SECRET environment variable (direct secret value)
     2. AWS Secrets Manager using JWT_SECRET_NAME (secret name, not ARN)
-    3. Fallback to development default
 
     Returns:
         JWT secret string for token validation
+
+    Raises:
+        Exception: If the secret cannot be retrieved from Secrets Manager
     """
     # Prefer explicit secret in settings when present
     if settings.jwt_secret:
@@ -37,37 +48,191 @@ def _get_jwt_secret() -> str:
 
     # Retrieve from Secrets Manager using secret name with environment suffix
     secret_name = settings.get_jwt_secret_name()
+    secrets_client: SecretsManagerClient = get_secretsmanager_client(settings.aws_region)
+    response = secrets_client.get_secret_value(SecretId=secret_name)
+    secret_value = response.get("SecretString")
+    if not secret_value:
+        raise ValueError(f"Secret {secret_name} has no SecretString")
+
+    # Parse JSON to extract jwt_secret key (matches .NET API behavior)
     try:
-        secrets_client: SecretsManagerClient = get_secretsmanager_client(settings.aws_region)
-        response = secrets_client.get_secret_value(SecretId=secret_name)
-        secret_value = response.get("SecretString")
-        if secret_value:
-            # Parse JSON to extract jwt_secret key (matches .NET API behavior)
-            import json
+        secret_data = json.loads(secret_value)
+        if "jwt_secret" in secret_data:
+            extracted_secret = str(secret_data["jwt_secret"])
+            logger.info(f"JWT secret extracted from JSON (length: {len(extracted_secret)})")
+            return extracted_secret
+        # Fallback to raw value if jwt_secret key not found
+        logger.warning("jwt_secret key not found in secret JSON, using raw value")
+        return str(secret_value)
+    except json.JSONDecodeError as e:
+        # If not JSON, return raw value
+        logger.warning(f"Secret is not valid JSON: {e}, using raw value")
+        return str(secret_value)
+
+
+_jwt_secret_provider: JwtSecretProvider | None = None
+
+
+def get_jwt_secret_provider() -> JwtSecretProvider:
+    """Get the process-wide cached JWT secret provider."""
+    global _jwt_secret_provider
+    if _jwt_secret_provider is None:
+        _jwt_secret_provider = JwtSecretProvider(
+            _load_jwt_secret,
+            ttl_seconds=settings.jwt_secret_cache_ttl_seconds,
+            refresh_ahead_seconds=settings.jwt_secret_refresh_ahead_seconds,
+            min_refresh_interval_seconds=settings.jwt_secret_min_refresh_interval_seconds,
+        )
+    return _jwt_secret_provider
 
-            try:
-                secret_data = json.loads(secret_value)
-                if "jwt_secret" in secret_data:
-                    extracted_secret = str(secret_data["jwt_secret"])
-                    logger.info(
-                        f"JWT secret extracted from JSON (length: {len(extracted_secret)}, "
-                        f"first 10 chars: {extracted_secret[:10]})"
-                    )
-                    return extracted_secret
-                # Fallback to raw value if jwt_secret key not found
-                logger.warning("jwt_secret key not found in secret JSON, using raw value")
-                return str(secret_value)
-            except json.JSONDecodeError as e:
-                # If not JSON, return raw value
-                logger.warning(f"Secret is not valid JSON: {e}, using raw value")
-                return str(secret_value)
+
+def _get_jwt_secret() -> str:
+    """Get the cached JWT secret with safe fallback.
+
+    The secret is cached in memory by the JwtSecretProvider and refreshed in
+    the background before it expires. Falls back to the development default
+    when it cannot be retrieved.
+
+    Returns:
+        JWT secret string for token validation
+    """
+    try:
+        secret: str = get_jwt_secret_provider().get_secret()
+        return secret
     except Exception as e:
         logger.warning(
-            f"Failed to get JWT secret from AWS Secrets Manager (secret: {secret_name}): {e}"
+            "Failed to get JWT secret from AWS Secrets Manager "
+            f"(secret: {settings.get_jwt_secret_name()}): {e}"
         )
 
     # Fallback for development
-    return "change-me-in-prod"
+    return _DEV_FALLBACK_SECRET
+
+
+class _DecodedClaimsCache:
+    """Small LRU of verified token claims keyed by token hash.
+
+    Entries expire at the token's ``exp`` claim or after ``ttl_seconds``,
+    whichever comes first, so a cached token is never accepted past expiry.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(claims)
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        exp = claims.get("exp")
+        if isinstance(exp, int | float):
+            expires_at = min(expires_at, float(exp))
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (dict(claims), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_claims_cache = _DecodedClaimsCache(
+    max_entries=settings.jwt_claims_cache_max_entries,
+    ttl_seconds=settings.jwt_claims_cache_ttl_seconds,
+)
+
+
+def _verify_token(token: str, secret: str) -> dict[str, Any]:
+    """Verify a token's signature and claims; allow flexible fields and issuer in dev."""
+    payload: dict[str, Any] = jwt.decode(
+        token,
+        secret,
+        algorithms=[settings.jwt_algorithm],
+        options={
+            "verify_aud": settings.stage != "dev",
+            "verify_iss": settings.stage != "dev",
+        },
+        issuer=None if settings.stage == "dev" else settings.jwt_issuer,
+        audience=None if settings.stage == "dev" else settings.jwt_audience,
+    )
+    return payload
+
+
+def _decode_token(token: str) -> dict[str, Any]:
+    """Decode and verify a JWT, using the claims cache and cached secret.
+
+    On a signature failure the secret is refreshed once (it may have been
+    rotated) before the token is rejected.
+
+    Args:
+        token: Raw bearer token
+
+    Returns:
+        Verified token claims
+
+    Raises:
+        JWTError: If the token is invalid or expired
+    """
+    cached = _claims_cache.get(token)
+    if cached is not None:
+        return cached
+
+    secret = _get_jwt_secret()
+    logger.debug(
+        f"JWT validation starting - Stage: {settings.stage}, Algorithm: {settings.jwt_algorithm}"
+    )
+
+    payload: dict[str, Any] | None = None
+    try:
+        payload = _verify_token(token, secret)
+    except JWTError as jwt_err:
+        signature_failure = not isinstance(jwt_err, ExpiredSignatureError | JWTClaimsError)
+        if signature_failure and not settings.jwt_secret and get_jwt_secret_provider().refresh():
+            logger.info("JWT secret rotated, retrying verification")
+            try:
+                payload = _verify_token(token, _get_jwt_secret())
+            except JWTError as retry_err:
+                jwt_err = retry_err
+
+        if payload is None:
+            logger.warning(f"JWT verification failed with AWS secret: {jwt_err}")
+            # Dev-friendly fallback to default secret
+            if settings.stage != "dev":
+                raise jwt_err from None
+            logger.info("Attempting fallback to default dev secret")
+            payload = jwt.decode(
+                token,
+                _DEV_FALLBACK_SECRET,
+                algorithms=[settings.jwt_algorithm],
+                options={"verify_aud": False, "verify_iss": False},
+            )
+            logger.info("JWT signature verification succeeded with fallback secret")
+
+    assert payload is not None
+    _claims_cache.put(token, payload)
+    return dict(payload)
 
 
 async def get_current_context(
@@ -107,55 +272,8 @@ async def get_current_context(
         )
 
     try:
-        # Decode and validate JWT token
-        secret = _get_jwt_secret()
-
-        # Log secret characteristics (safe - no actual secret exposed)
-        logger.info(
-            f"JWT validation starting (get_current_context) - Secret length: {len(secret)}, "
-            f"First 10 chars: {secret[:10]}, "
-            f"Stage: {settings.stage}, "
-            f"Algorithm: {settings.jwt_algorithm}"
-        )
-
-        # Decode token header to see what algorithm it was signed with
-        try:
-            unverified_header = jwt.get_unverified_header(token)
-            logger.info(f"Token header: {unverified_header}")
-        except Exception as e:
-            logger.warning(f"Could not decode token header: {e}")
-
-        # Decode token; allow flexible fields and issuer in dev
-        try:
-            payload = jwt.decode(
-                token,
-                secret,
-                algorithms=[settings.jwt_algorithm],
-                options={
-                    "verify_aud": settings.stage != "dev",
-                    "verify_iss": settings.stage != "dev",
-                },
-                issuer=None if settings.stage == "dev" else settings.jwt_issuer,
-                audience=None if settings.stage == "dev" else settings.jwt_audience,
-            )
-            logger.info(
-                "JWT signature verification succeeded with AWS secret (get_current_context)"
-            )
-        except JWTError as jwt_err:
-            logger.warning(
-                f"JWT verification failed with AWS secret (get_current_context): {jwt_err}"
-            )
-            # Dev-friendly fallback to default secret
-            if settings.stage == "dev":
-                logger.info("Attempting fallback to default dev secret (get_current_context)")
-                payload = jwt.decode(
-                    token,
-                    "change-me-in-prod",
-                    algorithms=[settings.jwt_algorithm],
-                    options={"verify_aud": False, "verify_iss": False},
-                )
-            else:
-                raise
+        # Decode and validate JWT token (cached secret and claims)
+        payload = _decode_token(token)
 
         # Extract required fields
         # Support both custom and standard claims
@@ -230,52 +348,8 @@ async def get_current_user(authorization: str = Header(...)) -> UserContext:
         )
 
     try:
-        # Decode and validate JWT token
-        secret = _get_jwt_secret()
-
-        # Log secret characteristics (safe - no actual secret exposed)
-        logger.info(
-            f"JWT validation starting - Secret length: {len(secret)}, "
-            f"First 10 chars: {secret[:10]}, "
-            f"Stage: {settings.stage}, "
-            f"Algorithm: {settings.jwt_algorithm}"
-        )
-
-        # Decode token header to see what algorithm it was signed with
-        try:
-            unverified_header = jwt.get_unverified_header(token)
-            logger.info(f"Token header: {unverified_header}")
-        except Exception as e:
-            logger.warning(f"Could not decode token header: {e}")
-
-        # Decode token; allow flexible fields and issuer in dev
-        try:
-            payload = jwt.decode(
-                token,
-                secret,
-                algorithms=[settings.jwt_algorithm],
-                options={
-                    "verify_aud": settings.stage != "dev",
-                    "verify_iss": settings.stage != "dev",
-                },
-                issuer=None if settings.stage == "dev" else settings.jwt_issuer,
-                audience=None if settings.stage == "dev" else settings.jwt_audience,
-            )
-            logger.info("JWT signature verification succeeded with AWS secret")
-        except JWTError as jwt_err:
-            logger.warning(f"JWT verification failed with AWS secret: {jwt_err}")
-            # Dev-friendly fallback to default secret
-            if settings.stage == "dev":
-                logger.info("Attempting fallback to default dev secret")
-                payload = jwt.decode(
-                    token,
-                    "change-me-in-prod",
-                    algorithms=[settings.jwt_algorithm],
-                    options={"verify_aud": False, "verify_iss": False},
-                )
-                logger.info("JWT signature verification succeeded with fallback secret")
-            else:
-                raise
+        # Decode and validate JWT token (cached secret and claims)
+        payload = _decode_token(token)
 
         # Extract fields (support both custom and standard claims)
         user_id = payload.get("user_id") or payload.get("sub")
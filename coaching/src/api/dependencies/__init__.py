@@ -1,35 +1,75 @@
 """Dependency injection for API layer.
 
 This package aggregates dependencies from legacy and new modules.
+
+Exports are resolved lazily so that submodules used outside HTTP requests
+(e.g. ``dependencies.async_execution`` for EventBridge jobs) can be imported
+without loading every route dependency.
 """
 
-from coaching.src.api.auth import get_current_context
-from coaching.src.api.legacy_dependencies import (
-    get_alignment_service,
-    get_analysis_service_by_type,
-    get_cache_service,
-    get_conversation_repository,
-    get_conversation_service,
-    get_insights_service,
-    get_llm_service,
-    get_llm_template_service,
-    get_measure_service,
-    get_model_config_service,
-    get_prompt_service,
-    get_strategy_service,
-    get_template_metadata_repository,
-)
-
-from .ai_engine import (
-    get_generic_handler,
-    get_llm_provider,
-    get_provider_factory,
-    get_response_serializer,
-    get_s3_prompt_storage,
-    get_topic_repository,
-    get_unified_ai_engine,
-    reset_singletons,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from coaching.src.api.auth import get_current_context
+    from coaching.src.api.legacy_dependencies import (
+        get_alignment_service,
+        get_analysis_service_by_type,
+        get_cache_service,
+        get_conversation_repository,
+        get_conversation_service,
+        get_insights_service,
+        get_llm_service,
+        get_llm_template_service,
+        get_measure_service,
+        get_model_config_service,
+        get_prompt_service,
+        get_strategy_service,
+        get_template_metadata_repository,
+    )
+
+    from .ai_engine import (
+        get_generic_handler,
+        get_llm_provider,
+        get_provider_factory,
+        get_response_serializer,
+        get_s3_prompt_storage,
+        get_topic_repository,
+        get_unified_ai_engine,
+        reset_singletons,
+    )
+else:
+
+    def __getattr__(name: str) -> object:
+        """Lazy import dependencies at runtime."""
+        if name in _EXPORT_MAP:
+            module = __import__(_EXPORT_MAP[name], fromlist=[name])
+            return getattr(module, name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    _EXPORT_MAP = {
+        "get_current_context": "coaching.src.api.auth",
+        "get_alignment_service": "coaching.src.api.legacy_dependencies",
+        "get_analysis_service_by_type": "coaching.src.api.legacy_dependencies",
+        "get_cache_service": "coaching.src.api.legacy_dependencies",
+        "get_conversation_repository": "coaching.src.api.legacy_dependencies",
+        "get_conversation_service": "coaching.src.api.legacy_dependencies",
+        "get_insights_service": "coaching.src.api.legacy_dependencies",
+        "get_llm_service": "coaching.src.api.legacy_dependencies",
+        "get_llm_template_service": "coaching.src.api.legacy_dependencies",
+        "get_measure_service": "coaching.src.api.legacy_dependencies",
+        "get_model_config_service": "coaching.src.api.legacy_dependencies",
+        "get_prompt_service": "coaching.src.api.legacy_dependencies",
+        "get_strategy_service": "coaching.src.api.legacy_dependencies",
+        "get_template_metadata_repository": "coaching.src.api.legacy_dependencies",
+        "get_generic_handler": "coaching.src.api.dependencies.ai_engine",
+        "get_llm_provider": "coaching.src.api.dependencies.ai_engine",
+        "get_provider_factory": "coaching.src.api.dependencies.ai_engine",
+        "get_response_serializer": "coaching.src.api.dependencies.ai_engine",
+        "get_s3_prompt_storage": "coaching.src.api.dependencies.ai_engine",
+        "get_topic_repository": "coaching.src.api.dependencies.ai_engine",
+        "get_unified_ai_engine": "coaching.src.api.dependencies.ai_engine",
+        "reset_singletons": "coaching.src.api.dependencies.ai_engine",
+    }
 
 __all__ = [
     # From legacy_dependencies
@@ -12,9 +12,11 @@ import boto3
 import structlog
 from coaching.src.api.handlers.generic_ai_handler import GenericAIHandler
 from coaching.src.application.ai_engine.response_serializer import ResponseSerializer
+from coaching.src.application.ai_engine.result_cache import get_llm_result_cache
 from coaching.src.application.ai_engine.unified_ai_engine import UnifiedAIEngine
 from coaching.src.core.config_multitenant import get_settings, settings
 from coaching.src.domain.ports.llm_provider_port import LLMProviderPort
+from coaching.src.infrastructure.external.business_api_cache import get_business_api_cache
 from coaching.src.infrastructure.external.business_api_client import BusinessApiClient
 from coaching.src.infrastructure.llm.bedrock_provider import BedrockLLMProvider
 from coaching.src.infrastructure.llm.provider_factory import LLMProviderFactory
@@ -67,6 +69,8 @@ async def get_s3_prompt_storage() -> S3PromptStorage:
         _s3_storage = S3PromptStorage(
             bucket_name=settings.prompts_bucket,
             s3_client=s3_client,
+            cache_max_entries=settings.prompt_cache_max_entries,
+            cache_revalidate_seconds=settings.prompt_cache_revalidate_seconds,
         )
         logger.info("S3PromptStorage initialized", bucket=settings.prompts_bucket)
 
@@ -142,6 +146,7 @@ async def get_unified_ai_engine() -> UnifiedAIEngine:
             s3_storage=s3_storage,
             provider_factory=provider_factory,
             response_serializer=response_serializer,
+            result_cache=get_llm_result_cache(),
         )
         logger.info("UnifiedAIEngine initialized with provider factory")
 
@@ -189,7 +194,9 @@ def create_template_processor(jwt_token: str | None = None) -> TemplateParameter
     """Create a TemplateParameterProcessor instance for the current request.
 
     This factory creates fresh instances per-request, each with its own
-    BusinessApiClient configured with the user's JWT token. This ensures:
+    BusinessApiClient configured with the user's JWT token. The client is a
+    thin wrapper: HTTP connections come from the shared keep-alive pool and
+    the token is sent as a header on each call. This ensures:
     - Thread safety (no shared state between concurrent requests)
     - Proper authentication (each request uses its own token)
     - Clean isolation (no risk of token leakage)
@@ -203,9 +210,14 @@ def create_template_processor(jwt_token: str | None = None) -> TemplateParameter
     business_api_client = BusinessApiClient(
         base_url=settings.business_api_base_url,
         jwt_token=jwt_token,
+        cache=get_business_api_cache(),
     )
 
-    processor = TemplateParameterProcessor(business_api_client=business_api_client)
+    processor = TemplateParameterProcessor(
+        business_api_client=business_api_client,
+        max_concurrency=settings.enrichment_max_concurrency,
+        method_timeout_seconds=settings.enrichment_method_timeout_seconds,
+    )
 
     logger.debug(
         "Created per-request TemplateParameterProcessor",
@@ -42,6 +42,11 @@ async def get_session_repository() -> DynamoDBCoachingSessionRepository:
         _session_repository = DynamoDBCoachingSessionRepository(
             dynamodb_resource=dynamodb_resource,
             table_name=settings.coaching_sessions_table,
+            messages_table_name=(
+                settings.coaching_session_messages_table
+                if settings.coaching_session_message_items_enabled
+                else None
+            ),
         )
         logger.info(
             "DynamoDBCoachingSessionRepository initialized",
@@ -74,6 +79,8 @@ async def get_coaching_session_service() -> CoachingSessionService:
             s3_prompt_storage=s3_storage,
             template_processor=None,  # Worker doesn't need enrichment
             provider_factory=provider_factory,
+            incremental_extraction=settings.coaching_incremental_extraction_enabled,
+            extraction_wait_seconds=settings.coaching_extraction_wait_seconds,
         )
         logger.info("CoachingSessionService initialized (worker mode)")
 
@@ -4,6 +4,8 @@ This module handles EventBridge events that trigger async AI job execution.
 Supports:
 - ai.job.created: Single-shot AI jobs
 - ai.message.created: Coaching conversation messages
+- business.data.changed: Invalidate cached Business API responses for a tenant
+- coaching.sessions.sweep: Pause coaching sessions idle past the threshold (scheduled)
 """
 
 from __future__ import annotations
@@ -194,6 +196,97 @@ async def handle_ai_message_created_event(event: dict[str, Any]) -> dict[str, An
         }
 
 
+async def handle_business_data_changed_event(event: dict[str, Any]) -> dict[str, Any]:
+    """Handle business.data.changed EventBridge event.
+
+    Published when tenant business data (foundation, goals, measures, org data)
+    changes upstream. Drops the tenant's cached Business API responses so the
+    next read fetches fresh data.
+
+    The cache is per Lambda container and the event reaches only one of them:
+    other warm containers keep their entries until the per-endpoint TTL
+    expires, so the TTL is the actual freshness bound across instances.
+
+    Expected detail fields: ``tenantId`` (required), ``userId`` and
+    ``endpoints`` (optional list of BusinessApiClient endpoint names).
+
+    Args:
+        event: EventBridge event payload
+
+    Returns:
+        Response dict with status
+    """
+    detail = event.get("detail", {})
+    tenant_id = detail.get("tenantId")
+    user_id = detail.get("userId")
+    endpoints = detail.get("endpoints")
+
+    if not tenant_id:
+        logger.error("eventbridge.missing_required_fields", has_tenant_id=False)
+        return {
+            "statusCode": 400,
+            "body": "Missing required field: tenantId",
+        }
+
+    from coaching.src.infrastructure.external.business_api_cache import (
+        invalidate_business_data,
+    )
+
+    removed = invalidate_business_data(tenant_id, endpoints=endpoints, user_id=user_id)
+
+    logger.info(
+        "eventbridge.business_cache_invalidated",
+        tenant_id=tenant_id,
+        user_id=user_id,
+        endpoints=endpoints,
+        removed=removed,
+    )
+    return {
+        "statusCode": 200,
+        "body": f"Invalidated {removed} cached entries for tenant {tenant_id}",
+    }
+
+
+async def handle_session_sweep_event(event: dict[str, Any]) -> dict[str, Any]:
+    """Handle coaching.sessions.sweep EventBridge event (scheduled rule).
+
+    Pauses active coaching sessions that have been idle longer than the
+    threshold. Optional detail field: ``inactivityThresholdMinutes``.
+
+    Args:
+        event: EventBridge event payload
+
+    Returns:
+        Response dict with status and sweep counts
+    """
+    detail = event.get("detail", {})
+    threshold_minutes = int(detail.get("inactivityThresholdMinutes", 30))
+
+    from coaching.src.api.dependencies.coaching_message_job import get_session_repository
+
+    try:
+        repository = await get_session_repository()
+        result = await repository.pause_inactive_sessions(
+            inactivity_threshold_minutes=threshold_minutes
+        )
+    except Exception as e:
+        logger.exception("eventbridge.session_sweep_failed", error=str(e))
+        return {
+            "statusCode": 500,
+            "body": f"Session sweep failed: {e!s}",
+        }
+
+    return {
+        "statusCode": 200,
+        "body": (
+            f"Session sweep examined {result.examined}, paused {result.paused}, "
+            f"skipped {result.skipped}, failed {result.failed}"
+        ),
+        "processed": result.examined,
+        "paused": result.paused,
+    }
+
+
 def handle_eventbridge_event(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     """Main handler for EventBridge events.
 
@@ -232,6 +325,12 @@ def handle_eventbridge_event(event: dict[str, Any], _context: Any) -> dict[str,
     elif source == "purposepath.ai" and detail_type == "ai.message.created":
         return loop.run_until_complete(handle_ai_message_created_event(event))
 
+    elif source == "purposepath.ai" and detail_type == "coaching.sessions.sweep":
+        return loop.run_until_complete(handle_session_sweep_event(event))
+
+    elif detail_type == "business.data.changed":
+        return loop.run_until_complete(handle_business_data_changed_event(event))
+
     logger.warning(
         "eventbridge.unknown_event_type",
         source=source,
@@ -11,6 +11,7 @@ from coaching.src.api.models.auth import UserContext
 from coaching.src.application.ai_engine.response_serializer import SerializationError
 from coaching.src.application.ai_engine.unified_ai_engine import (
     ParameterValidationError,
+    PreparedSingleShot,
     PromptRenderError,
     TopicNotFoundError,
     UnifiedAIEngine,
@@ -94,30 +95,7 @@ class GenericAIHandler:
 
         try:
             # Step 1: Lookup endpoint definition
-            endpoint_def = get_endpoint_definition(http_method, endpoint_path)
-            if endpoint_def is None:
-                self.logger.error(
-                    "Endpoint not found in registry",
-                    method=http_method,
-                    path=endpoint_path,
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Endpoint {http_method}:{endpoint_path} not registered",
-                )
-
-            if not endpoint_def.is_active:
-                self.logger.warning(
-                    "Endpoint is inactive",
-                    topic_id=endpoint_def.topic_id,
-                    path=endpoint_path,
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail=f"Endpoint {endpoint_path} is temporarily unavailable",
-                )
-
-            topic_id = endpoint_def.topic_id
+            topic_id = self._resolve_topic_id(http_method, endpoint_path)
 
             # Step 2: Convert request to parameters
             parameters = self._extract_parameters(request_body, user_context)
@@ -146,65 +124,79 @@ class GenericAIHandler:
 
             return result
 
-        except TopicNotFoundError as e:
-            self.logger.error("Topic not found", topic_id=e.topic_id)
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Topic configuration not found: {e.topic_id}. Please check the topic ID and ensure it is properly configured.",
+        except Exception as e:
+            raise self._single_shot_error(
+                e, http_method=http_method, endpoint_path=endpoint_path
             ) from e
 
-        except ParameterValidationError as e:
-            self.logger.error(
-                "Parameter validation failed",
-                topic_id=e.topic_id,
-                missing_params=e.missing_params,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Missing required parameters: {', '.join(e.missing_params)}",
-            ) from e
+    async def prepare_single_shot(
+        self,
+        *,
+        http_method: str,
+        endpoint_path: str,
+        request_body: BaseModel,
+        user_context: UserContext,
+        response_model: type[BaseModel],
+        template_processor: "TemplateParameterProcessor | None" = None,
+    ) -> PreparedSingleShot:
+        """Run a single-shot request up to (not including) the LLM call.
 
-        except PromptRenderError as e:
-            self.logger.error(
-                "Prompt rendering failed",
-                topic_id=e.topic_id,
-                prompt_type=e.prompt_type,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to render AI prompt",
-            ) from e
+        Lets a route key its own caching on the enriched, rendered prompts
+        before paying for generation. Pass the result to
+        ``complete_single_shot``.
 
-        except SerializationError as e:
-            self.logger.error(
-                "Response serialization failed",
-                topic_id=e.topic_id,
-                response_model=e.response_model,
+        Args:
+            http_method: HTTP method (GET, POST, etc.)
+            endpoint_path: API endpoint path
+            request_body: Validated request model
+            user_context: User authentication context
+            response_model: Expected response model class
+            template_processor: Optional processor for automatic parameter enrichment
+
+        Returns:
+            Prepared request with rendered prompts
+
+        Raises:
+            HTTPException: For all error conditions (404, 400, 500)
+        """
+        try:
+            topic_id = self._resolve_topic_id(http_method, endpoint_path)
+            return await self.ai_engine.prepare_single_shot(
+                topic_id=topic_id,
+                parameters=self._extract_parameters(request_body, user_context),
+                response_model=response_model,
+                user_id=user_context.user_id,
+                tenant_id=user_context.tenant_id,
+                template_processor=template_processor,
             )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to serialize AI response",
+        except Exception as e:
+            raise self._single_shot_error(
+                e, http_method=http_method, endpoint_path=endpoint_path
             ) from e
 
-        except UnifiedAIEngineError as e:
-            self.logger.error("AI engine error", topic_id=e.topic_id, error=str(e))
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="AI processing failed",
-            ) from e
+    async def complete_single_shot(
+        self, prepared: PreparedSingleShot, *, http_method: str, endpoint_path: str
+    ) -> BaseModel:
+        """Generate the response for a request from ``prepare_single_shot``.
+
+        Args:
+            prepared: Prepared request
+            http_method: HTTP method, for error reporting
+            endpoint_path: API endpoint path, for error reporting
 
+        Returns:
+            Instance of the prepared response model
+
+        Raises:
+            HTTPException: For all error conditions (500)
+        """
+        try:
+            context = await self.ai_engine.complete_single_shot(prepared)
         except Exception as e:
-            self.logger.error(
-                "Unexpected error in generic handler",
-                method=http_method,
-                path=endpoint_path,
-                error=str(e),
-                exc_info=True,
-            )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Internal server error",
+            raise self._single_shot_error(
+                e, http_method=http_method, endpoint_path=endpoint_path
             ) from e
+        return context.serialized_response
 
     async def get_initial_prompt(self, topic_id: str) -> str:
         """Get initial prompt for a topic.
@@ -457,6 +449,109 @@ class GenericAIHandler:
                 detail="Failed to complete conversation",
             ) from e
 
+    def _resolve_topic_id(self, http_method: str, endpoint_path: str) -> str:
+        """Look up the active topic registered for an endpoint.
+
+        Raises:
+            HTTPException: 404 if the endpoint is not registered, 503 if inactive
+        """
+        endpoint_def = get_endpoint_definition(http_method, endpoint_path)
+        if endpoint_def is None:
+            self.logger.error(
+                "Endpoint not found in registry",
+                method=http_method,
+                path=endpoint_path,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Endpoint {http_method}:{endpoint_path} not registered",
+            )
+
+        if not endpoint_def.is_active:
+            self.logger.warning(
+                "Endpoint is inactive",
+                topic_id=endpoint_def.topic_id,
+                path=endpoint_path,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Endpoint {endpoint_path} is temporarily unavailable",
+            )
+
+        return endpoint_def.topic_id
+
+    def _single_shot_error(
+        self, error: Exception, *, http_method: str, endpoint_path: str
+    ) -> HTTPException:
+        """Map a single-shot failure to the HTTPException returned to the client.
+
+        Args:
+            error: Exception raised while handling the request
+            http_method: HTTP method of the endpoint
+            endpoint_path: API endpoint path
+
+        Returns:
+            HTTPException to raise (chained from ``error``)
+        """
+        if isinstance(error, TopicNotFoundError):
+            self.logger.error("Topic not found", topic_id=error.topic_id)
+            return HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Topic configuration not found: {error.topic_id}. Please check the topic ID and ensure it is properly configured.",
+            )
+
+        if isinstance(error, ParameterValidationError):
+            self.logger.error(
+                "Parameter validation failed",
+                topic_id=error.topic_id,
+                missing_params=error.missing_params,
+            )
+            return HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Missing required parameters: {', '.join(error.missing_params)}",
+            )
+
+        if isinstance(error, PromptRenderError):
+            self.logger.error(
+                "Prompt rendering failed",
+                topic_id=error.topic_id,
+                prompt_type=error.prompt_type,
+            )
+            return HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to render AI prompt",
+            )
+
+        if isinstance(error, SerializationError):
+            self.logger.error(
+                "Response serialization failed",
+                topic_id=error.topic_id,
+                response_model=error.response_model,
+            )
+            return HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to serialize AI response",
+            )
+
+        if isinstance(error, UnifiedAIEngineError):
+            self.logger.error("AI engine error", topic_id=error.topic_id, error=str(error))
+            return HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="AI processing failed",
+            )
+
+        self.logger.error(
+            "Unexpected error in generic handler",
+            method=http_method,
+            path=endpoint_path,
+            error=str(error),
+            exc_info=True,
+        )
+        return HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
     def _extract_parameters(
         self, request_body: BaseModel, user_context: UserContext
     ) -> dict[str, Any]:
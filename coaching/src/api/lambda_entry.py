@@ -0,0 +1,79 @@
+"""Lambda entry point with deferred loading of the HTTP application.
+
+Importing ``coaching.src.api.main`` builds the FastAPI app, which imports every
+router and, through them, the LLM providers, LangGraph workflows, the
+parameter and topic registries and the website scraping stack. EventBridge
+job invocations need none of that, so this module only imports the event
+handler and loads the HTTP app on the first API Gateway event.
+
+``COLD_START_MODE`` controls when the HTTP app is built:
+
+- ``lazy`` (default): on the first HTTP event, so EventBridge-only
+  containers never pay for it
+- ``eager``: during Lambda init, which moves the cost out of the first
+  request's latency (useful with provisioned concurrency)
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+from coaching.src.api.handlers.eventbridge_handler import (
+    handle_eventbridge_event,
+    is_eventbridge_event,
+)
+from coaching.src.api.logging_config import configure_logging
+from coaching.src.core.config_multitenant import settings
+from shared.observability.metrics import flush_metrics
+
+configure_logging()
+
+logger = structlog.get_logger()
+
+_http_handler: Callable[[dict[str, Any], Any], dict[str, Any]] | None = None
+
+
+def get_http_handler() -> Callable[[dict[str, Any], Any], dict[str, Any]]:
+    """Get the API Gateway handler, importing the FastAPI app on first use."""
+    global _http_handler
+    if _http_handler is None:
+        from coaching.src.api.main import lambda_handler
+
+        _http_handler = lambda_handler
+    return _http_handler
+
+
+def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    """Lambda handler routing EventBridge events without loading the HTTP app.
+
+    Args:
+        event: Lambda event (EventBridge or API Gateway)
+        context: Lambda context
+
+    Returns:
+        Handler response
+    """
+    try:
+        if is_eventbridge_event(event):
+            print(
+                f"[LAMBDA_HANDLER] EventBridge event: {event.get('detail-type', 'unknown')}",
+                file=sys.stderr,
+                flush=True,
+            )
+            return handle_eventbridge_event(event, context)
+
+        return get_http_handler()(event, context)
+    finally:
+        # Metrics are buffered during the invocation and emitted once at the end
+        flush_metrics()
+
+
+if settings.cold_start_mode.lower() == "eager":
+    get_http_handler()
+logger.info("lambda_entry.initialized", cold_start_mode=settings.cold_start_mode)
+
+
+__all__ = ["get_http_handler", "handler"]
@@ -22,6 +22,7 @@ from coaching.src.application.conversation.conversation_service import (
 )
 from coaching.src.application.llm.llm_service import LLMApplicationService
 from coaching.src.core.config_multitenant import settings
+from coaching.src.infrastructure.external.business_api_cache import get_business_api_cache
 from coaching.src.infrastructure.external.business_api_client import BusinessApiClient
 from coaching.src.infrastructure.llm.bedrock_provider import BedrockLLMProvider
 from coaching.src.infrastructure.repositories.dynamodb_conversation_repository import (
@@ -33,6 +34,7 @@ from coaching.src.infrastructure.repositories.llm_config.template_metadata_repos
 from coaching.src.repositories.topic_repository import TopicRepository
 from coaching.src.services.cache_service import CacheService
 from coaching.src.services.insights_service import InsightsService
+from coaching.src.services.insights_snapshot_store import get_insights_snapshot_store
 from coaching.src.services.llm_template_service import LLMTemplateService
 from coaching.src.services.prompt_service import PromptService
 from coaching.src.services.s3_prompt_storage import S3PromptStorage
@@ -51,6 +53,7 @@ _dynamodb_resource = None
 _s3_client = None
 _bedrock_client = None
 _redis_client: Any = None
+_s3_prompt_storage: S3PromptStorage | None = None
 
 
 def get_dynamodb_resource_singleton() -> DynamoDBServiceResource:
@@ -315,6 +318,7 @@ async def get_insights_service(
         base_url=settings.business_api_base_url,
         jwt_token=None,  # Will be added when auth is fully integrated
         timeout=30,
+        cache=get_business_api_cache(),
     )
 
     return InsightsService(
@@ -323,6 +327,7 @@ async def get_insights_service(
         llm_service=llm_service,
         tenant_id=context.tenant_id,
         user_id=context.user_id,
+        snapshot_store=get_insights_snapshot_store(),
     )
 
 
@@ -340,16 +345,23 @@ def get_topic_repository() -> TopicRepository:
 
 
 def get_s3_prompt_storage() -> S3PromptStorage:
-    """Get S3 prompt storage instance.
+    """Get S3 prompt storage singleton.
+
+    A single instance is shared so its in-process prompt cache survives
+    across requests.
 
     Returns:
         S3PromptStorage: Service for storing/retrieving prompts in S3
     """
-    s3_client = get_s3_client_singleton()
-    return S3PromptStorage(
-        bucket_name=settings.prompts_bucket,
-        s3_client=s3_client,
-    )
+    global _s3_prompt_storage
+    if _s3_prompt_storage is None:
+        _s3_prompt_storage = S3PromptStorage(
+            bucket_name=settings.prompts_bucket,
+            s3_client=get_s3_client_singleton(),
+            cache_max_entries=settings.prompt_cache_max_entries,
+            cache_revalidate_seconds=settings.prompt_cache_revalidate_seconds,
+        )
+    return _s3_prompt_storage
 
 
 __all__ = [
@@ -0,0 +1,54 @@
+"""Logging configuration shared by the Lambda entry points.
+
+Both the HTTP application (``coaching.src.api.main``) and the lightweight
+EventBridge entry point (``coaching.src.api.lambda_entry``) need the same
+CloudWatch-friendly logging setup, so it lives here rather than at the top of
+``main``. Configuration runs once per process.
+"""
+
+import logging
+import sys
+
+import structlog
+
+_configured = False
+
+
+def configure_logging() -> None:
+    """Configure stdlib logging and structlog for Lambda (idempotent)."""
+    global _configured
+    if _configured:
+        return
+
+    # Configure Python logging for Lambda - Lambda captures stderr
+    logging.basicConfig(
+        format="%(levelname)s: %(message)s",
+        stream=sys.stderr,
+        level=logging.DEBUG,  # Allow all levels, structlog will filter
+        force=True,
+    )
+
+    # Set root logger level to DEBUG
+    logging.getLogger().setLevel(logging.DEBUG)
+
+    # Configure structlog for Lambda CloudWatch
+    structlog.configure(
+        processors=[
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+            structlog.dev.ConsoleRenderer(),  # Human-readable output
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+    _configured = True
+
+
+__all__ = ["configure_logging"]
@@ -1,17 +1,19 @@
 """Main FastAPI application with Phase 7 architecture."""
 
-import logging
 import sys
 from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from typing import Any
 
 import structlog
+from coaching.src.api.logging_config import configure_logging
 from coaching.src.api.middleware import (
     ErrorHandlingMiddleware,
     LoggingMiddleware,
+    MetricsFlushMiddleware,
     RateLimitingMiddleware,
 )
+from coaching.src.api.middleware.rate_limit_backends import get_rate_limit_backend
 from coaching.src.api.routes import (
     admin,
     ai_execute,
@@ -23,39 +25,15 @@ from coaching.src.api.routes import (
     multitenant_conversations,
 )
 from coaching.src.core.config_multitenant import settings
+from coaching.src.infrastructure.aws_io import shutdown_aws_io_executor
+from coaching.src.infrastructure.external.http_client_pool import close_shared_http_clients
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from mangum import Mangum
+from shared.observability.metrics import flush_metrics
 from starlette.middleware.base import BaseHTTPMiddleware
 
-# Configure Python logging for Lambda - Lambda captures stderr
-logging.basicConfig(
-    format="%(levelname)s: %(message)s",
-    stream=sys.stderr,
-    level=logging.DEBUG,  # Allow all levels, structlog will filter
-    force=True,
-)
-
-# Set root logger level to DEBUG
-logging.getLogger().setLevel(logging.DEBUG)
-
-# Configure structlog for Lambda CloudWatch
-structlog.configure(
-    processors=[
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.dev.ConsoleRenderer(),  # Human-readable output
-    ],
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    wrapper_class=structlog.stdlib.BoundLogger,
-    cache_logger_on_first_use=True,
-)
+configure_logging()
 
 logger = structlog.get_logger()
 
@@ -94,6 +72,9 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting PurposePath AI Coaching API", stage=settings.stage, version="2.0.0")
     yield
     logger.info("Shutting down PurposePath AI Coaching API")
+    await close_shared_http_clients()
+    shutdown_aws_io_executor()
+    flush_metrics()
 
 
 app = FastAPI(
@@ -106,10 +87,19 @@ app = FastAPI(
 )
 
 # Add middleware in correct order - CORS must be last (runs first)
-app.add_middleware(RateLimitingMiddleware, default_capacity=100, default_refill_rate=10.0)  # type: ignore[arg-type,call-arg]
+app.add_middleware(
+    RateLimitingMiddleware,  # type: ignore[arg-type,call-arg]
+    default_capacity=100,
+    default_refill_rate=10.0,
+    endpoint_costs=settings.rate_limit_endpoint_costs,
+    cost_path_prefix=settings.api_prefix,
+    backend=get_rate_limit_backend(),
+)
 app.add_middleware(ErrorHandlingMiddleware)  # type: ignore[arg-type,call-arg]
 app.add_middleware(LoggingMiddleware)  # type: ignore[arg-type,call-arg]
 app.add_middleware(CORSPreflightMiddleware)  # type: ignore[arg-type,call-arg]
+# Outside the other middleware so everything they record is flushed with the request
+app.add_middleware(MetricsFlushMiddleware)  # type: ignore[arg-type,call-arg]
 
 # CORS middleware must be added LAST so it runs FIRST in the middleware chain
 # This ensures CORS headers are added before any authentication or error handling
@@ -126,6 +116,7 @@ _cors_config: dict[str, Any] = {
         "X-RateLimit-Limit",
         "X-RateLimit-Remaining",
         "X-RateLimit-Reset",
+        "X-Next-Cursor",
     ],
     "max_age": 3600,
 }
@@ -163,6 +154,8 @@ async def root() -> dict[str, str]:
     }
 
 
+# Mangum buffers the full response, so SSE routes are only streamed when the app
+# runs behind the RESPONSE_STREAM Function URL (Dockerfile.stream, pulumi streamUrl)
 handler = Mangum(app, lifespan="off")
 
 
@@ -4,10 +4,17 @@ This package provides middleware for:
 - Logging: Request/response logging with request IDs
 - Error handling: Centralized exception handling
 - Rate limiting: Token bucket rate limiting
+- Metrics: Flushing buffered metrics after each request
 """
 
 from coaching.src.api.middleware.error_handling import ErrorHandlingMiddleware
 from coaching.src.api.middleware.logging import LoggingMiddleware
+from coaching.src.api.middleware.metrics import MetricsFlushMiddleware
 from coaching.src.api.middleware.rate_limiting import RateLimitingMiddleware
 
-__all__ = ["ErrorHandlingMiddleware", "LoggingMiddleware", "RateLimitingMiddleware"]
+__all__ = [
+    "ErrorHandlingMiddleware",
+    "LoggingMiddleware",
+    "MetricsFlushMiddleware",
+    "RateLimitingMiddleware",
+]
@@ -0,0 +1,29 @@
+"""Metrics middleware flushing buffered metrics at the end of each request."""
+
+from shared.observability.metrics import flush_metrics
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class MetricsFlushMiddleware:
+    """Flush buffered metrics once each HTTP request has been fully served.
+
+    This is a plain ASGI middleware rather than a ``BaseHTTPMiddleware``: the
+    wrapped app returns only after the last body chunk is sent, so streamed
+    (SSE) responses are flushed once the stream completes, not when headers go
+    out. Processes that are not invoked through ``lambda_entry`` (uvicorn behind
+    Lambda Web Adapter) rely on this to emit their metrics.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap an ASGI app."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve the request, then flush metrics recorded while serving it."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            flush_metrics()
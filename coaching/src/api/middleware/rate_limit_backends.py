@@ -0,0 +1,463 @@
+"""Rate limit backends for the rate limiting middleware.
+
+A backend decides whether a request may spend ``cost`` tokens from the token
+bucket identified by a key (client + limit scope).
+
+- ``LocalRateLimitBackend``: per-process buckets, bounded by LRU eviction.
+  Buckets idle long enough to have refilled completely are dropped first,
+  which loses nothing since a new bucket starts full.
+- ``SharedRateLimitBackend``: one bucket per key shared by all instances in a
+  ``SharedTokenStore`` (Redis, or an in-memory stand-in for tests). To avoid a
+  store round-trip per request, each instance leases a batch of tokens and
+  spends it locally until the lease is used up or expires. Tokens still in a
+  lease when it expires were taken from the shared bucket and are lost, so
+  batches are sized adaptively: the first lease for a key covers just the
+  request's cost, a lease used up before it expires doubles the next batch (up
+  to ``lease_size``), and a lease that expires unspent halves it. An instance
+  serving one request at a time (Lambda) therefore takes only what it spends.
+  Store errors fall back to a local backend so rate limiting never fails
+  requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class TokenBucket:
+    """Token bucket implementation for rate limiting.
+
+    Uses the token bucket algorithm to allow bursts while enforcing
+    a long-term rate limit.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        refill_rate: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize token bucket.
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Tokens added per second
+            clock: Time source in seconds
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens: float = capacity
+        self._clock = clock
+        self.last_refill = clock()
+
+    def _refill(self) -> None:
+        # Keep fractional tokens so frequent callers still accrue refills
+        now = self._clock()
+        elapsed = max(0.0, now - self.last_refill)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        self.last_refill = now
+
+    def consume(self, tokens: int = 1) -> bool:
+        """Attempt to consume tokens.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            True if tokens were consumed, False if insufficient tokens
+        """
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    def take(self, tokens: int) -> int:
+        """Consume up to ``tokens`` whole tokens.
+
+        Args:
+            tokens: Maximum number of tokens to take
+
+        Returns:
+            Number of tokens taken
+        """
+        self._refill()
+        granted = max(0, min(tokens, math.floor(self.tokens)))
+        self.tokens -= granted
+        return granted
+
+    def seconds_until(self, tokens: int) -> float:
+        """Get the time until ``tokens`` tokens are available (0 if available now)."""
+        missing = tokens - self.tokens
+        if missing <= 0:
+            return 0.0
+        if self.refill_rate <= 0:
+            return math.inf
+        return missing / self.refill_rate
+
+    def is_full(self) -> bool:
+        """Check whether the bucket has refilled to capacity."""
+        self._refill()
+        return self.tokens >= self.capacity
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket parameters for one limit scope."""
+
+    capacity: int
+    refill_rate: float
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of a rate limit check.
+
+    Attributes:
+        allowed: Whether the request may proceed
+        limit: Bucket capacity
+        remaining: Tokens left after this request (approximate for shared limits)
+        retry_after_seconds: Suggested wait before retrying (0 when allowed)
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after_seconds: float = 0.0
+
+
+class RateLimitBackend(Protocol):
+    """Decides whether a request may spend tokens from a bucket."""
+
+    async def acquire(self, key: str, limit: RateLimit, cost: int = 1) -> RateLimitDecision:
+        """Try to spend ``cost`` tokens from the bucket identified by ``key``."""
+        ...
+
+
+class LocalRateLimitBackend:
+    """Per-process token buckets with LRU eviction."""
+
+    def __init__(
+        self,
+        *,
+        max_buckets: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            max_buckets: Maximum buckets kept before evicting least recently used
+            clock: Time source in seconds
+        """
+        self.max_buckets = max_buckets
+        self._clock = clock
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._evictions = 0
+
+    async def acquire(self, key: str, limit: RateLimit, cost: int = 1) -> RateLimitDecision:
+        """Try to spend ``cost`` tokens from the local bucket for ``key``."""
+        bucket = self._bucket(key, limit)
+        allowed = bucket.consume(cost)
+        return RateLimitDecision(
+            allowed=allowed,
+            limit=limit.capacity,
+            remaining=math.floor(bucket.tokens),
+            retry_after_seconds=0.0 if allowed else bucket.seconds_until(cost),
+        )
+
+    def _bucket(self, key: str, limit: RateLimit) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if (
+            bucket is None
+            or bucket.capacity != limit.capacity
+            or bucket.refill_rate != limit.refill_rate
+        ):
+            bucket = TokenBucket(limit.capacity, limit.refill_rate, clock=self._clock)
+            self._buckets[key] = bucket
+        self._buckets.move_to_end(key)
+        self._evict()
+        return bucket
+
+    def _evict(self) -> None:
+        # Drop the LRU head while over the bound or already refilled (lossless)
+        while len(self._buckets) > 1:
+            key, bucket = next(iter(self._buckets.items()))
+            if len(self._buckets) <= self.max_buckets and not bucket.is_full():
+                break
+            del self._buckets[key]
+            self._evictions += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Get backend counters (buckets, evictions)."""
+        return {"buckets": len(self._buckets), "evictions": self._evictions}
+
+
+class SharedTokenStore(Protocol):
+    """Atomic token bucket storage shared by all instances."""
+
+    async def take(self, key: str, limit: RateLimit, count: int) -> tuple[int, int]:
+        """Refill the bucket and atomically take up to ``count`` tokens.
+
+        Returns:
+            Tuple of (tokens granted, whole tokens left in the bucket)
+        """
+        ...
+
+
+class InMemoryTokenStore:
+    """Process-local SharedTokenStore stand-in for tests and local development."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the store.
+
+        Args:
+            clock: Time source in seconds
+        """
+        self._clock = clock
+        self._buckets: dict[str, TokenBucket] = {}
+        self.calls = 0
+
+    async def take(self, key: str, limit: RateLimit, count: int) -> tuple[int, int]:
+        """Refill the bucket and take up to ``count`` tokens."""
+        self.calls += 1
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(limit.capacity, limit.refill_rate, clock=self._clock)
+            self._buckets[key] = bucket
+        granted = bucket.take(count)
+        return granted, math.floor(bucket.tokens)
+
+
+# Refill and take in one round-trip; uses the server clock so instances agree
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local count = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+  tokens = capacity
+  ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local granted = math.min(count, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+return {granted, math.floor(tokens)}
+"""
+
+
+class RedisTokenStore:
+    """SharedTokenStore backed by a Redis hash per bucket and a Lua script."""
+
+    def __init__(self, client_factory: Callable[[], Any]) -> None:
+        """Initialize the store.
+
+        Args:
+            client_factory: Returns the (synchronous) Redis client; resolved on
+                first use so the connection is not created at import
+        """
+        self._client_factory = client_factory
+        self._script: Any = None
+
+    async def take(self, key: str, limit: RateLimit, count: int) -> tuple[int, int]:
+        """Refill the bucket and atomically take up to ``count`` tokens."""
+        if self._script is None:
+            self._script = self._client_factory().register_script(_TAKE_SCRIPT)
+        # Keys expire once the bucket would have refilled completely
+        full_after_ms = (
+            math.ceil(limit.capacity / limit.refill_rate * 1000) if limit.refill_rate > 0 else 0
+        )
+        result = await asyncio.to_thread(
+            self._script,
+            keys=[key],
+            args=[limit.capacity, limit.refill_rate, count, full_after_ms + 1000],
+        )
+        return int(result[0]), int(result[1])
+
+
+@dataclass
+class _Lease:
+    tokens: int
+    store_remaining: int
+    expires_at: float
+    # Tokens requested from the store when this lease was taken
+    batch: int = 1
+
+
+class SharedRateLimitBackend:
+    """Cluster-wide limits from a shared store, with locally spent token leases."""
+
+    def __init__(
+        self,
+        store: SharedTokenStore,
+        *,
+        lease_size: int = 10,
+        lease_ttl_seconds: float = 1.0,
+        key_prefix: str = "ratelimit:",
+        max_leases: int = 10000,
+        fallback: RateLimitBackend | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            store: Shared token store
+            lease_size: Maximum tokens requested from the store per round-trip
+                (capped at the bucket capacity); batches grow to it while
+                leases are used up before they expire
+            lease_ttl_seconds: How long leased tokens may be spent locally
+            key_prefix: Prefix for store keys
+            max_leases: Maximum leases kept before evicting least recently used
+            fallback: Backend used when the store is unavailable
+            clock: Time source in seconds
+        """
+        self.store = store
+        self.lease_size = lease_size
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.key_prefix = key_prefix
+        self.max_leases = max_leases
+        self.fallback = fallback or LocalRateLimitBackend()
+        self._clock = clock
+        self._leases: OrderedDict[str, _Lease] = OrderedDict()
+        self._lease_hits = 0
+        self._store_calls = 0
+        self._store_errors = 0
+
+    def _held(self, key: str, now: float) -> _Lease | None:
+        lease = self._leases.get(key)
+        if lease is None or lease.expires_at <= now:
+            return None
+        return lease
+
+    def _next_batch(self, previous: _Lease | None, held: _Lease | None, limit: RateLimit) -> int:
+        """Size the next lease from how the previous one for the key was used."""
+        if previous is None:
+            return 1
+        if held is not None:
+            # Used up before it expired: requests arrive faster than the TTL
+            return min(previous.batch * 2, max(1, min(self.lease_size, limit.capacity)))
+        if previous.tokens > 0:
+            # Expired with tokens left, which the shared bucket has lost
+            return max(1, previous.batch // 2)
+        return previous.batch
+
+    async def acquire(self, key: str, limit: RateLimit, cost: int = 1) -> RateLimitDecision:
+        """Spend leased tokens, leasing more from the shared store when needed."""
+        previous = self._leases.get(key)
+        lease = self._held(key, self._clock())
+        if lease is not None and lease.tokens >= cost:
+            lease.tokens -= cost
+            self._leases.move_to_end(key)
+            self._lease_hits += 1
+            return RateLimitDecision(
+                allowed=True,
+                limit=limit.capacity,
+                remaining=lease.store_remaining + lease.tokens,
+            )
+
+        held = lease.tokens if lease is not None else 0
+        batch = self._next_batch(previous, lease, limit)
+        request = max(cost - held, batch)
+        try:
+            self._store_calls += 1
+            granted, store_remaining = await self.store.take(
+                f"{self.key_prefix}{key}", limit, request
+            )
+        except Exception as e:
+            self._store_errors += 1
+            logger.warning("rate_limit.shared_store_failed", key=key, error=str(e))
+            return await self.fallback.acquire(key, limit, cost)
+
+        # Re-read after the await: a concurrent request may have changed the lease
+        now = self._clock()
+        lease = self._held(key, now)
+        tokens = (lease.tokens if lease is not None else 0) + granted
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        self._leases[key] = _Lease(
+            tokens=tokens,
+            store_remaining=store_remaining,
+            expires_at=now + self.lease_ttl_seconds,
+            batch=batch,
+        )
+        self._leases.move_to_end(key)
+        while len(self._leases) > self.max_leases:
+            self._leases.popitem(last=False)
+
+        retry_after = 0.0
+        if not allowed:
+            retry_after = (cost - tokens) / limit.refill_rate if limit.refill_rate > 0 else math.inf
+        return RateLimitDecision(
+            allowed=allowed,
+            limit=limit.capacity,
+            remaining=store_remaining + tokens,
+            retry_after_seconds=retry_after,
+        )
+
+    def get_stats(self) -> dict[str, int]:
+        """Get backend counters (lease hits, store calls and errors, leases)."""
+        return {
+            "lease_hits": self._lease_hits,
+            "store_calls": self._store_calls,
+            "store_errors": self._store_errors,
+            "leases": len(self._leases),
+        }
+
+
+def _redis_client() -> Any:
+    from coaching.src.api.multitenant_dependencies import get_redis_client
+
+    return get_redis_client()
+
+
+_backend: RateLimitBackend | None = None
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """Get the process-wide rate limit backend selected in settings."""
+    global _backend
+    from coaching.src.core.config_multitenant import settings
+
+    if _backend is None:
+        local = LocalRateLimitBackend(max_buckets=settings.rate_limit_max_buckets)
+        if settings.rate_limit_backend.lower() == "redis":
+            _backend = SharedRateLimitBackend(
+                RedisTokenStore(_redis_client),
+                lease_size=settings.rate_limit_lease_size,
+                lease_ttl_seconds=settings.rate_limit_lease_ttl_seconds,
+                max_leases=settings.rate_limit_max_buckets,
+                fallback=local,
+            )
+        else:
+            _backend = local
+    return _backend
+
+
+__all__ = [
+    "InMemoryTokenStore",
+    "LocalRateLimitBackend",
+    "RateLimit",
+    "RateLimitBackend",
+    "RateLimitDecision",
+    "RedisTokenStore",
+    "SharedRateLimitBackend",
+    "SharedTokenStore",
+    "TokenBucket",
+    "get_rate_limit_backend",
+]
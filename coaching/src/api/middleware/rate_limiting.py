@@ -2,14 +2,25 @@
 
 This middleware implements token bucket rate limiting to protect
 the API from abuse and ensure fair resource allocation.
+
+Buckets are kept by a pluggable backend (see ``rate_limit_backends``): a
+bounded per-process backend, or a shared one enforcing one limit across all
+instances. Requests are cost-weighted, so expensive endpoints such as
+``POST /ai/execute`` spend more tokens than a ``GET``.
 """
 
-import time
-from collections import defaultdict
+import hashlib
+import math
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 import structlog
+from coaching.src.api.middleware.rate_limit_backends import (
+    LocalRateLimitBackend,
+    RateLimit,
+    RateLimitBackend,
+    TokenBucket,
+)
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -17,58 +28,13 @@ from starlette.middleware.base import BaseHTTPMiddleware
 logger = structlog.get_logger()
 
 
-class TokenBucket:
-    """Token bucket implementation for rate limiting.
-
-    Uses the token bucket algorithm to allow bursts while enforcing
-    a long-term rate limit.
-    """
-
-    def __init__(self, capacity: int, refill_rate: float):
-        """Initialize token bucket.
-
-        Args:
-            capacity: Maximum number of tokens (burst size)
-            refill_rate: Tokens added per second
-        """
-        self.capacity = capacity
-        self.refill_rate = refill_rate
-        self.tokens = capacity
-        self.last_refill = time.time()
-
-    def consume(self, tokens: int = 1) -> bool:
-        """Attempt to consume tokens.
-
-        Args:
-            tokens: Number of tokens to consume
-
-        Returns:
-            True if tokens were consumed, False if insufficient tokens
-        """
-        # Refill tokens based on elapsed time
-        now = time.time()
-        elapsed = now - self.last_refill
-        self.tokens = int(
-            min(
-                self.capacity,
-                self.tokens + (elapsed * self.refill_rate),
-            )
-        )
-        self.last_refill = now
-
-        # Try to consume
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
-
-        return False
-
-
 class RateLimitingMiddleware(BaseHTTPMiddleware):
     """Middleware to enforce rate limits on API requests.
 
-    Rate limits are applied per user (extracted from auth token).
-    Different endpoints can have different rate limits.
+    Rate limits are applied per client: the authenticated user when auth has
+    set ``request.state.user_id``, otherwise the bearer token. Requests under
+    an ``endpoint_limits`` prefix use that prefix's bucket; all other requests
+    share the client's default bucket.
 
     Note: BaseHTTPMiddleware exists at runtime but type stubs are incomplete.
     """
@@ -79,56 +45,99 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
         default_capacity: int = 100,
         default_refill_rate: float = 10.0,
         endpoint_limits: dict[str, tuple[int, float]] | None = None,
+        endpoint_costs: dict[str, int] | None = None,
+        default_cost: int = 1,
+        backend: RateLimitBackend | None = None,
+        cost_path_prefix: str = "",
     ):
         """Initialize rate limiting middleware.
 
         Args:
             app: FastAPI application
-            default_capacity: Default burst capacity (requests)
-            default_refill_rate: Default refill rate (requests/second)
+            default_capacity: Default burst capacity (tokens)
+            default_refill_rate: Default refill rate (tokens/second)
             endpoint_limits: Per-endpoint limits {path_prefix: (capacity, rate)}
+            endpoint_costs: Token cost per request {"[METHOD ]path_prefix": cost};
+                the longest matching rule wins
+            default_cost: Cost of requests matching no cost rule
+            backend: Bucket backend (defaults to a bounded per-process backend)
+            cost_path_prefix: Prefix prepended to every cost rule path, so rules
+                can be written relative to the API router prefix (e.g. "/api/v1")
         """
         super().__init__(app)
-        self.default_capacity = default_capacity
-        self.default_refill_rate = default_refill_rate
-        self.endpoint_limits = endpoint_limits or {}
-
-        # Store buckets per user
-        # Format: {user_id: {endpoint_prefix: TokenBucket}}
-        self.buckets: dict[str, dict[str, TokenBucket]] = defaultdict(dict)
+        self.default_limit = RateLimit(default_capacity, default_refill_rate)
+        self.endpoint_limits = {
+            prefix: RateLimit(capacity, rate)
+            for prefix, (capacity, rate) in (endpoint_limits or {}).items()
+        }
+        self.default_cost = default_cost
+        self.cost_rules = sorted(
+            (
+                self._parse_cost_rule(rule, cost, cost_path_prefix)
+                for rule, cost in (endpoint_costs or {}).items()
+            ),
+            key=lambda r: len(r[1]),
+            reverse=True,
+        )
+        self.backend: RateLimitBackend = backend or LocalRateLimitBackend()
 
         logger.info(
             "Rate limiting middleware initialized",
             default_capacity=default_capacity,
             default_refill_rate=default_refill_rate,
             endpoint_limits=list(self.endpoint_limits.keys()),
+            endpoint_costs=dict(endpoint_costs or {}),
+            cost_path_prefix=cost_path_prefix,
+            backend=type(self.backend).__name__,
         )
 
-    def get_bucket(self, user_id: str, endpoint: str) -> TokenBucket:
-        """Get or create token bucket for user and endpoint.
+    @staticmethod
+    def _parse_cost_rule(
+        rule: str, cost: int, path_prefix: str = ""
+    ) -> tuple[str | None, str, int]:
+        method, _, path = rule.strip().rpartition(" ")
+        return (method.upper() or None, path_prefix.rstrip("/") + path, cost)
+
+    def resolve_limit(self, path: str) -> tuple[str, RateLimit]:
+        """Get the bucket scope and limit for a request path.
 
         Args:
-            user_id: User identifier
-            endpoint: Endpoint path
+            path: Request path
 
         Returns:
-            TokenBucket for this user/endpoint combination
+            Tuple of (scope name, limit)
         """
-        # Find matching endpoint limit
-        capacity = self.default_capacity
-        refill_rate = self.default_refill_rate
+        for prefix, limit in self.endpoint_limits.items():
+            if path.startswith(prefix):
+                return prefix, limit
+        return "*", self.default_limit
 
-        for prefix, (ep_capacity, ep_rate) in self.endpoint_limits.items():
-            if endpoint.startswith(prefix):
-                capacity = ep_capacity
-                refill_rate = ep_rate
-                break
+    def resolve_cost(self, method: str, path: str) -> int:
+        """Get the token cost of a request.
 
-        # Get or create bucket
-        if endpoint not in self.buckets[user_id]:
-            self.buckets[user_id][endpoint] = TokenBucket(capacity, refill_rate)
+        Args:
+            method: HTTP method
+            path: Request path
 
-        return self.buckets[user_id][endpoint]
+        Returns:
+            Tokens the request spends
+        """
+        for rule_method, prefix, cost in self.cost_rules:
+            if path.startswith(prefix) and rule_method in (None, method):
+                return cost
+        return self.default_cost
+
+    @staticmethod
+    def client_key(request: Request) -> str | None:
+        """Identify the client a request is limited as (None if anonymous)."""
+        user_id = getattr(request.state, "user_id", None)
+        if user_id:
+            return f"user:{user_id}"
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and token:
+            # Hash rather than decode: the token is not verified at this point
+            return "token:" + hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+        return None
 
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
@@ -142,25 +151,28 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
         Returns:
             Response from handler or rate limit error
         """
-        # Extract user ID from request state (set by auth middleware)
-        user_id = getattr(request.state, "user_id", None)
+        client = self.client_key(request)
 
         # Skip rate limiting for unauthenticated requests (they'll be rejected by auth)
-        if not user_id:
+        if client is None or request.method == "OPTIONS":
             return await call_next(request)
 
-        # Get endpoint path
         endpoint = request.url.path
+        scope, limit = self.resolve_limit(endpoint)
+        # A request costing more than the burst size could never be admitted
+        cost = min(self.resolve_cost(request.method, endpoint), limit.capacity)
 
-        # Get bucket and try to consume token
-        bucket = self.get_bucket(user_id, endpoint)
+        decision = await self.backend.acquire(f"{client}|{scope}", limit, cost)
 
-        if not bucket.consume():
+        if not decision.allowed:
+            retry_after = max(1, math.ceil(min(decision.retry_after_seconds, 3600)))
             logger.warning(
                 "Rate limit exceeded",
-                user_id=user_id,
+                client=client,
                 endpoint=endpoint,
                 method=request.method,
+                cost=cost,
+                retry_after=retry_after,
             )
             return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -169,7 +181,9 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
                     "message": "Too many requests. Please try again later.",
                 },
                 headers={
-                    "Retry-After": "60",  # Suggest retry after 60 seconds
+                    "Retry-After": str(retry_after),
+                    "X-RateLimit-Limit": str(decision.limit),
+                    "X-RateLimit-Remaining": "0",
                 },
             )
 
@@ -177,8 +191,8 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
 
         # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(bucket.capacity)
-        response.headers["X-RateLimit-Remaining"] = str(int(bucket.tokens))
+        response.headers["X-RateLimit-Limit"] = str(decision.limit)
+        response.headers["X-RateLimit-Remaining"] = str(max(0, decision.remaining))
 
         return response
 
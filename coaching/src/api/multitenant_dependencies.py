@@ -1,7 +1,7 @@
 """Multitenant dependency injection for API routes."""
 
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from fastapi import Depends
@@ -20,7 +20,6 @@ from coaching.src.api.dependencies import (
     get_topic_repository,
 )
 from coaching.src.core.config_multitenant import settings
-from coaching.src.llm.providers.manager import ProviderManager
 from coaching.src.repositories.conversation_repository import ConversationRepository
 from coaching.src.services.cache_service import CacheService
 from coaching.src.services.llm_service import LLMService
@@ -28,11 +27,13 @@ from coaching.src.services.llm_template_service import LLMTemplateService
 from coaching.src.services.multitenant_conversation_service import MultitenantConversationService
 from coaching.src.services.onboarding_service import OnboardingService
 from coaching.src.services.prompt_service import PromptService
-from coaching.src.workflows.base import WorkflowType
-from coaching.src.workflows.conversation_workflow_template import ConversationWorkflowTemplate
-from coaching.src.workflows.orchestrator import WorkflowOrchestrator
 from shared.models.multitenant import RequestContext
 
+if TYPE_CHECKING:
+    # Provider SDKs, LangChain and LangGraph load on first use, not at app import
+    from coaching.src.llm.providers.manager import ProviderManager
+    from coaching.src.workflows.orchestrator import WorkflowOrchestrator
+
 logger = structlog.get_logger()
 
 if redis is None:
@@ -168,8 +169,10 @@ async def get_cache_service(context: RequestContext = Depends(get_current_contex
 
 async def get_provider_manager(
     _context: RequestContext = Depends(get_current_context),
-) -> ProviderManager:
+) -> "ProviderManager":
     """Get provider manager with tenant context."""
+    from coaching.src.llm.providers.manager import ProviderManager
+
     bedrock_client = get_bedrock_client()
 
     # Initialize provider manager with available providers
@@ -196,8 +199,14 @@ async def get_provider_manager(
 
 async def get_workflow_orchestrator(
     context: RequestContext = Depends(get_current_context),
-) -> WorkflowOrchestrator:
+) -> "WorkflowOrchestrator":
     """Get workflow orchestrator with tenant context."""
+    from coaching.src.workflows.base import WorkflowType
+    from coaching.src.workflows.conversation_workflow_template import (
+        ConversationWorkflowTemplate,
+    )
+    from coaching.src.workflows.orchestrator import WorkflowOrchestrator
+
     provider_manager = await get_provider_manager(context)
     cache_service = await get_cache_service(context)
 
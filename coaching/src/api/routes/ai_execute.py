@@ -7,11 +7,13 @@ the endpoint registry, and returning dynamically-typed responses.
 Endpoints:
     POST /ai/execute - Execute AI for any registered single-shot topic
         USED BY: FE - WebsiteScanPanel (website_scan), OnboardingReviews (niche_review, ica_review, value_proposition_review)
+    POST /ai/execute/stream - Same as /ai/execute, streaming tokens as Server-Sent Events
     GET /ai/schemas/{schema_name} - Get JSON schema for a response model
     GET /ai/topics - List all available single-shot topics
 """
 
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import structlog
@@ -23,6 +25,8 @@ from coaching.src.api.models.ai_execute import (
     TopicInfo,
     TopicParameter,
 )
+from coaching.src.api.streaming import format_sse_event, sse_response
+from coaching.src.application.ai_engine.result_cache import ResultCacheMode
 from coaching.src.application.ai_engine.unified_ai_engine import (
     ParameterValidationError,
     PromptRenderError,
@@ -42,12 +46,16 @@ from coaching.src.core.topic_registry import (
     get_topic_by_topic_id,
     list_all_topics,
 )
-from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
 logger = structlog.get_logger()
 
 router = APIRouter(prefix="/ai", tags=["AI Execute"])
 
+_CACHE_CONTROL_DESCRIPTION = "no-cache refreshes a cached result; no-store bypasses the cache"
+
 
 # Backwards compatibility alias for tests
 def get_endpoint_by_topic_id(topic_id: str) -> Any:
@@ -55,6 +63,120 @@ def get_endpoint_by_topic_id(topic_id: str) -> Any:
     return get_topic_by_topic_id(topic_id)
 
 
+def _resolve_single_shot_topic(
+    topic_id: str, parameters: dict[str, Any]
+) -> tuple[Any, type[BaseModel]]:
+    """Validate a single-shot request against the topic registry.
+
+    Args:
+        topic_id: Requested topic identifier
+        parameters: Request parameters
+
+    Returns:
+        Tuple of (endpoint definition, response model class)
+
+    Raises:
+        HTTPException: 404/400/422/500 for unknown, inactive, wrong-type topics,
+            missing parameters or an unconfigured response model
+    """
+    # Step 1: Validate topic exists and is active
+    endpoint = get_endpoint_by_topic_id(topic_id)
+    if endpoint is None:
+        logger.warning("ai_execute.topic_not_found", topic_id=topic_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Topic not found: {topic_id}",
+        )
+
+    if not endpoint.is_active:
+        logger.warning("ai_execute.topic_inactive", topic_id=topic_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Topic is not active: {topic_id}",
+        )
+
+    # Step 2: Validate topic is single-shot (not conversation)
+    if endpoint.topic_type != TopicType.SINGLE_SHOT:
+        logger.warning(
+            "ai_execute.wrong_topic_type",
+            topic_id=topic_id,
+            topic_type=endpoint.topic_type.value,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Topic {topic_id} is type {endpoint.topic_type.value}, "
+            "use conversation endpoints for conversation topics",
+        )
+
+    # Step 3: Validate required parameters
+    required_params = get_required_parameter_names_for_topic(topic_id)
+    missing = [p for p in required_params if p not in parameters]
+    if missing:
+        logger.warning(
+            "ai_execute.missing_parameters",
+            topic_id=topic_id,
+            missing=missing,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Missing required parameters for topic {topic_id}: {missing}",
+        )
+
+    # Step 4: Get response model for validation
+    response_model = get_response_model(endpoint.response_model)
+    if response_model is None:
+        logger.error(
+            "ai_execute.response_model_not_configured",
+            topic_id=topic_id,
+            response_model=endpoint.response_model,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Response model not configured: {endpoint.response_model}",
+        )
+
+    return endpoint, response_model
+
+
+def _engine_error_to_http(topic_id: str, error: Exception) -> HTTPException:
+    """Map an engine exception to the HTTP error returned by /ai/execute."""
+    if isinstance(error, TopicNotFoundError):
+        logger.error("ai_execute.engine_topic_not_found", topic_id=error.topic_id)
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Topic configuration not found: {error.topic_id}",
+        )
+    if isinstance(error, ParameterValidationError):
+        logger.error(
+            "ai_execute.engine_parameter_error",
+            topic_id=error.topic_id,
+            missing_params=error.missing_params,
+        )
+        return HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Parameter validation failed: {error.reason}",
+        )
+    if isinstance(error, PromptRenderError):
+        logger.error(
+            "ai_execute.prompt_render_error",
+            topic_id=error.topic_id,
+            prompt_type=error.prompt_type,
+        )
+        return HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Prompt rendering failed: {error.reason}",
+        )
+    logger.exception(
+        "ai_execute.unexpected_error",
+        topic_id=topic_id,
+        error=str(error),
+    )
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=f"AI execution failed: {error!s}",
+    )
+
+
 @router.post(
     "/execute",
     response_model=GenericAIResponse,
@@ -123,6 +245,7 @@ then validates required parameters and executes via UnifiedAIEngine.
 async def execute_ai(
     request: GenericAIRequest,
     engine: UnifiedAIEngine = Depends(get_unified_ai_engine),
+    cache_control: str | None = Header(None, description=_CACHE_CONTROL_DESCRIPTION),
 ) -> GenericAIResponse:
     """Execute AI for any registered single-shot topic.
 
@@ -132,6 +255,7 @@ async def execute_ai(
     Args:
         request: Generic AI request with topic_id and parameters
         engine: UnifiedAIEngine instance from dependency injection
+        cache_control: Cache-Control header controlling the result cache
 
     Returns:
         GenericAIResponse with AI-generated data and metadata
@@ -147,61 +271,8 @@ async def execute_ai(
         param_count=len(request.parameters),
     )
 
-    # Step 1: Validate topic exists and is active
-    endpoint = get_endpoint_by_topic_id(request.topic_id)
-    if endpoint is None:
-        logger.warning("ai_execute.topic_not_found", topic_id=request.topic_id)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Topic not found: {request.topic_id}",
-        )
-
-    if not endpoint.is_active:
-        logger.warning("ai_execute.topic_inactive", topic_id=request.topic_id)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Topic is not active: {request.topic_id}",
-        )
-
-    # Step 2: Validate topic is single-shot (not conversation)
-    if endpoint.topic_type != TopicType.SINGLE_SHOT:
-        logger.warning(
-            "ai_execute.wrong_topic_type",
-            topic_id=request.topic_id,
-            topic_type=endpoint.topic_type.value,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Topic {request.topic_id} is type {endpoint.topic_type.value}, "
-            "use conversation endpoints for conversation topics",
-        )
-
-    # Step 3: Validate required parameters
-    required_params = get_required_parameter_names_for_topic(request.topic_id)
-    missing = [p for p in required_params if p not in request.parameters]
-    if missing:
-        logger.warning(
-            "ai_execute.missing_parameters",
-            topic_id=request.topic_id,
-            missing=missing,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Missing required parameters for topic {request.topic_id}: {missing}",
-        )
-
-    # Step 4: Get response model for validation
-    response_model = get_response_model(endpoint.response_model)
-    if response_model is None:
-        logger.error(
-            "ai_execute.response_model_not_configured",
-            topic_id=request.topic_id,
-            response_model=endpoint.response_model,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Response model not configured: {endpoint.response_model}",
-        )
+    # Steps 1-4: Validate topic, parameters and response model
+    endpoint, response_model = _resolve_single_shot_topic(request.topic_id, request.parameters)
 
     # Step 5: Execute via UnifiedAIEngine
     try:
@@ -209,43 +280,10 @@ async def execute_ai(
             topic_id=request.topic_id,
             parameters=request.parameters,
             response_model=response_model,
+            cache_mode=ResultCacheMode.from_cache_control(cache_control),
         )
-    except TopicNotFoundError as e:
-        logger.error("ai_execute.engine_topic_not_found", topic_id=e.topic_id)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Topic configuration not found: {e.topic_id}",
-        ) from e
-    except ParameterValidationError as e:
-        logger.error(
-            "ai_execute.engine_parameter_error",
-            topic_id=e.topic_id,
-            missing_params=e.missing_params,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Parameter validation failed: {e.reason}",
-        ) from e
-    except PromptRenderError as e:
-        logger.error(
-            "ai_execute.prompt_render_error",
-            topic_id=e.topic_id,
-            prompt_type=e.prompt_type,
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Prompt rendering failed: {e.reason}",
-        ) from e
     except Exception as e:
-        logger.exception(
-            "ai_execute.unexpected_error",
-            topic_id=request.topic_id,
-            error=str(e),
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"AI execution failed: {e!s}",
-        ) from e
+        raise _engine_error_to_http(request.topic_id, e) from e
 
     processing_time = int((time.time() - start_time) * 1000)
 
@@ -271,6 +309,98 @@ async def execute_ai(
     )
 
 
+@router.post(
+    "/execute/stream",
+    response_class=StreamingResponse,
+    summary="Execute AI for a single-shot topic, streaming tokens as Server-Sent Events",
+    description="""
+Streaming variant of POST /ai/execute.
+
+The request is validated exactly like /ai/execute; validation failures are
+returned as normal HTTP errors. Once the LLM starts generating, the response is
+a `text/event-stream` with these events:
+
+- `token` - `{"text": "..."}` raw output chunk as it is generated
+- `result` - the complete `GenericAIResponse`, sent once the output is serialized
+- `error` - `{"code": "STREAM_FAILED", "message": "..."}` if generation fails mid-stream
+""",
+    responses={
+        200: {"description": "Event stream", "content": {"text/event-stream": {}}},
+        400: {"description": "Invalid request - topic inactive or wrong type"},
+        404: {"description": "Topic not found"},
+        422: {"description": "Missing required parameters"},
+        500: {"description": "Internal server error"},
+    },
+)
+async def execute_ai_stream(
+    request: GenericAIRequest,
+    engine: UnifiedAIEngine = Depends(get_unified_ai_engine),
+    cache_control: str | None = Header(None, description=_CACHE_CONTROL_DESCRIPTION),
+) -> StreamingResponse:
+    """Execute AI for a single-shot topic and stream the output.
+
+    Args:
+        request: Generic AI request with topic_id and parameters
+        engine: UnifiedAIEngine instance from dependency injection
+        cache_control: Cache-Control header controlling the result cache
+
+    Returns:
+        StreamingResponse emitting token events followed by the final result
+
+    Raises:
+        HTTPException: Validation and preparation errors, before streaming starts
+    """
+    start_time = time.time()
+
+    logger.info(
+        "ai_execute.stream_started",
+        topic_id=request.topic_id,
+        param_count=len(request.parameters),
+    )
+
+    endpoint, response_model = _resolve_single_shot_topic(request.topic_id, request.parameters)
+
+    try:
+        prepared = await engine.prepare_single_shot(
+            topic_id=request.topic_id,
+            parameters=request.parameters,
+            response_model=response_model,
+            cache_mode=ResultCacheMode.from_cache_control(cache_control),
+        )
+    except Exception as e:
+        raise _engine_error_to_http(request.topic_id, e) from e
+
+    async def events() -> AsyncIterator[str]:
+        usage: dict[str, int] = {}
+        async for item in engine.stream_single_shot(prepared, usage):
+            if isinstance(item, str):
+                yield format_sse_event("token", {"text": item})
+                continue
+
+            processing_time = int((time.time() - start_time) * 1000)
+            logger.info(
+                "ai_execute.stream_completed",
+                topic_id=request.topic_id,
+                processing_time_ms=processing_time,
+                result_type=type(item).__name__,
+            )
+            response = GenericAIResponse(
+                topic_id=request.topic_id,
+                success=True,
+                data=item.model_dump(),
+                schema_ref=endpoint.response_model,
+                metadata=ResponseMetadata(
+                    model=endpoint.response_model,
+                    tokens_used=usage.get("total_tokens", 0),
+                    processing_time_ms=processing_time,
+                    finish_reason="stop",
+                ),
+            )
+            yield format_sse_event("result", response.model_dump(mode="json"))
+
+    return sse_response(events(), log_event="ai_execute.stream_failed")
+
+
 @router.get(
     "/schemas/{schema_name}",
     response_model=dict[str, Any],
@@ -14,6 +14,7 @@ Endpoints:
         USED BY: FE - When user wants to continue existing conversation
     POST /ai/coaching/message        - Send a message in active session
         USED BY: FE - OnboardingCoachPanel.tsx
+    POST /ai/coaching/message/stream - Send a message and stream the reply as Server-Sent Events
     POST /ai/coaching/pause          - Pause an active session
         USED BY: FE - OnboardingCoachPanel.tsx
     POST /ai/coaching/complete       - Complete a session with result extraction
@@ -37,6 +38,7 @@ Error Responses:
     500 - EXTRACTION_FAILED: Failed to extract results from session
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 import structlog
@@ -45,11 +47,14 @@ from coaching.src.api.dependencies.ai_engine import create_template_processor
 from coaching.src.api.multitenant_dependencies import (
     get_dynamodb_client,
 )
+from coaching.src.api.streaming import format_sse_event, sse_response
 from coaching.src.core.config_multitenant import settings
 from coaching.src.core.types import ConversationId, TenantId, UserId
 from coaching.src.domain.entities.ai_job import AIJobStatus
 from coaching.src.domain.exceptions.session_exceptions import (
     ExtractionFailedError,
+    InvalidCursorError,
+    MaxTurnsReachedError,
     SessionAccessDeniedError,
     SessionConflictError,
     SessionNotActiveError,
@@ -79,7 +84,8 @@ from coaching.src.services.coaching_session_service import (
     TopicNotActiveError,
     TopicsWithStatusResponse,
 )
-from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from shared.models.multitenant import RequestContext
 from shared.models.schemas import ApiResponse
@@ -162,6 +168,11 @@ async def get_coaching_session_repository() -> DynamoDBCoachingSessionRepository
     return DynamoDBCoachingSessionRepository(
         dynamodb_resource=dynamodb,
         table_name=settings.coaching_sessions_table,
+        messages_table_name=(
+            settings.coaching_session_messages_table
+            if settings.coaching_session_message_items_enabled
+            else None
+        ),
     )
 
 
@@ -204,6 +215,8 @@ async def get_coaching_session_service(
         s3_prompt_storage=s3_prompt_storage,
         template_processor=template_processor,
         provider_factory=provider_factory,
+        incremental_extraction=settings.coaching_incremental_extraction_enabled,
+        extraction_wait_seconds=settings.coaching_extraction_wait_seconds,
     )
 
 
@@ -605,6 +618,134 @@ async def send_message_async(
         ) from e
 
 
+@router.post(
+    "/message/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Event stream of the coach reply",
+            "content": {"text/event-stream": {}},
+        }
+    },
+)
+async def send_message_stream(
+    request: SendMessageRequest,
+    context: RequestContext = Depends(get_current_context),
+    service: CoachingSessionService = Depends(get_coaching_session_service),
+) -> StreamingResponse:
+    """Send a message in an active coaching session and stream the reply.
+
+    Alternative to the async job flow: the coach reply is sent as Server-Sent
+    Events while the LLM generates it, and the session is persisted when the
+    stream completes.
+
+    Events:
+        token   - {"text": "..."} chunk of the coach message
+        message - final MessageResponse (includes result if the session completed)
+        error   - {"code": "STREAM_FAILED", "message": "..."} if generation fails
+
+    Args:
+        request: Contains session_id and message content
+
+    Returns:
+        StreamingResponse with the event stream
+
+    Raises:
+        HTTPException 400: Session not active
+        HTTPException 403: User does not own this session
+        HTTPException 422: Session not found or max turns reached
+        HTTPException 500: Failed to prepare the message
+    """
+    logger.info(
+        "coaching_sessions.send_message_stream",
+        session_id=request.session_id,
+        tenant_id=context.tenant_id,
+        message_length=len(request.message),
+    )
+
+    try:
+        turn = await service.prepare_message_turn(
+            session_id=request.session_id,
+            tenant_id=context.tenant_id,
+            user_id=context.user_id,
+            user_message=request.message,
+        )
+
+    except SessionNotFoundError as e:
+        logger.warning(
+            "coaching_sessions.send_message_stream.not_found",
+            session_id=request.session_id,
+            error_code=e.code,
+        )
+        raise HTTPException(
+            status_code=422,
+            detail={"code": e.code, "message": str(e)},
+        ) from e
+
+    except SessionAccessDeniedError as e:
+        logger.warning(
+            "coaching_sessions.send_message_stream.access_denied",
+            session_id=request.session_id,
+            user_id=context.user_id,
+            error_code=e.code,
+        )
+        raise HTTPException(
+            status_code=403,
+            detail={"code": e.code, "message": str(e)},
+        ) from e
+
+    except SessionNotActiveError as e:
+        logger.warning(
+            "coaching_sessions.send_message_stream.not_active",
+            session_id=request.session_id,
+            current_status=e.current_status,
+            error_code=e.code,
+        )
+        raise HTTPException(
+            status_code=400,
+            detail={"code": e.code, "message": str(e)},
+        ) from e
+
+    except MaxTurnsReachedError as e:
+        logger.warning(
+            "coaching_sessions.send_message_stream.max_turns",
+            session_id=request.session_id,
+            error_code=e.code,
+        )
+        raise HTTPException(
+            status_code=422,
+            detail={"code": e.code, "message": str(e)},
+        ) from e
+
+    except Exception as e:
+        logger.error(
+            "coaching_sessions.send_message_stream.error",
+            error=str(e),
+            session_id=request.session_id,
+            tenant_id=context.tenant_id,
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to send message",
+        ) from e
+
+    async def events() -> AsyncIterator[str]:
+        async for item in service.stream_message_turn(turn):
+            if isinstance(item, str):
+                yield format_sse_event("token", {"text": item})
+            else:
+                logger.info(
+                    "coaching_sessions.send_message_stream.completed",
+                    session_id=request.session_id,
+                    is_final=item.is_final,
+                )
+                yield format_sse_event("message", item.model_dump(mode="json"))
+        await service.wait_for_partial_extraction(request.session_id)
+
+    return sse_response(events(), log_event="coaching_sessions.send_message_stream.failed")
+
+
 @router.get("/message/{job_id}", response_model=ApiResponse[MessageJobStatusResponse])
 async def get_message_job_status(
     job_id: str,
@@ -1201,23 +1342,30 @@ async def get_session(
 
 @router.get("/sessions", response_model=ApiResponse[list[SessionSummary]])
 async def list_user_sessions(
+    response: Response,
     include_completed: bool = Query(
         default=False, description="Include completed and cancelled sessions"
     ),
     limit: int = Query(default=20, ge=1, le=100, description="Maximum sessions to return"),
+    cursor: str | None = Query(default=None, description="X-Next-Cursor of the previous page"),
     context: RequestContext = Depends(get_current_context),
     service: CoachingSessionService = Depends(get_coaching_session_service),
 ) -> ApiResponse[list[SessionSummary]]:
     """List all coaching sessions for the current user.
 
+    Sessions are returned one page at a time; when more remain, the cursor
+    for the next page is returned in the ``X-Next-Cursor`` header.
+
     Args:
         include_completed: Whether to include completed/cancelled sessions
         limit: Maximum number of sessions to return (1-100)
+        cursor: Cursor of the page to return (omit for the first page)
 
     Returns:
         ApiResponse with list of SessionSummary
 
     Raises:
+        HTTPException 400: Invalid cursor
         HTTPException 500: Failed to list sessions
     """
     logger.info(
@@ -1229,16 +1377,21 @@ async def list_user_sessions(
     )
 
     try:
-        sessions = await service.list_user_sessions(
+        page = await service.list_user_sessions(
             tenant_id=context.tenant_id,
             user_id=context.user_id,
             include_completed=include_completed,
             limit=limit,
+            cursor=cursor,
         )
+        sessions = page.sessions
+        if page.next_cursor is not None:
+            response.headers["X-Next-Cursor"] = page.next_cursor
 
         logger.info(
             "coaching_sessions.list_sessions.success",
             count=len(sessions),
+            has_more=page.next_cursor is not None,
             tenant_id=context.tenant_id,
         )
 
@@ -1248,6 +1401,16 @@ async def list_user_sessions(
             message=f"Found {len(sessions)} sessions",
         )
 
+    except InvalidCursorError as e:
+        logger.warning(
+            "coaching_sessions.list_sessions.invalid_cursor",
+            tenant_id=context.tenant_id,
+        )
+        raise HTTPException(
+            status_code=400,
+            detail={"code": e.code, "message": e.message},
+        ) from e
+
     except Exception as e:
         logger.error(
             "coaching_sessions.list_sessions.error",
@@ -6,7 +6,7 @@ Migration Status:
 - categories, priorities, dismiss, acknowledge, summary: DEPRECATED - Not called by FE
 """
 
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 import structlog
 from coaching.src.api.auth import get_current_context, get_current_user
@@ -24,10 +24,17 @@ from coaching.src.models.responses import (
     InsightsSummaryResponse,
 )
 from coaching.src.services.insights_service import InsightsService
+from coaching.src.services.insights_snapshot_store import (
+    InsightsSnapshotStore,
+    get_insights_snapshot_store,
+)
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 from shared.models.multitenant import RequestContext
-from shared.models.schemas import ApiResponse, PaginatedResponse
+from shared.models.schemas import ApiResponse, PaginatedResponse, PaginationMeta
+
+if TYPE_CHECKING:
+    from coaching.src.services.template_parameter_processor import TemplateParameterProcessor
 
 logger = structlog.get_logger()
 router = APIRouter()
@@ -50,6 +57,9 @@ async def generate_coaching_insights(
     category: str | None = Query(None, description="Filter by category"),
     priority: str | None = Query(None, description="Filter by priority"),
     status: str | None = Query(None, description="Filter by status"),
+    force_refresh: bool = Query(
+        False, description="Regenerate insights instead of using the current snapshot"
+    ),
     user: UserContext = Depends(get_current_user),
     handler: GenericAIHandler = Depends(get_generic_handler),
     jwt_token: str | None = Depends(get_jwt_token),
@@ -59,7 +69,11 @@ async def generate_coaching_insights(
     Migrated to unified topic-driven architecture (Issue #113).
     Uses 'insights_generation' topic for consistent prompt management.
 
-    This endpoint generates NEW insights from real-time business data.
+    This endpoint generates NEW insights from real-time business data. The
+    generated insights are kept in the insights snapshot store, keyed by the
+    rendered prompts (which contain only the business data), so later pages
+    and filter changes are served from the snapshot while the data is
+    unchanged and the snapshot is within its validity window.
     """
     logger.info(
         "Generating coaching insights",
@@ -78,7 +92,44 @@ async def generate_coaching_insights(
 
     template_processor = create_template_processor(jwt_token) if jwt_token else None
 
-    result = await handler.handle_single_shot(
+    snapshot_store = get_insights_snapshot_store()
+    if snapshot_store is None:
+        result = await handler.handle_single_shot(
+            http_method="POST",
+            endpoint_path="/insights/generate",
+            request_body=request,
+            user_context=user,
+            response_model=PaginatedResponse[InsightResponse],
+            template_processor=template_processor,
+        )
+        return cast(PaginatedResponse[InsightResponse], result)
+
+    insights = await _get_or_generate_insights(
+        snapshot_store,
+        handler,
+        request=request,
+        user=user,
+        template_processor=template_processor,
+        force_refresh=force_refresh,
+    )
+    return _paginate_insights(insights, request)
+
+
+async def _get_or_generate_insights(
+    snapshot_store: InsightsSnapshotStore,
+    handler: GenericAIHandler,
+    *,
+    request: InsightsGenerationRequest,
+    user: UserContext,
+    template_processor: "TemplateParameterProcessor | None",
+    force_refresh: bool,
+) -> list[InsightResponse]:
+    """Get the tenant's generated insights from the snapshot, generating on a miss.
+
+    Paging and filter fields are not prompt parameters, so every page of the
+    same business data renders the same prompts and shares one snapshot.
+    """
+    prepared = await handler.prepare_single_shot(
         http_method="POST",
         endpoint_path="/insights/generate",
         request_body=request,
@@ -86,7 +137,49 @@ async def generate_coaching_insights(
         response_model=PaginatedResponse[InsightResponse],
         template_processor=template_processor,
     )
-    return cast(PaginatedResponse[InsightResponse], result)
+
+    async def generate() -> list[InsightResponse]:
+        result = cast(
+            PaginatedResponse[InsightResponse],
+            await handler.complete_single_shot(
+                prepared, http_method="POST", endpoint_path="/insights/generate"
+            ),
+        )
+        return list(result.data or []) if result.success else []
+
+    return await snapshot_store.get_or_generate(
+        tenant_id=user.tenant_id,
+        fingerprint=snapshot_store.fingerprint_prompts(
+            prepared.topic_id, prepared.rendered_system_prompt, prepared.rendered_user_prompt
+        ),
+        generate=generate,
+        force_refresh=force_refresh,
+    )
+
+
+def _paginate_insights(
+    insights: list[InsightResponse], request: InsightsGenerationRequest
+) -> PaginatedResponse[InsightResponse]:
+    """Filter and page generated insights (same rules as InsightsService)."""
+    filtered = [
+        insight
+        for insight in insights
+        if (not request.category or insight.category == request.category)
+        and (not request.priority or insight.priority == request.priority)
+        and (not request.status or insight.status == request.status)
+    ]
+    total = len(filtered)
+    start = (request.page - 1) * request.page_size
+    return PaginatedResponse(
+        success=bool(insights),
+        data=filtered[start : start + request.page_size],
+        pagination=PaginationMeta(
+            page=request.page,
+            limit=request.page_size,
+            total=total,
+            total_pages=(total + request.page_size - 1) // request.page_size,
+        ),
+    )
 
 
 @router.get("/categories", response_model=ApiResponse[list[str]])
@@ -177,6 +270,9 @@ async def acknowledge_insight(
 
 @router.get("/summary", response_model=ApiResponse[InsightsSummaryResponse])
 async def get_insights_summary(
+    force_refresh: bool = Query(
+        False, description="Regenerate insights instead of using the current snapshot"
+    ),
     context: RequestContext = Depends(get_current_context),
     service: InsightsService = Depends(get_insights_service),
 ) -> ApiResponse[InsightsSummaryResponse]:
@@ -184,7 +280,7 @@ async def get_insights_summary(
     logger.info("Fetching insights summary", user_id=context.user_id, tenant_id=context.tenant_id)
 
     try:
-        summary = await service.get_insights_summary(context.user_id)
+        summary = await service.get_insights_summary(context.user_id, force_refresh=force_refresh)
 
         return ApiResponse(success=True, data=summary)
 
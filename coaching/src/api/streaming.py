@@ -0,0 +1,84 @@
+"""Server-Sent Events helpers for streaming API responses.
+
+Streaming endpoints send LLM output as it is generated instead of making the
+client wait for (or poll) the complete result. Each endpoint builds an async
+iterator of SSE frames with ``format_sse_event`` and returns it through
+``sse_response``.
+
+Event stream contract:
+    event: token   - ``{"text": "..."}`` chunk of generated text
+    event: <final> - endpoint-specific final payload (e.g. ``message``, ``result``)
+    event: error   - ``{"code": "...", "message": "..."}`` if the stream fails
+
+Validation errors are raised as normal HTTP errors before the stream starts;
+once the first byte is sent the status code is fixed, so later failures are
+reported with an ``error`` event.
+"""
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import structlog
+from fastapi.responses import StreamingResponse
+
+logger = structlog.get_logger()
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# Sent instead of the exception text, which can carry provider and AWS error details
+STREAM_FAILED_ERROR = {
+    "code": "STREAM_FAILED",
+    "message": "The response could not be completed.",
+}
+
+# Disable proxy buffering (nginx/API Gateway) and caching so tokens flush immediately
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse_event(event: str, data: dict[str, Any]) -> str:
+    """Format a single SSE frame.
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+
+    Returns:
+        SSE frame terminated by a blank line
+    """
+    payload = json.dumps(data, default=str, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+async def _guard_stream(events: AsyncIterator[str], *, log_event: str) -> AsyncIterator[str]:
+    """Pass frames through, turning a mid-stream failure into an ``error`` event."""
+    try:
+        async for frame in events:
+            yield frame
+    except Exception as e:
+        logger.error(log_event, error=str(e), exc_info=True)
+        yield format_sse_event("error", STREAM_FAILED_ERROR)
+
+
+def sse_response(events: AsyncIterator[str], *, log_event: str) -> StreamingResponse:
+    """Wrap SSE frames in a streaming HTTP response.
+
+    Args:
+        events: Async iterator of frames built with ``format_sse_event``
+        log_event: Log event name used if the stream fails
+
+    Returns:
+        StreamingResponse with the ``text/event-stream`` media type
+    """
+    return StreamingResponse(
+        _guard_stream(events, log_event=log_event),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
+
+
+__all__ = ["SSE_HEADERS", "SSE_MEDIA_TYPE", "format_sse_event", "sse_response"]
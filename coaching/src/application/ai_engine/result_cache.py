@@ -0,0 +1,241 @@
+"""Exact-match result cache for single-shot LLM topics.
+
+Some single-shot topics are requested again with identical enriched inputs
+(e.g. measure suggestions for the same goal). When a topic opts in, the
+serialized response model is cached under a hash of everything that
+determines the LLM output - model code, sampling settings, rendered system
+and user prompts and the response schema - so a repeat skips both the LLM
+call and response serialization.
+
+Topics opt in through ``additional_config``::
+
+    {"result_cache_enabled": true, "result_cache_ttl_seconds": 3600}
+
+Entries are tenant scoped, expire after the TTL and are LRU-evicted. Callers
+choose per request whether to use the cache, bypass it, or refresh it
+(``ResultCacheMode``). The cache is per process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from enum import Enum
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from coaching.src.domain.entities.llm_topic import LLMTopic
+    from coaching.src.domain.ports.llm_provider_port import LLMResponse
+    from pydantic import BaseModel
+
+logger = structlog.get_logger()
+
+# Topic additional_config keys
+CONFIG_ENABLED = "result_cache_enabled"
+CONFIG_TTL_SECONDS = "result_cache_ttl_seconds"
+
+
+class ResultCacheMode(str, Enum):
+    """How a request interacts with the result cache."""
+
+    USE = "use"  # Serve hits, store misses
+    BYPASS = "bypass"  # Neither read nor write
+    REFRESH = "refresh"  # Skip the lookup, store the fresh result
+
+    @classmethod
+    def from_cache_control(cls, header: str | None) -> ResultCacheMode:
+        """Map an HTTP Cache-Control request header to a mode.
+
+        ``no-store`` bypasses the cache and ``no-cache`` refreshes it.
+        """
+        directives = {d.strip().lower() for d in (header or "").split(",")}
+        if "no-store" in directives:
+            return cls.BYPASS
+        if "no-cache" in directives:
+            return cls.REFRESH
+        return cls.USE
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """A cached single-shot result."""
+
+    result: BaseModel
+    llm_response: LLMResponse
+    created_at: datetime
+    expires_at: float  # time.monotonic() deadline
+
+
+def topic_cache_ttl(topic: LLMTopic, default_ttl_seconds: float) -> float | None:
+    """Get the result cache TTL for a topic.
+
+    Args:
+        topic: Topic configuration
+        default_ttl_seconds: TTL used when the topic sets none
+
+    Returns:
+        TTL in seconds, or None if the topic has not opted in
+    """
+    config = topic.additional_config or {}
+    if not config.get(CONFIG_ENABLED):
+        return None
+    ttl = config.get(CONFIG_TTL_SECONDS)
+    return float(ttl) if ttl else default_ttl_seconds
+
+
+class LLMResultCache:
+    """In-memory TTL cache of serialized single-shot results."""
+
+    def __init__(self, *, default_ttl_seconds: float = 3600.0, max_entries: int = 1024) -> None:
+        """Initialize the cache.
+
+        Args:
+            default_ttl_seconds: TTL for topics that do not set their own
+            max_entries: Maximum entries kept before LRU eviction
+        """
+        self.default_ttl_seconds = default_ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], CachedResult] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+
+    @staticmethod
+    def make_key(
+        *,
+        model_code: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: str,
+        user_prompt: str,
+        response_schema: dict[str, object] | None,
+        response_model: type[BaseModel],
+    ) -> str:
+        """Hash everything that determines the LLM output.
+
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {
+                "model": model_code,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "system": system_prompt,
+                "user": user_prompt,
+                "schema": response_schema,
+                "response_model": f"{response_model.__module__}.{response_model.__qualname__}",
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+    def get(self, scope: str, key: str) -> CachedResult | None:
+        """Get a cached result.
+
+        Args:
+            scope: Tenant scope
+            key: Request key from ``make_key``
+
+        Returns:
+            The entry with a private copy of the result, or None on a miss
+        """
+        entry = self._entries.get((scope, key))
+        if entry is not None and entry.expires_at <= time.monotonic():
+            del self._entries[(scope, key)]
+            entry = None
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end((scope, key))
+        self._hits += 1
+        return replace(entry, result=entry.result.model_copy(deep=True))
+
+    def put(
+        self,
+        scope: str,
+        key: str,
+        result: BaseModel,
+        llm_response: LLMResponse,
+        ttl_seconds: float,
+    ) -> None:
+        """Store a result.
+
+        Args:
+            scope: Tenant scope
+            key: Request key from ``make_key``
+            result: Serialized response model (copied)
+            llm_response: Provider response the result was serialized from
+            ttl_seconds: Time to keep the entry
+        """
+        if self.max_entries <= 0 or ttl_seconds <= 0:
+            return
+        self._entries[(scope, key)] = CachedResult(
+            result=result.model_copy(deep=True),
+            llm_response=llm_response,
+            created_at=datetime.now(UTC),
+            expires_at=time.monotonic() + ttl_seconds,
+        )
+        self._entries.move_to_end((scope, key))
+        self._stores += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, scope: str) -> int:
+        """Drop all entries for a tenant scope.
+
+        Returns:
+            Number of entries removed
+        """
+        keys = [k for k in self._entries if k[0] == scope]
+        for k in keys:
+            del self._entries[k]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache counters (hits, misses, stores, size)."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "stores": self._stores,
+            "size": len(self._entries),
+        }
+
+
+_cache: LLMResultCache | None = None
+
+
+def get_llm_result_cache() -> LLMResultCache | None:
+    """Get the process-wide result cache, or None when disabled in settings."""
+    global _cache
+    from coaching.src.core.config_multitenant import settings
+
+    if not settings.llm_result_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = LLMResultCache(
+            default_ttl_seconds=settings.llm_result_cache_default_ttl_seconds,
+            max_entries=settings.llm_result_cache_max_entries,
+        )
+    return _cache
+
+
+__all__ = [
+    "CachedResult",
+    "LLMResultCache",
+    "ResultCacheMode",
+    "get_llm_result_cache",
+    "topic_cache_ttl",
+]
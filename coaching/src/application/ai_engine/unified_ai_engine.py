@@ -4,15 +4,25 @@ This module provides a unified interface for executing AI requests using
 topic-driven configuration, supporting both single-shot and conversation flows.
 """
 
-import json
 import os
-import re
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 import structlog
 from coaching.src.application.ai_engine.response_serializer import ResponseSerializer
+from coaching.src.application.ai_engine.result_cache import (
+    CachedResult,
+    LLMResultCache,
+    ResultCacheMode,
+    topic_cache_ttl,
+)
 from coaching.src.core.constants import CoachingTopic, MessageRole, TierLevel
+from coaching.src.core.context_window import get_context_window_builder
+from coaching.src.core.llm_models import MODEL_REGISTRY
+from coaching.src.core.response_model_registry import get_schema_artifacts
+from coaching.src.core.template_compiler import compile_template
 from coaching.src.core.topic_registry import get_required_parameter_names_for_topic
 from coaching.src.core.types import ConversationId, TenantId, UserId
 from coaching.src.domain.entities.conversation import Conversation
@@ -20,10 +30,12 @@ from coaching.src.domain.entities.llm_topic import LLMTopic
 from coaching.src.domain.ports.conversation_repository_port import ConversationRepositoryPort
 from coaching.src.domain.ports.llm_provider_port import LLMMessage, LLMProviderPort, LLMResponse
 from coaching.src.domain.value_objects.conversation_context import ConversationContext
+from coaching.src.infrastructure.llm.hedging import HedgePolicy
 from coaching.src.infrastructure.llm.provider_factory import LLMProviderFactory
 from coaching.src.repositories.topic_repository import TopicRepository
 from coaching.src.services.s3_prompt_storage import S3PromptStorage
 from pydantic import BaseModel
+from shared.observability.metrics import get_metrics
 
 if TYPE_CHECKING:
     from coaching.src.services.template_parameter_processor import TemplateParameterProcessor
@@ -115,26 +127,33 @@ class SingleShotExecutionContext:
     response_schema: dict[str, object] | None
     llm_response: LLMResponse
     serialized_response: BaseModel
+    cache_hit: bool = False
 
 
-# Response format instructions template appended to system prompts
-RESPONSE_FORMAT_INSTRUCTIONS = """
-
-## Response Format Instructions
-
-You MUST respond with valid JSON that matches this exact schema:
+@dataclass
+class PreparedSingleShot:
+    """Single-shot request resolved up to the LLM call.
 
-```json
-{schema}
-```
+    Holds the rendered prompts and selected provider so the call can be made
+    either as one blocking request or as a token stream.
+    """
 
-**Important:**
-- Use the exact field names shown above (including camelCase where specified by "alias")
-- Do not include any text before or after the JSON
-- Ensure all required fields are present
-- Follow any constraints (min/max length, enum values, etc.)
-- For text fields with multiple sections or paragraphs, use newlines (\\n) to separate them for readability
-- Preserve logical paragraph breaks in your responses using \\n characters"""
+    topic_id: str
+    topic: LLMTopic
+    response_model: type[BaseModel]
+    parameters: dict[str, Any]
+    enriched_parameters: dict[str, Any]
+    rendered_system_prompt: str
+    rendered_user_prompt: str
+    response_schema: dict[str, object] | None
+    provider: LLMProviderPort
+    model_code: str
+    model_name: str
+    user_tier: TierLevel = TierLevel.ULTIMATE
+    cache_mode: ResultCacheMode = ResultCacheMode.BYPASS
+    cache_scope: str = ""
+    cache_key: str | None = None
+    cache_ttl_seconds: float | None = None
 
 
 class UnifiedAIEngineError(Exception):
@@ -244,6 +263,7 @@ class UnifiedAIEngine:
         response_serializer: ResponseSerializer,
         conversation_repo: ConversationRepositoryPort | None = None,
         llm_provider: LLMProviderPort | None = None,  # Deprecated, use provider_factory
+        result_cache: LLMResultCache | None = None,
     ) -> None:
         """Initialize unified AI engine.
 
@@ -254,6 +274,7 @@ class UnifiedAIEngine:
             response_serializer: Serializer for response formatting
             conversation_repo: Optional repository for conversation persistence
             llm_provider: DEPRECATED - use provider_factory. Kept for backward compat.
+            result_cache: Optional result cache for topics that opt in
         """
         self.topic_repo = topic_repo
         self.s3_storage = s3_storage
@@ -262,6 +283,7 @@ class UnifiedAIEngine:
         self.conversation_repo = conversation_repo
         # Support legacy llm_provider parameter for backward compatibility
         self._legacy_provider = llm_provider
+        self.result_cache = result_cache
         self.logger = logger.bind(service="unified_ai_engine")
 
     async def execute_single_shot(
@@ -275,6 +297,7 @@ class UnifiedAIEngine:
         template_processor: "TemplateParameterProcessor | None" = None,
         allow_inactive: bool = False,
         user_tier: TierLevel = TierLevel.ULTIMATE,
+        cache_mode: ResultCacheMode = ResultCacheMode.USE,
     ) -> BaseModel:
         """Execute single-shot AI request using topic configuration.
 
@@ -299,6 +322,7 @@ class UnifiedAIEngine:
                 (created per-request with user's JWT token for API calls)
             allow_inactive: Allow execution on inactive topics (for testing)
             user_tier: User's subscription tier (default: ULTIMATE for full access)
+            cache_mode: Result cache behaviour for topics that opt in
 
         Returns:
             Instance of response_model with AI-generated data
@@ -319,6 +343,7 @@ class UnifiedAIEngine:
             template_processor=template_processor,
             allow_inactive=allow_inactive,
             user_tier=user_tier,
+            cache_mode=cache_mode,
         )
 
         return context.serialized_response
@@ -334,6 +359,7 @@ class UnifiedAIEngine:
         template_processor: "TemplateParameterProcessor | None" = None,
         allow_inactive: bool = False,
         user_tier: TierLevel = TierLevel.ULTIMATE,
+        cache_mode: ResultCacheMode = ResultCacheMode.USE,
     ) -> SingleShotExecutionContext:
         """Execute single-shot and return debug context with prompts and metadata.
 
@@ -346,6 +372,7 @@ class UnifiedAIEngine:
             template_processor: Optional parameter processor
             allow_inactive: Allow inactive topics
             user_tier: User's subscription tier (default: ULTIMATE)
+            cache_mode: Result cache behaviour for topics that opt in
 
         Returns:
             Full execution context with debug information
@@ -360,21 +387,48 @@ class UnifiedAIEngine:
             template_processor=template_processor,
             allow_inactive=allow_inactive,
             user_tier=user_tier,
+            cache_mode=cache_mode,
         )
 
-    async def _build_single_shot_context(
+    async def prepare_single_shot(
         self,
         *,
         topic_id: str,
         parameters: dict[str, Any],
         response_model: type[BaseModel],
-        user_id: str | None,
-        tenant_id: str | None,
-        template_processor: "TemplateParameterProcessor | None",
-        allow_inactive: bool,
-        user_tier: TierLevel,
-    ) -> SingleShotExecutionContext:
-        """Execute single-shot flow and return full context for debugging."""
+        user_id: str | None = None,
+        tenant_id: str | None = None,
+        template_processor: "TemplateParameterProcessor | None" = None,
+        allow_inactive: bool = False,
+        user_tier: TierLevel = TierLevel.ULTIMATE,
+        cache_mode: ResultCacheMode = ResultCacheMode.USE,
+    ) -> PreparedSingleShot:
+        """Run the single-shot flow up to (not including) the LLM call.
+
+        Covers steps 1-6 of ``execute_single_shot``: topic lookup, tier check,
+        prompt loading, parameter enrichment and validation, prompt rendering
+        and model selection.
+
+        Args:
+            topic_id: Topic identifier
+            parameters: Request parameters to inject into prompts
+            response_model: Expected response model class
+            user_id: Optional user ID for parameter enrichment
+            tenant_id: Optional tenant ID for parameter enrichment
+            template_processor: Optional processor for automatic parameter enrichment
+            allow_inactive: Allow execution on inactive topics (for testing)
+            user_tier: User's subscription tier (default: ULTIMATE for full access)
+            cache_mode: Result cache behaviour for topics that opt in
+
+        Returns:
+            PreparedSingleShot ready for ``stream_single_shot``
+
+        Raises:
+            TopicNotFoundError: If topic doesn't exist or is inactive
+            TopicAccessDeniedError: If user tier cannot access topic tier
+            ParameterValidationError: If required parameters are missing
+            PromptRenderError: If prompt rendering fails
+        """
 
         self.logger.info(
             "Executing single-shot AI request",
@@ -537,7 +591,256 @@ class UnifiedAIEngine:
             model_code=model_code,
             topic_id=topic_id,
         )
-        provider, model_name = self.provider_factory.get_provider_for_model(model_code)
+        provider, model_name = self.provider_factory.get_provider_for_model(
+            model_code,
+            fallback_model_codes=topic.get_fallback_model_codes(),
+            hedge_policy=HedgePolicy.from_config(topic.topic_id, topic.additional_config),
+        )
+
+        prepared = PreparedSingleShot(
+            topic_id=topic_id,
+            topic=topic,
+            response_model=response_model,
+            parameters=parameters,
+            enriched_parameters=enriched_params,
+            rendered_system_prompt=rendered_system,
+            rendered_user_prompt=rendered_user,
+            response_schema=response_schema,
+            provider=provider,
+            model_code=model_code,
+            model_name=model_name,
+            user_tier=user_tier,
+        )
+
+        # Step 6.5: Key the result cache if the topic opted in
+        ttl = (
+            topic_cache_ttl(topic, self.result_cache.default_ttl_seconds)
+            if self.result_cache is not None and cache_mode is not ResultCacheMode.BYPASS
+            else None
+        )
+        if ttl is not None:
+            prepared.cache_mode = cache_mode
+            prepared.cache_scope = str(tenant_id or parameters.get("tenant_id", ""))
+            prepared.cache_ttl_seconds = ttl
+            prepared.cache_key = LLMResultCache.make_key(
+                model_code=model_code,
+                temperature=topic.temperature,
+                max_tokens=topic.max_tokens,
+                system_prompt=rendered_system,
+                user_prompt=rendered_user,
+                response_schema=response_schema,
+                response_model=response_model,
+            )
+
+        return prepared
+
+    def _get_cached_result(self, prepared: PreparedSingleShot) -> CachedResult | None:
+        """Look up a prepared request in the result cache."""
+        if (
+            self.result_cache is None
+            or prepared.cache_key is None
+            or prepared.cache_mode is not ResultCacheMode.USE
+        ):
+            return None
+        cached = self.result_cache.get(prepared.cache_scope, prepared.cache_key)
+        self.logger.info(
+            "result_cache.hit" if cached is not None else "result_cache.miss",
+            topic_id=prepared.topic_id,
+            model_code=prepared.model_code,
+        )
+        return cached
+
+    def _store_cached_result(
+        self, prepared: PreparedSingleShot, result: BaseModel, llm_response: LLMResponse
+    ) -> None:
+        """Store a serialized result for a prepared request, if it is cacheable."""
+        if (
+            self.result_cache is None
+            or prepared.cache_key is None
+            or prepared.cache_ttl_seconds is None
+        ):
+            return
+        self.result_cache.put(
+            prepared.cache_scope,
+            prepared.cache_key,
+            result,
+            llm_response,
+            prepared.cache_ttl_seconds,
+        )
+        self.logger.info(
+            "result_cache.stored",
+            topic_id=prepared.topic_id,
+            ttl_seconds=prepared.cache_ttl_seconds,
+            refresh=prepared.cache_mode is ResultCacheMode.REFRESH,
+        )
+
+    @staticmethod
+    def _record_token_usage(prepared: PreparedSingleShot, usage: dict[str, int]) -> None:
+        """Emit token usage metrics for an LLM call, per topic and tier."""
+        get_metrics().record_llm_tokens(
+            model=prepared.model_code,
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+            topic=prepared.topic_id,
+            tenant_tier=prepared.user_tier.value,
+        )
+
+    async def stream_single_shot(
+        self, prepared: PreparedSingleShot, usage: dict[str, int] | None = None
+    ) -> AsyncIterator[str | BaseModel]:
+        """Stream the LLM output for a prepared single-shot request.
+
+        Yields raw tokens as the provider generates them, then the serialized
+        response model once the full output has arrived. Streaming providers
+        take no response schema, so structure comes from the format
+        instructions already injected into the system prompt.
+
+        Args:
+            prepared: Request returned by ``prepare_single_shot``
+            usage: Optional dict filled with the provider's token usage. Left
+                empty when the result is served from the cache.
+
+        Yields:
+            Token strings, then the instance of ``prepared.response_model``
+
+        Raises:
+            SerializationError: If the completed output cannot be serialized
+        """
+        cached = self._get_cached_result(prepared)
+        if cached is not None:
+            # Replay the cached output as a single chunk
+            yield cached.result.model_dump_json()
+            yield cached.result
+            return
+
+        topic = prepared.topic
+        messages = [LLMMessage(role="user", content=prepared.rendered_user_prompt)]
+
+        self.logger.info(
+            "Streaming LLM provider",
+            topic_id=prepared.topic_id,
+            model_code=prepared.model_code,
+            model_name=prepared.model_name,
+        )
+
+        chunks: list[str] = []
+        stream_usage: dict[str, int] = {}
+        stream = prepared.provider.generate_stream(
+            messages,
+            prepared.model_name,
+            topic.temperature,
+            topic.max_tokens,
+            prepared.rendered_system_prompt,
+            usage=stream_usage,
+        )
+        # Provider streams are async generators; close them promptly on disconnect
+        async with aclosing(cast("AsyncGenerator[str, None]", stream)):
+            async for chunk in stream:
+                chunks.append(chunk)
+                yield chunk
+
+        content = "".join(chunks)
+        serialized = await self.response_serializer.serialize(
+            ai_response=content,
+            response_model=prepared.response_model,
+            topic_id=prepared.topic_id,
+        )
+        self._record_token_usage(prepared, stream_usage)
+        if usage is not None:
+            usage.update(stream_usage)
+        if prepared.cache_key is not None:
+            self._store_cached_result(
+                prepared,
+                serialized,
+                LLMResponse(
+                    content=content,
+                    model=prepared.model_name,
+                    usage=stream_usage,
+                    finish_reason="stop",
+                    provider=prepared.provider.provider_name,
+                ),
+            )
+
+        self.logger.info(
+            "Single-shot stream completed",
+            topic_id=prepared.topic_id,
+            chunk_count=len(chunks),
+            result_type=type(serialized).__name__,
+        )
+
+        yield serialized
+
+    async def _build_single_shot_context(
+        self,
+        *,
+        topic_id: str,
+        parameters: dict[str, Any],
+        response_model: type[BaseModel],
+        user_id: str | None,
+        tenant_id: str | None,
+        template_processor: "TemplateParameterProcessor | None",
+        allow_inactive: bool,
+        user_tier: TierLevel,
+        cache_mode: ResultCacheMode,
+    ) -> SingleShotExecutionContext:
+        """Execute single-shot flow and return full context for debugging."""
+        prepared = await self.prepare_single_shot(
+            topic_id=topic_id,
+            parameters=parameters,
+            response_model=response_model,
+            user_id=user_id,
+            tenant_id=tenant_id,
+            template_processor=template_processor,
+            allow_inactive=allow_inactive,
+            user_tier=user_tier,
+            cache_mode=cache_mode,
+        )
+        return await self.complete_single_shot(prepared)
+
+    async def complete_single_shot(
+        self, prepared: PreparedSingleShot
+    ) -> SingleShotExecutionContext:
+        """Run the LLM call for a prepared single-shot request.
+
+        Covers steps 7-8 of ``execute_single_shot``: the LLM call (or a result
+        cache hit) and response serialization.
+
+        Args:
+            prepared: Request returned by ``prepare_single_shot``
+
+        Returns:
+            Execution context holding the serialized response
+
+        Raises:
+            SerializationError: If response serialization fails
+        """
+        topic_id = prepared.topic_id
+        response_model = prepared.response_model
+        parameters = prepared.parameters
+        topic = prepared.topic
+        enriched_params = prepared.enriched_parameters
+        rendered_system = prepared.rendered_system_prompt
+        rendered_user = prepared.rendered_user_prompt
+        response_schema = prepared.response_schema
+        provider = prepared.provider
+        model_code = prepared.model_code
+        model_name = prepared.model_name
+
+        # Step 6.5: Serve an identical earlier request from the result cache
+        cached = self._get_cached_result(prepared)
+        if cached is not None:
+            return SingleShotExecutionContext(
+                topic_id=topic_id,
+                response_model_name=response_model.__name__,
+                rendered_system_prompt=rendered_system,
+                rendered_user_prompt=rendered_user,
+                enriched_parameters=enriched_params,
+                response_schema=response_schema,
+                llm_response=cached.llm_response,
+                serialized_response=cached.result,
+                cache_hit=True,
+            )
 
         # Step 7: Call LLM with topic configuration
         messages = [LLMMessage(role="user", content=rendered_user)]
@@ -580,8 +883,11 @@ class UnifiedAIEngine:
             topic_id=topic_id,
             model=llm_response.model,
             tokens_used=llm_response.usage.get("total_tokens", 0),
+            cache_read_tokens=llm_response.usage.get("cache_read_tokens", 0),
+            cache_write_tokens=llm_response.usage.get("cache_write_tokens", 0),
             finish_reason=llm_response.finish_reason,
         )
+        self._record_token_usage(prepared, llm_response.usage)
 
         _log_ai_debug(
             "LLM response received",
@@ -601,6 +907,8 @@ class UnifiedAIEngine:
             topic_id=topic_id,
         )
 
+        self._store_cached_result(prepared, serialized, llm_response)
+
         self.logger.info(
             "Single-shot execution completed",
             topic_id=topic_id,
@@ -702,6 +1010,12 @@ class UnifiedAIEngine:
             required_params=required_params,
         )
 
+        self.logger.info(
+            "Retrieval methods completed",
+            topic_id=topic.topic_id,
+            method_latencies_ms=result.method_latencies_ms,
+        )
+
         # Log any warnings
         if result.warnings:
             for warning in result.warnings:
@@ -879,6 +1193,9 @@ class UnifiedAIEngine:
         - Jinja2-style: {{param_name}} -> value
         - Python-style: {param_name} -> value (backward compatibility)
 
+        The template is parsed once (cached by content hash) and rendered in a
+        single pass; see ``coaching.src.core.template_compiler``.
+
         Args:
             template: Template string with placeholders
             params: Parameter name to value mapping
@@ -886,20 +1203,7 @@ class UnifiedAIEngine:
         Returns:
             Template with all placeholders substituted
         """
-        result = template
-
-        # First, substitute Jinja2-style double braces {{param}}
-        for name, value in params.items():
-            result = result.replace(f"{{{{{name}}}}}", value)
-
-        # Then, substitute Python-style single braces {param}
-        # Use regex to avoid matching {{escaped}} patterns
-        for name, value in params.items():
-            # Match {name} but not {{name}}
-            pattern = r"(?<!\{)\{" + re.escape(name) + r"\}(?!\})"
-            result = re.sub(pattern, value.replace("\\", "\\\\"), result)
-
-        return result
+        return compile_template(template).render(params)
 
     def _inject_response_format_with_schema(
         self,
@@ -920,32 +1224,18 @@ class UnifiedAIEngine:
             Tuple of (updated system prompt, JSON schema for structured output)
         """
         try:
-            # Get full schema for structured output (OpenAI Responses API)
-            # Use by_alias=True to ensure camelCase field names match the aliases
-            full_schema = response_model.model_json_schema(by_alias=True)
-
-            # Prepare schema for OpenAI structured output (needs specific format)
-            structured_schema = self._prepare_schema_for_structured_output(
-                full_schema, response_model.__name__
-            )
-
-            # Create a simplified schema for the prompt (remove internal details)
-            simplified = self._simplify_schema_for_prompt(full_schema)
-
-            # Format as pretty JSON
-            schema_json = json.dumps(simplified, indent=2)
-
-            # Append format instructions to system prompt
-            format_instructions = RESPONSE_FORMAT_INSTRUCTIONS.format(schema=schema_json)
+            # Schema forms are built once per model class and shared process-wide
+            artifacts = get_schema_artifacts(response_model)
+            structured_schema = artifacts.strict_schema()
 
             self.logger.debug(
                 "Injected response format instructions with schema",
                 response_model=response_model.__name__,
-                schema_size=len(schema_json),
+                schema_size=len(artifacts.prompt_schema_json),
                 has_structured_schema=structured_schema is not None,
             )
 
-            return system_prompt + format_instructions, structured_schema
+            return system_prompt + artifacts.format_instructions, structured_schema
 
         except Exception as e:
             # If schema generation fails, log warning but don't fail the request
@@ -956,82 +1246,6 @@ class UnifiedAIEngine:
             )
             return system_prompt, None
 
-    def _prepare_schema_for_structured_output(
-        self,
-        schema: dict[str, Any],
-        model_name: str,
-    ) -> dict[str, Any]:
-        """Prepare JSON schema for OpenAI structured output format.
-
-        OpenAI's structured output requires a specific schema format with
-        additionalProperties set to false for strict validation.
-
-        Args:
-            schema: Pydantic JSON schema
-            model_name: Name of the response model
-
-        Returns:
-            Schema prepared for OpenAI structured output
-        """
-        # Create a copy to avoid modifying the original
-        prepared = dict(schema)
-
-        # Ensure title is set
-        if "title" not in prepared:
-            prepared["title"] = model_name
-
-        # Add additionalProperties: false for strict mode
-        prepared["additionalProperties"] = False
-
-        # Recursively add additionalProperties to nested objects
-        self._add_additional_properties_false(prepared)
-
-        return prepared
-
-    def _add_additional_properties_false(self, schema: dict[str, Any]) -> None:
-        """Recursively add additionalProperties: false to all object schemas.
-
-        OpenAI's structured output with additionalProperties: false requires:
-        1. ALL properties to be in the 'required' array, even those with defaults
-        2. $ref cannot have sibling keywords like 'description'
-
-        Args:
-            schema: JSON schema dict to modify in place
-        """
-        # Fix $ref with extra keywords (OpenAI doesn't allow this)
-        if "$ref" in schema:
-            # Remove all keys except $ref to comply with OpenAI's strict validation
-            ref_value = schema["$ref"]
-            schema.clear()
-            schema["$ref"] = ref_value
-            return  # $ref properties don't need further processing
-
-        if schema.get("type") == "object":
-            schema["additionalProperties"] = False
-
-            properties = schema.get("properties", {})
-            if properties:
-                # OpenAI requires ALL properties in 'required' when using additionalProperties: false
-                # This is different from Pydantic's default which only includes fields without defaults
-                schema["required"] = list(properties.keys())
-
-            for prop in properties.values():
-                self._add_additional_properties_false(prop)
-
-        # Handle $defs (nested model definitions)
-        for definition in schema.get("$defs", {}).values():
-            self._add_additional_properties_false(definition)
-
-        # Handle items in arrays
-        if "items" in schema:
-            self._add_additional_properties_false(schema["items"])
-
-        # Handle anyOf/oneOf/allOf
-        for key in ["anyOf", "oneOf", "allOf"]:
-            if key in schema:
-                for item in schema[key]:
-                    self._add_additional_properties_false(item)
-
     def _inject_response_format(
         self,
         system_prompt: str,
@@ -1054,98 +1268,6 @@ class UnifiedAIEngine:
         result, _ = self._inject_response_format_with_schema(system_prompt, response_model)
         return result
 
-    def _simplify_schema_for_prompt(
-        self, schema: dict[str, Any], root_schema: dict[str, Any] | None = None
-    ) -> dict[str, Any]:
-        """Simplify JSON schema for LLM prompt injection.
-
-        Removes internal Pydantic details and creates a cleaner schema
-        that's easier for the LLM to understand.
-
-        Args:
-            schema: Schema (or sub-schema) to simplify
-            root_schema: Full root schema with $defs (for resolving nested refs)
-
-        Returns:
-            Simplified schema dict
-        """
-        # On first call, root_schema is the schema itself
-        if root_schema is None:
-            root_schema = schema
-
-        result: dict[str, Any] = {}
-
-        # Include title if present
-        if "title" in schema:
-            result["title"] = schema["title"]
-
-        # Process properties
-        if "properties" in schema:
-            result["properties"] = {}
-            for name, prop in schema["properties"].items():
-                # Handle direct $ref properties (e.g., "data": {"$ref": "#/$defs/SomeModel"})
-                if "$ref" in prop:
-                    ref_name = prop["$ref"].split("/")[-1]
-                    if "$defs" in root_schema and ref_name in root_schema["$defs"]:
-                        # Recursively simplify the referenced schema, passing root_schema
-                        result["properties"][name] = self._simplify_schema_for_prompt(
-                            root_schema["$defs"][ref_name], root_schema
-                        )
-                    else:
-                        # Reference not found, keep empty object
-                        result["properties"][name] = {}
-                    continue
-
-                simplified_prop: dict[str, Any] = {}
-
-                # Include type
-                if "type" in prop:
-                    simplified_prop["type"] = prop["type"]
-                elif "anyOf" in prop:
-                    # Handle Optional types
-                    types = [t.get("type") for t in prop["anyOf"] if "type" in t]
-                    simplified_prop["type"] = types[0] if types else "any"
-
-                # Include description
-                if "description" in prop:
-                    simplified_prop["description"] = prop["description"]
-
-                # Include constraints
-                for constraint in [
-                    "minLength",
-                    "maxLength",
-                    "minimum",
-                    "maximum",
-                    "minItems",
-                    "maxItems",
-                    "enum",
-                ]:
-                    if constraint in prop:
-                        simplified_prop[constraint] = prop[constraint]
-
-                # Handle array items
-                if prop.get("type") == "array" and "items" in prop:
-                    items = prop["items"]
-                    if "$ref" in items:
-                        # Resolve reference from root schema $defs
-                        ref_name = items["$ref"].split("/")[-1]
-                        if "$defs" in root_schema and ref_name in root_schema["$defs"]:
-                            simplified_prop["items"] = self._simplify_schema_for_prompt(
-                                root_schema["$defs"][ref_name], root_schema
-                            )
-                    else:
-                        simplified_prop["items"] = self._simplify_schema_for_prompt(
-                            items, root_schema
-                        )
-
-                result["properties"][name] = simplified_prop
-
-        # Include required fields
-        if "required" in schema:
-            result["required"] = schema["required"]
-
-        return result
-
     # ========== Conversation Methods ==========
 
     async def get_initial_prompt(self, topic_id: str) -> str:
@@ -1289,9 +1411,6 @@ class UnifiedAIEngine:
             )
             raise TopicAccessDeniedError(conversation.topic, user_tier, topic.tier_level)
 
-        # Build conversation history for context
-        messages = self._build_message_history(conversation, user_message)
-
         # Load system prompt
         system_prompt_content = await self._load_prompt(topic, "system")
         rendered_system = self._render_prompt(
@@ -1309,7 +1428,20 @@ class UnifiedAIEngine:
             model_code=model_code,
             conversation_id=conversation_id,
         )
-        provider, model_name = self.provider_factory.get_provider_for_model(model_code)
+        provider, model_name = self.provider_factory.get_provider_for_model(
+            model_code,
+            fallback_model_codes=topic.get_fallback_model_codes(),
+            hedge_policy=HedgePolicy.from_config(topic.topic_id, topic.additional_config),
+        )
+
+        # Build conversation history packed into the model's input budget
+        messages = self._build_message_history(
+            conversation,
+            user_message,
+            model_code=model_code,
+            system_prompt=rendered_system,
+            max_output_tokens=topic.max_tokens,
+        )
 
         # Call LLM with resolved model name
         llm_response = await provider.generate(
@@ -1336,7 +1468,10 @@ class UnifiedAIEngine:
         self.logger.info(
             "Message sent successfully",
             conversation_id=conversation_id,
+            topic_id=topic.topic_id,
             response_length=len(llm_response.content),
+            cache_read_tokens=llm_response.usage.get("cache_read_tokens", 0),
+            cache_write_tokens=llm_response.usage.get("cache_write_tokens", 0),
         )
 
         return response_data
@@ -1433,25 +1568,41 @@ class UnifiedAIEngine:
         return conversation
 
     def _build_message_history(
-        self, conversation: Conversation, new_message: str
+        self,
+        conversation: Conversation,
+        new_message: str,
+        *,
+        model_code: str | None = None,
+        system_prompt: str | None = None,
+        max_output_tokens: int = 0,
+        max_history_tokens: int | None = None,
     ) -> list[LLMMessage]:
         """Build message history for LLM context.
 
+        History is packed newest first into the selected model's input budget
+        (see ContextWindowBuilder).
+
         Args:
             conversation: Conversation entity with history
-            new_message: New user message to add
+            new_message: New user message to add (always included)
+            model_code: Selected model code from MODEL_REGISTRY
+            system_prompt: Rendered system prompt sent with the history
+            max_output_tokens: Output tokens the call will request
+            max_history_tokens: Optional per-call bound on history tokens
 
         Returns:
             List of LLM messages including history and new message
         """
-        messages = []
-
-        # Add conversation history (limit to recent messages for context window)
-        max_history = 10  # Configurable based on model context window
-        recent_messages = conversation.messages[-max_history:]
+        window = get_context_window_builder().build(
+            model=MODEL_REGISTRY.get(model_code) if model_code else None,
+            system_prompt=system_prompt,
+            history=conversation.messages,
+            max_output_tokens=max_output_tokens,
+            new_message=new_message,
+            max_history_tokens=max_history_tokens,
+        )
 
-        for msg in recent_messages:
-            messages.append(LLMMessage(role=msg.role, content=msg.content))
+        messages = [LLMMessage(role=msg.role, content=msg.content) for msg in window.history]
 
         # Add new user message
         messages.append(LLMMessage(role="user", content=new_message))
@@ -1461,6 +1612,7 @@ class UnifiedAIEngine:
 
 __all__ = [
     "ParameterValidationError",
+    "PreparedSingleShot",
     "PromptRenderError",
     "TopicNotFoundError",
     "UnifiedAIEngine",
@@ -74,6 +74,14 @@ class Settings(BaseSettings):
         validation_alias="BUSINESS_API_MAX_RETRIES",
     )
 
+    # Parameter enrichment (retrieval methods run concurrently)
+    enrichment_max_concurrency: int = Field(
+        default=5, validation_alias="ENRICHMENT_MAX_CONCURRENCY"
+    )
+    enrichment_method_timeout_seconds: float = Field(
+        default=10.0, validation_alias="ENRICHMENT_METHOD_TIMEOUT_SECONDS"
+    )
+
 
 @lru_cache
 def get_settings() -> Settings:
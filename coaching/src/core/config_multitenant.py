@@ -35,6 +35,23 @@ class Settings(BaseSettings):
         default="https://dev.purposepath.app", validation_alias="JWT_AUDIENCE"
     )
 
+    # JWT secret and decoded-claims caching
+    jwt_secret_cache_ttl_seconds: float = Field(
+        default=900.0, validation_alias="JWT_SECRET_CACHE_TTL_SECONDS"
+    )
+    jwt_secret_refresh_ahead_seconds: float = Field(
+        default=60.0, validation_alias="JWT_SECRET_REFRESH_AHEAD_SECONDS"
+    )
+    jwt_secret_min_refresh_interval_seconds: float = Field(
+        default=30.0, validation_alias="JWT_SECRET_MIN_REFRESH_INTERVAL_SECONDS"
+    )
+    jwt_claims_cache_max_entries: int = Field(
+        default=1024, validation_alias="JWT_CLAIMS_CACHE_MAX_ENTRIES"
+    )
+    jwt_claims_cache_ttl_seconds: float = Field(
+        default=300.0, validation_alias="JWT_CLAIMS_CACHE_TTL_SECONDS"
+    )
+
     def get_jwt_secret_name(self) -> str:
         """Get JWT secret name with environment suffix."""
         if self.jwt_secret_name:
@@ -53,6 +70,11 @@ class Settings(BaseSettings):
         """Get coaching sessions table name."""
         return f"purposepath-coaching-sessions-{self.stage}"
 
+    @property
+    def coaching_session_messages_table(self) -> str:
+        """Get coaching session messages table name (append-only message items)."""
+        return f"purposepath-coaching-session-messages-{self.stage}"
+
     @property
     def business_data_table(self) -> str:
         """Get business data table name."""
@@ -78,6 +100,21 @@ class Settings(BaseSettings):
         """Get template metadata table name."""
         return f"prompt_templates_metadata_{self.stage}"
 
+    # Store coaching session messages as separate items in the messages table
+    # (requires the table to be deployed; existing sessions migrate on next update)
+    coaching_session_message_items_enabled: bool = Field(
+        default=False, validation_alias="COACHING_SESSION_MESSAGE_ITEMS_ENABLED"
+    )
+
+    # Refresh a partial coaching result in the background after each turn, so
+    # completion validates it instead of extracting from the whole transcript
+    coaching_incremental_extraction_enabled: bool = Field(
+        default=False, validation_alias="COACHING_INCREMENTAL_EXTRACTION_ENABLED"
+    )
+    coaching_extraction_wait_seconds: float = Field(
+        default=5.0, validation_alias="COACHING_EXTRACTION_WAIT_SECONDS"
+    )
+
     # Optional: Allow override via env var for local development
     dynamodb_endpoint: str | None = None
 
@@ -85,6 +122,23 @@ class Settings(BaseSettings):
     prompts_bucket: str = Field(
         default="purposepath-coaching-prompts-dev", validation_alias="PROMPTS_BUCKET"
     )
+    prompt_cache_max_entries: int = Field(default=256, validation_alias="PROMPT_CACHE_MAX_ENTRIES")
+    prompt_cache_revalidate_seconds: float = Field(
+        default=60.0, validation_alias="PROMPT_CACHE_REVALIDATE_SECONDS"
+    )
+
+    # Blocking AWS SDK calls run on per-service bounded thread pools
+    aws_io_dynamodb_concurrency: int = Field(
+        default=16, validation_alias="AWS_IO_DYNAMODB_CONCURRENCY"
+    )
+    aws_io_s3_concurrency: int = Field(default=8, validation_alias="AWS_IO_S3_CONCURRENCY")
+    # Bedrock calls and streaming reads hold a thread for the whole generation
+    aws_io_bedrock_concurrency: int = Field(
+        default=32, validation_alias="AWS_IO_BEDROCK_CONCURRENCY"
+    )
+    aws_io_default_concurrency: int = Field(
+        default=8, validation_alias="AWS_IO_DEFAULT_CONCURRENCY"
+    )
 
     # Redis/ElastiCache
     redis_cluster_endpoint: str | None = Field(
@@ -112,6 +166,116 @@ class Settings(BaseSettings):
         default="https://api.dev.purposepath.app",
         validation_alias="ACCOUNT_API_URL",
     )
+
+    # Shared HTTP connection pool for Business API calls
+    http_pool_max_connections: int = Field(default=50, validation_alias="HTTP_POOL_MAX_CONNECTIONS")
+    http_pool_max_keepalive_connections: int = Field(
+        default=20, validation_alias="HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    http_pool_keepalive_expiry_seconds: float = Field(
+        default=30.0, validation_alias="HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS"
+    )
+
+    # Business API response cache (per process, tenant scoped)
+    business_api_cache_enabled: bool = Field(
+        default=True, validation_alias="BUSINESS_API_CACHE_ENABLED"
+    )
+    business_api_cache_default_ttl_seconds: float = Field(
+        default=60.0, validation_alias="BUSINESS_API_CACHE_DEFAULT_TTL_SECONDS"
+    )
+    business_api_cache_max_entries: int = Field(
+        default=2048, validation_alias="BUSINESS_API_CACHE_MAX_ENTRIES"
+    )
+
+    # Conversation context window (history packed into the model's input budget)
+    context_history_max_tokens: int = Field(
+        default=32000, validation_alias="CONTEXT_HISTORY_MAX_TOKENS"
+    )
+    context_safety_margin_tokens: int = Field(
+        default=1024, validation_alias="CONTEXT_SAFETY_MARGIN_TOKENS"
+    )
+
+    # Insights snapshots (per process, keyed by tenant + business data fingerprint)
+    insights_snapshot_enabled: bool = Field(
+        default=True, validation_alias="INSIGHTS_SNAPSHOT_ENABLED"
+    )
+    insights_snapshot_ttl_seconds: float = Field(
+        default=900.0, validation_alias="INSIGHTS_SNAPSHOT_TTL_SECONDS"
+    )
+    insights_snapshot_max_entries: int = Field(
+        default=512, validation_alias="INSIGHTS_SNAPSHOT_MAX_ENTRIES"
+    )
+
+    # Single-shot LLM result cache (topics opt in via additional_config)
+    llm_result_cache_enabled: bool = Field(
+        default=True, validation_alias="LLM_RESULT_CACHE_ENABLED"
+    )
+    llm_result_cache_default_ttl_seconds: float = Field(
+        default=3600.0, validation_alias="LLM_RESULT_CACHE_DEFAULT_TTL_SECONDS"
+    )
+    llm_result_cache_max_entries: int = Field(
+        default=1024, validation_alias="LLM_RESULT_CACHE_MAX_ENTRIES"
+    )
+
+    # LLM failover across providers (topics list fallback_model_codes)
+    llm_failover_enabled: bool = Field(default=True, validation_alias="LLM_FAILOVER_ENABLED")
+    llm_failover_attempt_timeout_seconds: float | None = Field(
+        default=20.0, validation_alias="LLM_FAILOVER_ATTEMPT_TIMEOUT_SECONDS"
+    )
+    llm_circuit_failure_threshold: int = Field(
+        default=5, validation_alias="LLM_CIRCUIT_FAILURE_THRESHOLD"
+    )
+    llm_circuit_recovery_seconds: float = Field(
+        default=30.0, validation_alias="LLM_CIRCUIT_RECOVERY_SECONDS"
+    )
+    llm_latency_window: int = Field(default=100, validation_alias="LLM_LATENCY_WINDOW")
+    llm_latency_min_samples: int = Field(default=5, validation_alias="LLM_LATENCY_MIN_SAMPLES")
+
+    # Hedged LLM requests (topics opt in via additional_config)
+    llm_hedging_enabled: bool = Field(default=True, validation_alias="LLM_HEDGING_ENABLED")
+    llm_hedge_budget_ratio: float = Field(default=0.1, validation_alias="LLM_HEDGE_BUDGET_RATIO")
+    llm_hedge_budget_burst: float = Field(default=10.0, validation_alias="LLM_HEDGE_BUDGET_BURST")
+    llm_hedge_default_delay_ms: float = Field(
+        default=3000.0, validation_alias="LLM_HEDGE_DEFAULT_DELAY_MS"
+    )
+    llm_hedge_min_delay_ms: float = Field(default=100.0, validation_alias="LLM_HEDGE_MIN_DELAY_MS")
+
+    # LangGraph workflow orchestrator (per process; checkpoints also go to the cache service)
+    workflow_state_max_entries: int = Field(
+        default=1000, validation_alias="WORKFLOW_STATE_MAX_ENTRIES"
+    )
+    workflow_graph_cache_max_entries: int = Field(
+        default=32, validation_alias="WORKFLOW_GRAPH_CACHE_MAX_ENTRIES"
+    )
+
+    # API rate limiting ("local" per-process buckets or "redis" shared buckets)
+    rate_limit_backend: str = Field(default="local", validation_alias="RATE_LIMIT_BACKEND")
+    rate_limit_max_buckets: int = Field(default=10000, validation_alias="RATE_LIMIT_MAX_BUCKETS")
+    rate_limit_lease_size: int = Field(default=10, validation_alias="RATE_LIMIT_LEASE_SIZE")
+    rate_limit_lease_ttl_seconds: float = Field(
+        default=1.0, validation_alias="RATE_LIMIT_LEASE_TTL_SECONDS"
+    )
+    # Token cost per request, keyed "[METHOD ]path_prefix" (longest match wins).
+    # Paths are relative to api_prefix, so they survive an API version change.
+    rate_limit_endpoint_costs: dict[str, int] = Field(
+        default_factory=lambda: {
+            "POST /ai/execute": 5,
+            "POST /ai/coaching/message": 3,
+        },
+        validation_alias="RATE_LIMIT_ENDPOINT_COSTS",
+    )
+
+    # Lambda cold start: "lazy" builds the HTTP app on the first HTTP event so
+    # EventBridge jobs skip route imports; "eager" builds it during init
+    cold_start_mode: str = Field(default="lazy", validation_alias="COLD_START_MODE")
+
+    # Parameter enrichment (retrieval methods run concurrently)
+    enrichment_max_concurrency: int = Field(
+        default=5, validation_alias="ENRICHMENT_MAX_CONCURRENCY"
+    )
+    enrichment_method_timeout_seconds: float = Field(
+        default=10.0, validation_alias="ENRICHMENT_METHOD_TIMEOUT_SECONDS"
+    )
     cors_origins: list[str] = Field(
         default_factory=lambda: [
             "http://localhost:3000",
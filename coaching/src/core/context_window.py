@@ -0,0 +1,234 @@
+"""Token-budgeted context window for conversation flows.
+
+Every conversational LLM call sends a system prompt, some history and usually
+a new message. The history is the part that grows, so it is packed newest
+first into whatever input budget is left:
+
+    input budget = model input limit - reserved output tokens - safety margin
+    history budget = min(input budget - system prompt - new message,
+                         max_history_tokens)
+
+The model limits come from MODEL_REGISTRY (``SupportedModel.input_token_limit``)
+and the output reservation is the ``max_tokens`` the call will request. The
+cut point is found with a prefix-sum search over per-message token counts
+(see ``token_budget``); callers holding cached counts can pass them in,
+otherwise the cheap chars/4 estimate is used.
+
+When older messages are dropped, an optional ``summarize`` callback can turn
+them into a rolling summary that is appended to the system prompt (its tokens
+are taken from the history budget).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+import structlog
+from coaching.src.core.llm_models import SupportedModel
+from coaching.src.core.token_budget import estimate_tokens, find_cut_index, prefix_sums
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+# Role/framing tokens added per message by chat formats
+MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_HEADING = "## Earlier Conversation Summary"
+
+
+def _message_content(message: Any) -> str:
+    if isinstance(message, Mapping):
+        return str(message.get("content", ""))
+    return str(message.content)
+
+
+@dataclass(frozen=True)
+class ContextWindow(Generic[T]):
+    """Result of packing a conversation into a model's input budget.
+
+    Attributes:
+        system_prompt: System prompt to send (with the rolling summary, if any)
+        history: Retained history messages, oldest first
+        dropped: Number of older history messages left out
+        summary: Rolling summary of the dropped messages, if one was produced
+        history_tokens: Estimated tokens of the retained history
+        input_tokens: Estimated tokens of the whole request input
+        budget_tokens: Input budget the window was packed into
+    """
+
+    system_prompt: str | None
+    history: list[T]
+    dropped: int
+    summary: str | None
+    history_tokens: int
+    input_tokens: int
+    budget_tokens: int
+
+
+class ContextWindowBuilder:
+    """Packs conversation history into a model's input token budget."""
+
+    def __init__(
+        self,
+        *,
+        max_history_tokens: int | None = None,
+        safety_margin_tokens: int = 1024,
+        default_context_tokens: int = 128000,
+        message_overhead_tokens: int = MESSAGE_OVERHEAD_TOKENS,
+        token_counter: Callable[[str], int] = estimate_tokens,
+    ) -> None:
+        """Initialize the builder.
+
+        Args:
+            max_history_tokens: Upper bound on history tokens regardless of the
+                model's context size (None for no bound)
+            safety_margin_tokens: Tokens kept free for estimation error
+            default_context_tokens: Input limit used when the model is unknown
+            message_overhead_tokens: Tokens added per message for role framing
+            token_counter: Token counter for text without a cached count
+        """
+        self.max_history_tokens = max_history_tokens
+        self.safety_margin_tokens = safety_margin_tokens
+        self.default_context_tokens = default_context_tokens
+        self.message_overhead_tokens = message_overhead_tokens
+        self.token_counter = token_counter
+
+    def input_budget(self, model: SupportedModel | None, max_output_tokens: int) -> int:
+        """Get the input token budget for a model.
+
+        Args:
+            model: Resolved model (None uses the default context size)
+            max_output_tokens: Output tokens the call will request
+
+        Returns:
+            Tokens available for the request input
+        """
+        limit = model.input_token_limit if model is not None else self.default_context_tokens
+        return max(0, limit - max_output_tokens - self.safety_margin_tokens)
+
+    def build(
+        self,
+        *,
+        model: SupportedModel | None,
+        system_prompt: str | None,
+        history: Sequence[T],
+        max_output_tokens: int,
+        new_message: str | None = None,
+        token_counts: Sequence[int] | None = None,
+        keep_last: bool = False,
+        summarize: Callable[[Sequence[T]], str] | None = None,
+        max_history_tokens: int | None = None,
+    ) -> ContextWindow[T]:
+        """Pack history into the model's input budget, newest messages first.
+
+        Args:
+            model: Resolved model from MODEL_REGISTRY (None if unknown)
+            system_prompt: Rendered system prompt
+            history: Conversation history, oldest first (dicts or objects with
+                ``content``)
+            max_output_tokens: Output tokens the call will request
+            new_message: New user message sent after the history, if separate
+            token_counts: Cached token counts for ``history`` (estimated if None)
+            keep_last: Always keep the newest history message (when it is the
+                message being answered)
+            summarize: Optional callback producing a summary of dropped messages
+            max_history_tokens: Per-call override of the history bound
+
+        Returns:
+            ContextWindow with the retained history and accounting
+        """
+        counts = self._message_tokens(history, token_counts)
+        fixed_tokens = self._text_tokens(system_prompt) + self._text_tokens(new_message)
+        budget = self.input_budget(model, max_output_tokens)
+
+        history_budget = max(0, budget - fixed_tokens)
+        bound = max_history_tokens if max_history_tokens is not None else self.max_history_tokens
+        if bound is not None:
+            history_budget = min(history_budget, bound)
+
+        prefix = prefix_sums(counts)
+        start = self._cut(prefix, history_budget, keep_last)
+
+        summary: str | None = None
+        if start > 0 and summarize is not None:
+            summary = summarize(history[:start]) or None
+            if summary is not None:
+                summary_tokens = self._text_tokens(summary)
+                refined = self._cut(prefix, max(0, history_budget - summary_tokens), keep_last)
+                if refined > start:
+                    start = refined
+                    summary = summarize(history[:start]) or None
+
+        final_prompt = system_prompt
+        if summary:
+            final_prompt = f"{system_prompt or ''}\n\n{SUMMARY_HEADING}\n{summary}".lstrip()
+
+        history_tokens = prefix[-1] - prefix[start]
+        window = ContextWindow(
+            system_prompt=final_prompt,
+            history=list(history[start:]),
+            dropped=start,
+            summary=summary,
+            history_tokens=history_tokens,
+            input_tokens=self._text_tokens(final_prompt)
+            + self._text_tokens(new_message)
+            + history_tokens,
+            budget_tokens=budget,
+        )
+        if start:
+            logger.info(
+                "context_window.history_trimmed",
+                model=model.code if model is not None else None,
+                dropped=start,
+                retained=len(window.history),
+                history_tokens=history_tokens,
+                budget_tokens=budget,
+                summarized=summary is not None,
+            )
+        return window
+
+    def _cut(self, prefix: Sequence[int], budget: int, keep_last: bool) -> int:
+        start = find_cut_index(prefix, budget)
+        if keep_last and len(prefix) > 1:
+            start = min(start, len(prefix) - 2)
+        return start
+
+    def _message_tokens(
+        self, history: Sequence[Any], token_counts: Sequence[int] | None
+    ) -> list[int]:
+        if token_counts is not None and len(token_counts) == len(history):
+            return [count + self.message_overhead_tokens for count in token_counts]
+        return [self._text_tokens(_message_content(message)) for message in history]
+
+    def _text_tokens(self, text: str | None) -> int:
+        if not text:
+            return 0
+        return self.token_counter(text) + self.message_overhead_tokens
+
+
+_builder: ContextWindowBuilder | None = None
+
+
+def get_context_window_builder() -> ContextWindowBuilder:
+    """Get the process-wide context window builder configured from settings."""
+    global _builder
+    from coaching.src.core.config_multitenant import settings
+
+    if _builder is None:
+        _builder = ContextWindowBuilder(
+            # 0 or less disables the bound; the model's limits still apply
+            max_history_tokens=settings.context_history_max_tokens or None,
+            safety_margin_tokens=settings.context_safety_margin_tokens,
+        )
+    return _builder
+
+
+__all__ = [
+    "MESSAGE_OVERHEAD_TOKENS",
+    "ContextWindow",
+    "ContextWindowBuilder",
+    "get_context_window_builder",
+]
@@ -46,6 +46,8 @@ class SupportedModel:
         max_tokens: Maximum tokens supported by model
         cost_per_1k_tokens: Cost per 1000 tokens (for tracking)
         is_active: Whether model is currently active/available
+        context_window: Input context size in tokens, when it differs from
+            max_tokens (models whose max_tokens is the output limit)
     """
 
     code: str
@@ -57,6 +59,12 @@ class SupportedModel:
     max_tokens: int
     cost_per_1k_tokens: float
     is_active: bool = True
+    context_window: int | None = None
+
+    @property
+    def input_token_limit(self) -> int:
+        """Maximum input context in tokens."""
+        return self.context_window or self.max_tokens
 
 
 # Registry of ALL supported models
@@ -80,6 +88,7 @@ MODEL_REGISTRY: dict[str, SupportedModel] = {
         provider_class="BedrockLLMProvider",
         capabilities=["chat", "analysis", "streaming", "function_calling"],
         max_tokens=4096,
+        context_window=200000,
         cost_per_1k_tokens=0.003,
         is_active=True,
     ),
@@ -91,6 +100,7 @@ MODEL_REGISTRY: dict[str, SupportedModel] = {
         provider_class="BedrockLLMProvider",
         capabilities=["chat", "analysis", "streaming"],
         max_tokens=4096,
+        context_window=200000,
         cost_per_1k_tokens=0.00025,
         is_active=True,
     ),
@@ -102,6 +112,7 @@ MODEL_REGISTRY: dict[str, SupportedModel] = {
         provider_class="BedrockLLMProvider",
         capabilities=["chat", "analysis", "streaming", "function_calling", "vision"],
         max_tokens=8192,
+        context_window=200000,
         cost_per_1k_tokens=0.003,
         is_active=True,
     ),
@@ -120,6 +131,7 @@ MODEL_REGISTRY: dict[str, SupportedModel] = {
             "extended_context",
         ],
         max_tokens=8192,
+        context_window=200000,
         cost_per_1k_tokens=0.0008,
         is_active=True,
     ),
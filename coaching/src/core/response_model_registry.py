@@ -7,8 +7,18 @@ Used by the generic AI execute endpoint to:
 1. Validate AI responses against expected schemas
 2. Return JSON schemas for documentation
 3. Support dynamic response model resolution
+
+Schema artifacts:
+    Building the JSON schema, the strict structured-output schema and the
+    prompt format instructions for a model is a pure function of the model
+    class, so ``get_schema_artifacts`` builds them once per class and caches
+    them. Artifacts are immutable (stored as JSON text); accessors return
+    fresh copies callers may modify.
 """
 
+import json
+import threading
+from dataclasses import dataclass
 from typing import Any
 
 import structlog
@@ -112,6 +122,280 @@ RESPONSE_MODEL_REGISTRY: dict[str, type[BaseModel]] = {
 }
 
 
+# Response format instructions template appended to system prompts
+RESPONSE_FORMAT_INSTRUCTIONS = """
+
+## Response Format Instructions
+
+You MUST respond with valid JSON that matches this exact schema:
+
+```json
+{schema}
+```
+
+**Important:**
+- Use the exact field names shown above (including camelCase where specified by "alias")
+- Do not include any text before or after the JSON
+- Ensure all required fields are present
+- Follow any constraints (min/max length, enum values, etc.)
+- For text fields with multiple sections or paragraphs, use newlines (\\n) to separate them for readability
+- Preserve logical paragraph breaks in your responses using \\n characters"""
+
+
+@dataclass(frozen=True)
+class ResponseSchemaArtifacts:
+    """Precomputed schema forms for one response model.
+
+    Attributes:
+        model_name: Response model class name
+        json_schema_text: ``model_json_schema(by_alias=True)`` as indented JSON text
+        strict_schema_text: Schema for providers with strict structured output
+            (``additionalProperties: false``, all properties required)
+        prompt_schema_json: Simplified schema shown to the LLM (indented JSON)
+        format_instructions: Response format block appended to system prompts
+    """
+
+    model_name: str
+    json_schema_text: str
+    strict_schema_text: str
+    prompt_schema_json: str
+    format_instructions: str
+
+    def json_schema(self) -> dict[str, Any]:
+        """Get a fresh copy of the model's JSON schema."""
+        schema: dict[str, Any] = json.loads(self.json_schema_text)
+        return schema
+
+    def strict_schema(self) -> dict[str, Any]:
+        """Get a fresh copy of the strict structured-output schema."""
+        schema: dict[str, Any] = json.loads(self.strict_schema_text)
+        return schema
+
+
+_artifacts: dict[type[BaseModel], ResponseSchemaArtifacts] = {}
+_artifacts_lock = threading.Lock()
+
+
+def get_schema_artifacts(model: type[BaseModel]) -> ResponseSchemaArtifacts:
+    """Get the schema artifacts for a model class, building them on first use.
+
+    Args:
+        model: Pydantic model class (registered or not)
+
+    Returns:
+        Cached ResponseSchemaArtifacts for the class
+    """
+    artifacts = _artifacts.get(model)
+    if artifacts is not None:
+        return artifacts
+
+    artifacts = _build_schema_artifacts(model)
+    with _artifacts_lock:
+        # Keep the first build if another thread raced us
+        artifacts = _artifacts.setdefault(model, artifacts)
+    logger.debug(
+        "response_model_registry.schema_artifacts_built",
+        model=artifacts.model_name,
+        prompt_schema_size=len(artifacts.prompt_schema_json),
+    )
+    return artifacts
+
+
+def clear_schema_artifacts() -> None:
+    """Drop all cached schema artifacts (e.g. after models are redefined in tests)."""
+    with _artifacts_lock:
+        _artifacts.clear()
+
+
+def _build_schema_artifacts(model: type[BaseModel]) -> ResponseSchemaArtifacts:
+    # Use by_alias=True to ensure camelCase field names match the aliases
+    full_schema = model.model_json_schema(by_alias=True)
+    json_schema_text = json.dumps(full_schema, indent=2)
+
+    # Note: the strict schema is a shallow copy, so its in-place changes to
+    # nested objects are also visible to the prompt schema built below. This
+    # mirrors the original per-request behaviour and keeps prompts unchanged.
+    strict_schema = _prepare_schema_for_structured_output(full_schema, model.__name__)
+    prompt_schema = _simplify_schema_for_prompt(full_schema)
+    prompt_schema_json = json.dumps(prompt_schema, indent=2)
+
+    return ResponseSchemaArtifacts(
+        model_name=model.__name__,
+        json_schema_text=json_schema_text,
+        strict_schema_text=json.dumps(strict_schema),
+        prompt_schema_json=prompt_schema_json,
+        format_instructions=RESPONSE_FORMAT_INSTRUCTIONS.format(schema=prompt_schema_json),
+    )
+
+
+def _prepare_schema_for_structured_output(
+    schema: dict[str, Any],
+    model_name: str,
+) -> dict[str, Any]:
+    """Prepare JSON schema for OpenAI structured output format.
+
+    OpenAI's structured output requires a specific schema format with
+    additionalProperties set to false for strict validation.
+
+    Args:
+        schema: Pydantic JSON schema
+        model_name: Name of the response model
+
+    Returns:
+        Schema prepared for OpenAI structured output
+    """
+    # Create a copy to avoid modifying the original
+    prepared = dict(schema)
+
+    # Ensure title is set
+    if "title" not in prepared:
+        prepared["title"] = model_name
+
+    # Add additionalProperties: false for strict mode
+    prepared["additionalProperties"] = False
+
+    # Recursively add additionalProperties to nested objects
+    _add_additional_properties_false(prepared)
+
+    return prepared
+
+
+def _add_additional_properties_false(schema: dict[str, Any]) -> None:
+    """Recursively add additionalProperties: false to all object schemas.
+
+    OpenAI's structured output with additionalProperties: false requires:
+    1. ALL properties to be in the 'required' array, even those with defaults
+    2. $ref cannot have sibling keywords like 'description'
+
+    Args:
+        schema: JSON schema dict to modify in place
+    """
+    # Fix $ref with extra keywords (OpenAI doesn't allow this)
+    if "$ref" in schema:
+        # Remove all keys except $ref to comply with OpenAI's strict validation
+        ref_value = schema["$ref"]
+        schema.clear()
+        schema["$ref"] = ref_value
+        return  # $ref properties don't need further processing
+
+    if schema.get("type") == "object":
+        schema["additionalProperties"] = False
+
+        properties = schema.get("properties", {})
+        if properties:
+            # OpenAI requires ALL properties in 'required' when using additionalProperties: false
+            # This is different from Pydantic's default which only includes fields without defaults
+            schema["required"] = list(properties.keys())
+
+        for prop in properties.values():
+            _add_additional_properties_false(prop)
+
+    # Handle $defs (nested model definitions)
+    for definition in schema.get("$defs", {}).values():
+        _add_additional_properties_false(definition)
+
+    # Handle items in arrays
+    if "items" in schema:
+        _add_additional_properties_false(schema["items"])
+
+    # Handle anyOf/oneOf/allOf
+    for key in ["anyOf", "oneOf", "allOf"]:
+        if key in schema:
+            for item in schema[key]:
+                _add_additional_properties_false(item)
+
+
+def _simplify_schema_for_prompt(
+    schema: dict[str, Any], root_schema: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Simplify JSON schema for LLM prompt injection.
+
+    Removes internal Pydantic details and creates a cleaner schema
+    that's easier for the LLM to understand.
+
+    Args:
+        schema: Schema (or sub-schema) to simplify
+        root_schema: Full root schema with $defs (for resolving nested refs)
+
+    Returns:
+        Simplified schema dict
+    """
+    # On first call, root_schema is the schema itself
+    if root_schema is None:
+        root_schema = schema
+
+    result: dict[str, Any] = {}
+
+    # Include title if present
+    if "title" in schema:
+        result["title"] = schema["title"]
+
+    # Process properties
+    if "properties" in schema:
+        result["properties"] = {}
+        for name, prop in schema["properties"].items():
+            # Handle direct $ref properties (e.g., "data": {"$ref": "#/$defs/SomeModel"})
+            if "$ref" in prop:
+                ref_name = prop["$ref"].split("/")[-1]
+                if "$defs" in root_schema and ref_name in root_schema["$defs"]:
+                    # Recursively simplify the referenced schema, passing root_schema
+                    result["properties"][name] = _simplify_schema_for_prompt(
+                        root_schema["$defs"][ref_name], root_schema
+                    )
+                else:
+                    # Reference not found, keep empty object
+                    result["properties"][name] = {}
+                continue
+
+            simplified_prop: dict[str, Any] = {}
+
+            # Include type
+            if "type" in prop:
+                simplified_prop["type"] = prop["type"]
+            elif "anyOf" in prop:
+                # Handle Optional types
+                types = [t.get("type") for t in prop["anyOf"] if "type" in t]
+                simplified_prop["type"] = types[0] if types else "any"
+
+            # Include description
+            if "description" in prop:
+                simplified_prop["description"] = prop["description"]
+
+            # Include constraints
+            for constraint in [
+                "minLength",
+                "maxLength",
+                "minimum",
+                "maximum",
+                "minItems",
+                "maxItems",
+                "enum",
+            ]:
+                if constraint in prop:
+                    simplified_prop[constraint] = prop[constraint]
+
+            # Handle array items
+            if prop.get("type") == "array" and "items" in prop:
+                items = prop["items"]
+                if "$ref" in items:
+                    # Resolve reference from root schema $defs
+                    ref_name = items["$ref"].split("/")[-1]
+                    if "$defs" in root_schema and ref_name in root_schema["$defs"]:
+                        simplified_prop["items"] = _simplify_schema_for_prompt(
+                            root_schema["$defs"][ref_name], root_schema
+                        )
+                else:
+                    simplified_prop["items"] = _simplify_schema_for_prompt(items, root_schema)
+
+            result["properties"][name] = simplified_prop
+
+    # Include required fields
+    if "required" in schema:
+        result["required"] = schema["required"]
+
+    return result
+
+
 def get_response_model(model_name: str) -> type[BaseModel] | None:
     """Get response model class by name.
 
@@ -136,7 +420,7 @@ def get_response_schema(model_name: str) -> dict[str, Any] | None:
     model = RESPONSE_MODEL_REGISTRY.get(model_name)
     if model is None:
         return None
-    return model.model_json_schema()
+    return get_schema_artifacts(model).json_schema()
 
 
 def list_available_schemas() -> list[str]:
@@ -94,6 +94,27 @@ You MUST respond with valid JSON matching this schema:
 - Be concise but complete
 """
 
+INCREMENTAL_EXTRACTION_PROMPT_TEMPLATE = """Update the results extracted so far from a coaching conversation.
+
+## Instructions
+Below are the current results (extracted from the earlier part of the conversation)
+and the new messages since then. Return the complete updated results: keep what is
+still valid, revise anything the new messages changed, and add what they introduced.
+
+## Required Output Format
+You MUST respond with valid JSON matching this schema:
+{result_schema_json}
+
+## Guidelines
+- Extract only information that was discussed and confirmed in the conversation
+- Use the user's own words and phrases where appropriate
+- Fill required fields as well as the conversation so far allows
+- Return the full result, not just the changes
+
+## Current Results
+{current_result_json}
+"""
+
 
 def get_structured_output_instructions(
     topic_name: str,
@@ -158,7 +179,9 @@ def _get_clean_schema(model: type["BaseModel"]) -> dict[str, Any]:
     Returns:
         Cleaned schema dict
     """
-    schema = model.model_json_schema()
+    from coaching.src.core.response_model_registry import get_schema_artifacts
+
+    schema = get_schema_artifacts(model).json_schema()
 
     # Remove internal schema details
     keys_to_remove = {"$defs", "definitions", "additionalProperties"}
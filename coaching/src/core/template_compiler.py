@@ -0,0 +1,212 @@
+"""Compiled prompt templates with a content-hash cache.
+
+Prompt templates use two placeholder styles:
+
+- ``{{param_name}}`` (Jinja2-style, preferred)
+- ``{param_name}`` (Python-style, backward compatibility). A single-brace
+  placeholder is only recognized when it is not part of ``{{...}}``, unless
+  the template is compiled with ``lenient=True``; then any ``{name}`` is a
+  placeholder, including ``{name}}`` and ``{{name}`` (the coaching session
+  renderer has always substituted these)
+
+Substituting each parameter with its own ``str.replace``/regex pass rescans the
+whole prompt once per parameter. Instead, a template is parsed once into
+alternating literal text and placeholder names, and rendering is a single
+join. Parsed templates are cached by a hash of their content, so the same
+prompt loaded repeatedly (e.g. from S3) is only parsed once per process.
+
+Semantics:
+    - Placeholders whose name has no value are left unchanged
+    - Values are inserted verbatim; placeholders inside values are not expanded
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+# One alternation so each position is matched once: {{name}} first, then {name}
+# when not adjacent to another brace (same rules as the per-style patterns in
+# template_parameter_processor).
+PLACEHOLDER_PATTERN = re.compile(
+    r"\{\{([a-zA-Z_][a-zA-Z0-9_]*)\}\}|(?<!\{)\{([a-zA-Z_][a-zA-Z0-9_]*)\}(?!\})"
+)
+# Same, without the adjacent-brace checks on single-brace placeholders
+LENIENT_PLACEHOLDER_PATTERN = re.compile(
+    r"\{\{([a-zA-Z_][a-zA-Z0-9_]*)\}\}|\{([a-zA-Z_][a-zA-Z0-9_]*)\}"
+)
+
+DEFAULT_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class Placeholder:
+    """A placeholder occurrence in a template."""
+
+    name: str
+    raw: str  # Original text, kept when no value is provided
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template parsed into literal segments and placeholders.
+
+    ``literals`` always has exactly one more element than ``placeholders``:
+    the rendered output is ``literals[0] + value(placeholders[0]) + literals[1] + ...``.
+    """
+
+    literals: tuple[str, ...]
+    placeholders: tuple[Placeholder, ...]
+    parameter_names: frozenset[str]
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """Render the template.
+
+        Args:
+            values: Parameter name to already-formatted string value
+
+        Returns:
+            Rendered text; placeholders without a value are kept as written
+        """
+        if not self.placeholders:
+            return self.literals[0]
+
+        parts: list[str] = [self.literals[0]]
+        for placeholder, literal in zip(self.placeholders, self.literals[1:], strict=True):
+            value = values.get(placeholder.name)
+            parts.append(placeholder.raw if value is None else value)
+            parts.append(literal)
+        return "".join(parts)
+
+
+def parse_template(template: str, *, lenient: bool = False) -> CompiledTemplate:
+    """Parse a template without using the cache.
+
+    Args:
+        template: Template text with ``{{name}}``/``{name}`` placeholders
+        lenient: Also treat ``{name}`` next to another brace as a placeholder
+
+    Returns:
+        CompiledTemplate for the text
+    """
+    pattern = LENIENT_PLACEHOLDER_PATTERN if lenient else PLACEHOLDER_PATTERN
+    literals: list[str] = []
+    placeholders: list[Placeholder] = []
+    position = 0
+    for match in pattern.finditer(template):
+        literals.append(template[position : match.start()])
+        placeholders.append(Placeholder(name=match.group(1) or match.group(2), raw=match.group(0)))
+        position = match.end()
+    literals.append(template[position:])
+
+    return CompiledTemplate(
+        literals=tuple(literals),
+        placeholders=tuple(placeholders),
+        parameter_names=frozenset(p.name for p in placeholders),
+    )
+
+
+class TemplateCache:
+    """Thread-safe LRU of compiled templates keyed by content hash."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of compiled templates kept
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[bytes, CompiledTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def compile(self, template: str, *, lenient: bool = False) -> CompiledTemplate:
+        """Get the compiled form of a template, parsing it on first use.
+
+        Args:
+            template: Template text
+            lenient: Parse with ``LENIENT_PLACEHOLDER_PATTERN``
+
+        Returns:
+            CompiledTemplate for the text
+        """
+        key = hashlib.blake2b(
+            template.encode("utf-8"), digest_size=16, person=b"lenient" if lenient else b""
+        ).digest()
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = parse_template(template, lenient=lenient)
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        """Drop all cached templates and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_template_cache = TemplateCache()
+
+
+def get_template_cache() -> TemplateCache:
+    """Get the process-wide template cache."""
+    return _template_cache
+
+
+def compile_template(template: str, *, lenient: bool = False) -> CompiledTemplate:
+    """Compile a template through the process-wide cache.
+
+    Args:
+        template: Template text with ``{{name}}``/``{name}`` placeholders
+        lenient: Also treat ``{name}`` next to another brace as a placeholder
+
+    Returns:
+        CompiledTemplate for the text
+    """
+    return _template_cache.compile(template, lenient=lenient)
+
+
+def render_template(template: str, values: Mapping[str, str]) -> str:
+    """Compile (cached) and render a template in one call.
+
+    Args:
+        template: Template text
+        values: Parameter name to string value
+
+    Returns:
+        Rendered text
+    """
+    return _template_cache.compile(template).render(values)
+
+
+__all__ = [
+    "LENIENT_PLACEHOLDER_PATTERN",
+    "PLACEHOLDER_PATTERN",
+    "CompiledTemplate",
+    "Placeholder",
+    "TemplateCache",
+    "compile_template",
+    "get_template_cache",
+    "parse_template",
+    "render_template",
+]
@@ -0,0 +1,84 @@
+"""Token budgeting helpers for conversation history.
+
+History is trimmed from the oldest message forward. With per-message token
+counts known, the cut point is found with a binary search over prefix sums
+instead of re-counting the remaining messages after each removal.
+
+``estimate_tokens`` is the same characters/4 heuristic the LLM providers use
+for ``count_tokens``; it is O(1) per message and good enough for budgeting.
+Use an exact tokenizer where counts are cached (see ConversationMemory).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import accumulate
+
+# Approximate characters per token for English text
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text (characters / 4)."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def prefix_sums(token_counts: Sequence[int]) -> list[int]:
+    """Build prefix sums where ``result[i]`` is the total of the first ``i`` counts.
+
+    Args:
+        token_counts: Token count per message, oldest first
+
+    Returns:
+        List of ``len(token_counts) + 1`` running totals starting at 0
+    """
+    return list(accumulate(token_counts, initial=0))
+
+
+def find_cut_index(prefix: Sequence[int], max_tokens: int) -> int:
+    """Find how many leading messages to drop so the rest fit a budget.
+
+    Args:
+        prefix: Prefix sums from ``prefix_sums``
+        max_tokens: Token budget for the retained (most recent) messages
+
+    Returns:
+        Smallest index ``i`` such that messages ``[i:]`` total at most
+        ``max_tokens`` (``len(prefix) - 1`` when nothing fits)
+    """
+    total = prefix[-1]
+    if total <= max_tokens:
+        return 0
+    # Need prefix[i] >= total - max_tokens; prefix is non-decreasing
+    return bisect_left(prefix, total - max_tokens)
+
+
+def select_recent_within_budget(
+    token_counts: Sequence[int], max_tokens: int, *, keep_last: bool = True
+) -> int:
+    """Find the start index of the most recent messages that fit a budget.
+
+    Args:
+        token_counts: Token count per message, oldest first
+        max_tokens: Token budget
+        keep_last: Always keep the newest message even if it alone exceeds the budget
+
+    Returns:
+        Start index into the message list
+    """
+    if not token_counts:
+        return 0
+    start = find_cut_index(prefix_sums(token_counts), max(0, max_tokens))
+    if keep_last:
+        start = min(start, len(token_counts) - 1)
+    return start
+
+
+__all__ = [
+    "CHARS_PER_TOKEN",
+    "estimate_tokens",
+    "find_cut_index",
+    "prefix_sums",
+    "select_recent_within_budget",
+]
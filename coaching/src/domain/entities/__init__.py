@@ -1,7 +1,12 @@
 """Domain entities package."""
 
 from .analysis_request import AnalysisRequest
-from .coaching_session import CoachingMessage, CoachingSession
+from .coaching_session import (
+    CoachingMessage,
+    CoachingSession,
+    CoachingSessionSummary,
+    CoachingSessionSummaryPage,
+)
 from .conversation import Conversation
 from .prompt_template import PromptTemplate
 
@@ -9,6 +14,8 @@ __all__ = [
     "AnalysisRequest",
     "CoachingMessage",
     "CoachingSession",
+    "CoachingSessionSummary",
+    "CoachingSessionSummaryPage",
     "Conversation",
     "PromptTemplate",
 ]
@@ -11,6 +11,7 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from coaching.src.core.constants import ConversationStatus, MessageRole
+from coaching.src.core.token_budget import estimate_tokens, select_recent_within_budget
 from coaching.src.core.types import (
     SessionId,
     TenantId,
@@ -22,7 +23,7 @@ from coaching.src.domain.exceptions import (
     SessionExpiredError,
     SessionNotActiveError,
 )
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class CoachingMessage(BaseModel):
@@ -81,6 +82,8 @@ class CoachingSession(BaseModel):
         expires_at: Absolute expiration time
         extracted_result: Final extracted result (only when completed)
         extraction_model: Model used for result extraction
+        partial_result: Speculative result extracted in the background while active
+        partial_result_message_count: Number of messages the partial result covers
     """
 
     session_id: SessionId = Field(
@@ -147,6 +150,21 @@ class CoachingSession(BaseModel):
         description="Model used for result extraction",
     )
 
+    # Speculative extraction (refreshed in the background after each turn)
+    partial_result: dict[str, Any] | None = Field(
+        default=None,
+        description="Partial result extracted from the first messages",
+    )
+    partial_result_message_count: int = Field(
+        default=0,
+        ge=0,
+        description="Number of messages covered by partial_result",
+    )
+
+    # Messages the repository has loaded or written as separate items (None if
+    # unknown); later messages in ``messages`` are the ones still to append
+    _stored_message_count: int | None = PrivateAttr(default=None)
+
     model_config = {"extra": "forbid"}
 
     # =========================================================================
@@ -523,18 +541,27 @@ class CoachingSession(BaseModel):
         """Update the updated_at timestamp."""
         self.updated_at = datetime.now(UTC)
 
-    def get_messages_for_llm(self, max_messages: int = 30) -> list[dict[str, str]]:
+    def get_messages_for_llm(
+        self, max_messages: int = 30, max_tokens: int | None = None
+    ) -> list[dict[str, str]]:
         """Get messages formatted for LLM context.
 
         Applies sliding window to limit context size.
 
         Args:
             max_messages: Maximum number of messages to include
+            max_tokens: Optional token budget (estimated); older messages that do
+                not fit are dropped, the most recent message is always kept
 
         Returns:
             List of message dicts with 'role' and 'content' keys
         """
         recent_messages = self.messages[-max_messages:]
+        if max_tokens is not None and recent_messages:
+            start = select_recent_within_budget(
+                [estimate_tokens(msg.content) for msg in recent_messages], max_tokens
+            )
+            recent_messages = recent_messages[start:]
         return [{"role": msg.role.value, "content": msg.content} for msg in recent_messages]
 
     def calculate_estimated_completion(self, estimated_total: int = 20) -> float:
@@ -560,3 +587,59 @@ class CoachingSession(BaseModel):
                 if v[i].timestamp > v[i + 1].timestamp:
                     raise ValueError("Messages must be in chronological order")
         return v
+
+
+class CoachingSessionSummary(BaseModel):
+    """Lightweight view of a session for listings (no messages or context).
+
+    Attributes:
+        session_id: Unique session identifier
+        topic_id: The coaching topic
+        status: Current session status
+        turn_count: Number of conversation turns (user messages)
+        created_at: When session was created
+        updated_at: When session was last updated
+        completed_at: When session was completed (if applicable)
+    """
+
+    session_id: SessionId = Field(..., description="Unique session identifier")
+    topic_id: str = Field(..., min_length=1, description="Coaching topic ID")
+    status: ConversationStatus = Field(..., description="Current session status")
+    turn_count: int = Field(default=0, ge=0, description="Number of conversation turns")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+    completed_at: datetime | None = Field(default=None, description="Completion timestamp")
+
+    model_config = {"extra": "forbid"}
+
+    @classmethod
+    def from_session(cls, session: CoachingSession) -> "CoachingSessionSummary":
+        """Summarize a fully loaded session.
+
+        Args:
+            session: Session to summarize
+
+        Returns:
+            Summary of the session
+        """
+        return cls(
+            session_id=session.session_id,
+            topic_id=session.topic_id,
+            status=session.status,
+            turn_count=session.get_turn_count(),
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+            completed_at=session.completed_at,
+        )
+
+
+class CoachingSessionSummaryPage(BaseModel):
+    """One page of session summaries.
+
+    Attributes:
+        items: Summaries in index order
+        next_cursor: Opaque cursor for the next page (None on the last page)
+    """
+
+    items: list[CoachingSessionSummary] = Field(default_factory=list)
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page")
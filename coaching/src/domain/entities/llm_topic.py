@@ -702,5 +702,20 @@ class LLMTopic:
         """
         return self.additional_config.get("extraction_model_code") or "CLAUDE_3_5_HAIKU"
 
+    def get_fallback_model_codes(self) -> list[str]:
+        """Get equivalent models to fail over to, in preference order.
+
+        Read from ``additional_config["fallback_model_codes"]`` as a list or a
+        comma-separated string of MODEL_REGISTRY codes, typically the same class
+        of model on other providers (e.g. ``["GPT_5_MINI", "GEMINI_2_5_FLASH"]``).
+
+        Returns:
+            list[str]: Fallback model codes (empty when none are configured)
+        """
+        codes = self.additional_config.get("fallback_model_codes") or []
+        if isinstance(codes, str):
+            codes = codes.split(",")
+        return [str(code).strip() for code in codes if str(code).strip()]
+
 
 __all__ = ["LLMTopic", "ParameterDefinition", "PromptInfo"]
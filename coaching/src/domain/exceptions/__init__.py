@@ -27,6 +27,7 @@ if TYPE_CHECKING:
     )
     from coaching.src.domain.exceptions.session_exceptions import (
         ExtractionFailedError,
+        InvalidCursorError,
         MaxTurnsReachedError,
         SessionAccessDeniedError,
         SessionConflictError,
@@ -162,6 +163,10 @@ else:
             "coaching.src.domain.exceptions.session_exceptions",
             "ExtractionFailedError",
         ),
+        "InvalidCursorError": (
+            "coaching.src.domain.exceptions.session_exceptions",
+            "InvalidCursorError",
+        ),
     }
 
 __all__ = [
@@ -178,6 +183,7 @@ __all__ = [
     "ExtractionFailedError",
     "InsufficientDataForAnalysis",
     "InvalidAnalysisRequest",
+    "InvalidCursorError",
     "InvalidMessageContent",
     "InvalidParameterDefinitionError",
     "InvalidPhaseTransition",
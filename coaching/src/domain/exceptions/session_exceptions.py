@@ -307,3 +307,23 @@ class ExtractionFailedError(DomainError):
         )
         self.session_id = session_id
         self.reason = reason
+
+
+class InvalidCursorError(DomainError):
+    """Raised when a session listing cursor cannot be decoded.
+
+    HTTP Status: 400
+    Error Code: INVALID_CURSOR
+    """
+
+    def __init__(self, context: dict[str, Any] | None = None) -> None:
+        """Initialize InvalidCursorError.
+
+        Args:
+            context: Additional context data
+        """
+        super().__init__(
+            message="Invalid cursor",
+            code="INVALID_CURSOR",
+            context=context or {},
+        )
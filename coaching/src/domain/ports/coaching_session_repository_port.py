@@ -8,10 +8,13 @@ get_active_for_user_topic method which enables blocking different users
 from initiating sessions for the same topic when one is already active.
 """
 
-from typing import Protocol
+from typing import Any, Protocol
 
 from coaching.src.core.types import SessionId, TenantId, UserId
-from coaching.src.domain.entities.coaching_session import CoachingSession
+from coaching.src.domain.entities.coaching_session import (
+    CoachingSession,
+    CoachingSessionSummaryPage,
+)
 
 
 class CoachingSessionRepositoryPort(Protocol):
@@ -199,6 +202,25 @@ class CoachingSessionRepositoryPort(Protocol):
         """
         ...
 
+    async def update_partial_result(
+        self, session_id: str, partial_result: dict[str, Any], message_count: int
+    ) -> bool:
+        """
+        Store a speculative extraction result for an active session.
+
+        Args:
+            session_id: Session identifier
+            partial_result: Result extracted from the first messages
+            message_count: Number of messages the result covers
+
+        Returns:
+            True if stored, False if the session is not active or already
+            has a partial result covering as many messages
+
+        Business Rule: A partial result never replaces a newer one
+        """
+        ...
+
     async def mark_expired(self, session_id: SessionId, tenant_id: TenantId) -> bool:
         """
         Mark a session as expired.
@@ -298,6 +320,37 @@ class CoachingSessionRepositoryPort(Protocol):
         """
         ...
 
+    async def list_summaries_by_tenant_user(
+        self,
+        tenant_id: str,
+        user_id: str,
+        *,
+        include_completed: bool = False,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> CoachingSessionSummaryPage:
+        """
+        List session summaries for a tenant's user without loading messages.
+
+        Args:
+            tenant_id: Tenant ID for isolation (string)
+            user_id: User identifier (string)
+            include_completed: Whether to include COMPLETED sessions
+            limit: Maximum number of summaries to return
+            cursor: next_cursor of the previous page, None for the first page
+
+        Returns:
+            Page of summaries and the cursor for the next page
+
+        Raises:
+            ValueError: If the cursor is invalid
+
+        Business Rule:
+            - CANCELLED and ABANDONED sessions are never included
+            - A cursor only pages through the tenant and user it was issued for
+        """
+        ...
+
     # =========================================================================
     # Delete Operations
     # =========================================================================
@@ -6,9 +6,9 @@ to be used interchangeably via the Strategy pattern.
 """
 
 from collections.abc import AsyncIterator
-from typing import Protocol
+from typing import Any, Protocol
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class LLMMessage(BaseModel):
@@ -26,6 +26,7 @@ class LLMResponse(BaseModel):
     usage: dict[str, int]  # {"prompt_tokens": X, "completion_tokens": Y, "total_tokens": Z}
     finish_reason: str  # "stop", "length", "content_filter", etc.
     provider: str
+    metadata: dict[str, Any] = Field(default_factory=dict)  # e.g. {"routing": {...}}
 
 
 class LLMProviderPort(Protocol):
@@ -106,6 +107,7 @@ class LLMProviderPort(Protocol):
         _temperature: float = 0.7,
         _max_tokens: int | None = None,
         _system_prompt: str | None = None,
+        usage: dict[str, int] | None = None,  # noqa: ARG002 - passed by keyword
     ) -> AsyncIterator[str]:
         """
         Generate a completion with token streaming.
@@ -116,6 +118,8 @@ class LLMProviderPort(Protocol):
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens to generate (None = provider default)
             system_prompt: Optional system prompt
+            usage: Optional dict filled with token usage (same keys as
+                ``LLMResponse.usage``) once the provider reports it
 
         Yields:
             Token strings as they are generated
@@ -0,0 +1,292 @@
+"""Non-blocking execution of synchronous AWS SDK calls.
+
+boto3 clients and resources are synchronous. Calling them directly from an
+``async def`` blocks the event loop for the whole network round-trip, so
+concurrent requests in one worker queue behind each other. This module runs
+those calls on dedicated, bounded thread pools - one per AWS service - so the
+event loop stays free and each service has its own concurrency limit.
+
+Usage:
+    from coaching.src.infrastructure.aws_io import iterate_aws_stream, run_aws_call
+
+    response = await run_aws_call("dynamodb", self.table.get_item, Key={"id": item_id})
+
+    # Streaming responses (e.g. Bedrock converse_stream) are read on a pool thread
+    async for event in iterate_aws_stream("bedrock-runtime", stream, close=stream.close):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections.abc import AsyncGenerator, Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import structlog
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+DEFAULT_SERVICE_CONCURRENCY = 8
+DEFAULT_STREAM_BUFFER = 32
+
+# Queue entry kinds used by AwsIOExecutor.iterate
+_ITEM = 0
+_DONE = 1
+_ERROR = 2
+
+
+class AwsIOExecutor:
+    """Per-service bounded thread pools for blocking AWS SDK calls.
+
+    Design:
+        - One ThreadPoolExecutor per service name, created lazily
+        - Pool size is the service's concurrency limit, so a burst of slow
+          S3 reads cannot starve DynamoDB calls and vice versa
+        - Context variables (e.g. structlog context) are propagated to the
+          worker thread, matching ``asyncio.to_thread``
+    """
+
+    def __init__(
+        self,
+        *,
+        service_limits: Mapping[str, int] | None = None,
+        default_limit: int = DEFAULT_SERVICE_CONCURRENCY,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            service_limits: Maximum concurrent calls per service name
+            default_limit: Limit for services not listed in service_limits
+        """
+        self.service_limits: dict[str, int] = dict(service_limits or {})
+        self.default_limit = default_limit
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def get_limit(self, service: str) -> int:
+        """Get the concurrency limit for a service."""
+        return max(1, self.service_limits.get(service, self.default_limit))
+
+    def _executor_for(self, service: str) -> ThreadPoolExecutor:
+        executor = self._executors.get(service)
+        if executor is None:
+            with self._lock:
+                executor = self._executors.get(service)
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=self.get_limit(service),
+                        thread_name_prefix=f"aws-io-{service}",
+                    )
+                    self._executors[service] = executor
+        return executor
+
+    async def run(
+        self,
+        service: str,
+        func: Callable[..., T],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run a blocking call on the service's pool and await its result.
+
+        Args:
+            service: AWS service name used to select the pool (e.g. "s3", "dynamodb")
+            func: Blocking callable, typically a boto3 client/table method
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The callable's return value; exceptions propagate unchanged
+        """
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+
+        def call() -> T:
+            return ctx.run(func, *args, **kwargs)
+
+        return await loop.run_in_executor(self._executor_for(service), call)
+
+    async def iterate(
+        self,
+        service: str,
+        events: Iterable[T],
+        /,
+        *,
+        max_buffered: int = DEFAULT_STREAM_BUFFER,
+        close: Callable[[], None] | None = None,
+    ) -> AsyncGenerator[T, None]:
+        """Consume a blocking iterator (e.g. a botocore EventStream) without blocking the loop.
+
+        A pool thread reads ``events`` and hands each item to the event loop
+        through a queue. At most ``max_buffered`` items are held unconsumed; when
+        the consumer falls behind, the reader thread waits, so a slow client
+        applies backpressure all the way to the HTTP stream.
+
+        If the consumer stops early (cancellation, client disconnect, ``break``),
+        the reader is told to stop and ``close`` is called to abort the
+        underlying connection, releasing the pool thread.
+
+        Args:
+            service: AWS service name used to select the pool
+            events: Blocking iterable to consume
+            max_buffered: Maximum items read ahead of the consumer
+            close: Optional callable that aborts the underlying stream
+
+        Yields:
+            Items from ``events`` in order; reader exceptions propagate unchanged
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[tuple[int, Any]] = asyncio.Queue()
+        slots = threading.Semaphore(max(1, max_buffered))
+        stop = threading.Event()
+
+        def deliver(kind: int, value: Any) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (kind, value))
+            except RuntimeError:
+                # Event loop already closed; nobody is listening any more
+                stop.set()
+
+        def pump() -> None:
+            try:
+                for item in events:
+                    slots.acquire()
+                    if stop.is_set():
+                        return
+                    deliver(_ITEM, item)
+            except BaseException as e:
+                if not stop.is_set():
+                    deliver(_ERROR, e)
+                return
+            deliver(_DONE, None)
+
+        ctx = contextvars.copy_context()
+        reader = loop.run_in_executor(self._executor_for(service), lambda: ctx.run(pump))
+        finished = False
+        try:
+            while True:
+                kind, value = await queue.get()
+                if kind == _DONE:
+                    finished = True
+                    return
+                if kind == _ERROR:
+                    finished = True
+                    raise value
+                slots.release()
+                yield value
+        finally:
+            if not finished:
+                stop.set()
+                # Wake the reader if it is waiting for buffer space
+                slots.release()
+                if close is not None:
+                    try:
+                        close()
+                    except Exception:
+                        logger.warning("AWS stream close failed", service=service, exc_info=True)
+                logger.debug("AWS stream consumer stopped early", service=service)
+            # Surface reader failures in logs instead of "exception never retrieved"
+            reader.add_done_callback(_consume_reader_result)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Shut down all service pools."""
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait)
+        logger.info("AWS I/O executor shut down", pools=len(executors))
+
+
+def _consume_reader_result(future: asyncio.Future[None]) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.debug("AWS stream reader exited with error", error=str(future.exception()))
+
+
+_executor: AwsIOExecutor | None = None
+
+
+def get_aws_io_executor() -> AwsIOExecutor:
+    """Get the process-wide AWS I/O executor, configured from settings."""
+    global _executor
+    if _executor is None:
+        from coaching.src.core.config_multitenant import settings
+
+        _executor = AwsIOExecutor(
+            service_limits={
+                "dynamodb": settings.aws_io_dynamodb_concurrency,
+                "s3": settings.aws_io_s3_concurrency,
+                "bedrock-runtime": settings.aws_io_bedrock_concurrency,
+            },
+            default_limit=settings.aws_io_default_concurrency,
+        )
+        logger.info("AWS I/O executor initialized", limits=_executor.service_limits)
+    return _executor
+
+
+def shutdown_aws_io_executor() -> None:
+    """Shut down the process-wide executor (used on application shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+async def run_aws_call(
+    service: str,
+    func: Callable[..., T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """Run a blocking AWS SDK call without blocking the event loop.
+
+    Args:
+        service: AWS service name used to select the pool
+        func: Blocking callable
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The callable's return value
+    """
+    return await get_aws_io_executor().run(service, func, *args, **kwargs)
+
+
+def iterate_aws_stream(
+    service: str,
+    events: Iterable[T],
+    /,
+    *,
+    max_buffered: int = DEFAULT_STREAM_BUFFER,
+    close: Callable[[], None] | None = None,
+) -> AsyncGenerator[T, None]:
+    """Consume a blocking AWS event stream without blocking the event loop.
+
+    See ``AwsIOExecutor.iterate``.
+
+    Args:
+        service: AWS service name used to select the pool
+        events: Blocking iterable, typically a botocore EventStream
+        max_buffered: Maximum items read ahead of the consumer
+        close: Optional callable that aborts the underlying stream
+
+    Returns:
+        Async iterator over the stream's items
+    """
+    return get_aws_io_executor().iterate(service, events, max_buffered=max_buffered, close=close)
+
+
+__all__ = [
+    "AwsIOExecutor",
+    "get_aws_io_executor",
+    "iterate_aws_stream",
+    "run_aws_call",
+    "shutdown_aws_io_executor",
+]
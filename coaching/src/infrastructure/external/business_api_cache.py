@@ -0,0 +1,321 @@
+"""Tenant-scoped response cache for Business API calls.
+
+Business foundation, goals, strategies, measures and org data change rarely
+but are fetched repeatedly within one user journey (/ai/execute, coaching
+session start, insights, enrichment). This cache sits in front of the
+BusinessApiClient read methods:
+
+- Keys are tenant + endpoint (+ user for user-scoped endpoints) + call arguments
+- Each endpoint has its own TTL (see DEFAULT_ENDPOINT_TTLS)
+- Concurrent identical fetches are coalesced into one request (single-flight)
+- invalidate() drops a tenant's entries and is safe to call from event handlers;
+  a fetch that was in flight during invalidation is not stored
+
+The cache is per process; invalidation only affects the instance handling the
+event, so TTLs bound staleness across instances.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import structlog
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+# TTL in seconds per endpoint (BusinessApiClient method name without "get_")
+DEFAULT_ENDPOINT_TTLS: dict[str, float] = {
+    "business_foundation": 300.0,
+    "user_context": 300.0,
+    "user_goals": 60.0,
+    "goal_by_id": 60.0,
+    "strategies": 60.0,
+    "strategy_by_id": 60.0,
+    "measures": 60.0,
+    "measure_by_id": 60.0,
+    "measures_summary": 60.0,
+    "operations_actions": 30.0,
+    "operations_issues": 30.0,
+    "actions": 30.0,
+    "action_by_id": 30.0,
+    "issues": 30.0,
+    "issue_by_id": 30.0,
+    "people": 300.0,
+    "person_by_id": 300.0,
+    "departments": 600.0,
+    "positions": 600.0,
+    "position_by_id": 600.0,
+    "roles": 600.0,
+    "measure_catalog": 3600.0,
+}
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+    tenant_id: str
+    endpoint: str
+    user_id: str | None
+
+
+class BusinessApiCache:
+    """In-memory TTL cache with single-flight fetches, scoped by tenant."""
+
+    def __init__(
+        self,
+        *,
+        default_ttl_seconds: float = 60.0,
+        endpoint_ttls: Mapping[str, float] | None = None,
+        max_entries: int = 2048,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            default_ttl_seconds: TTL for endpoints without an explicit entry
+            endpoint_ttls: Per-endpoint TTL overrides (merged over DEFAULT_ENDPOINT_TTLS)
+            max_entries: Maximum cached responses before LRU eviction
+        """
+        self.default_ttl_seconds = default_ttl_seconds
+        self.endpoint_ttls: dict[str, float] = {**DEFAULT_ENDPOINT_TTLS, **(endpoint_ttls or {})}
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._generations: dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    def get_ttl(self, endpoint: str) -> float:
+        """Get the TTL for an endpoint in seconds."""
+        return self.endpoint_ttls.get(endpoint, self.default_ttl_seconds)
+
+    @staticmethod
+    def build_key(
+        *,
+        tenant_id: str,
+        endpoint: str,
+        user_id: str | None = None,
+        arguments: Mapping[str, Any] | None = None,
+    ) -> str:
+        """Build the cache key for a call.
+
+        Args:
+            tenant_id: Tenant the data belongs to
+            endpoint: Endpoint name
+            user_id: User for user-scoped endpoints
+            arguments: Remaining call arguments (ids, filters)
+
+        Returns:
+            Cache key string
+        """
+        args = json.dumps(arguments or {}, sort_keys=True, default=str)
+        return f"{tenant_id}|{endpoint}|{user_id or ''}|{args}"
+
+    async def get_or_fetch(
+        self,
+        *,
+        tenant_id: str,
+        endpoint: str,
+        fetch: Callable[[], Awaitable[T]],
+        user_id: str | None = None,
+        arguments: Mapping[str, Any] | None = None,
+    ) -> T:
+        """Return a cached response or fetch it, coalescing concurrent fetches.
+
+        Errors are never cached; concurrent waiters receive the same error.
+
+        Args:
+            tenant_id: Tenant the data belongs to
+            endpoint: Endpoint name (selects the TTL)
+            fetch: Coroutine factory performing the real API call
+            user_id: User for user-scoped endpoints
+            arguments: Remaining call arguments
+
+        Returns:
+            A private copy of the response
+        """
+        key = self.build_key(
+            tenant_id=tenant_id, endpoint=endpoint, user_id=user_id, arguments=arguments
+        )
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(entry.value)  # type: ignore[no-any-return]
+            del self._entries[key]
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.get_loop() is loop:
+            self._coalesced += 1
+            try:
+                shared = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leading fetch was cancelled; fetch on our own behalf
+                return await self.get_or_fetch(
+                    tenant_id=tenant_id,
+                    endpoint=endpoint,
+                    fetch=fetch,
+                    user_id=user_id,
+                    arguments=arguments,
+                )
+            return copy.deepcopy(shared)  # type: ignore[no-any-return]
+
+        self._misses += 1
+        generation = self._generations.get(tenant_id, 0)
+        future: asyncio.Future[Any] = loop.create_future()
+        # Mark exceptions as retrieved when nobody else is waiting
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+
+        try:
+            value = await fetch()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            if self._generations.get(tenant_id, 0) == generation:
+                self._store(key, value, tenant_id=tenant_id, endpoint=endpoint, user_id=user_id)
+            return copy.deepcopy(value)
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        *,
+        tenant_id: str,
+        endpoint: str,
+        user_id: str | None,
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = _CacheEntry(
+            value=copy.deepcopy(value),
+            expires_at=time.monotonic() + self.get_ttl(endpoint),
+            tenant_id=tenant_id,
+            endpoint=endpoint,
+            user_id=user_id,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        tenant_id: str,
+        *,
+        endpoints: Iterable[str] | None = None,
+        user_id: str | None = None,
+    ) -> int:
+        """Drop cached responses for a tenant.
+
+        Args:
+            tenant_id: Tenant whose data changed
+            endpoints: Only drop these endpoints (all if None)
+            user_id: Only drop entries for this user (all users if None)
+
+        Returns:
+            Number of entries removed
+        """
+        endpoint_set = set(endpoints) if endpoints is not None else None
+        keys = [
+            key
+            for key, entry in self._entries.items()
+            if entry.tenant_id == tenant_id
+            and (endpoint_set is None or entry.endpoint in endpoint_set)
+            and (user_id is None or entry.user_id == user_id)
+        ]
+        for key in keys:
+            del self._entries[key]
+        self._generations[tenant_id] = self._generations.get(tenant_id, 0) + 1
+
+        logger.info(
+            "business_api_cache.invalidated",
+            tenant_id=tenant_id,
+            endpoints=sorted(endpoint_set) if endpoint_set is not None else None,
+            user_id=user_id,
+            removed=len(keys),
+        )
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache counters (hits, misses, coalesced fetches, size)."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "size": len(self._entries),
+        }
+
+
+_cache: BusinessApiCache | None = None
+
+
+def get_business_api_cache() -> BusinessApiCache | None:
+    """Get the process-wide Business API cache, or None when disabled in settings."""
+    global _cache
+    from coaching.src.core.config_multitenant import settings
+
+    if not settings.business_api_cache_enabled:
+        return None
+    if _cache is None:
+        _cache = BusinessApiCache(
+            default_ttl_seconds=settings.business_api_cache_default_ttl_seconds,
+            max_entries=settings.business_api_cache_max_entries,
+        )
+    return _cache
+
+
+def invalidate_business_data(
+    tenant_id: str,
+    *,
+    endpoints: Iterable[str] | None = None,
+    user_id: str | None = None,
+) -> int:
+    """Invalidate cached Business API data for a tenant (hook for upstream events).
+
+    Args:
+        tenant_id: Tenant whose data changed
+        endpoints: Only drop these endpoints (all if None)
+        user_id: Only drop entries for this user (all users if None)
+
+    Returns:
+        Number of entries removed (0 when caching is disabled)
+    """
+    cache = get_business_api_cache()
+    if cache is None:
+        return 0
+    return cache.invalidate(tenant_id, endpoints=endpoints, user_id=user_id)
+
+
+__all__ = [
+    "DEFAULT_ENDPOINT_TTLS",
+    "BusinessApiCache",
+    "get_business_api_cache",
+    "invalidate_business_data",
+]
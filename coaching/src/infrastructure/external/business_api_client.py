@@ -4,13 +4,61 @@ This client provides integration with the .NET Business API for
 retrieving user and organizational data for context enrichment.
 """
 
-from typing import Any, cast
+import functools
+import inspect
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar, cast
 
 import httpx
 import structlog
+from coaching.src.infrastructure.external.business_api_cache import BusinessApiCache
+from coaching.src.infrastructure.external.http_client_pool import (
+    get_shared_http_client,
+    is_shared_http_client,
+)
 
 logger = structlog.get_logger()
 
+_F = TypeVar("_F", bound=Callable[..., Awaitable[Any]])
+
+
+def _cached(endpoint: str) -> Callable[[_F], _F]:
+    """Serve a read method through the client's BusinessApiCache, if configured.
+
+    The cache key is built from tenant_id, user_id (when the method takes one)
+    and the remaining call arguments.
+
+    Args:
+        endpoint: Endpoint name used for the key and TTL lookup
+    """
+
+    def decorator(func: _F) -> _F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self: "BusinessApiClient", *args: Any, **kwargs: Any) -> Any:
+            if self.cache is None:
+                return await func(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop("self")
+            tenant_id = str(arguments.pop("tenant_id"))
+            user_id = arguments.pop("user_id", None)
+
+            return await self.cache.get_or_fetch(
+                tenant_id=tenant_id,
+                endpoint=endpoint,
+                user_id=user_id,
+                arguments=arguments,
+                fetch=lambda: func(self, *args, **kwargs),
+            )
+
+        return cast(_F, wrapper)
+
+    return decorator
+
 
 class BusinessApiClient:
     """
@@ -23,7 +71,10 @@ class BusinessApiClient:
         - HTTP-based REST API calls using httpx
         - Async/await support
         - Retry logic for resilience
+        - Connections come from a process-wide keep-alive pool, so a client
+          per request is cheap; the JWT and tenant headers are sent per call
         - JWT token forwarding for authentication
+        - Optional tenant-scoped response cache for read endpoints
         - Comprehensive error handling
         - Structured logging
     """
@@ -34,6 +85,8 @@ class BusinessApiClient:
         jwt_token: str | None = None,
         timeout: int = 30,
         max_retries: int = 3,
+        http_client: httpx.AsyncClient | None = None,
+        cache: BusinessApiCache | None = None,
     ):
         """
         Initialize Business API client.
@@ -43,28 +96,43 @@ class BusinessApiClient:
             jwt_token: Optional JWT token for authentication
             timeout: Request timeout in seconds (default: 30)
             max_retries: Maximum number of retry attempts (default: 3)
+            http_client: Optional dedicated HTTP client (closed by close()).
+                If None, the shared connection pool is used.
+            cache: Optional response cache shared across clients
         """
         self.base_url = base_url.rstrip("/")
         self.jwt_token = jwt_token
         self.timeout = timeout
         self.max_retries = max_retries
+        self._client = http_client
+        self.cache = cache
 
-        # Create async HTTP client with retry transport
-        transport = httpx.AsyncHTTPTransport(retries=max_retries)
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=timeout,
-            transport=transport,
-            follow_redirects=True,
-        )
-
-        logger.info(
+        logger.debug(
             "Business API client initialized",
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
         )
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client used for requests.
+
+        Resolved lazily from the shared pool for the running event loop unless
+        a dedicated client was provided.
+        """
+        if self._client is not None:
+            return self._client
+        return get_shared_http_client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+        )
+
+    @client.setter
+    def client(self, value: httpx.AsyncClient) -> None:
+        self._client = value
+
     def _get_headers(self, tenant_id: str | None = None) -> dict[str, str]:
         """Get HTTP headers including authentication and tenancy context."""
         headers = {
@@ -92,6 +160,7 @@ class BusinessApiClient:
 
         return data
 
+    @_cached("user_context")
     async def get_user_context(self, user_id: str, tenant_id: str) -> dict[str, Any]:
         """
         Get user context data from Account Service.
@@ -187,6 +256,7 @@ class BusinessApiClient:
             )
             raise
 
+    @_cached("business_foundation")
     async def get_business_foundation(self, tenant_id: str) -> dict[str, Any]:
         """
         Get complete business foundation data.
@@ -252,6 +322,7 @@ class BusinessApiClient:
         """Deprecated: Use get_business_foundation instead."""
         return await self.get_business_foundation(tenant_id)
 
+    @_cached("user_goals")
     async def get_user_goals(self, user_id: str, tenant_id: str) -> list[dict[str, Any]]:
         """
         Get user's goals from Traction Service.
@@ -327,6 +398,7 @@ class BusinessApiClient:
     # Goal statistics can be derived from GET /goals list endpoint.
     # Performance metrics will be computed from measures data.
 
+    @_cached("goal_by_id")
     async def get_goal_by_id(self, goal_id: str, tenant_id: str) -> dict[str, Any]:
         """Get single goal by ID from Traction Service.
 
@@ -370,6 +442,7 @@ class BusinessApiClient:
             logger.error("Request error fetching goal", goal_id=goal_id, error=str(e))
             raise
 
+    @_cached("strategy_by_id")
     async def get_strategy_by_id(self, strategy_id: str, tenant_id: str) -> dict[str, Any]:
         """Get single strategy by ID from Traction Service.
 
@@ -409,6 +482,7 @@ class BusinessApiClient:
             logger.error("Request error fetching strategy", strategy_id=strategy_id, error=str(e))
             raise
 
+    @_cached("strategies")
     async def get_strategies(
         self, tenant_id: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
@@ -454,6 +528,7 @@ class BusinessApiClient:
             logger.error("Request error fetching strategies", tenant_id=tenant_id, error=str(e))
             raise
 
+    @_cached("measure_by_id")
     async def get_measure_by_id(self, measure_id: str, tenant_id: str) -> dict[str, Any]:
         """Get measure details by ID from Traction Service.
 
@@ -486,6 +561,7 @@ class BusinessApiClient:
             logger.error("Request error fetching measure", measure_id=measure_id, error=str(e))
             raise
 
+    @_cached("measures")
     async def get_measures(
         self, tenant_id: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
@@ -531,6 +607,7 @@ class BusinessApiClient:
             logger.error("Request error fetching measures", tenant_id=tenant_id, error=str(e))
             raise
 
+    @_cached("measures_summary")
     async def get_measures_summary(self, tenant_id: str) -> dict[str, Any]:
         """Get comprehensive measures summary with progress and statistics.
 
@@ -582,6 +659,7 @@ class BusinessApiClient:
         """Deprecated: Use get_measures instead."""
         return await self.get_measures(tenant_id, params)
 
+    @_cached("operations_actions")
     async def get_operations_actions(self, tenant_id: str, limit: int = 50) -> list[dict[str, Any]]:
         """
         Get recent operations actions from Traction Service.
@@ -659,6 +737,7 @@ class BusinessApiClient:
             )
             raise
 
+    @_cached("operations_issues")
     async def get_operations_issues(self, tenant_id: str, limit: int = 50) -> list[dict[str, Any]]:
         """
         Get open operations issues from Traction Service.
@@ -731,6 +810,7 @@ class BusinessApiClient:
             )
             raise
 
+    @_cached("issues")
     async def get_issues(
         self, tenant_id: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
@@ -780,6 +860,7 @@ class BusinessApiClient:
             logger.error("Request error fetching issues", tenant_id=tenant_id, error=str(e))
             raise
 
+    @_cached("issue_by_id")
     async def get_issue_by_id(self, issue_id: str, tenant_id: str) -> dict[str, Any]:
         """Get single issue by ID.
 
@@ -812,6 +893,7 @@ class BusinessApiClient:
             logger.error("Request error fetching issue", issue_id=issue_id, error=str(e))
             raise
 
+    @_cached("actions")
     async def get_actions(
         self, tenant_id: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
@@ -869,6 +951,7 @@ class BusinessApiClient:
             logger.error("Request error fetching actions", tenant_id=tenant_id, error=str(e))
             raise
 
+    @_cached("action_by_id")
     async def get_action_by_id(self, action_id: str, tenant_id: str) -> dict[str, Any]:
         """Get single action by ID.
 
@@ -901,6 +984,7 @@ class BusinessApiClient:
             logger.error("Request error fetching action", action_id=action_id, error=str(e))
             raise
 
+    @_cached("people")
     async def get_people(
         self, tenant_id: str, params: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
@@ -949,6 +1033,7 @@ class BusinessApiClient:
             logger.error("Request error fetching people", tenant_id=tenant_id, error=str(e))
             raise
 
+    @_cached("person_by_id")
     async def get_person_by_id(self, person_id: str, tenant_id: str) -> dict[str, Any]:
         """Get single person by ID.
 
@@ -988,6 +1073,7 @@ class BusinessApiClient:
             logger.error("Request error fetching person", person_id=person_id, error=str(e))
             raise
 
+    @_cached("departments")
     async def get_departments(self, tenant_id: str) -> list[dict[str, Any]]:
         """List departments for the tenant.
 
@@ -1032,6 +1118,7 @@ class BusinessApiClient:
             logger.error("Request error fetching departments", tenant_id=tenant_id, error=str(e))
             raise
 
+    @_cached("positions")
     async def get_positions(self, tenant_id: str) -> list[dict[str, Any]]:
         """List positions for the tenant.
 
@@ -1076,6 +1163,7 @@ class BusinessApiClient:
             logger.error("Request error fetching positions", tenant_id=tenant_id, error=str(e))
             raise
 
+    @_cached("position_by_id")
     async def get_position_by_id(self, position_id: str, tenant_id: str) -> dict[str, Any]:
         """Get position details by ID.
 
@@ -1120,6 +1208,7 @@ class BusinessApiClient:
             )
             raise
 
+    @_cached("roles")
     async def get_roles(self, tenant_id: str) -> list[dict[str, Any]]:
         """List all roles for the tenant.
 
@@ -1164,6 +1253,7 @@ class BusinessApiClient:
             logger.error("Request error fetching roles", tenant_id=tenant_id, error=str(e))
             raise
 
+    @_cached("measure_catalog")
     async def get_measure_catalog(
         self, tenant_id: str, goal_id: str | None = None
     ) -> dict[str, Any]:
@@ -1353,11 +1443,14 @@ class BusinessApiClient:
 
     async def close(self) -> None:
         """
-        Close the HTTP client and cleanup resources.
+        Close a dedicated HTTP client and cleanup resources.
 
-        Should be called when the client is no longer needed.
+        The shared pooled client is left open for other requests; it is closed
+        on application shutdown via close_shared_http_clients().
         """
-        await self.client.aclose()
+        if self._client is None or is_shared_http_client(self._client):
+            return
+        await self._client.aclose()
         logger.info("Business API client closed")
 
 
@@ -1,6 +1,7 @@
 """Factory functions for creating external API clients."""
 
 from coaching.src.core.config import get_settings
+from coaching.src.infrastructure.external.business_api_cache import get_business_api_cache
 from coaching.src.infrastructure.external.business_api_client import BusinessApiClient
 
 
@@ -42,6 +43,7 @@ def create_business_api_client(jwt_token: str) -> BusinessApiClient:
         jwt_token=jwt_token,
         timeout=settings.business_api_timeout,
         max_retries=settings.business_api_max_retries,
+        cache=get_business_api_cache(),
     )
 
 
@@ -0,0 +1,123 @@
+"""Process-wide pooled HTTP clients for external service calls.
+
+Creating an ``httpx.AsyncClient`` per request pays TCP/TLS setup on every
+call and leaks sockets when the client is never closed. This module keeps one
+pooled client per (event loop, base URL, timeout, retries) so connections are
+reused across requests, while request-scoped data such as the user's JWT and
+tenant headers is passed on each call.
+
+Clients are keyed by event loop because httpx connection pools cannot be
+shared between loops. HTTP/2 is enabled when the optional ``h2`` package is
+installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import weakref
+
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+
+_PoolKey = tuple[str, float, int]
+
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_PoolKey, httpx.AsyncClient]]
+_clients = weakref.WeakKeyDictionary()
+
+
+def http2_available() -> bool:
+    """Check whether HTTP/2 support (the ``h2`` package) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _pool_limits() -> httpx.Limits:
+    """Build connection limits from settings."""
+    from coaching.src.core.config_multitenant import settings
+
+    return httpx.Limits(
+        max_connections=settings.http_pool_max_connections,
+        max_keepalive_connections=settings.http_pool_max_keepalive_connections,
+        keepalive_expiry=settings.http_pool_keepalive_expiry_seconds,
+    )
+
+
+def get_shared_http_client(
+    *,
+    base_url: str,
+    timeout: float = 30,
+    max_retries: int = 3,
+) -> httpx.AsyncClient:
+    """Get the pooled client for a base URL on the running event loop.
+
+    Args:
+        base_url: Base URL requests are made against
+        timeout: Default request timeout in seconds
+        max_retries: Connection retry attempts for the transport
+
+    Returns:
+        Shared AsyncClient; callers must not close it
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    loop_clients = _clients.setdefault(loop, {})
+    key: _PoolKey = (base_url.rstrip("/"), float(timeout), max_retries)
+
+    client = loop_clients.get(key)
+    if client is None or client.is_closed:
+        http2 = http2_available()
+        transport = httpx.AsyncHTTPTransport(
+            retries=max_retries,
+            http2=http2,
+            limits=_pool_limits(),
+        )
+        client = httpx.AsyncClient(
+            base_url=key[0],
+            timeout=timeout,
+            transport=transport,
+            follow_redirects=True,
+        )
+        loop_clients[key] = client
+        logger.info(
+            "Shared HTTP client created",
+            base_url=key[0],
+            timeout=timeout,
+            max_retries=max_retries,
+            http2=http2,
+        )
+
+    return client
+
+
+def is_shared_http_client(client: object) -> bool:
+    """Check whether a client is owned by the shared pool."""
+    return any(client is pooled for clients in _clients.values() for pooled in clients.values())
+
+
+async def close_shared_http_clients() -> int:
+    """Close pooled clients belonging to the running event loop.
+
+    Called on application shutdown.
+
+    Returns:
+        Number of clients closed
+    """
+    loop_clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in loop_clients.values():
+        await client.aclose()
+    if loop_clients:
+        logger.info("Shared HTTP clients closed", count=len(loop_clients))
+    return len(loop_clients)
+
+
+__all__ = [
+    "close_shared_http_clients",
+    "get_shared_http_client",
+    "http2_available",
+    "is_shared_http_client",
+]
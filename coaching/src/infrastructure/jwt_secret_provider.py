@@ -0,0 +1,162 @@
+"""Cached provider for the JWT signing secret.
+
+Token validation runs on every authenticated request. Fetching the secret from
+AWS Secrets Manager each time adds a network round-trip and risks throttling,
+so this provider keeps the secret in memory:
+
+- The secret is cached for ``ttl_seconds``
+- Within ``refresh_ahead_seconds`` of expiry a background thread reloads it,
+  so requests keep using the cached value instead of waiting on the fetch
+- ``refresh()`` forces a reload (used when a signature fails after rotation)
+  and is rate limited so invalid tokens cannot drive Secrets Manager traffic
+- If a reload fails, the previous secret stays in use
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_TTL_SECONDS = 900.0
+DEFAULT_REFRESH_AHEAD_SECONDS = 60.0
+DEFAULT_MIN_REFRESH_INTERVAL_SECONDS = 30.0
+
+
+class JwtSecretProvider:
+    """In-memory TTL cache around a secret loader with background refresh."""
+
+    def __init__(
+        self,
+        loader: Callable[[], str],
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        refresh_ahead_seconds: float = DEFAULT_REFRESH_AHEAD_SECONDS,
+        min_refresh_interval_seconds: float = DEFAULT_MIN_REFRESH_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the provider.
+
+        Args:
+            loader: Blocking callable returning the current secret; raises on failure
+            ttl_seconds: How long a loaded secret is used before a blocking reload
+            refresh_ahead_seconds: Window before expiry in which a background reload starts
+            min_refresh_interval_seconds: Minimum time between forced reloads
+        """
+        self._loader = loader
+        self.ttl_seconds = ttl_seconds
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.min_refresh_interval_seconds = min_refresh_interval_seconds
+
+        self._secret: str | None = None
+        self._loaded_at = 0.0
+        self._last_forced_refresh = float("-inf")
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+        self._last_background_attempt = float("-inf")
+        self._loads = 0
+
+    @property
+    def load_count(self) -> int:
+        """Number of successful loads from the underlying source."""
+        return self._loads
+
+    def get_secret(self) -> str:
+        """Get the current secret, loading it if missing or expired.
+
+        Returns:
+            The secret
+
+        Raises:
+            Exception: If no secret is cached and the loader fails
+        """
+        secret = self._secret
+        age = time.monotonic() - self._loaded_at
+        if secret is not None and age < self.ttl_seconds:
+            if age >= self.ttl_seconds - self.refresh_ahead_seconds:
+                self._start_background_refresh()
+            return secret
+
+        with self._lock:
+            # Another caller may have loaded it while we waited
+            if self._secret is not None and time.monotonic() - self._loaded_at < self.ttl_seconds:
+                return self._secret
+            try:
+                return self._load_locked()
+            except Exception:
+                if self._secret is not None:
+                    logger.warning("jwt_secret.reload_failed_using_cached", exc_info=True)
+                    return self._secret
+                raise
+
+    def refresh(self) -> bool:
+        """Force a reload, e.g. after a signature failure that may mean rotation.
+
+        Returns:
+            True if a new, different secret was loaded
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_forced_refresh < self.min_refresh_interval_seconds:
+                return False
+            self._last_forced_refresh = now
+            previous = self._secret
+            try:
+                current = self._load_locked()
+            except Exception:
+                logger.warning("jwt_secret.forced_refresh_failed", exc_info=True)
+                return False
+
+        changed = current != previous
+        if changed:
+            logger.info("jwt_secret.rotated")
+        return changed
+
+    def invalidate(self) -> None:
+        """Drop the cached secret so the next call reloads it."""
+        with self._lock:
+            self._secret = None
+            self._loaded_at = 0.0
+            self._last_forced_refresh = float("-inf")
+
+    def _load_locked(self) -> str:
+        return self._store(self._loader())
+
+    def _store(self, secret: str) -> str:
+        self._secret = secret
+        self._loaded_at = time.monotonic()
+        self._loads += 1
+        return secret
+
+    def _start_background_refresh(self) -> None:
+        with self._refresh_lock:
+            now = time.monotonic()
+            if (
+                self._refreshing
+                or now - self._last_background_attempt < self.min_refresh_interval_seconds
+            ):
+                return
+            self._refreshing = True
+            self._last_background_attempt = now
+        threading.Thread(
+            target=self._background_refresh, name="jwt-secret-refresh", daemon=True
+        ).start()
+
+    def _background_refresh(self) -> None:
+        try:
+            # Load outside the main lock so requests keep using the cached secret
+            secret = self._loader()
+            with self._lock:
+                self._store(secret)
+            logger.debug("jwt_secret.refreshed_in_background")
+        except Exception:
+            logger.warning("jwt_secret.background_refresh_failed", exc_info=True)
+        finally:
+            self._refreshing = False
+
+
+__all__ = ["JwtSecretProvider"]
@@ -14,6 +14,12 @@ Prompt Caching:
     This reduces processing time for repeated system prompts (e.g., coaching prompts)
     by up to 80% on subsequent requests within the cache TTL.
 
+    Multi-turn conversations resend their whole history each turn, so cache
+    points are also placed on the stable conversation prefix: after the last
+    assistant turn (and the one before it, so the prefix written on the previous
+    turn is read back), within the per-request cache point limit.
+    ``LLMResponse.usage`` reports ``cache_read_tokens`` and ``cache_write_tokens``.
+
     Cache requirements:
     - Claude 3.5 Sonnet+ or Claude 3.5 Haiku+
     - Minimum 1024 tokens (2048 for Claude 3.5 Haiku)
@@ -29,15 +35,19 @@ Note on Inference Profiles:
     See: https://docs.aws.amazon.com/bedrock/latest/userguide/inference-profiles.html
 """
 
-import asyncio
 from collections.abc import AsyncIterator
+from contextlib import aclosing
 from typing import Any, ClassVar
 
 import structlog
 from coaching.src.domain.ports.llm_provider_port import LLMMessage, LLMResponse
+from coaching.src.infrastructure.aws_io import iterate_aws_stream, run_aws_call
 
 logger = structlog.get_logger()
 
+# Stream events buffered between the reader thread and the consumer
+DEFAULT_STREAM_BUFFER_SIZE = 64
+
 # Models that require inference profiles (region-prefixed identifiers)
 # These cannot be invoked with direct model IDs
 INFERENCE_PROFILE_MODELS: set[str] = {
@@ -78,6 +88,13 @@ CACHE_SUPPORTED_MODELS: set[str] = {
 MIN_CACHE_TOKENS_DEFAULT = 1024
 MIN_CACHE_TOKENS_HAIKU = 2048
 
+# Bedrock accepts at most this many cache points per request (system + messages)
+MAX_CACHE_POINTS = 4
+# Cache points placed on conversation history (latest assistant turns)
+MAX_MESSAGE_CACHE_POINTS = 2
+
+CACHE_POINT_BLOCK: dict[str, Any] = {"cachePoint": {"type": "default"}}
+
 
 class BedrockLLMProvider:
     """
@@ -128,16 +145,24 @@ class BedrockLLMProvider:
         "meta.llama3-8b-instruct-v1:0",
     ]
 
-    def __init__(self, bedrock_client: Any, region: str = "us-east-1"):
+    def __init__(
+        self,
+        bedrock_client: Any,
+        region: str = "us-east-1",
+        stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+    ):
         """
         Initialize Bedrock LLM provider.
 
         Args:
             bedrock_client: Boto3 Bedrock Runtime client
             region: AWS region for Bedrock
+            stream_buffer_size: Stream events read ahead of a slow consumer before
+                reading pauses (backpressure)
         """
         self.bedrock_client = bedrock_client
         self.region = region
+        self.stream_buffer_size = stream_buffer_size
         self._region_prefix = self._get_region_prefix(region)
         logger.info("Bedrock LLM provider initialized", region=region)
 
@@ -258,13 +283,16 @@ class BedrockLLMProvider:
                 "inferenceConfig": inference_config,
             }
 
-            # Add system prompt with caching if supported
+            # Add system prompt and conversation cache points if supported
             if system_prompt:
                 request_params["system"] = self._build_system_with_cache(
                     system_prompt, resolved_model
                 )
+            self._add_message_cache_points(
+                converse_messages, resolved_model, request_params.get("system", [])
+            )
 
-            # Use Converse API (async via run_in_executor)
+            # Use Converse API (async on the bounded bedrock-runtime pool)
             logger.debug(
                 "Invoking Bedrock Converse API",
                 original_model=model,
@@ -273,10 +301,9 @@ class BedrockLLMProvider:
             )
 
             # Run synchronous boto3 call in thread pool with graceful caching fallback
-            loop = asyncio.get_event_loop()
             try:
-                response = await loop.run_in_executor(
-                    None, lambda: self.bedrock_client.converse(**request_params)
+                response = await run_aws_call(
+                    "bedrock-runtime", self.bedrock_client.converse, **request_params
                 )
             except Exception as bedrock_error:
                 # Handle AccessDeniedException for prompt caching
@@ -287,12 +314,11 @@ class BedrockLLMProvider:
                         model=resolved_model,
                         error=error_msg,
                     )
-                    # Retry without caching - use simple system prompt format
-                    if system_prompt:
-                        request_params["system"] = [{"text": system_prompt}]
+                    # Retry without caching
+                    self._strip_cache_points(request_params)
 
-                    response = await loop.run_in_executor(
-                        None, lambda: self.bedrock_client.converse(**request_params)
+                    response = await run_aws_call(
+                        "bedrock-runtime", self.bedrock_client.converse, **request_params
                     )
                 else:
                     # Re-raise if not a caching-related error
@@ -310,12 +336,7 @@ class BedrockLLMProvider:
 
             # Extract usage metrics from Converse API response
             usage_data = response.get("usage", {})
-            usage = {
-                "prompt_tokens": usage_data.get("inputTokens", 0),
-                "completion_tokens": usage_data.get("outputTokens", 0),
-                "total_tokens": usage_data.get("inputTokens", 0)
-                + usage_data.get("outputTokens", 0),
-            }
+            usage = self._build_usage(usage_data)
 
             # Extract stop reason
             stop_reason = response.get("stopReason", "end_turn")
@@ -336,11 +357,9 @@ class BedrockLLMProvider:
             )
 
             # Log cache usage if available (Claude models report cache metrics)
-            cache_read_tokens = usage_data.get("cacheReadInputTokens", 0)
-            cache_write_tokens = usage_data.get("cacheCreationInputTokens", 0)
+            cache_read_tokens = usage["cache_read_tokens"]
+            cache_write_tokens = usage["cache_write_tokens"]
             if cache_read_tokens > 0 or cache_write_tokens > 0:
-                usage["cache_read_tokens"] = cache_read_tokens
-                usage["cache_write_tokens"] = cache_write_tokens
                 logger.info(
                     "Prompt cache metrics",
                     model=model,
@@ -369,6 +388,7 @@ class BedrockLLMProvider:
         temperature: float = 0.7,
         max_tokens: int | None = None,
         system_prompt: str | None = None,
+        usage: dict[str, int] | None = None,
     ) -> AsyncIterator[str]:
         """
         Generate a completion with token streaming using Converse Stream API.
@@ -379,6 +399,7 @@ class BedrockLLMProvider:
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens to generate
             system_prompt: Optional system prompt
+            usage: Optional dict filled with token usage once the stream reports it
 
         Yields:
             Token strings as they are generated
@@ -406,11 +427,14 @@ class BedrockLLMProvider:
                 "inferenceConfig": inference_config,
             }
 
-            # Add system prompt with caching if supported
+            # Add system prompt and conversation cache points if supported
             if system_prompt:
                 request_params["system"] = self._build_system_with_cache(
                     system_prompt, resolved_model
                 )
+            self._add_message_cache_points(
+                converse_messages, resolved_model, request_params.get("system", [])
+            )
 
             logger.debug(
                 "Starting Bedrock Converse Stream",
@@ -420,10 +444,9 @@ class BedrockLLMProvider:
 
             # Use Converse Stream API with graceful caching fallback
             # Run in thread pool since boto3 is synchronous
-            loop = asyncio.get_event_loop()
             try:
-                response = await loop.run_in_executor(
-                    None, lambda: self.bedrock_client.converse_stream(**request_params)
+                response = await run_aws_call(
+                    "bedrock-runtime", self.bedrock_client.converse_stream, **request_params
                 )
             except Exception as bedrock_error:
                 # Handle AccessDeniedException for prompt caching
@@ -434,25 +457,44 @@ class BedrockLLMProvider:
                         model=resolved_model,
                         error=error_msg,
                     )
-                    # Retry without caching - use simple system prompt format
-                    if system_prompt:
-                        request_params["system"] = [{"text": system_prompt}]
+                    # Retry without caching
+                    self._strip_cache_points(request_params)
 
-                    response = await loop.run_in_executor(
-                        None, lambda: self.bedrock_client.converse_stream(**request_params)
+                    response = await run_aws_call(
+                        "bedrock-runtime", self.bedrock_client.converse_stream, **request_params
                     )
                 else:
                     # Re-raise if not a caching-related error
                     raise
 
-            # Process streaming response
+            # Process streaming response. The EventStream blocks on each read, so
+            # it is consumed on a pool thread; if the caller stops early (client
+            # disconnect) the HTTP stream is closed to free that thread.
             stream = response.get("stream")
             if stream:
-                for event in stream:
-                    if "contentBlockDelta" in event:
-                        delta = event["contentBlockDelta"].get("delta", {})
-                        if "text" in delta:
-                            yield delta["text"]
+                events = iterate_aws_stream(
+                    "bedrock-runtime",
+                    stream,
+                    max_buffered=self.stream_buffer_size,
+                    close=getattr(stream, "close", None),
+                )
+                async with aclosing(events):
+                    async for event in events:
+                        if "contentBlockDelta" in event:
+                            delta = event["contentBlockDelta"].get("delta", {})
+                            if "text" in delta:
+                                yield delta["text"]
+                        elif "metadata" in event:
+                            stream_usage = self._build_usage(event["metadata"].get("usage", {}))
+                            if usage is not None:
+                                usage.update(stream_usage)
+                            logger.info(
+                                "Bedrock stream usage",
+                                model=model,
+                                tokens=stream_usage["total_tokens"],
+                                cache_read_tokens=stream_usage["cache_read_tokens"],
+                                cache_write_tokens=stream_usage["cache_write_tokens"],
+                            )
 
         except Exception as e:
             logger.error("Bedrock streaming failed", model=model, error=str(e))
@@ -506,6 +548,99 @@ class BedrockLLMProvider:
 
         return converse_messages
 
+    @staticmethod
+    def _build_usage(usage_data: dict[str, Any]) -> dict[str, int]:
+        """Convert Converse API usage to ``LLMResponse.usage``.
+
+        ``inputTokens`` excludes cached tokens, so ``prompt_tokens`` counts only
+        uncached input; cache reads and writes are reported separately.
+        """
+        input_tokens = usage_data.get("inputTokens", 0)
+        output_tokens = usage_data.get("outputTokens", 0)
+        return {
+            "prompt_tokens": input_tokens,
+            "completion_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "cache_read_tokens": usage_data.get("cacheReadInputTokens", 0),
+            "cache_write_tokens": usage_data.get(
+                "cacheWriteInputTokens", usage_data.get("cacheCreationInputTokens", 0)
+            ),
+        }
+
+    @staticmethod
+    def _min_cache_tokens(resolved_model: str) -> int:
+        """Get the minimum prefix size Bedrock will cache for a model."""
+        return (
+            MIN_CACHE_TOKENS_HAIKU
+            if "haiku" in resolved_model.lower()
+            else MIN_CACHE_TOKENS_DEFAULT
+        )
+
+    def _add_message_cache_points(
+        self,
+        converse_messages: list[dict[str, Any]],
+        resolved_model: str,
+        system_blocks: list[dict[str, Any]],
+    ) -> None:
+        """Place cache points on the stable prefix of a multi-turn conversation.
+
+        Everything up to the last assistant turn is resent unchanged on the next
+        turn, so a cache point after it lets the next request read that prefix
+        from cache. A second point after the previous assistant turn matches the
+        prefix written by the previous request. Points are only placed where the
+        prefix meets the model's minimum cache size, and the total (including the
+        system prompt's) stays within MAX_CACHE_POINTS.
+
+        Args:
+            converse_messages: Converse API messages, modified in place
+            resolved_model: The resolved model ID
+            system_blocks: System content blocks already built for the request
+        """
+        if resolved_model not in CACHE_SUPPORTED_MODELS:
+            return
+
+        used = sum(1 for block in system_blocks if "cachePoint" in block)
+        budget = min(MAX_MESSAGE_CACHE_POINTS, MAX_CACHE_POINTS - used)
+        if budget <= 0:
+            return
+
+        min_tokens = self._min_cache_tokens(resolved_model)
+        # Estimate prefix size (rough estimate: 4 chars per token)
+        prefix_chars = sum(len(block.get("text", "")) for block in system_blocks)
+        prefix_tokens: list[int] = []
+        for message in converse_messages:
+            prefix_chars += sum(len(block.get("text", "")) for block in message["content"])
+            prefix_tokens.append(prefix_chars // 4)
+
+        # The final message is the new user turn; only earlier turns are stable
+        placed: list[int] = []
+        for index in range(len(converse_messages) - 2, -1, -1):
+            if len(placed) == budget or prefix_tokens[index] < min_tokens:
+                break
+            if converse_messages[index]["role"] == "assistant":
+                converse_messages[index]["content"].append(dict(CACHE_POINT_BLOCK))
+                placed.append(index)
+
+        if placed:
+            logger.debug(
+                "Adding cache points to conversation history",
+                message_indexes=placed,
+                estimated_prefix_tokens=prefix_tokens[placed[0]],
+                model=resolved_model,
+            )
+
+    @staticmethod
+    def _strip_cache_points(request_params: dict[str, Any]) -> None:
+        """Remove all cache points from a Converse request (caching unavailable)."""
+        if "system" in request_params:
+            request_params["system"] = [
+                block for block in request_params["system"] if "cachePoint" not in block
+            ]
+        for message in request_params["messages"]:
+            message["content"] = [
+                block for block in message["content"] if "cachePoint" not in block
+            ]
+
     def _build_system_with_cache(
         self,
         system_prompt: str,
@@ -537,11 +672,7 @@ class BedrockLLMProvider:
         estimated_tokens = len(system_prompt) // 4
 
         # Get minimum cache tokens for model type
-        min_tokens = (
-            MIN_CACHE_TOKENS_HAIKU
-            if "haiku" in resolved_model.lower()
-            else MIN_CACHE_TOKENS_DEFAULT
-        )
+        min_tokens = self._min_cache_tokens(resolved_model)
 
         # Only add cache_control if prompt meets minimum token requirement
         if estimated_tokens < min_tokens:
@@ -562,7 +693,7 @@ class BedrockLLMProvider:
         )
         return [
             {"text": system_prompt},
-            {"cachePoint": {"type": "default"}},
+            dict(CACHE_POINT_BLOCK),
         ]
 
 
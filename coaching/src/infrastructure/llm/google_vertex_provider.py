@@ -381,6 +381,7 @@ class GoogleVertexLLMProvider:
         temperature: float = 0.7,
         max_tokens: int | None = None,
         system_prompt: str | None = None,
+        usage: dict[str, int] | None = None,
     ) -> AsyncIterator[str]:
         """
         Generate a completion with token streaming using async API.
@@ -391,6 +392,7 @@ class GoogleVertexLLMProvider:
             temperature: Sampling temperature (0.0-2.0 for Gemini)
             max_tokens: Maximum tokens to generate
             system_prompt: Optional system prompt
+            usage: Optional dict filled with token usage once the stream reports it
 
         Yields:
             Token strings as they are generated
@@ -450,6 +452,17 @@ class GoogleVertexLLMProvider:
             ):
                 if chunk.text:
                     yield chunk.text
+                # Usage metadata is cumulative; the last chunk carries the totals
+                if usage is not None and getattr(chunk, "usage_metadata", None):
+                    usage_meta = chunk.usage_metadata
+                    usage.update(
+                        {
+                            "prompt_tokens": getattr(usage_meta, "prompt_token_count", 0) or 0,
+                            "completion_tokens": getattr(usage_meta, "candidates_token_count", 0)
+                            or 0,
+                            "total_tokens": getattr(usage_meta, "total_token_count", 0) or 0,
+                        }
+                    )
 
         except Exception as e:
             logger.error("Google Vertex AI streaming API call failed", error=str(e), model=model)
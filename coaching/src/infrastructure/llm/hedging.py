@@ -0,0 +1,347 @@
+"""Hedged LLM requests for latency-critical topics.
+
+On the synchronous API paths a single slow provider call decides whether a
+request hits the 30 s API Gateway timeout. Topics that opt in
+(``additional_config["hedge_enabled"]``) get a ``HedgedLLMProvider``: if the
+first request has not answered after the model's observed p90 latency, a
+duplicate is sent to the same model (or ``hedge_model_code``); the first
+successful response wins and the other request is cancelled. A primary
+cancelled this way is sampled at its elapsed time, a lower bound on its
+latency, so the percentile is not computed from fast calls alone.
+
+
+Extra spend is capped by a process-wide ``HedgeBudget``: every request earns
+a fraction of a hedge (``LLM_HEDGE_BUDGET_RATIO``), and a hedge is only sent
+when a whole one has been earned.
+
+Metrics (``Topic``/``Model`` dimensions):
+    LLM_HedgeFired, LLM_HedgeWon, LLM_HedgeBudgetExhausted. The hedge win
+    rate is LLM_HedgeWon / LLM_HedgeFired.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from coaching.src.infrastructure.llm.routing import LLMRouter, ProviderRoute
+from shared.observability.metrics import get_metrics, llm_dimensions
+
+if TYPE_CHECKING:
+    from coaching.src.domain.ports.llm_provider_port import LLMMessage, LLMResponse
+
+logger = structlog.get_logger(__name__)
+
+# Topic additional_config keys
+CONFIG_ENABLED = "hedge_enabled"
+CONFIG_DELAY_MS = "hedge_delay_ms"
+CONFIG_PERCENTILE = "hedge_percentile"
+CONFIG_MODEL_CODE = "hedge_model_code"
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """Per-topic hedging configuration."""
+
+    topic_id: str
+    percentile: float = 90.0
+    delay_ms: float | None = None  # Fixed delay instead of the observed percentile
+    model_code: str | None = None  # Equivalent model for the hedge (default: same model)
+
+    @classmethod
+    def from_config(cls, topic_id: str, config: Mapping[str, Any]) -> HedgePolicy | None:
+        """Build a policy from topic ``additional_config``.
+
+        Returns:
+            The policy, or None if the topic has not opted in
+        """
+        if not config.get(CONFIG_ENABLED):
+            return None
+        delay_ms = config.get(CONFIG_DELAY_MS)
+        return cls(
+            topic_id=topic_id,
+            percentile=float(config.get(CONFIG_PERCENTILE) or 90.0),
+            delay_ms=float(delay_ms) if delay_ms is not None else None,
+            model_code=config.get(CONFIG_MODEL_CODE) or None,
+        )
+
+
+class HedgeBudget:
+    """Caps hedges to a fraction of requests.
+
+    Each request earns ``ratio`` credits (up to ``burst``) and each hedge
+    spends one, so over time at most ``ratio`` of requests are duplicated.
+    """
+
+    def __init__(self, ratio: float = 0.1, burst: float = 10.0) -> None:
+        """Initialize an empty budget.
+
+        Args:
+            ratio: Hedges allowed per request (0.1 = at most 10% extra calls)
+            burst: Maximum credits saved up during quiet periods
+        """
+        self.ratio = ratio
+        self.burst = burst
+        self._credits = 0.0
+        self._lock = threading.Lock()
+
+    def earn(self) -> None:
+        """Credit one request."""
+        with self._lock:
+            self._credits = min(self.burst, self._credits + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Spend a hedge if one has been earned."""
+        with self._lock:
+            if self._credits < 1.0:
+                return False
+            self._credits -= 1.0
+            return True
+
+
+@dataclass
+class HedgeStats:
+    """In-process hedge counters."""
+
+    requests: int = 0
+    fired: int = 0
+    won: int = 0
+    budget_exhausted: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        """Get the fraction of hedges that answered first."""
+        return self.won / self.fired if self.fired else 0.0
+
+
+class HedgedLLMProvider:
+    """LLM provider that sends a delayed duplicate request for tail latency.
+
+    Implements ``LLMProviderPort``. Only ``generate`` is hedged; streams are
+    passed through to the primary, since their first token already arrives
+    long before the API Gateway limit.
+    """
+
+    def __init__(
+        self,
+        primary: ProviderRoute,
+        hedge: ProviderRoute,
+        policy: HedgePolicy,
+        router: LLMRouter,
+        budget: HedgeBudget,
+        *,
+        default_delay_ms: float = 3000.0,
+        min_delay_ms: float = 100.0,
+        record_primary_latency: bool = True,
+        stats: HedgeStats | None = None,
+    ) -> None:
+        """Initialize the hedged provider.
+
+        Args:
+            primary: Route for the first request
+            hedge: Route for the duplicate (same or equivalent model)
+            policy: Topic hedging policy
+            router: Shared latency windows the hedge delay is taken from
+            budget: Shared hedge budget
+            default_delay_ms: Delay used until the model has enough latency samples
+            min_delay_ms: Lower bound on the hedge delay
+            record_primary_latency: Record primary latencies in the router
+                (False when the primary route records them itself)
+            stats: Counters to update (shared per topic by the factory)
+        """
+        self.primary = primary
+        self.hedge = hedge
+        self.policy = policy
+        self.router = router
+        self.budget = budget
+        self.default_delay_ms = default_delay_ms
+        self.min_delay_ms = min_delay_ms
+        self.record_primary_latency = record_primary_latency
+        self.stats = stats or HedgeStats()
+
+    @property
+    def provider_name(self) -> str:
+        """Get the primary route's provider name."""
+        return str(self.primary.provider.provider_name)
+
+    @property
+    def supported_models(self) -> list[str]:
+        """Get the model names of both routes."""
+        return list(dict.fromkeys([self.primary.model_name, self.hedge.model_name]))
+
+    def hedge_delay_seconds(self) -> float:
+        """Get the delay before hedging: fixed, observed percentile, or default."""
+        delay_ms = self.policy.delay_ms
+        if delay_ms is None:
+            delay_ms = self.router.percentile(self.primary.key, self.policy.percentile)
+        if delay_ms is None:
+            delay_ms = self.default_delay_ms
+        return max(delay_ms, self.min_delay_ms) / 1000
+
+    def _record(self, metric_name: str, route: ProviderRoute) -> None:
+        get_metrics().record_metric(
+            metric_name,
+            1.0,
+            "Count",
+            llm_dimensions(model=route.model_code, topic=self.policy.topic_id),
+        )
+
+    async def generate(
+        self,
+        messages: list[LLMMessage],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        system_prompt: str | None = None,
+        response_schema: dict[str, object] | None = None,
+    ) -> LLMResponse:
+        """Generate a completion, hedging if the primary is slow.
+
+        Returns:
+            The first successful response; ``metadata["hedge"]`` records whether
+            a hedge was sent and which request won
+        """
+        _ = model  # Each route uses its own model name
+
+        def call(route: ProviderRoute) -> asyncio.Task[LLMResponse]:
+            return asyncio.ensure_future(
+                route.provider.generate(
+                    messages=messages,
+                    model=route.model_name,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    system_prompt=system_prompt,
+                    response_schema=response_schema,
+                )
+            )
+
+        self.stats.requests += 1
+        self.budget.earn()
+        started = time.monotonic()
+        delay = self.hedge_delay_seconds()
+        primary = call(self.primary)
+        tasks = {primary: self.primary}
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                response = primary.result()
+                self._record_primary_latency(started)
+                response.metadata["hedge"] = {"fired": False}
+                return response
+
+            if not self.budget.try_spend():
+                self.stats.budget_exhausted += 1
+                self._record("LLM_HedgeBudgetExhausted", self.primary)
+                response = await primary
+                self._record_primary_latency(started)
+                response.metadata["hedge"] = {"fired": False, "budget_exhausted": True}
+                return response
+
+            self.stats.fired += 1
+            self._record("LLM_HedgeFired", self.primary)
+            logger.info(
+                "llm_hedge.fired",
+                topic_id=self.policy.topic_id,
+                model_code=self.primary.model_code,
+                hedge_model_code=self.hedge.model_code,
+                delay_ms=round(delay * 1000),
+            )
+            hedge = call(self.hedge)
+            tasks[hedge] = self.hedge
+            return await self._first_success(tasks, hedge, started, delay)
+        finally:
+            # Cancel the loser (or everything, if the caller was cancelled)
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            if losers:
+                await asyncio.gather(*losers, return_exceptions=True)
+
+    async def _first_success(
+        self,
+        tasks: dict[asyncio.Task[LLMResponse], ProviderRoute],
+        hedge: asyncio.Task[LLMResponse],
+        started: float,
+        delay: float,
+    ) -> LLMResponse:
+        """Wait for the first successful response among the primary and the hedge."""
+        pending = set(tasks)
+        errors: list[BaseException] = []
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task_error = task.exception()
+                if task_error is not None:
+                    errors.append(task_error)
+                    continue
+                won = task is hedge
+                if won:
+                    self.stats.won += 1
+                    self._record("LLM_HedgeWon", self.primary)
+                    if pending:
+                        # The primary is about to be cancelled. Its elapsed time is a
+                        # lower bound on its latency; leaving it out would keep only
+                        # calls faster than the delay and drag the percentile down.
+                        self._record_primary_latency(started, cancelled=True)
+                else:
+                    self._record_primary_latency(started)
+                response = task.result()
+                response.metadata["hedge"] = {
+                    "fired": True,
+                    "won": won,
+                    "model_code": tasks[task].model_code,
+                    "delay_ms": round(delay * 1000),
+                }
+                return response
+
+        # Both requests failed: surface the first error
+        raise errors[0]
+
+    def _record_primary_latency(self, started: float, *, cancelled: bool = False) -> None:
+        # Routes that record their own latencies never see a cancelled call
+        if self.record_primary_latency or cancelled:
+            self.router.latency(self.primary.key).add((time.monotonic() - started) * 1000)
+
+    def generate_stream(
+        self,
+        messages: list[LLMMessage],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        system_prompt: str | None = None,
+        usage: dict[str, int] | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream from the primary route (streams are not hedged)."""
+        _ = model
+        stream: AsyncIterator[str] = self.primary.provider.generate_stream(
+            messages=messages,
+            model=self.primary.model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            usage=usage,
+        )
+        return stream
+
+    async def count_tokens(self, text: str, model: str) -> int:
+        """Count tokens with the primary route's provider."""
+        _ = model
+        count: int = await self.primary.provider.count_tokens(text, self.primary.model_name)
+        return count
+
+    async def validate_model(self, model: str) -> bool:
+        """Check whether a model name belongs to one of the routes."""
+        return model in self.supported_models
+
+
+__all__ = [
+    "HedgeBudget",
+    "HedgePolicy",
+    "HedgeStats",
+    "HedgedLLMProvider",
+]
@@ -298,6 +298,7 @@ class OpenAILLMProvider:
         temperature: float = 0.7,
         max_tokens: int | None = None,
         system_prompt: str | None = None,
+        usage: dict[str, int] | None = None,
     ) -> AsyncIterator[str]:
         """
         Generate a completion with token streaming using Responses API.
@@ -308,6 +309,7 @@ class OpenAILLMProvider:
             temperature: Sampling temperature (0.0-2.0 for OpenAI)
             max_tokens: Maximum tokens to generate
             system_prompt: Optional system prompt
+            usage: Optional dict filled with token usage once the stream reports it
 
         Yields:
             Token strings as they are generated
@@ -388,6 +390,18 @@ class OpenAILLMProvider:
                             and hasattr(event.delta, "text")
                         ):
                             yield event.delta.text
+                        elif (
+                            event.type == "response.completed"
+                            and usage is not None
+                            and getattr(event.response, "usage", None)
+                        ):
+                            usage.update(
+                                {
+                                    "prompt_tokens": event.response.usage.input_tokens,
+                                    "completion_tokens": event.response.usage.output_tokens,
+                                    "total_tokens": event.response.usage.total_tokens,
+                                }
+                            )
 
         except Exception as e:
             logger.error("OpenAI Responses API streaming failed", error=str(e), model=model)
@@ -10,6 +10,9 @@ Design:
     - Model code resolution to actual model name
     - Lazy initialization of providers
     - Provider-specific credential validation
+    - Optional failover to equivalent models on other providers, with
+      per-provider/model circuit breakers and p95 latency routing (see routing.py)
+    - Optional hedged requests for latency-critical topics (see hedging.py)
 
 Architecture:
     Infrastructure layer component following Clean Architecture.
@@ -20,11 +23,18 @@ Usage:
     provider, model_name = factory.get_provider_for_model("GPT_5_MINI")
     response = await provider.generate(messages, model=model_name, ...)
 
+    # With failover to equivalent models
+    provider, model_name = factory.get_provider_for_model(
+        "CLAUDE_3_5_HAIKU", fallback_model_codes=["GPT_5_MINI", "GEMINI_2_5_FLASH"]
+    )
+
 Related Issues:
     - Issue #136: Implement LLM Provider Factory
     - Issue #75: Add support for Claude 4/4.5, GPT-5, and Gemini 2.5 models
 """
 
+from collections.abc import Sequence
+from dataclasses import replace
 from typing import Any
 
 import structlog
@@ -40,10 +50,22 @@ from coaching.src.core.llm_models import (
     get_model,
 )
 from coaching.src.infrastructure.llm.exceptions import (
+    LLMProviderError,
     ModelNotAvailableError,
     ModelNotFoundError,
     ProviderNotConfiguredError,
 )
+from coaching.src.infrastructure.llm.hedging import (
+    HedgeBudget,
+    HedgedLLMProvider,
+    HedgePolicy,
+    HedgeStats,
+)
+from coaching.src.infrastructure.llm.routing import (
+    FailoverLLMProvider,
+    LLMRouter,
+    ProviderRoute,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -61,28 +83,36 @@ class LLMProviderFactory:
         _settings: Application settings for provider configuration
         _providers: Cache of instantiated provider instances
         _bedrock_client: Optional pre-injected Bedrock client for testing
+        _router: Circuit breakers and latency windows for failover routing
     """
 
     def __init__(
         self,
         settings: Settings,
         bedrock_client: Any | None = None,
+        router: LLMRouter | None = None,
     ) -> None:
         """Initialize the LLM Provider Factory.
 
         Args:
             settings: Application settings with provider configuration
             bedrock_client: Optional Bedrock client (for dependency injection in tests)
+            router: Optional failover router (created from settings on first use)
         """
         self._settings = settings
         # Use Any to avoid Protocol parameter name compatibility issues
         self._providers: dict[LLMProvider, Any] = {}
         self._bedrock_client = bedrock_client
+        self._router = router
+        self._hedge_budget: HedgeBudget | None = None
+        self._hedge_stats: dict[str, HedgeStats] = {}
         logger.info("LLM Provider Factory initialized")
 
     def get_provider_for_model(
         self,
         model_code: str,
+        fallback_model_codes: Sequence[str] | None = None,
+        hedge_policy: HedgePolicy | None = None,
     ) -> tuple[Any, str]:
         """Get provider instance and resolved model name for a model code.
 
@@ -92,8 +122,17 @@ class LLMProviderFactory:
         3. Gets or creates the appropriate provider
         4. Returns the provider and the actual model name for API calls
 
+        When ``fallback_model_codes`` resolves to at least one usable model, the
+        provider returned is a ``FailoverLLMProvider`` over the primary and
+        fallback routes. Unusable fallbacks (unknown, inactive, unconfigured)
+        are skipped with a warning; the primary model is still validated strictly.
+        With a ``hedge_policy`` the result is further wrapped in a
+        ``HedgedLLMProvider``.
+
         Args:
             model_code: Model code from MODEL_REGISTRY (e.g., "GPT_5_MINI", "CLAUDE_3_5_SONNET")
+            fallback_model_codes: Optional equivalent models to fail over to, in order
+            hedge_policy: Optional hedging policy for latency-critical topics
 
         Returns:
             Tuple of (provider_instance, actual_model_name)
@@ -139,7 +178,101 @@ class LLMProviderFactory:
             provider=model_config.provider.value,
         )
 
-        return provider, model_config.model_name
+        primary = ProviderRoute(
+            provider=provider,
+            provider_type=model_config.provider.value,
+            model_code=model_code,
+            model_name=model_config.model_name,
+        )
+
+        # Step 4: Wrap in a failover provider when fallbacks are configured
+        if fallback_model_codes and self._settings.llm_failover_enabled:
+            routes = [primary]
+            routes.extend(self._resolve_fallback_routes(model_code, fallback_model_codes))
+            if len(routes) > 1:
+                primary = replace(primary, provider=FailoverLLMProvider(routes, self.router))
+
+        # Step 5: Wrap in a hedged provider for latency-critical topics
+        if hedge_policy is not None and self._settings.llm_hedging_enabled:
+            return self._create_hedged_provider(primary, hedge_policy), model_config.model_name
+
+        return primary.provider, model_config.model_name
+
+    @property
+    def router(self) -> LLMRouter:
+        """Get the failover router (breakers and latency stats shared by all topics)."""
+        if self._router is None:
+            self._router = LLMRouter.from_settings(self._settings)
+        return self._router
+
+    def get_hedge_stats(self) -> dict[str, HedgeStats]:
+        """Get hedge counters per topic."""
+        return dict(self._hedge_stats)
+
+    def _create_hedged_provider(
+        self,
+        primary: ProviderRoute,
+        policy: HedgePolicy,
+    ) -> HedgedLLMProvider:
+        """Wrap a route in a hedged provider sharing the factory's budget and stats."""
+        hedge = primary
+        if policy.model_code and policy.model_code != primary.model_code:
+            resolved = self._resolve_fallback_routes(primary.model_code, [policy.model_code])
+            hedge = resolved[0] if resolved else primary
+
+        if self._hedge_budget is None:
+            self._hedge_budget = HedgeBudget(
+                ratio=self._settings.llm_hedge_budget_ratio,
+                burst=self._settings.llm_hedge_budget_burst,
+            )
+        stats = self._hedge_stats.setdefault(policy.topic_id, HedgeStats())
+        return HedgedLLMProvider(
+            primary,
+            hedge,
+            policy,
+            self.router,
+            self._hedge_budget,
+            default_delay_ms=self._settings.llm_hedge_default_delay_ms,
+            min_delay_ms=self._settings.llm_hedge_min_delay_ms,
+            # Failover providers record their own route latencies
+            record_primary_latency=not isinstance(primary.provider, FailoverLLMProvider),
+            stats=stats,
+        )
+
+    def _resolve_fallback_routes(
+        self,
+        model_code: str,
+        fallback_model_codes: Sequence[str],
+    ) -> list[ProviderRoute]:
+        """Resolve fallback model codes to routes, skipping unusable ones."""
+        routes: list[ProviderRoute] = []
+        seen = {model_code}
+        for code in fallback_model_codes:
+            if code in seen:
+                continue
+            seen.add(code)
+            try:
+                config = self.get_model_info(code)
+                if not config.is_active:
+                    raise ModelNotAvailableError(code, reason="Model is marked as inactive.")
+                provider = self._get_or_create_provider(config.provider)
+            except (LLMProviderError, ImportError) as e:
+                logger.warning(
+                    "Skipping unusable fallback model",
+                    model_code=model_code,
+                    fallback_model_code=code,
+                    error=str(e),
+                )
+                continue
+            routes.append(
+                ProviderRoute(
+                    provider=provider,
+                    provider_type=config.provider.value,
+                    model_code=code,
+                    model_name=config.model_name,
+                )
+            )
+        return routes
 
     def get_model_info(self, model_code: str) -> SupportedModel:
         """Get model configuration from registry.
@@ -0,0 +1,521 @@
+"""Cross-provider failover and latency-aware routing for LLM calls.
+
+A topic can list equivalent models on other providers
+(``additional_config["fallback_model_codes"]``). The provider factory then
+returns a ``FailoverLLMProvider`` that tries those routes in order of measured
+latency, skips routes whose circuit breaker is open and moves on to the next
+route when a call fails or exceeds the per-attempt timeout.
+
+Circuit breakers and latency windows are kept per (provider, model) in an
+``LLMRouter`` shared by every topic in the process, so a provider throttling
+one topic is skipped by all of them.
+
+The route used and any failed attempts are recorded in
+``LLMResponse.metadata["routing"]``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from coaching.src.infrastructure.llm.exceptions import LLMProviderError
+
+if TYPE_CHECKING:
+    from coaching.src.core.config_multitenant import Settings
+    from coaching.src.domain.ports.llm_provider_port import LLMMessage, LLMResponse
+
+logger = structlog.get_logger(__name__)
+
+# Caller errors (bad temperature, unsupported model) fail the same on every route
+NON_RETRYABLE_ERRORS: tuple[type[BaseException], ...] = (ValueError, TypeError)
+
+RouteKey = tuple[str, str]
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one provider and model.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and the
+    route is skipped. After ``recovery_seconds`` a single trial call is let
+    through (half-open); success closes the circuit, failure reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_seconds: Time an open circuit waits before a trial call
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at >= self.recovery_seconds:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def can_attempt(self) -> bool:
+        """Check whether ``allow_request`` would let a call through, without claiming."""
+        state = self.state
+        return state is CircuitState.CLOSED or (
+            state is CircuitState.HALF_OPEN and not self._trial_in_flight
+        )
+
+    def allow_request(self) -> bool:
+        """Check whether a call may go to this route, claiming the half-open trial.
+
+        A claimed trial must end in ``record_success``, ``record_failure`` or
+        ``release``; until then no other call gets through the half-open circuit.
+        """
+        if not self.can_attempt():
+            return False
+        if self.state is CircuitState.HALF_OPEN:
+            self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Give up a claimed trial without recording an outcome."""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        self._failures += 1
+        self._trial_in_flight = False
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+
+
+class LatencyWindow:
+    """Rolling window of successful call latencies."""
+
+    def __init__(self, size: int = 100) -> None:
+        """Initialize an empty window.
+
+        Args:
+            size: Number of most recent samples kept
+        """
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def add(self, latency_ms: float) -> None:
+        """Record a sample."""
+        self._samples.append(latency_ms)
+
+    def __len__(self) -> int:
+        """Get the number of samples."""
+        return len(self._samples)
+
+    def percentile(self, q: float) -> float | None:
+        """Get a latency percentile (nearest rank), or None without samples.
+
+        Args:
+            q: Percentile between 0 and 100
+        """
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+    def p95(self) -> float | None:
+        """Get the 95th percentile latency, or None without samples."""
+        return self.percentile(95)
+
+
+@dataclass(frozen=True)
+class ProviderRoute:
+    """One way to serve a request: a provider and model."""
+
+    provider: Any
+    provider_type: str
+    model_code: str
+    model_name: str
+
+    @property
+    def key(self) -> RouteKey:
+        """Get the breaker/latency key."""
+        return (self.provider_type, self.model_code)
+
+
+@dataclass
+class RouteAttempt:
+    """A failed attempt on a route."""
+
+    route: ProviderRoute
+    error: str
+    skipped: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to response metadata."""
+        return {
+            "provider": self.route.provider_type,
+            "model_code": self.route.model_code,
+            "error": self.error,
+            "skipped": self.skipped,
+        }
+
+
+class AllRoutesFailedError(LLMProviderError):
+    """Raised when every route in a failover chain failed or was unavailable."""
+
+    def __init__(self, attempts: list[RouteAttempt]) -> None:
+        """Initialize with the failed attempts.
+
+        Args:
+            attempts: Attempts in the order they were made
+        """
+        self.attempts = attempts
+        summary = "; ".join(
+            f"{a.route.provider_type}/{a.route.model_code}: {a.error}" for a in attempts
+        )
+        super().__init__(f"All LLM routes failed: {summary}")
+
+
+@dataclass
+class LLMRouter:
+    """Process-wide circuit breakers and latency windows per (provider, model)."""
+
+    failure_threshold: int = 5
+    recovery_seconds: float = 30.0
+    latency_window: int = 100
+    min_latency_samples: int = 5
+    attempt_timeout_seconds: float | None = 20.0
+    clock: Callable[[], float] = time.monotonic
+    _breakers: dict[RouteKey, CircuitBreaker] = field(default_factory=dict)
+    _latencies: dict[RouteKey, LatencyWindow] = field(default_factory=dict)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> LLMRouter:
+        """Create a router from application settings."""
+        return cls(
+            failure_threshold=settings.llm_circuit_failure_threshold,
+            recovery_seconds=settings.llm_circuit_recovery_seconds,
+            latency_window=settings.llm_latency_window,
+            min_latency_samples=settings.llm_latency_min_samples,
+            attempt_timeout_seconds=settings.llm_failover_attempt_timeout_seconds,
+        )
+
+    def breaker(self, key: RouteKey) -> CircuitBreaker:
+        """Get (creating) the breaker for a route."""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.recovery_seconds, self.clock)
+            self._breakers[key] = breaker
+        return breaker
+
+    def latency(self, key: RouteKey) -> LatencyWindow:
+        """Get (creating) the latency window for a route."""
+        window = self._latencies.get(key)
+        if window is None:
+            window = LatencyWindow(self.latency_window)
+            self._latencies[key] = window
+        return window
+
+    def percentile(self, key: RouteKey, q: float) -> float | None:
+        """Get a route's latency percentile, or None until it has enough samples."""
+        window = self._latencies.get(key)
+        if window is None or len(window) < self.min_latency_samples:
+            return None
+        return window.percentile(q)
+
+    def p95(self, key: RouteKey) -> float | None:
+        """Get a route's p95 latency, or None until it has enough samples."""
+        return self.percentile(key, 95)
+
+    def order(self, routes: Sequence[ProviderRoute]) -> list[ProviderRoute]:
+        """Order routes by measured p95 latency.
+
+        Routes without enough samples keep their configured order after the
+        measured ones, so the primary is used until latencies are known.
+        """
+
+        def sort_key(indexed: tuple[int, ProviderRoute]) -> tuple[float, int]:
+            index, route = indexed
+            p95 = self.p95(route.key)
+            return (p95 if p95 is not None else math.inf, index)
+
+        return [route for _, route in sorted(enumerate(routes), key=sort_key)]
+
+    def record_success(self, route: ProviderRoute, latency_ms: float) -> None:
+        """Record a successful call."""
+        self.breaker(route.key).record_success()
+        self.latency(route.key).add(latency_ms)
+
+    def record_failure(self, route: ProviderRoute) -> None:
+        """Record a failed call."""
+        breaker = self.breaker(route.key)
+        breaker.record_failure()
+        if breaker.state is CircuitState.OPEN:
+            logger.warning(
+                "llm_routing.circuit_open",
+                provider=route.provider_type,
+                model_code=route.model_code,
+                recovery_seconds=self.recovery_seconds,
+            )
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get breaker state and p95 per route."""
+        keys = set(self._breakers) | set(self._latencies)
+        return {
+            f"{provider}/{model_code}": {
+                "state": self.breaker((provider, model_code)).state.value,
+                "p95_ms": self.p95((provider, model_code)),
+                "samples": len(self.latency((provider, model_code))),
+            }
+            for provider, model_code in sorted(keys)
+        }
+
+
+class FailoverLLMProvider:
+    """LLM provider that fails over across equivalent models on several providers.
+
+    Implements ``LLMProviderPort``. The ``model`` argument of ``generate`` and
+    ``generate_stream`` is the primary route's model name (as returned by the
+    factory); every route calls its own provider with its own model name.
+    """
+
+    def __init__(self, routes: Sequence[ProviderRoute], router: LLMRouter) -> None:
+        """Initialize with routes in configured preference order.
+
+        Args:
+            routes: Primary route first, then fallbacks
+            router: Shared breakers and latency windows
+        """
+        if not routes:
+            raise ValueError("FailoverLLMProvider needs at least one route")
+        self.routes = list(routes)
+        self.router = router
+
+    @property
+    def provider_name(self) -> str:
+        """Get the primary route's provider name."""
+        return str(self.routes[0].provider.provider_name)
+
+    @property
+    def supported_models(self) -> list[str]:
+        """Get the model names of all routes."""
+        return [route.model_name for route in self.routes]
+
+    def _claim(self, route: ProviderRoute, attempts: list[RouteAttempt]) -> bool:
+        """Claim a route right before calling it, recording it as skipped if open.
+
+        Claiming lazily means a half-open trial is only taken for a route that
+        is actually called; the caller releases it once the attempt ends.
+        """
+        if self.router.breaker(route.key).allow_request():
+            return True
+        attempts.append(RouteAttempt(route, "circuit open", skipped=True))
+        return False
+
+    def _timeout(self, remaining: Sequence[ProviderRoute]) -> float | None:
+        """Per-attempt timeout; the last usable route gets the caller's full budget."""
+        if any(self.router.breaker(route.key).can_attempt() for route in remaining):
+            return self.router.attempt_timeout_seconds
+        return None
+
+    def _record_failure(
+        self, route: ProviderRoute, error: BaseException, attempts: list[RouteAttempt]
+    ) -> None:
+        self.router.record_failure(route)
+        message = "timeout" if isinstance(error, TimeoutError) else f"{type(error).__name__}"
+        attempts.append(RouteAttempt(route, message))
+        logger.warning(
+            "llm_routing.failover",
+            provider=route.provider_type,
+            model_code=route.model_code,
+            error=str(error) or message,
+        )
+
+    @staticmethod
+    def _metadata(route: ProviderRoute, attempts: list[RouteAttempt]) -> dict[str, Any]:
+        return {
+            "provider": route.provider_type,
+            "model_code": route.model_code,
+            "model": route.model_name,
+            "failover": any(not a.skipped for a in attempts),
+            "attempts": [a.to_dict() for a in attempts],
+        }
+
+    async def generate(
+        self,
+        messages: list[LLMMessage],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        system_prompt: str | None = None,
+        response_schema: dict[str, object] | None = None,
+    ) -> LLMResponse:
+        """Generate a completion on the best available route.
+
+        Raises:
+            AllRoutesFailedError: If every route failed or had an open circuit
+        """
+        _ = model  # Each route uses its own model name
+        attempts: list[RouteAttempt] = []
+        routes = self.router.order(self.routes)
+        for index, route in enumerate(routes):
+            if not self._claim(route, attempts):
+                continue
+            started = time.monotonic()
+            try:
+                response: LLMResponse = await asyncio.wait_for(
+                    route.provider.generate(
+                        messages=messages,
+                        model=route.model_name,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        system_prompt=system_prompt,
+                        response_schema=response_schema,
+                    ),
+                    timeout=self._timeout(routes[index + 1 :]),
+                )
+            except NON_RETRYABLE_ERRORS:
+                # Not the provider's fault; do not count it against the route
+                raise
+            except Exception as e:
+                self._record_failure(route, e, attempts)
+                continue
+            else:
+                self.router.record_success(route, (time.monotonic() - started) * 1000)
+            finally:
+                # Frees the trial claim on caller errors and cancellation (no-op otherwise)
+                self.router.breaker(route.key).release()
+
+            response.metadata["routing"] = self._metadata(route, attempts)
+            if attempts:
+                logger.info(
+                    "llm_routing.served_by_fallback",
+                    provider=route.provider_type,
+                    model_code=route.model_code,
+                    attempts=len(attempts),
+                )
+            return response
+
+        raise AllRoutesFailedError(attempts)
+
+    async def generate_stream(
+        self,
+        messages: list[LLMMessage],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        system_prompt: str | None = None,
+        usage: dict[str, int] | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a completion, failing over only before the first token.
+
+        Once a route has produced output, later errors are raised to the
+        caller rather than mixing output from two models.
+
+        Raises:
+            AllRoutesFailedError: If no route produced a first token
+        """
+        _ = model
+        attempts: list[RouteAttempt] = []
+        routes = self.router.order(self.routes)
+        for index, route in enumerate(routes):
+            if not self._claim(route, attempts):
+                continue
+            started = time.monotonic()
+            stream = route.provider.generate_stream(
+                messages=messages,
+                model=route.model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system_prompt=system_prompt,
+                usage=usage,
+            )
+            try:
+                first = await asyncio.wait_for(
+                    anext(stream), timeout=self._timeout(routes[index + 1 :])
+                )
+            except StopAsyncIteration:
+                self.router.record_success(route, (time.monotonic() - started) * 1000)
+                return
+            except NON_RETRYABLE_ERRORS:
+                raise
+            except Exception as e:
+                await _aclose(stream)
+                self._record_failure(route, e, attempts)
+                continue
+            finally:
+                # Frees the trial claim on caller errors and cancellation (no-op otherwise)
+                self.router.breaker(route.key).release()
+
+            # Time to first token is the latency that matters for streams
+            self.router.record_success(route, (time.monotonic() - started) * 1000)
+            logger.info("llm_routing.stream_route", **self._metadata(route, attempts))
+            try:
+                yield first
+                async for chunk in stream:
+                    yield chunk
+            finally:
+                await _aclose(stream)
+            return
+
+        raise AllRoutesFailedError(attempts)
+
+    async def count_tokens(self, text: str, model: str) -> int:
+        """Count tokens with the primary route's provider."""
+        _ = model
+        primary = self.routes[0]
+        count: int = await primary.provider.count_tokens(text, primary.model_name)
+        return count
+
+    async def validate_model(self, model: str) -> bool:
+        """Check whether a model name belongs to one of the routes."""
+        return model in self.supported_models
+
+
+async def _aclose(stream: AsyncIterator[str]) -> None:
+    """Close an async generator if it supports it."""
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+__all__ = [
+    "AllRoutesFailedError",
+    "CircuitBreaker",
+    "CircuitState",
+    "FailoverLLMProvider",
+    "LLMRouter",
+    "LatencyWindow",
+    "ProviderRoute",
+    "RouteAttempt",
+]
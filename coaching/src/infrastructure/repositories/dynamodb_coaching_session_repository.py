@@ -5,6 +5,13 @@ retrieving coaching session records with proper tenant isolation
 and topic-based session enforcement.
 """
 
+import asyncio
+import base64
+import binascii
+import json
+import zlib
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
@@ -15,12 +22,35 @@ from coaching.src.core.types import SessionId, TenantId, UserId
 from coaching.src.domain.entities.coaching_session import (
     CoachingMessage,
     CoachingSession,
+    CoachingSessionSummary,
+    CoachingSessionSummaryPage,
 )
-from coaching.src.domain.exceptions.session_exceptions import SessionConflictError
+from coaching.src.domain.exceptions.session_exceptions import (
+    InvalidCursorError,
+    SessionConflictError,
+)
+from coaching.src.infrastructure.aws_io import run_aws_call
 
 logger = structlog.get_logger()
 
 
+@dataclass
+class InactiveSessionSweepResult:
+    """Outcome of an inactive-session sweep.
+
+    Attributes:
+        examined: Sessions read from the activity index
+        paused: Sessions paused by this sweep
+        skipped: Sessions that became active or changed status meanwhile
+        failed: Sessions whose update raised an error
+    """
+
+    examined: int = 0
+    paused: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+
 class DynamoDBCoachingSessionRepository:
     """DynamoDB repository for coaching session persistence.
 
@@ -35,12 +65,24 @@ class DynamoDBCoachingSessionRepository:
         - PK: session_id (String)
         - GSI1: tenant-topic-index (tenant_id, topic_id)
         - GSI2: tenant-user-index (tenant_id, user_id)
+        - GSI3: active-activity-index (active_shard, last_activity_at), sparse,
+          KEYS_ONLY - only ACTIVE sessions carry active_shard
         - TTL: ttl (Number - Unix timestamp)
 
+    Messages Table Schema (optional, append-only message storage):
+        - PK: session_id (String)
+        - SK: seq (Number - message index within the session)
+        - TTL: ttl (Number - Unix timestamp, only while the session is not active)
+
     Design:
         - Sessions use tenant-scoped GSI for efficient lookups
         - Active session per topic is enforced at application level
         - Completed/cancelled sessions have TTL for cleanup
+        - When a messages table is configured, each message is its own item.
+          A turn appends only the new messages (conditional puts) and updates
+          the session header with a single update_item, so write cost stays
+          constant as the conversation grows. Headers written before the
+          switch keep their inline messages until their next update.
     """
 
     # TTL duration for completed/cancelled sessions (14 days)
@@ -51,23 +93,50 @@ class DynamoDBCoachingSessionRepository:
     # giving users flexibility for breaks, power outages, travel, etc.
     ACTIVE_SESSION_TTL_DAYS = 14
 
+    # Sparse index of active sessions ordered by last activity. The partition
+    # key is spread over a fixed number of shards so the index has no hot key
+    # and a sweep can read the shards in parallel.
+    ACTIVE_INDEX_NAME = "active-activity-index"
+    ACTIVE_INDEX_SHARDS = 8
+
+    # Attributes read for session listings (keys are needed for cursors)
+    SUMMARY_ATTRIBUTES = (
+        "session_id",
+        "tenant_id",
+        "user_id",
+        "topic_id",
+        "status",
+        "turn_count",
+        "created_at",
+        "updated_at",
+        "completed_at",
+    )
+
     def __init__(
         self,
         dynamodb_resource: Any,  # boto3.resources.base.ServiceResource
         table_name: str,
+        messages_table_name: str | None = None,
     ) -> None:
         """Initialize DynamoDB coaching session repository.
 
         Args:
             dynamodb_resource: Boto3 DynamoDB resource
             table_name: DynamoDB table name for coaching sessions
+            messages_table_name: Optional table for append-only message items;
+                when None, messages are stored inline on the session item
         """
         self.dynamodb = dynamodb_resource
         self.table = self.dynamodb.Table(table_name)
         self.table_name = table_name
+        self.messages_table = (
+            self.dynamodb.Table(messages_table_name) if messages_table_name else None
+        )
+        self.messages_table_name = messages_table_name
         logger.info(
             "coaching_session_repository.initialized",
             table_name=table_name,
+            messages_table_name=messages_table_name,
         )
 
     # =========================================================================
@@ -112,7 +181,13 @@ class DynamoDBCoachingSessionRepository:
                 )
                 item["ttl"] = ttl_timestamp
 
-            self.table.put_item(Item=item)
+            if self.messages_table is not None:
+                # Messages go first so a visible header never references missing messages
+                await self._append_messages(session)
+                del item["messages"]
+                item["message_count"] = len(session.messages)
+
+            await run_aws_call("dynamodb", self.table.put_item, Item=item)
 
             logger.info(
                 "coaching_session.created",
@@ -138,32 +213,16 @@ class DynamoDBCoachingSessionRepository:
             session: CoachingSession entity to persist
         """
         try:
-            item = self._to_dynamodb_item(session)
-
-            # Add TTL based on session state
-            if session.status in (
-                ConversationStatus.COMPLETED,
-                ConversationStatus.CANCELLED,
-                ConversationStatus.ABANDONED,
-            ):
-                # Terminal states: 14 days TTL (shorter cleanup)
-                ttl_timestamp = int(
-                    datetime.now(UTC).timestamp() + (self.COMPLETED_SESSION_TTL_DAYS * 24 * 60 * 60)
-                )
-                item["ttl"] = ttl_timestamp
-            elif session.status in (
-                ConversationStatus.ACTIVE,
-                ConversationStatus.PAUSED,
-            ):
-                # Active/Paused states: 14 days TTL (user flexibility)
-                # This allows users to resume after stepping away, power outages, etc.
-                # But still cleans up truly abandoned sessions after 2 weeks
-                ttl_timestamp = int(
-                    datetime.now(UTC).timestamp() + (self.ACTIVE_SESSION_TTL_DAYS * 24 * 60 * 60)
-                )
-                item["ttl"] = ttl_timestamp
-
-            self.table.put_item(Item=item)
+            if self.messages_table is not None:
+                last_item = await self._append_messages(session)
+                await self._update_header(session, must_exist=False)
+                await self._sync_message_ttl(session, last_item)
+            else:
+                item = self._to_dynamodb_item(session)
+                ttl_timestamp = self._session_ttl(session)
+                if ttl_timestamp is not None:
+                    item["ttl"] = ttl_timestamp
+                await run_aws_call("dynamodb", self.table.put_item, Item=item)
 
             logger.info(
                 "coaching_session.saved",
@@ -208,13 +267,15 @@ class DynamoDBCoachingSessionRepository:
             CoachingSession if found, None otherwise
         """
         try:
-            response = self.table.get_item(Key={"session_id": session_id})
+            response = await run_aws_call(
+                "dynamodb", self.table.get_item, Key={"session_id": session_id}
+            )
 
             if "Item" not in response:
                 logger.debug("coaching_session.not_found", session_id=session_id)
                 return None
 
-            session = self._from_dynamodb_item(response["Item"])
+            session = await self._load_session(response["Item"])
             logger.debug(
                 "coaching_session.retrieved",
                 session_id=session_id,
@@ -282,10 +343,15 @@ class DynamoDBCoachingSessionRepository:
             return False
 
         try:
-            self.table.delete_item(
+            await run_aws_call(
+                "dynamodb",
+                self.table.delete_item,
                 Key={"session_id": str(session_id)},
                 ConditionExpression="attribute_exists(session_id)",
             )
+            if self.messages_table is not None:
+                await run_aws_call("dynamodb", self._delete_message_items, str(session_id))
+
             logger.info(
                 "coaching_session.deleted",
                 session_id=str(session_id),
@@ -346,7 +412,9 @@ class DynamoDBCoachingSessionRepository:
         """
         try:
             # Query GSI for tenant+topic sessions
-            response = self.table.query(
+            response = await run_aws_call(
+                "dynamodb",
+                self.table.query,
                 IndexName="tenant-topic-index",
                 KeyConditionExpression=(
                     Key("tenant_id").eq(tenant_id) & Key("topic_id").eq(topic_id)
@@ -360,6 +428,7 @@ class DynamoDBCoachingSessionRepository:
                     ConversationStatus.ACTIVE,
                     ConversationStatus.PAUSED,
                 ):
+                    await self._hydrate_messages(session, item)
                     logger.debug(
                         "coaching_session.active_found",
                         session_id=session.session_id,
@@ -406,7 +475,9 @@ class DynamoDBCoachingSessionRepository:
         try:
             # Query GSI for tenant+user sessions
             # tenant_id is hash key, user_id is range key
-            response = self.table.query(
+            response = await run_aws_call(
+                "dynamodb",
+                self.table.query,
                 IndexName="tenant-user-index",
                 KeyConditionExpression=Key("tenant_id").eq(tenant_id) & Key("user_id").eq(user_id),
                 ScanIndexForward=False,  # Most recent first
@@ -414,6 +485,7 @@ class DynamoDBCoachingSessionRepository:
             )
 
             sessions: list[CoachingSession] = []
+            session_items: list[dict[str, Any]] = []
             for item in response.get("Items", []):
                 session = self._from_dynamodb_item(item)
 
@@ -426,10 +498,13 @@ class DynamoDBCoachingSessionRepository:
                     continue
 
                 sessions.append(session)
+                session_items.append(item)
 
                 if len(sessions) >= limit:
                     break
 
+            await self._hydrate_all(sessions, session_items)
+
             logger.debug(
                 "coaching_session.list_by_user",
                 tenant_id=tenant_id,
@@ -472,6 +547,116 @@ class DynamoDBCoachingSessionRepository:
             limit=limit,
         )
 
+    async def list_summaries_by_tenant_user(
+        self,
+        tenant_id: str,
+        user_id: str,
+        *,
+        include_completed: bool = False,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> CoachingSessionSummaryPage:
+        """List session summaries for a tenant's user, one page at a time.
+
+        Only the summary attributes are read from the index and no messages are
+        loaded, so a listing stays small however long the conversations are.
+        Status filtering happens in DynamoDB; pages are read until ``limit``
+        summaries are found or the index is exhausted.
+
+        Args:
+            tenant_id: Tenant identifier
+            user_id: User identifier
+            include_completed: Whether to include completed sessions
+            limit: Maximum number of summaries to return
+            cursor: ``next_cursor`` of the previous page
+
+        Returns:
+            Page of summaries with the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid
+        """
+        excluded = [ConversationStatus.CANCELLED.value, ConversationStatus.ABANDONED.value]
+        if not include_completed:
+            excluded.append(ConversationStatus.COMPLETED.value)
+        query_kwargs: dict[str, Any] = {
+            "IndexName": "tenant-user-index",
+            "KeyConditionExpression": Key("tenant_id").eq(tenant_id) & Key("user_id").eq(user_id),
+            "FilterExpression": ~Attr("status").is_in(excluded),
+            "ProjectionExpression": ", ".join(f"#{name}" for name in self.SUMMARY_ATTRIBUTES),
+            "ExpressionAttributeNames": {f"#{name}": name for name in self.SUMMARY_ATTRIBUTES},
+            "ScanIndexForward": False,
+            "Limit": limit,
+        }
+        if cursor is not None:
+            # Keys come from the caller, so a cursor cannot reach another tenant or user
+            query_kwargs["ExclusiveStartKey"] = {
+                "session_id": self._decode_cursor(cursor),
+                "tenant_id": tenant_id,
+                "user_id": user_id,
+            }
+
+        items: list[dict[str, Any]] = []
+        next_cursor: str | None = None
+        while True:
+            response = await run_aws_call("dynamodb", self.table.query, **query_kwargs)
+            page = response.get("Items", [])
+            last_key = response.get("LastEvaluatedKey")
+            remaining = limit - len(items)
+            items.extend(page[:remaining])
+            if len(page) > remaining or (len(items) >= limit and last_key):
+                next_cursor = self._encode_cursor(items[-1]["session_id"])
+                break
+            if not last_key:
+                break
+            query_kwargs["ExclusiveStartKey"] = last_key
+
+        # Items without turn_count need a full read; run those concurrently
+        summaries = list(await asyncio.gather(*(self._to_summary(item) for item in items)))
+        logger.debug(
+            "coaching_session.list_summaries",
+            tenant_id=tenant_id,
+            user_id=user_id,
+            count=len(summaries),
+            has_more=next_cursor is not None,
+        )
+        return CoachingSessionSummaryPage(items=summaries, next_cursor=next_cursor)
+
+    async def _to_summary(self, item: dict[str, Any]) -> CoachingSessionSummary:
+        """Convert a projected index item to a summary."""
+        if "turn_count" not in item:
+            # Written before turn_count was stored; load it until the next update
+            # or ``backfill_turn_count`` stores it
+            session = await self._get_by_id_internal(item["session_id"])
+            if session is not None:
+                return CoachingSessionSummary.from_session(session)
+        return CoachingSessionSummary(
+            session_id=SessionId(item["session_id"]),
+            topic_id=item["topic_id"],
+            status=ConversationStatus(item["status"]),
+            turn_count=int(item.get("turn_count", 0)),
+            created_at=datetime.fromisoformat(item["created_at"]),
+            updated_at=datetime.fromisoformat(item["updated_at"]),
+            completed_at=(
+                datetime.fromisoformat(item["completed_at"]) if item.get("completed_at") else None
+            ),
+        )
+
+    @staticmethod
+    def _encode_cursor(session_id: str) -> str:
+        payload = json.dumps({"session_id": session_id}).encode()
+        return base64.urlsafe_b64encode(payload).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> str:
+        try:
+            session_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))["session_id"]
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise InvalidCursorError() from None
+        if not isinstance(session_id, str):
+            raise InvalidCursorError()
+        return session_id
+
     async def list_by_tenant_topic(
         self,
         tenant_id: str,
@@ -489,7 +674,9 @@ class DynamoDBCoachingSessionRepository:
             List of CoachingSession entities
         """
         try:
-            response = self.table.query(
+            response = await run_aws_call(
+                "dynamodb",
+                self.table.query,
                 IndexName="tenant-topic-index",
                 KeyConditionExpression=(
                     Key("tenant_id").eq(tenant_id) & Key("topic_id").eq(topic_id)
@@ -498,7 +685,9 @@ class DynamoDBCoachingSessionRepository:
                 Limit=limit,
             )
 
-            sessions = [self._from_dynamodb_item(item) for item in response.get("Items", [])]
+            items = response.get("Items", [])
+            sessions = [self._from_dynamodb_item(item) for item in items]
+            await self._hydrate_all(sessions, items)
 
             logger.debug(
                 "coaching_session.list_by_topic",
@@ -540,7 +729,9 @@ class DynamoDBCoachingSessionRepository:
         try:
             # Use tenant-user-index GSI for efficient lookup, filter by topic_id
             # tenant_id is hash key, user_id is range key
-            response = self.table.query(
+            response = await run_aws_call(
+                "dynamodb",
+                self.table.query,
                 IndexName="tenant-user-index",
                 KeyConditionExpression=Key("tenant_id").eq(tenant_id) & Key("user_id").eq(user_id),
                 FilterExpression=Attr("topic_id").eq(topic_id),
@@ -553,6 +744,7 @@ class DynamoDBCoachingSessionRepository:
                     ConversationStatus.ACTIVE,
                     ConversationStatus.PAUSED,
                 ):
+                    await self._hydrate_messages(session, item)
                     logger.debug(
                         "coaching_session.user_topic_active_found",
                         session_id=session.session_id,
@@ -593,15 +785,63 @@ class DynamoDBCoachingSessionRepository:
         Raises:
             ValueError: If session doesn't exist
         """
-        # Verify session exists
-        existing = await self._get_by_id_internal(str(session.session_id))
-        if existing is None:
-            raise ValueError(f"Session not found: {session.session_id}")
+        inline_messages = self.messages_table is None
+        last_item = None if inline_messages else await self._append_messages(session)
+        # One conditional header update replaces the get_item existence check and
+        # the full-item rewrite, which could revert a newer partial result
+        try:
+            await self._update_header(session, must_exist=True, inline_messages=inline_messages)
+        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            raise ValueError(f"Session not found: {session.session_id}") from None
+        if not inline_messages:
+            await self._sync_message_ttl(session, last_item)
 
-        # Save the updated session
-        await self.save(session)
+        logger.info(
+            "coaching_session.saved",
+            session_id=session.session_id,
+            tenant_id=session.tenant_id,
+            status=session.status.value,
+        )
         return session
 
+    async def update_partial_result(
+        self, session_id: str, partial_result: dict[str, Any], message_count: int
+    ) -> bool:
+        """Store a speculative extraction result for an active session.
+
+        The write is conditional, so a slower background extraction never
+        replaces a result covering more messages.
+
+        Args:
+            session_id: Session identifier
+            partial_result: Result extracted from the first ``message_count`` messages
+            message_count: Number of messages the result covers
+
+        Returns:
+            True if stored, False if the session is no longer active or already
+            has a newer partial result
+        """
+        try:
+            await run_aws_call(
+                "dynamodb",
+                self.table.update_item,
+                Key={"session_id": session_id},
+                UpdateExpression="SET partial_result = :result, partial_result_message_count = :count",
+                ConditionExpression=(
+                    "#status = :active AND (attribute_not_exists(partial_result_message_count) "
+                    "OR partial_result_message_count < :count)"
+                ),
+                ExpressionAttributeNames={"#status": "status"},
+                ExpressionAttributeValues={
+                    ":result": partial_result,
+                    ":count": message_count,
+                    ":active": ConversationStatus.ACTIVE.value,
+                },
+            )
+        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            return False
+        return True
+
     async def mark_expired(
         self,
         session_id: SessionId,
@@ -694,7 +934,9 @@ class DynamoDBCoachingSessionRepository:
         try:
             # Scan for active/paused sessions in this tenant
             # Note: In production, consider using DynamoDB Streams + Lambda
-            response = self.table.query(
+            response = await run_aws_call(
+                "dynamodb",
+                self.table.query,
                 IndexName="tenant-topic-index",
                 KeyConditionExpression=Key("tenant_id").eq(tenant_id),
                 FilterExpression="#status IN (:active, :paused)",
@@ -710,6 +952,7 @@ class DynamoDBCoachingSessionRepository:
 
                 # Check expiration
                 if session.is_expired() or session.is_idle():
+                    await self._hydrate_messages(session, item)
                     expired_sessions.append(session)
                     if len(expired_sessions) >= limit:
                         break
@@ -732,37 +975,40 @@ class DynamoDBCoachingSessionRepository:
     async def find_inactive_sessions(
         self,
         inactivity_threshold_minutes: int = 30,
+        limit: int | None = None,
     ) -> list[CoachingSession]:
         """Find active sessions that have exceeded inactivity threshold.
 
-        Used by background job to auto-pause inactive sessions.
+        Reads the sparse active-activity index (all shards, all pages), so
+        only active sessions past the threshold are read.
 
         Args:
             inactivity_threshold_minutes: Minutes of inactivity before flagging
+            limit: Maximum number of sessions to return (all if None)
 
         Returns:
             List of inactive sessions that should be paused
         """
         try:
-            # Calculate threshold timestamp
-            threshold_time = datetime.now(UTC).timestamp() - (inactivity_threshold_minutes * 60)
-
-            # Scan for active sessions (this is less efficient but needed
-            # since we don't have a GSI on status)
-            # In production, consider using DynamoDB Streams + Lambda
-            response = self.table.scan(
-                FilterExpression=("#status = :active AND #last_activity < :threshold"),
-                ExpressionAttributeNames={
-                    "#status": "status",
-                    "#last_activity": "last_activity_at",
-                },
-                ExpressionAttributeValues={
-                    ":active": ConversationStatus.ACTIVE.value,
-                    ":threshold": datetime.fromtimestamp(threshold_time, UTC).isoformat(),
-                },
-            )
+            threshold = self._activity_threshold(inactivity_threshold_minutes)
+            session_ids: list[str] = []
+            for shard in range(self.ACTIVE_INDEX_SHARDS):
+                async for items in self._query_inactive_shard(shard, threshold):
+                    session_ids.extend(item["session_id"] for item in items)
+                    if limit is not None and len(session_ids) >= limit:
+                        break
+                if limit is not None and len(session_ids) >= limit:
+                    session_ids = session_ids[:limit]
+                    break
 
-            sessions = [self._from_dynamodb_item(item) for item in response.get("Items", [])]
+            loaded = await asyncio.gather(
+                *(self._get_by_id_internal(session_id) for session_id in session_ids)
+            )
+            sessions = [
+                session
+                for session in loaded
+                if session is not None and session.status == ConversationStatus.ACTIVE
+            ]
 
             logger.info(
                 "coaching_session.inactive_found",
@@ -778,6 +1024,524 @@ class DynamoDBCoachingSessionRepository:
             )
             raise
 
+    async def pause_inactive_sessions(
+        self,
+        inactivity_threshold_minutes: int = 30,
+        *,
+        page_size: int = 100,
+        max_concurrency: int = 8,
+    ) -> InactiveSessionSweepResult:
+        """Pause all active sessions idle longer than the threshold.
+
+        Each index shard is paged through in parallel; every page is paused as
+        a batch of conditional update_items (bounded by max_concurrency). The
+        condition re-checks status and last activity, so a session the user
+        touched after it was read is left alone.
+
+        Args:
+            inactivity_threshold_minutes: Minutes of inactivity before pausing
+            page_size: Index items read per Query page
+            max_concurrency: Maximum concurrent pause updates
+
+        Returns:
+            Counts of examined, paused, skipped and failed sessions
+        """
+        threshold = self._activity_threshold(inactivity_threshold_minutes)
+        result = InactiveSessionSweepResult()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def pause(session_id: str) -> None:
+            async with semaphore:
+                try:
+                    paused = await self._pause_if_inactive(session_id, threshold)
+                except Exception as e:
+                    result.failed += 1
+                    logger.warning(
+                        "coaching_session.sweep_pause_failed",
+                        session_id=session_id,
+                        error=str(e),
+                    )
+                    return
+            if paused:
+                result.paused += 1
+            else:
+                result.skipped += 1
+
+        async def sweep_shard(shard: int) -> None:
+            async for items in self._query_inactive_shard(shard, threshold, page_size):
+                result.examined += len(items)
+                await asyncio.gather(*(pause(item["session_id"]) for item in items))
+
+        await asyncio.gather(*(sweep_shard(shard) for shard in range(self.ACTIVE_INDEX_SHARDS)))
+
+        logger.info(
+            "coaching_session.inactive_sweep_completed",
+            threshold_minutes=inactivity_threshold_minutes,
+            examined=result.examined,
+            paused=result.paused,
+            skipped=result.skipped,
+            failed=result.failed,
+        )
+        return result
+
+    async def backfill_active_index(self, total_segments: int = 4) -> int:
+        """Add active sessions written before the activity index to the index.
+
+        Runs a paginated parallel Scan (one task per segment). Only needed once
+        after the index is deployed; new writes maintain it. Run it with
+        ``coaching/scripts/backfill_coaching_sessions.py active-index``.
+
+        Args:
+            total_segments: Number of parallel scan segments
+
+        Returns:
+            Number of sessions added to the index
+        """
+
+        async def add(session_id: str) -> bool:
+            await run_aws_call(
+                "dynamodb",
+                self.table.update_item,
+                Key={"session_id": session_id},
+                UpdateExpression="SET active_shard = :shard",
+                ConditionExpression="#status = :active",
+                ExpressionAttributeNames={"#status": "status"},
+                ExpressionAttributeValues={
+                    ":shard": self._active_shard(session_id),
+                    ":active": ConversationStatus.ACTIVE.value,
+                },
+            )
+            return True
+
+        added = await self._backfill(
+            total_segments,
+            {
+                "FilterExpression": "#status = :active AND attribute_not_exists(active_shard)",
+                "ExpressionAttributeNames": {"#status": "status"},
+                "ExpressionAttributeValues": {":active": ConversationStatus.ACTIVE.value},
+            },
+            add,
+        )
+        logger.info("coaching_session.active_index_backfilled", added=added)
+        return added
+
+    async def backfill_turn_count(self, total_segments: int = 4) -> int:
+        """Store turn_count on sessions written before summaries read it.
+
+        Until then ``list_summaries_by_tenant_user`` loads such sessions in
+        full. Only needed once; new writes store it. Run it with
+        ``coaching/scripts/backfill_coaching_sessions.py turn-count``.
+
+        Args:
+            total_segments: Number of parallel scan segments
+
+        Returns:
+            Number of sessions updated
+        """
+
+        async def store(session_id: str) -> bool:
+            session = await self._get_by_id_internal(session_id)
+            if session is None:
+                return False
+            # A concurrent update has already stored the current count
+            await run_aws_call(
+                "dynamodb",
+                self.table.update_item,
+                Key={"session_id": session_id},
+                UpdateExpression="SET turn_count = :count",
+                ConditionExpression="attribute_not_exists(turn_count)",
+                ExpressionAttributeValues={":count": session.get_turn_count()},
+            )
+            return True
+
+        updated = await self._backfill(
+            total_segments, {"FilterExpression": "attribute_not_exists(turn_count)"}, store
+        )
+        logger.info("coaching_session.turn_count_backfilled", updated=updated)
+        return updated
+
+    async def _backfill(
+        self,
+        total_segments: int,
+        scan_kwargs: dict[str, Any],
+        update: Callable[[str], Awaitable[bool]],
+    ) -> int:
+        """Run ``update`` for every session matched by a paginated parallel Scan.
+
+        Args:
+            total_segments: Number of parallel scan segments (one task each)
+            scan_kwargs: Filter arguments for the Scan
+            update: Conditional update of one session, returning whether it
+                wrote; a failed condition counts as skipped
+
+        Returns:
+            Number of sessions updated
+        """
+
+        async def scan_segment(segment: int) -> int:
+            updated = 0
+            segment_kwargs: dict[str, Any] = {
+                **scan_kwargs,
+                "Segment": segment,
+                "TotalSegments": total_segments,
+                "ProjectionExpression": "session_id",
+            }
+            while True:
+                response = await run_aws_call("dynamodb", self.table.scan, **segment_kwargs)
+                for item in response.get("Items", []):
+                    try:
+                        if await update(item["session_id"]):
+                            updated += 1
+                    except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+                        continue
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    return updated
+                segment_kwargs["ExclusiveStartKey"] = last_key
+
+        counts = await asyncio.gather(*(scan_segment(s) for s in range(total_segments)))
+        return sum(counts)
+
+    async def _query_inactive_shard(
+        self,
+        shard: int,
+        threshold: str,
+        page_size: int = 100,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield pages of index items in one shard idle since before threshold."""
+        query_kwargs: dict[str, Any] = {
+            "IndexName": self.ACTIVE_INDEX_NAME,
+            "KeyConditionExpression": (
+                Key("active_shard").eq(f"ACTIVE#{shard}") & Key("last_activity_at").lt(threshold)
+            ),
+            "Limit": page_size,
+        }
+        while True:
+            response = await run_aws_call("dynamodb", self.table.query, **query_kwargs)
+            items = response.get("Items", [])
+            if items:
+                yield items
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return
+            query_kwargs["ExclusiveStartKey"] = last_key
+
+    async def _pause_if_inactive(self, session_id: str, threshold: str) -> bool:
+        """Pause one session if it is still active and idle.
+
+        Returns:
+            True if paused, False if the session changed since it was read
+        """
+        now = datetime.now(UTC)
+        ttl_timestamp = int(now.timestamp() + (self.ACTIVE_SESSION_TTL_DAYS * 24 * 60 * 60))
+        try:
+            await run_aws_call(
+                "dynamodb",
+                self.table.update_item,
+                Key={"session_id": session_id},
+                UpdateExpression=(
+                    "SET #status = :paused, updated_at = :now, #ttl = :ttl REMOVE active_shard"
+                ),
+                ConditionExpression="#status = :active AND last_activity_at < :threshold",
+                ExpressionAttributeNames={"#status": "status", "#ttl": "ttl"},
+                ExpressionAttributeValues={
+                    ":paused": ConversationStatus.PAUSED.value,
+                    ":active": ConversationStatus.ACTIVE.value,
+                    ":now": now.isoformat(),
+                    ":ttl": ttl_timestamp,
+                    ":threshold": threshold,
+                },
+            )
+        except self.dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
+            return False
+        if self.messages_table is not None:
+            # Paused sessions expire with their messages unless resumed
+            await run_aws_call("dynamodb", self._set_message_ttl, session_id, ttl_timestamp)
+        return True
+
+    @staticmethod
+    def _activity_threshold(inactivity_threshold_minutes: int) -> str:
+        """ISO timestamp of the latest activity considered inactive."""
+        threshold_time = datetime.now(UTC).timestamp() - (inactivity_threshold_minutes * 60)
+        return datetime.fromtimestamp(threshold_time, UTC).isoformat()
+
+    @classmethod
+    def _active_shard(cls, session_id: str) -> str:
+        """Active-index partition key for a session (stable hash of its ID)."""
+        return f"ACTIVE#{zlib.crc32(session_id.encode()) % cls.ACTIVE_INDEX_SHARDS}"
+
+    # =========================================================================
+    # Message Items (append-only storage)
+    # =========================================================================
+
+    async def _append_messages(self, session: CoachingSession) -> dict[str, Any] | None:
+        """Write messages that are not yet stored as items.
+
+        Each message is put with ``attribute_not_exists`` so a concurrent
+        writer can never overwrite an existing turn. New messages are the ones
+        after those the session was loaded with; sequence numbers continue
+        from the last stored item, so a gap in ``seq`` never hides a turn.
+
+        Args:
+            session: Session whose messages list is complete
+
+        Returns:
+            The last stored message item (``seq`` and ``ttl``) before the append,
+            or None if the session had no message items
+        """
+        assert self.messages_table is not None
+        session_id = str(session.session_id)
+
+        response = await run_aws_call(
+            "dynamodb",
+            self.messages_table.query,
+            KeyConditionExpression=Key("session_id").eq(session_id),
+            ScanIndexForward=False,
+            Limit=1,
+            ProjectionExpression="#seq, #ttl",
+            ExpressionAttributeNames={"#seq": "seq", "#ttl": "ttl"},
+        )
+        items = response.get("Items", [])
+        last_item: dict[str, Any] | None = items[0] if items else None
+        next_seq = int(last_item["seq"]) + 1 if last_item is not None else 0
+
+        if last_item is None:
+            # Nothing stored yet (new or pre-migration session): write everything
+            stored = 0
+        elif session._stored_message_count is not None:
+            stored = session._stored_message_count
+        else:
+            # Not loaded through this repository; positions match seq without gaps
+            stored = next_seq
+        new_messages = session.messages[stored:]
+
+        for seq, message in enumerate(new_messages, start=next_seq):
+            item = {
+                "session_id": session_id,
+                "seq": seq,
+                "tenant_id": str(session.tenant_id),
+                **self._message_to_dict(message),
+            }
+            await run_aws_call(
+                "dynamodb",
+                self.messages_table.put_item,
+                Item=item,
+                ConditionExpression="attribute_not_exists(session_id)",
+            )
+        session._stored_message_count = len(session.messages)
+
+        if new_messages:
+            logger.debug(
+                "coaching_session.messages_appended",
+                session_id=session_id,
+                first_seq=next_seq,
+                count=len(new_messages),
+            )
+        return last_item
+
+    async def _sync_message_ttl(
+        self, session: CoachingSession, last_item: dict[str, Any] | None
+    ) -> None:
+        """Give message items the header's TTL unless the session is active.
+
+        An active session's header TTL moves forward on every update, so its
+        messages carry no TTL; once it pauses or ends they expire with the
+        header. A resumed session has the TTL removed again.
+
+        Args:
+            session: Session just written
+            last_item: Last stored message item before the write (from ``_append_messages``)
+        """
+        if session.status == ConversationStatus.ACTIVE:
+            if last_item is not None and "ttl" in last_item:
+                await run_aws_call("dynamodb", self._set_message_ttl, str(session.session_id), None)
+            return
+        ttl_timestamp = self._session_ttl(session)
+        if ttl_timestamp is not None:
+            await run_aws_call(
+                "dynamodb", self._set_message_ttl, str(session.session_id), ttl_timestamp
+            )
+
+    async def _update_header(
+        self, session: CoachingSession, *, must_exist: bool, inline_messages: bool = False
+    ) -> None:
+        """Write the session header (everything but messages) with one update_item.
+
+        Args:
+            session: Session to persist
+            must_exist: Fail with ConditionalCheckFailedException if the header is missing
+            inline_messages: Write the messages on the item too (no messages table)
+        """
+        item = self._to_dynamodb_item(session)
+        del item["session_id"]
+        # Written only by update_partial_result, so a turn never reverts a newer partial
+        item.pop("partial_result", None)
+        item.pop("partial_result_message_count", None)
+        if not inline_messages:
+            del item["messages"]
+            item["message_count"] = len(session.messages)
+        ttl_timestamp = self._session_ttl(session)
+        if ttl_timestamp is not None:
+            item["ttl"] = ttl_timestamp
+
+        names: dict[str, str] = {}
+        values: dict[str, Any] = {}
+        set_clauses: list[str] = []
+        for index, (name, value) in enumerate(item.items()):
+            names[f"#f{index}"] = name
+            values[f":v{index}"] = value
+            set_clauses.append(f"#f{index} = :v{index}")
+
+        # Inline messages (pre-migration headers) and cleared optional fields
+        removed = ([] if inline_messages else ["messages"]) + [
+            name
+            for name in (
+                "active_shard",
+                "completed_at",
+                "expires_at",
+                "extracted_result",
+                "extraction_model",
+            )
+            if name not in item
+        ]
+        remove_clauses: list[str] = []
+        for index, name in enumerate(removed):
+            names[f"#r{index}"] = name
+            remove_clauses.append(f"#r{index}")
+
+        update_expression = f"SET {', '.join(set_clauses)}"
+        if remove_clauses:
+            update_expression += f" REMOVE {', '.join(remove_clauses)}"
+        kwargs: dict[str, Any] = {
+            "Key": {"session_id": str(session.session_id)},
+            "UpdateExpression": update_expression,
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": values,
+        }
+        if must_exist:
+            kwargs["ConditionExpression"] = "attribute_exists(session_id)"
+
+        await run_aws_call("dynamodb", self.table.update_item, **kwargs)
+
+    async def _load_messages(self, session_id: str) -> list[CoachingMessage]:
+        """Load all message items of a session in order (paginated Query)."""
+        assert self.messages_table is not None
+        messages: list[CoachingMessage] = []
+        query_kwargs: dict[str, Any] = {"KeyConditionExpression": Key("session_id").eq(session_id)}
+        while True:
+            response = await run_aws_call("dynamodb", self.messages_table.query, **query_kwargs)
+            messages.extend(self._dict_to_message(item) for item in response.get("Items", []))
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return messages
+            query_kwargs["ExclusiveStartKey"] = last_key
+
+    def _delete_message_items(self, session_id: str) -> None:
+        """Delete all message items of a session (blocking; run via run_aws_call)."""
+        assert self.messages_table is not None
+        query_kwargs: dict[str, Any] = {
+            "KeyConditionExpression": Key("session_id").eq(session_id),
+            "ProjectionExpression": "session_id, #seq",
+            "ExpressionAttributeNames": {"#seq": "seq"},
+        }
+        with self.messages_table.batch_writer() as batch:
+            while True:
+                response = self.messages_table.query(**query_kwargs)
+                for item in response.get("Items", []):
+                    batch.delete_item(Key={"session_id": session_id, "seq": item["seq"]})
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    return
+                query_kwargs["ExclusiveStartKey"] = last_key
+
+    def _set_message_ttl(self, session_id: str, ttl_timestamp: int | None) -> None:
+        """Set (or remove, if None) the TTL of all message items of a session.
+
+        Blocking; run via run_aws_call.
+        """
+        assert self.messages_table is not None
+        query_kwargs: dict[str, Any] = {
+            "KeyConditionExpression": Key("session_id").eq(session_id),
+            "ProjectionExpression": "session_id, #seq",
+            "ExpressionAttributeNames": {"#seq": "seq"},
+        }
+        update_kwargs: dict[str, Any] = {
+            "UpdateExpression": "REMOVE #ttl",
+            "ExpressionAttributeNames": {"#ttl": "ttl"},
+        }
+        if ttl_timestamp is not None:
+            update_kwargs["UpdateExpression"] = "SET #ttl = :ttl"
+            update_kwargs["ExpressionAttributeValues"] = {":ttl": ttl_timestamp}
+        while True:
+            response = self.messages_table.query(**query_kwargs)
+            for item in response.get("Items", []):
+                self.messages_table.update_item(
+                    Key={"session_id": session_id, "seq": item["seq"]}, **update_kwargs
+                )
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return
+            query_kwargs["ExclusiveStartKey"] = last_key
+
+    def _uses_message_items(self, item: dict[str, Any]) -> bool:
+        """Check whether a session item keeps its messages as separate items."""
+        return self.messages_table is not None and "message_count" in item
+
+    async def _hydrate_messages(self, session: CoachingSession, item: dict[str, Any]) -> None:
+        """Load message items into a session converted from a header item."""
+        if self._uses_message_items(item):
+            session.messages = await self._load_messages(str(session.session_id))
+            session._stored_message_count = len(session.messages)
+
+    async def _hydrate_all(
+        self,
+        sessions: list[CoachingSession],
+        items: list[dict[str, Any]],
+    ) -> None:
+        """Load message items for several sessions concurrently."""
+        await asyncio.gather(
+            *(
+                self._hydrate_messages(session, item)
+                for session, item in zip(sessions, items, strict=True)
+            )
+        )
+
+    async def _load_session(self, item: dict[str, Any]) -> CoachingSession:
+        """Convert a session item to an entity, including its message items."""
+        session = self._from_dynamodb_item(item)
+        await self._hydrate_messages(session, item)
+        return session
+
+    def _session_ttl(self, session: CoachingSession) -> int | None:
+        """Compute the TTL timestamp for a session based on its state.
+
+        Args:
+            session: CoachingSession entity
+
+        Returns:
+            Unix timestamp, or None if the status has no TTL
+        """
+        if session.status in (
+            ConversationStatus.COMPLETED,
+            ConversationStatus.CANCELLED,
+            ConversationStatus.ABANDONED,
+        ):
+            # Terminal states: 14 days TTL (shorter cleanup)
+            return int(
+                datetime.now(UTC).timestamp() + (self.COMPLETED_SESSION_TTL_DAYS * 24 * 60 * 60)
+            )
+        if session.status in (
+            ConversationStatus.ACTIVE,
+            ConversationStatus.PAUSED,
+        ):
+            # Active/Paused states: 14 days TTL (user flexibility)
+            # This allows users to resume after stepping away, power outages, etc.
+            # But still cleans up truly abandoned sessions after 2 weeks
+            return int(
+                datetime.now(UTC).timestamp() + (self.ACTIVE_SESSION_TTL_DAYS * 24 * 60 * 60)
+            )
+        return None
+
     # =========================================================================
     # Serialization
     # =========================================================================
@@ -809,6 +1573,10 @@ class DynamoDBCoachingSessionRepository:
             "user_topic_key": f"USER#{session.user_id}#TOPIC#{session.topic_id}",
         }
 
+        # Sparse activity index: only active sessions are indexed
+        if session.status == ConversationStatus.ACTIVE:
+            item["active_shard"] = self._active_shard(str(session.session_id))
+
         if session.completed_at is not None:
             item["completed_at"] = session.completed_at.isoformat()
 
@@ -821,6 +1589,13 @@ class DynamoDBCoachingSessionRepository:
         if session.extraction_model is not None:
             item["extraction_model"] = session.extraction_model
 
+        # Lets summary listings skip loading messages
+        item["turn_count"] = session.get_turn_count()
+
+        if session.partial_result is not None:
+            item["partial_result"] = session.partial_result
+            item["partial_result_message_count"] = session.partial_result_message_count
+
         return item
 
     def _from_dynamodb_item(self, item: dict[str, Any]) -> CoachingSession:
@@ -855,6 +1630,8 @@ class DynamoDBCoachingSessionRepository:
             # Results
             extracted_result=item.get("extracted_result"),
             extraction_model=item.get("extraction_model"),
+            partial_result=item.get("partial_result"),
+            partial_result_message_count=int(item.get("partial_result_message_count", 0)),
         )
 
     def _message_to_dict(self, message: CoachingMessage) -> dict[str, Any]:
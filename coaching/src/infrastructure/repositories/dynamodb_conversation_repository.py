@@ -14,6 +14,7 @@ from coaching.src.core.types import ConversationId, TenantId, UserId
 from coaching.src.domain.entities.conversation import Conversation
 from coaching.src.domain.value_objects.conversation_context import ConversationContext
 from coaching.src.domain.value_objects.message import Message
+from coaching.src.infrastructure.aws_io import run_aws_call
 
 logger = structlog.get_logger()
 
@@ -59,7 +60,7 @@ class DynamoDBConversationRepository:
         """
         try:
             item = self._to_dynamodb_item(conversation)
-            self.table.put_item(Item=item)
+            await run_aws_call("dynamodb", self.table.put_item, Item=item)
 
             logger.info(
                 "Conversation saved",
@@ -89,7 +90,9 @@ class DynamoDBConversationRepository:
             Conversation entity if found, None otherwise
         """
         try:
-            response = self.table.get_item(Key={"conversation_id": conversation_id})
+            response = await run_aws_call(
+                "dynamodb", self.table.get_item, Key={"conversation_id": conversation_id}
+            )
 
             if "Item" not in response:
                 logger.debug("Conversation not found", conversation_id=conversation_id)
@@ -164,7 +167,7 @@ class DynamoDBConversationRepository:
             if filter_expression:
                 query_params["FilterExpression"] = filter_expression
 
-            response = self.table.query(**query_params)
+            response = await run_aws_call("dynamodb", self.table.query, **query_params)
 
             conversations = [self._from_dynamodb_item(item) for item in response.get("Items", [])]
 
@@ -204,7 +207,9 @@ class DynamoDBConversationRepository:
                 return False
 
             # Soft delete: Update status to ABANDONED
-            self.table.update_item(
+            await run_aws_call(
+                "dynamodb",
+                self.table.update_item,
                 Key={"conversation_id": conversation_id},
                 UpdateExpression="SET #status = :status, updated_at = :updated_at",
                 ExpressionAttributeNames={"#status": "status"},
@@ -10,6 +10,7 @@ from typing import Any
 import structlog
 from boto3.dynamodb.conditions import Key
 from coaching.src.domain.entities.ai_job import AIJob, AIJobErrorCode, AIJobStatus, AIJobType
+from coaching.src.infrastructure.aws_io import run_aws_call
 
 logger = structlog.get_logger()
 
@@ -55,7 +56,7 @@ class DynamoDBJobRepository:
         """
         try:
             item = self._to_dynamodb_item(job)
-            self.table.put_item(Item=item)
+            await run_aws_call("dynamodb", self.table.put_item, Item=item)
 
             logger.info(
                 "ai_job.saved",
@@ -82,7 +83,7 @@ class DynamoDBJobRepository:
             AIJob if found, None otherwise
         """
         try:
-            response = self.table.get_item(Key={"job_id": job_id})
+            response = await run_aws_call("dynamodb", self.table.get_item, Key={"job_id": job_id})
 
             if "Item" not in response:
                 logger.debug("ai_job.not_found", job_id=job_id)
@@ -188,7 +189,9 @@ class DynamoDBJobRepository:
 
             update_expr = "SET " + ", ".join(update_expr_parts)
 
-            self.table.update_item(
+            await run_aws_call(
+                "dynamodb",
+                self.table.update_item,
                 Key={"job_id": job_id},
                 UpdateExpression=update_expr,
                 ExpressionAttributeNames=expr_attr_names,
@@ -233,7 +236,9 @@ class DynamoDBJobRepository:
         try:
             # Query GSI for tenant+user jobs
             # Note: Requires GSI on (tenant_id, created_at) with user_id filter
-            response = self.table.query(
+            response = await run_aws_call(
+                "dynamodb",
+                self.table.query,
                 IndexName="tenant-user-index",
                 KeyConditionExpression=Key("tenant_id").eq(tenant_id),
                 FilterExpression=Key("user_id").eq(user_id),
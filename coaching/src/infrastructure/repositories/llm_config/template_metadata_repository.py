@@ -12,6 +12,7 @@ import structlog
 from boto3.dynamodb.conditions import Attr, Key
 from coaching.src.core.llm_interactions import get_interaction
 from coaching.src.domain.entities.llm_config.template_metadata import TemplateMetadata
+from coaching.src.infrastructure.aws_io import run_aws_call
 
 logger = structlog.get_logger()
 
@@ -80,7 +81,9 @@ class TemplateMetadataRepository:
             item = self._to_dynamodb_item(metadata)
 
             # Use condition expression to prevent overwriting
-            self.table.put_item(
+            await run_aws_call(
+                "dynamodb",
+                self.table.put_item,
                 Item=item,
                 ConditionExpression=Attr("template_id").not_exists(),
             )
@@ -112,7 +115,9 @@ class TemplateMetadataRepository:
             Template metadata if found, None otherwise
         """
         try:
-            response = self.table.get_item(Key={"template_id": template_id})
+            response = await run_aws_call(
+                "dynamodb", self.table.get_item, Key={"template_id": template_id}
+            )
 
             if "Item" not in response:
                 logger.debug("Template not found", template_id=template_id)
@@ -138,7 +143,9 @@ class TemplateMetadataRepository:
             Template metadata if found, None otherwise
         """
         try:
-            response = self.table.query(
+            response = await run_aws_call(
+                "dynamodb",
+                self.table.query,
                 IndexName="code-index",
                 KeyConditionExpression=Key("template_code").eq(template_code),
                 Limit=1,
@@ -183,7 +190,7 @@ class TemplateMetadataRepository:
                 if last_evaluated_key:
                     query_kwargs["ExclusiveStartKey"] = last_evaluated_key
 
-                response = self.table.query(**query_kwargs)
+                response = await run_aws_call("dynamodb", self.table.query, **query_kwargs)
 
                 for item in response.get("Items", []):
                     templates.append(self._from_dynamodb_item(item))
@@ -275,7 +282,7 @@ class TemplateMetadataRepository:
                 if last_evaluated_key:
                     query_kwargs["ExclusiveStartKey"] = last_evaluated_key
 
-                response = self.table.query(**query_kwargs)
+                response = await run_aws_call("dynamodb", self.table.query, **query_kwargs)
 
                 for item in response.get("Items", []):
                     versions.append(self._from_dynamodb_item(item))
@@ -330,7 +337,9 @@ class TemplateMetadataRepository:
             item = self._to_dynamodb_item(metadata)
 
             # Use condition expression to ensure template exists
-            self.table.put_item(
+            await run_aws_call(
+                "dynamodb",
+                self.table.put_item,
                 Item=item,
                 ConditionExpression=Attr("template_id").exists(),
             )
@@ -360,7 +369,9 @@ class TemplateMetadataRepository:
             ValueError: If template not found
         """
         try:
-            self.table.update_item(
+            await run_aws_call(
+                "dynamodb",
+                self.table.update_item,
                 Key={"template_id": template_id},
                 UpdateExpression="SET is_active = :inactive, updated_at = :now",
                 ExpressionAttributeValues={
@@ -394,7 +405,9 @@ class TemplateMetadataRepository:
             ValueError: If template not found
         """
         try:
-            self.table.update_item(
+            await run_aws_call(
+                "dynamodb",
+                self.table.update_item,
                 Key={"template_id": template_id},
                 UpdateExpression="SET is_active = :active, updated_at = :now",
                 ExpressionAttributeValues={
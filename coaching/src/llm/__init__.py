@@ -6,9 +6,28 @@ This module provides:
 - Enhanced workflow orchestration with LangGraph
 - Conversation memory management
 - Provider management and configuration
+
+Exports are resolved lazily: importing a submodule (e.g. ``llm.memory`` or
+``llm.providers.manager``) does not load LangGraph or the provider SDKs.
 """
 
-from .workflow_orchestrator import LangGraphWorkflowOrchestrator, langgraph_orchestrator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .workflow_orchestrator import LangGraphWorkflowOrchestrator, langgraph_orchestrator
+else:
+
+    def __getattr__(name: str) -> object:
+        """Lazy import exports at runtime."""
+        if name in _EXPORT_MAP:
+            module = __import__(_EXPORT_MAP[name], fromlist=[name])
+            return getattr(module, name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    _EXPORT_MAP = {
+        "LangGraphWorkflowOrchestrator": "coaching.src.llm.workflow_orchestrator",
+        "langgraph_orchestrator": "coaching.src.llm.workflow_orchestrator",
+    }
 
 __all__ = [
     "LangGraphWorkflowOrchestrator",
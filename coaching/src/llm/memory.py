@@ -1,9 +1,18 @@
-"""Memory management for conversations."""
+"""Memory management for conversations.
+
+Token counts are computed once per message when it is added and a running
+total is kept, so checking the memory size does not re-encode the history.
+When the total exceeds the limit, the oldest messages are folded into the
+summary; the cut point is found with a prefix-sum search so the retained
+messages fit ``trim_to_ratio`` of the limit (headroom avoids trimming on
+every subsequent add).
+"""
 
 from datetime import UTC, datetime
 from typing import Any
 
 import structlog
+from coaching.src.core.token_budget import find_cut_index, prefix_sums
 
 try:
     import tiktoken
@@ -26,15 +35,15 @@ logger = structlog.get_logger()
 class ConversationMemory:
     """Manages conversation memory with sliding window and summarization."""
 
-    def __init__(self, max_token_limit: int = 4000):
+    def __init__(self, max_token_limit: int = 4000, trim_to_ratio: float = 0.75):
         """Initialize conversation memory.
 
         Args:
             max_token_limit: Maximum tokens to maintain in memory
+            trim_to_ratio: Fraction of the limit to trim down to once it is exceeded
         """
         self.max_token_limit = max_token_limit
-        self.messages: list[dict[str, str]] = []
-        self.summary: str = ""
+        self.trim_to_ratio = trim_to_ratio
         self.key_points: list[str] = []
 
         # Initialize tokenizer
@@ -44,6 +53,36 @@ class ConversationMemory:
             logger.debug("Falling back to gpt2 tokenizer for conversation memory")
             self.tokenizer = tiktoken.get_encoding("gpt2")
 
+        self._messages: list[dict[str, str]] = []
+        self._token_counts: list[int] = []  # Parallel to _messages
+        self._message_tokens = 0
+        self._summary = ""
+        self._summary_tokens = 0
+
+    @property
+    def messages(self) -> list[dict[str, str]]:
+        """Retained messages, oldest first (use add_message to append)."""
+        return self._messages
+
+    @messages.setter
+    def messages(self, messages: list[dict[str, str]]) -> None:
+        self._set_messages(messages)
+
+    @property
+    def summary(self) -> str:
+        """Summary of messages trimmed from memory."""
+        return self._summary
+
+    @summary.setter
+    def summary(self, summary: str) -> None:
+        self._summary = summary
+        self._summary_tokens = self._count_tokens(summary) if summary else 0
+
+    @property
+    def total_tokens(self) -> int:
+        """Tokens held in memory (summary plus retained messages)."""
+        return self._summary_tokens + self._message_tokens
+
     def add_message(self, role: str, content: str) -> None:
         """Add a message to memory.
 
@@ -51,16 +90,23 @@ class ConversationMemory:
             role: Message role (user/assistant/system)
             content: Message content
         """
-        self.messages.append(
+        tokens = self._count_tokens(content)
+        self._messages.append(
             {"role": role, "content": content, "timestamp": datetime.now(UTC).isoformat()}
         )
+        self._token_counts.append(tokens)
+        self._message_tokens += tokens
 
         # Manage memory size
         self._manage_memory()
 
-    def get_messages_for_llm(self) -> list[dict[str, str]]:
+    def get_messages_for_llm(self, max_tokens: int | None = None) -> list[dict[str, str]]:
         """Get messages formatted for LLM.
 
+        Args:
+            max_tokens: Optional token budget; the summary is counted first and
+                the oldest messages that do not fit are left out
+
         Returns:
             List of message dictionaries
         """
@@ -72,8 +118,13 @@ class ConversationMemory:
                 {"role": "system", "content": f"Previous conversation summary: {self.summary}"}
             )
 
+        start = 0
+        if max_tokens is not None:
+            budget = max(0, max_tokens - self._summary_tokens)
+            start = find_cut_index(prefix_sums(self._token_counts), budget)
+
         # Add recent messages
-        for msg in self.messages:
+        for msg in self._messages[start:]:
             messages.append({"role": msg["role"], "content": msg["content"]})
 
         return messages
@@ -104,39 +155,60 @@ class ConversationMemory:
 
     def _manage_memory(self) -> None:
         """Manage memory size using sliding window and summarization."""
-        total_tokens = self._count_total_tokens()
-
-        if total_tokens > self.max_token_limit:
-            # Keep only recent messages
-            messages_to_keep = len(self.messages) // 2
-
-            # Summarize older messages
-            older_messages = self.messages[:messages_to_keep]
-            self.summary = self._create_summary(older_messages)
-
-            # Extract key points
-            self._extract_key_points(older_messages)
-
-            # Keep recent messages
-            self.messages = self.messages[messages_to_keep:]
+        if self.total_tokens <= self.max_token_limit or len(self._messages) <= 1:
+            return
+
+        target = int(self.max_token_limit * self.trim_to_ratio)
+        prefix = prefix_sums(self._token_counts)
+        last = len(self._messages) - 1  # Always keep the newest message
+
+        # Cut so the retained messages fit next to the current summary, then
+        # re-check once against the size of the new summary
+        cut = min(max(1, find_cut_index(prefix, max(0, target - self._summary_tokens))), last)
+        summary = self._create_summary(self._messages[:cut])
+        summary_tokens = self._count_tokens(summary) if summary else 0
+        if summary_tokens > self._summary_tokens:
+            refined = find_cut_index(prefix, max(0, target - summary_tokens))
+            if refined > cut:
+                cut = min(refined, last)
+                summary = self._create_summary(self._messages[:cut])
+
+        # Summarize older messages and extract key points
+        older_messages = self._messages[:cut]
+        self.summary = summary
+        self._extract_key_points(older_messages)
+
+        # Keep recent messages
+        self._messages = self._messages[cut:]
+        self._token_counts = self._token_counts[cut:]
+        self._message_tokens = prefix[-1] - prefix[cut]
+
+        logger.debug(
+            "conversation_memory.trimmed",
+            dropped=cut,
+            retained=len(self._messages),
+            total_tokens=self.total_tokens,
+        )
 
     def _count_total_tokens(self) -> int:
         """Count total tokens in memory.
 
         Returns:
-            Total token count
+            Total token count (maintained incrementally)
         """
-        total = 0
-
-        # Count summary tokens
-        if self.summary:
-            total += len(self.tokenizer.encode(self.summary))
+        return self.total_tokens
 
-        # Count message tokens
-        for msg in self.messages:
-            total += len(self.tokenizer.encode(msg["content"]))
+    def _count_tokens(self, text: str) -> int:
+        return len(self.tokenizer.encode(text))
 
-        return total
+    def _set_messages(
+        self, messages: list[dict[str, str]], token_counts: list[int] | None = None
+    ) -> None:
+        if token_counts is None or len(token_counts) != len(messages):
+            token_counts = [self._count_tokens(msg["content"]) for msg in messages]
+        self._messages = messages
+        self._token_counts = list(token_counts)
+        self._message_tokens = sum(self._token_counts)
 
     def _create_summary(self, messages: list[dict[str, str]]) -> str:
         """Create a summary of messages.
@@ -244,6 +316,7 @@ class ConversationMemory:
         """
         return {
             "messages": self.messages,
+            "token_counts": self._token_counts,
             "summary": self.summary,
             "key_points": self.key_points,
             "max_token_limit": self.max_token_limit,
@@ -260,7 +333,7 @@ class ConversationMemory:
             ConversationMemory instance
         """
         memory = cls(max_token_limit=data.get("max_token_limit", 4000))
-        memory.messages = data.get("messages", [])
+        memory._set_messages(data.get("messages", []), data.get("token_counts"))
         memory.summary = data.get("summary", "")
         memory.key_points = data.get("key_points", [])
         return memory
@@ -10,13 +10,38 @@ Architecture:
 - BaseProvider: Abstract interface for all providers
 - ProviderManager: Factory and lifecycle management
 - Provider Implementations: Specific provider integrations
+
+Exports are resolved lazily so that importing the manager does not load
+every provider SDK; each SDK is imported when its provider is first used.
 """
 
-from .anthropic import AnthropicProvider
-from .base import BaseProvider, ProviderConfig, ProviderType
-from .bedrock import BedrockProvider
-from .manager import ProviderManager, provider_manager
-from .openai import OpenAIProvider
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .anthropic import AnthropicProvider
+    from .base import BaseProvider, ProviderConfig, ProviderType
+    from .bedrock import BedrockProvider
+    from .manager import ProviderManager, provider_manager
+    from .openai import OpenAIProvider
+else:
+
+    def __getattr__(name: str) -> object:
+        """Lazy import exports at runtime."""
+        if name in _EXPORT_MAP:
+            module = __import__(_EXPORT_MAP[name], fromlist=[name])
+            return getattr(module, name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    _EXPORT_MAP = {
+        "AnthropicProvider": "coaching.src.llm.providers.anthropic",
+        "BaseProvider": "coaching.src.llm.providers.base",
+        "BedrockProvider": "coaching.src.llm.providers.bedrock",
+        "OpenAIProvider": "coaching.src.llm.providers.openai",
+        "ProviderConfig": "coaching.src.llm.providers.base",
+        "ProviderManager": "coaching.src.llm.providers.manager",
+        "ProviderType": "coaching.src.llm.providers.base",
+        "provider_manager": "coaching.src.llm.providers.manager",
+    }
 
 __all__ = [
     "AnthropicProvider",
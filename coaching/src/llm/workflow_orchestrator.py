@@ -6,6 +6,13 @@ Extends the base WorkflowOrchestrator with advanced LangGraph features:
 - Advanced state management
 - Enhanced workflow execution engine
 - Provider integration
+
+Memory stays bounded in long-lived containers: workflow states are kept in
+LRU maps and checkpointed to the cache service (see ``workflows.checkpoints``),
+and ``continue_workflow``, ``get_workflow_state`` and ``cancel_workflow``
+restore evicted workflows from their checkpoint.
+Compiled graphs are cached per workflow type and configuration, so starting or
+resuming a workflow does not rebuild its graph.
 """
 
 import uuid
@@ -14,7 +21,19 @@ from typing import Any, TypedDict
 
 import structlog
 from coaching.src.llm.providers.manager import provider_manager
-from coaching.src.workflows.base import WorkflowConfig, WorkflowState, WorkflowStatus, WorkflowType
+from coaching.src.workflows.base import (
+    BaseWorkflow,
+    WorkflowConfig,
+    WorkflowState,
+    WorkflowStatus,
+    WorkflowType,
+)
+from coaching.src.workflows.checkpoints import (
+    InMemoryCheckpointBackend,
+    LRUDict,
+    deserialize_state,
+    serialize_state,
+)
 from coaching.src.workflows.orchestrator import WorkflowOrchestrator
 
 logger = structlog.get_logger(__name__)
@@ -51,15 +70,38 @@ class GraphState(TypedDict):
 class LangGraphWorkflowOrchestrator(WorkflowOrchestrator):
     """Enhanced workflow orchestrator with LangGraph-specific features."""
 
-    def __init__(self, cache_service: Any = None) -> None:
+    def __init__(
+        self,
+        cache_service: Any = None,
+        *,
+        max_workflows: int | None = None,
+        max_compiled_graphs: int | None = None,
+    ) -> None:
         """Initialize the LangGraph workflow orchestrator.
 
         Args:
-            cache_service: Cache service for state persistence
+            cache_service: Cache service for state persistence (a
+                ``CheckpointBackend``; default: a per-process
+                ``InMemoryCheckpointBackend``)
+            max_workflows: Workflows kept in memory (default:
+                WORKFLOW_STATE_MAX_ENTRIES)
+            max_compiled_graphs: Compiled workflows kept for reuse (default:
+                WORKFLOW_GRAPH_CACHE_MAX_ENTRIES)
         """
+        from coaching.src.core.config_multitenant import settings
+
+        if cache_service is None:
+            cache_service = InMemoryCheckpointBackend()
         super().__init__(provider_manager, cache_service)
+        if max_workflows is None:
+            max_workflows = settings.workflow_state_max_entries
+        if max_compiled_graphs is None:
+            max_compiled_graphs = settings.workflow_graph_cache_max_entries
+        self._active_workflows: LRUDict[str, BaseWorkflow] = LRUDict(max_workflows)
+        self._workflow_states: LRUDict[str, WorkflowState] = LRUDict(max_workflows)
+        self._compiled_workflows: LRUDict[str, BaseWorkflow] = LRUDict(max_compiled_graphs)
         self._graph_utilities = GraphUtilities()
-        self._state_manager = AdvancedStateManager(cache_service)
+        self._state_manager = AdvancedStateManager(cache_service, max_entries=max_workflows)
 
     async def initialize(self) -> None:
         """Initialize the orchestrator and provider manager."""
@@ -88,6 +130,62 @@ class LangGraphWorkflowOrchestrator(WorkflowOrchestrator):
         graph: Any = await workflow.build_graph()
         return graph
 
+    def _get_workflow(self, workflow_type: WorkflowType, config: WorkflowConfig) -> BaseWorkflow:
+        """Get a workflow instance, reusing one already built for the same configuration.
+
+        Workflow instances keep no per-execution state, so one instance (and
+        its compiled graph) serves every workflow of a type and configuration.
+        The configuration is part of the key because graph nodes read it.
+
+        Args:
+            workflow_type: Registered workflow type
+            config: Workflow configuration
+
+        Returns:
+            Workflow instance whose graph is compiled on first execution
+        """
+        key = f"{WorkflowType(workflow_type).value}:{config.model_dump_json()}"
+        if key in self._compiled_workflows:
+            return self._compiled_workflows[key]
+        # Copy the configuration so later changes by the caller cannot leak into the cache
+        workflow: BaseWorkflow = self._workflow_registry[workflow_type](
+            config.model_copy(deep=True)
+        )
+        self._compiled_workflows[key] = workflow
+        return workflow
+
+    async def _restore_workflow(self, workflow_id: str) -> tuple[BaseWorkflow, WorkflowState]:
+        """Restore a workflow that is no longer in memory from its checkpoint.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            The workflow instance and its last checkpointed state
+
+        Raises:
+            KeyError: If the workflow has no checkpoint
+        """
+        state = await self._state_manager.load_state(workflow_id)
+        if state is None:
+            raise KeyError(f"Workflow not found: {workflow_id}")
+
+        workflow_type = WorkflowType(state.workflow_type)
+        if workflow_type not in self._workflow_registry:
+            raise KeyError(f"Workflow not found: {workflow_id}")
+        config_data = state.metadata.get("config")
+        config = (
+            WorkflowConfig.model_validate(config_data)
+            if isinstance(config_data, dict)
+            else WorkflowConfig(workflow_type=workflow_type)
+        )
+        workflow = self._get_workflow(workflow_type, config)
+
+        self._active_workflows[workflow_id] = workflow
+        self._workflow_states[workflow_id] = state
+        logger.info("LangGraph workflow restored from checkpoint", workflow_id=workflow_id)
+        return workflow, state
+
     async def start_workflow(
         self,
         workflow_type: WorkflowType,
@@ -125,9 +223,8 @@ class LangGraphWorkflowOrchestrator(WorkflowOrchestrator):
         workflow_id = str(uuid.uuid4())
 
         try:
-            # Create workflow instance
-            workflow_class = self._workflow_registry[workflow_type]
-            workflow = workflow_class(config)
+            # Reuse the compiled workflow for this type and configuration
+            workflow = self._get_workflow(workflow_type, config)
 
             # Store workflow
             self._active_workflows[workflow_id] = workflow
@@ -194,12 +291,16 @@ class LangGraphWorkflowOrchestrator(WorkflowOrchestrator):
 
         Returns:
             Updated workflow state
-        """
-        if workflow_id not in self._active_workflows:
-            raise KeyError(f"Workflow not found: {workflow_id}")
 
-        workflow = self._active_workflows[workflow_id]
-        current_state = self._workflow_states[workflow_id]
+        Raises:
+            KeyError: If the workflow is neither in memory nor checkpointed
+            ValueError: If the workflow cannot be continued
+        """
+        if workflow_id in self._active_workflows and workflow_id in self._workflow_states:
+            workflow = self._active_workflows[workflow_id]
+            current_state = self._workflow_states[workflow_id]
+        else:
+            workflow, current_state = await self._restore_workflow(workflow_id)
 
         if current_state.status not in [WorkflowStatus.WAITING_INPUT, WorkflowStatus.RUNNING]:
             raise ValueError(f"Workflow cannot be continued in status: {current_state.status}")
@@ -211,27 +312,14 @@ class LangGraphWorkflowOrchestrator(WorkflowOrchestrator):
                 current_step=current_state.current_step,
             )
 
-            # Convert current state to GraphState
-            graph_state = self._workflow_state_to_graph_state(current_state)
-
-            # Add new user input
-            graph_state["messages"].append(
-                {
-                    "role": "user",
-                    "content": user_input.get("content", ""),
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
-            )
-
-            # Update provider if specified
+            # Resume from a copy: the stored state (and its checkpoint) only
+            # changes once the step has succeeded
+            state = current_state.model_copy(deep=True)
             if provider_id:
-                graph_state["provider_id"] = provider_id
-
-            # Resume workflow execution
-            final_state = await workflow.resume(WorkflowState(**graph_state), user_input)
+                state.workflow_context["provider_id"] = provider_id
+            message = {"role": "user", **user_input, "timestamp": datetime.utcnow().isoformat()}
 
-            # Convert back and store
-            workflow_state = self._graph_state_to_workflow_state(final_state.model_dump())
+            workflow_state = await workflow.resume(state, message)
             self._workflow_states[workflow_id] = workflow_state
 
             # Persist state
@@ -241,7 +329,7 @@ class LangGraphWorkflowOrchestrator(WorkflowOrchestrator):
             logger.info(
                 "LangGraph workflow continued",
                 workflow_id=workflow_id,
-                status=workflow_state.status.value,
+                status=workflow_state.status,
                 step=workflow_state.current_step,
             )
             return workflow_state
@@ -256,6 +344,55 @@ class LangGraphWorkflowOrchestrator(WorkflowOrchestrator):
             self._workflow_states[workflow_id] = current_state
             raise
 
+    async def get_workflow_state(self, workflow_id: str) -> WorkflowState | None:
+        """Get current state of a workflow, restoring it from its checkpoint.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            Workflow state if in memory or checkpointed, None otherwise
+        """
+        if workflow_id in self._workflow_states:
+            return self._workflow_states[workflow_id]
+        try:
+            _, state = await self._restore_workflow(workflow_id)
+        except KeyError:
+            return None
+        return state
+
+    async def cancel_workflow(self, workflow_id: str) -> bool:
+        """Cancel a workflow, restoring it from its checkpoint if evicted.
+
+        The cancelled state is checkpointed, so other instances see it too.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            True if cancelled, False if not found or already cancelled
+        """
+        if workflow_id in self._active_workflows and workflow_id in self._workflow_states:
+            workflow = self._active_workflows[workflow_id]
+            state = self._workflow_states[workflow_id]
+        else:
+            try:
+                workflow, state = await self._restore_workflow(workflow_id)
+            except KeyError:
+                return False
+        if state.status == WorkflowStatus.CANCELLED:
+            self._active_workflows.pop(workflow_id, None)
+            return False
+
+        state.status = WorkflowStatus.CANCELLED
+        state.completed_at = datetime.utcnow().isoformat()
+        self._active_workflows.pop(workflow_id, None)
+        if workflow.config.enable_checkpoints:
+            await self._state_manager.save_state(workflow_id, state)
+
+        logger.info("LangGraph workflow cancelled", workflow_id=workflow_id)
+        return True
+
     def _create_graph_state(
         self,
         workflow_id: str,
@@ -301,46 +438,6 @@ class LangGraphWorkflowOrchestrator(WorkflowOrchestrator):
             "updated_at": datetime.utcnow().isoformat(),
         }
 
-    def _workflow_state_to_graph_state(self, state: WorkflowState) -> dict[str, Any]:
-        """Convert WorkflowState to GraphState format."""
-        return {
-            "workflow_id": state.workflow_id,
-            "workflow_type": state.workflow_type.value,
-            "user_id": state.user_id,
-            "session_id": state.session_id,
-            "messages": state.conversation_history,
-            "current_step": state.current_step,
-            "step_data": state.step_data,
-            "provider_id": state.metadata.get("provider_id"),
-            "model_config": state.metadata.get("model_config", {}),
-            "status": state.status.value,
-            "results": state.results,
-            "metadata": state.metadata,
-            "created_at": state.created_at or datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
-        }
-
-    def _graph_state_to_workflow_state(self, graph_state: dict[str, Any]) -> WorkflowState:
-        """Convert GraphState to WorkflowState."""
-        return WorkflowState(
-            workflow_id=graph_state["workflow_id"],
-            workflow_type=WorkflowType(graph_state["workflow_type"]),
-            status=WorkflowStatus(graph_state["status"]),
-            user_id=graph_state["user_id"],
-            session_id=graph_state.get("session_id"),
-            conversation_history=graph_state.get("messages", []),
-            current_step=graph_state["current_step"],
-            step_data=graph_state.get("step_data", {}),
-            workflow_context={
-                "provider_id": graph_state.get("provider_id"),
-                "model_config": graph_state.get("model_config", {}),
-            },
-            results=graph_state.get("results", {}),
-            metadata=graph_state.get("metadata", {}),
-            created_at=graph_state.get("created_at"),
-            updated_at=graph_state.get("updated_at"),
-        )
-
 
 class GraphUtilities:
     """Utilities for LangGraph construction and management."""
@@ -470,16 +567,21 @@ class GraphUtilities:
 
 
 class AdvancedStateManager:
-    """Advanced state management for LangGraph workflows."""
+    """Advanced state management for LangGraph workflows.
+
+    States are kept in a bounded in-memory LRU and checkpointed to the cache
+    service, from which evicted states are loaded back on demand.
+    """
 
-    def __init__(self, cache_service: Any = None) -> None:
+    def __init__(self, cache_service: Any = None, *, max_entries: int = 1000) -> None:
         """Initialize state manager.
 
         Args:
-            cache_service: Cache service for persistence
+            cache_service: Cache service for persistence (a ``CheckpointBackend``)
+            max_entries: Maximum states kept in memory
         """
         self.cache_service = cache_service
-        self._local_state_cache: dict[str, WorkflowState] = {}
+        self._local_state_cache: LRUDict[str, WorkflowState] = LRUDict(max_entries)
 
     async def save_state(self, workflow_id: str, state: WorkflowState) -> None:
         """Save workflow state with persistence.
@@ -492,9 +594,9 @@ class AdvancedStateManager:
         self._local_state_cache[workflow_id] = state
 
         # Persist to external cache if available
-        if self.cache_service:
+        if self.cache_service is not None:
             try:
-                await self.cache_service.save_workflow_state(workflow_id, state.model_dump())
+                await self.cache_service.save_workflow_state(workflow_id, serialize_state(state))
                 logger.debug("Workflow state persisted", workflow_id=workflow_id)
             except Exception as e:
                 logger.warning(
@@ -515,11 +617,11 @@ class AdvancedStateManager:
             return self._local_state_cache[workflow_id]
 
         # Try external cache
-        if self.cache_service:
+        if self.cache_service is not None:
             try:
                 state_data = await self.cache_service.load_workflow_state(workflow_id)
                 if state_data:
-                    state = WorkflowState(**state_data)
+                    state = deserialize_state(state_data)
                     self._local_state_cache[workflow_id] = state
                     return state
             except Exception as e:
@@ -542,7 +644,7 @@ class AdvancedStateManager:
         cleaned_count = 0
 
         states_to_remove = []
-        for workflow_id, state in self._local_state_cache.items():
+        for workflow_id, state in list(self._local_state_cache.items()):
             if state.completed_at:
                 # Handle both ISO format strings and timestamp floats
                 try:
@@ -571,5 +673,6 @@ class AdvancedStateManager:
         return cleaned_count
 
 
-# Global enhanced orchestrator instance
+# Global enhanced orchestrator instance; checkpoints stay in process memory unless
+# an orchestrator is created with a shared CheckpointBackend (CacheService on Redis)
 langgraph_orchestrator = LangGraphWorkflowOrchestrator()
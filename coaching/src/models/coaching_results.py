@@ -147,7 +147,9 @@ def get_result_json_schema(model_name: str) -> dict[str, object] | None:
     Returns:
         JSON schema dict, or None if model not found
     """
+    from coaching.src.core.response_model_registry import get_schema_artifacts
+
     model = get_coaching_result_model(model_name)
     if model is None:
         return None
-    return model.model_json_schema()
+    return get_schema_artifacts(model).json_schema()
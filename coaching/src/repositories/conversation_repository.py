@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 from coaching.src.core.constants import ConversationStatus, MessageRole
 from coaching.src.core.exceptions import ConversationNotFoundCompatError
 from coaching.src.domain.value_objects.message import Message
+from coaching.src.infrastructure.aws_io import run_aws_call
 from coaching.src.models.conversation import Conversation, ConversationContext
 from shared.domain_types.common import JSONDict
 
@@ -149,7 +150,7 @@ class ConversationRepository:
 
         # Save to DynamoDB
         item = self._conversation_to_item(conversation)
-        self.table.put_item(Item=cast(dict[str, Any], item))
+        await run_aws_call("dynamodb", self.table.put_item, Item=cast(dict[str, Any], item))
 
         logger.info(
             "Conversation created", conversation_id=conversation_id, user_id=user_id, topic=topic
@@ -168,7 +169,9 @@ class ConversationRepository:
         """
         try:
             # Query with conversation_id and latest timestamp
-            response = self.table.query(
+            response = await run_aws_call(
+                "dynamodb",
+                self.table.query,
                 KeyConditionExpression=Key("conversation_id").eq(conversation_id),
                 ScanIndexForward=False,  # Get latest first
                 Limit=1,
@@ -198,7 +201,7 @@ class ConversationRepository:
         item = self._conversation_to_item(conversation)
 
         # Save to DynamoDB
-        self.table.put_item(Item=cast(dict[str, Any], item))
+        await run_aws_call("dynamodb", self.table.put_item, Item=cast(dict[str, Any], item))
 
         logger.info("Conversation updated", conversation_id=conversation.conversation_id)
 
@@ -294,7 +297,7 @@ class ConversationRepository:
                         combined_filter = combined_filter & expr
                     kwargs["FilterExpression"] = combined_filter
 
-            response = self.table.query(**kwargs)
+            response = await run_aws_call("dynamodb", self.table.query, **kwargs)
 
             conversations: list[Conversation] = []
             items = cast(list[ConversationItemDict], response["Items"])
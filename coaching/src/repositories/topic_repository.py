@@ -21,6 +21,7 @@ from coaching.src.domain.exceptions.topic_exceptions import (
     TopicNotFoundError,
     TopicUpdateError,
 )
+from coaching.src.infrastructure.aws_io import run_aws_call
 
 logger = structlog.get_logger()
 
@@ -62,7 +63,9 @@ class TopicRepository:
             LLMTopic if found, None otherwise
         """
         try:
-            response = self.table.get_item(Key={"topic_id": topic_id})
+            response = await run_aws_call(
+                "dynamodb", self.table.get_item, Key={"topic_id": topic_id}
+            )
 
             if "Item" not in response:
                 logger.debug("Topic not found", topic_id=topic_id)
@@ -89,9 +92,11 @@ class TopicRepository:
         """
         try:
             if include_inactive:
-                response = self.table.scan()
+                response = await run_aws_call("dynamodb", self.table.scan)
             else:
-                response = self.table.scan(FilterExpression=Attr("is_active").eq(True))
+                response = await run_aws_call(
+                    "dynamodb", self.table.scan, FilterExpression=Attr("is_active").eq(True)
+                )
 
             items = cast(list[dict[str, Any]], response.get("Items", []))
             topics = [LLMTopic.from_dynamodb_item(item) for item in items]
@@ -205,12 +210,16 @@ class TopicRepository:
         """
         try:
             if include_inactive:
-                response = self.table.query(
+                response = await run_aws_call(
+                    "dynamodb",
+                    self.table.query,
                     IndexName="topic_type-index",
                     KeyConditionExpression=Key("topic_type").eq(topic_type),
                 )
             else:
-                response = self.table.query(
+                response = await run_aws_call(
+                    "dynamodb",
+                    self.table.query,
                     IndexName="topic_type-index",
                     KeyConditionExpression=Key("topic_type").eq(topic_type),
                     FilterExpression=Attr("is_active").eq(True),
@@ -254,7 +263,7 @@ class TopicRepository:
 
         try:
             item = topic.to_dynamodb_item()
-            self.table.put_item(Item=item)
+            await run_aws_call("dynamodb", self.table.put_item, Item=item)
 
             logger.info(
                 "Topic created",
@@ -293,7 +302,7 @@ class TopicRepository:
             topic.updated_at = datetime.now(UTC)
 
             item = topic.to_dynamodb_item()
-            self.table.put_item(Item=item)
+            await run_aws_call("dynamodb", self.table.put_item, Item=item)
 
             logger.info(
                 "Topic updated",
@@ -326,7 +335,7 @@ class TopicRepository:
         try:
             if hard_delete:
                 # Permanent deletion
-                self.table.delete_item(Key={"topic_id": topic_id})
+                await run_aws_call("dynamodb", self.table.delete_item, Key={"topic_id": topic_id})
                 logger.info("Topic hard deleted", topic_id=topic_id)
             else:
                 # Soft delete
@@ -1,21 +1,49 @@
 """Services module for coaching application.
 
 This module contains application services that orchestrate business logic.
+
+Exports are resolved lazily so that importing one service module (for example
+from an EventBridge job) does not load the coaching session service.
 """
 
-from coaching.src.services.coaching_session_service import (
-    ActiveSessionExistsError,
-    CoachingSessionService,
-    InvalidTopicError,
-    MessageDetail,
-    MessageResponse,
-    SessionCompletionResponse,
-    SessionDetails,
-    SessionResponse,
-    SessionStateResponse,
-    SessionSummary,
-    SessionValidationError,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from coaching.src.services.coaching_session_service import (
+        ActiveSessionExistsError,
+        CoachingSessionService,
+        InvalidTopicError,
+        MessageDetail,
+        MessageResponse,
+        SessionCompletionResponse,
+        SessionDetails,
+        SessionResponse,
+        SessionStateResponse,
+        SessionSummary,
+        SessionValidationError,
+    )
+else:
+
+    def __getattr__(name: str) -> object:
+        """Lazy import exports at runtime."""
+        if name in _EXPORT_MAP:
+            module = __import__(_EXPORT_MAP[name], fromlist=[name])
+            return getattr(module, name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    _EXPORT_MAP = {
+        "ActiveSessionExistsError": "coaching.src.services.coaching_session_service",
+        "CoachingSessionService": "coaching.src.services.coaching_session_service",
+        "InvalidTopicError": "coaching.src.services.coaching_session_service",
+        "MessageDetail": "coaching.src.services.coaching_session_service",
+        "MessageResponse": "coaching.src.services.coaching_session_service",
+        "SessionCompletionResponse": "coaching.src.services.coaching_session_service",
+        "SessionDetails": "coaching.src.services.coaching_session_service",
+        "SessionResponse": "coaching.src.services.coaching_session_service",
+        "SessionStateResponse": "coaching.src.services.coaching_session_service",
+        "SessionSummary": "coaching.src.services.coaching_session_service",
+        "SessionValidationError": "coaching.src.services.coaching_session_service",
+    }
 
 __all__ = [
     "ActiveSessionExistsError",
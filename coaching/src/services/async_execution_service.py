@@ -25,6 +25,7 @@ from coaching.src.core.topic_registry import (
     get_topic_by_topic_id,
 )
 from coaching.src.domain.entities.ai_job import AIJob, AIJobErrorCode, AIJobStatus
+from coaching.src.infrastructure.external.business_api_cache import get_business_api_cache
 from coaching.src.infrastructure.external.business_api_client import BusinessApiClient
 from coaching.src.infrastructure.repositories.dynamodb_job_repository import DynamoDBJobRepository
 from coaching.src.services.template_parameter_processor import TemplateParameterProcessor
@@ -525,10 +526,15 @@ class AsyncAIExecutionService:
         api_client = BusinessApiClient(
             base_url=settings.business_api_base_url,
             jwt_token=jwt_token,
+            cache=get_business_api_cache(),
         )
 
         # Create and return processor
-        return TemplateParameterProcessor(business_api_client=api_client)
+        return TemplateParameterProcessor(
+            business_api_client=api_client,
+            max_concurrency=settings.enrichment_max_concurrency,
+            method_timeout_seconds=settings.enrichment_method_timeout_seconds,
+        )
 
     def _estimate_duration(self, topic_id: str) -> int:
         """Estimate processing duration for a topic.
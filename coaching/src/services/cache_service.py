@@ -130,3 +130,28 @@ class CacheService:
         """
         key = f"session:{conversation_id}"
         return await self.set(key, session_data)
+
+    async def load_workflow_state(self, workflow_id: str) -> dict[str, Any] | None:
+        """Get a workflow checkpoint from cache.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            Checkpoint data or None
+        """
+        key = f"workflow:{workflow_id}"
+        return await self.get(key)
+
+    async def save_workflow_state(self, workflow_id: str, state_data: dict[str, Any]) -> bool:
+        """Save a workflow checkpoint to cache.
+
+        Args:
+            workflow_id: Workflow identifier
+            state_data: Checkpoint data (see ``workflows.checkpoints``)
+
+        Returns:
+            True if successful
+        """
+        key = f"workflow:{workflow_id}"
+        return await self.set(key, state_data)
@@ -61,6 +61,7 @@ class CoachingMessageJobService:
         - Worker Lambda processes message via coaching_session_service
         - Complete message published via ai.message.completed (no token streaming)
         - Frontend receives full response via WebSocket or polling
+        - Token streaming is served separately by POST /message/stream (SSE)
     """
 
     def __init__(
@@ -344,6 +345,10 @@ class CoachingMessageJobService:
                 processing_time_ms=processing_time_ms,
             )
 
+            # The reply is already delivered; finish the turn's partial
+            # extraction before the invocation returns and the container freezes
+            await self._session_service.wait_for_partial_extraction(job.session_id)
+
         except SessionNotFoundError as e:
             await self._handle_failure(
                 job=job,
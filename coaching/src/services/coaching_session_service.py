@@ -14,24 +14,37 @@ Architecture:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
-from typing import TYPE_CHECKING, Any
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import structlog
 from coaching.src.core.constants import ConversationStatus, MessageRole, TierLevel, TopicType
+from coaching.src.core.context_window import get_context_window_builder
 from coaching.src.core.llm_models import MODEL_REGISTRY
+from coaching.src.core.response_model_registry import get_schema_artifacts
 from coaching.src.core.structured_output import (
     EXTRACTION_PROMPT_TEMPLATE,
+    INCREMENTAL_EXTRACTION_PROMPT_TEMPLATE,
     get_structured_output_instructions,
 )
+from coaching.src.core.template_compiler import compile_template
 from coaching.src.core.topic_registry import (
     TemplateType,
     TopicDefinition,
     list_topics_by_topic_type,
 )
 from coaching.src.core.types import TenantId, UserId
-from coaching.src.domain.entities.coaching_session import CoachingMessage, CoachingSession
+from coaching.src.domain.entities.coaching_session import (
+    CoachingMessage,
+    CoachingSession,
+    CoachingSessionSummary,
+)
 from coaching.src.domain.exceptions import (
     MaxTurnsReachedError,
     SessionAccessDeniedError,
@@ -40,11 +53,13 @@ from coaching.src.domain.exceptions import (
     SessionNotFoundError,
 )
 from coaching.src.models.coaching_results import get_coaching_result_model
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+from shared.observability.metrics import get_metrics
 
 if TYPE_CHECKING:
     from coaching.src.domain.entities.llm_topic import LLMTopic
     from coaching.src.domain.ports import CoachingSessionRepositoryPort
+    from coaching.src.domain.ports.llm_provider_port import LLMMessage
     from coaching.src.infrastructure.llm.provider_factory import LLMProviderFactory
     from coaching.src.repositories.topic_repository import TopicRepository
     from coaching.src.services.s3_prompt_storage import S3PromptStorage
@@ -202,6 +217,13 @@ class SessionSummary(BaseModel):
     updated_at: str
 
 
+class SessionSummaryPage(BaseModel):
+    """A page of session summaries."""
+
+    sessions: list[SessionSummary]
+    next_cursor: str | None = Field(default=None, description="Cursor for the next page")
+
+
 class TopicStatus(BaseModel):
     """Status of a coaching topic for a user."""
 
@@ -219,6 +241,188 @@ class TopicsWithStatusResponse(BaseModel):
     topics: list[TopicStatus]
 
 
+# =============================================================================
+# Streaming Support
+# =============================================================================
+
+
+@dataclass
+class PreparedMessageTurn:
+    """A validated user turn whose LLM prompt is ready to be sent.
+
+    Produced by ``CoachingSessionService.prepare_message_turn``. The user message
+    has been added to the in-memory session but nothing is persisted until the
+    turn is completed.
+    """
+
+    session: CoachingSession
+    endpoint_def: TopicDefinition
+    llm_topic: LLMTopic
+    messages: list[dict[str, str]]
+
+
+@dataclass
+class PartialResult:
+    """A result extracted speculatively from the first messages of a session."""
+
+    result: dict[str, Any]
+    message_count: int
+
+
+@dataclass
+class _ResolvedLLMCall:
+    """Provider, model and request arguments for a coaching LLM call."""
+
+    provider: Any
+    model_code: str
+    model_name: str
+    messages: list[LLMMessage]
+    system_prompt: str | None
+    temperature: float
+    max_tokens: int
+    user_tier: TierLevel
+
+    def record_token_usage(self, topic_id: str, usage: dict[str, int]) -> None:
+        """Emit token usage metrics for this call, per topic and tier."""
+        get_metrics().record_llm_tokens(
+            model=self.model_code,
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+            topic=topic_id,
+            tenant_tier=self.user_tier.value,
+        )
+
+
+class MessageStreamExtractor:
+    """Incrementally extract the coach message from a streamed LLM reply.
+
+    Coaching replies use the structured format ``{"message": "...", "is_final": ...}``,
+    sometimes inside a markdown code fence. While tokens stream in, clients should
+    only see the message text, so ``feed`` returns the newly decoded part of the
+    ``message`` string. Replies that are not JSON are passed through unchanged,
+    matching ``CoachingSessionService._parse_llm_response``.
+    """
+
+    _MESSAGE_KEY = re.compile(r'"message"\s*:\s*"')
+    _ESCAPES: ClassVar[dict[str, str]] = {
+        '"': '"',
+        "\\": "\\",
+        "/": "/",
+        "b": "\b",
+        "f": "\f",
+        "n": "\n",
+        "r": "\r",
+        "t": "\t",
+    }
+
+    def __init__(self) -> None:
+        """Initialize an empty extractor."""
+        self._buffer = ""
+        self._mode: str | None = None  # "text", "json" or "done"
+        self._pos = 0
+        self._in_message = False
+
+    def feed(self, chunk: str) -> str:
+        """Add a streamed chunk.
+
+        Args:
+            chunk: Raw text from the LLM stream
+
+        Returns:
+            Message text that became available with this chunk (may be empty)
+        """
+        self._buffer += chunk
+        if self._mode is None:
+            self._mode = self._detect_mode()
+        if self._mode == "text":
+            text = self._buffer[self._pos :]
+            self._pos = len(self._buffer)
+            return text
+        if self._mode == "json":
+            return self._read_message()
+        return ""
+
+    def _detect_mode(self) -> str | None:
+        stripped = self._buffer.lstrip()
+        if stripped.startswith("```"):
+            newline = stripped.find("\n")
+            if newline == -1:
+                return None
+            stripped = stripped[newline + 1 :].lstrip()
+        elif "```".startswith(stripped):
+            # Empty so far, or a code fence that is still arriving
+            return None
+        if not stripped:
+            return None
+        return "json" if stripped[0] == "{" else "text"
+
+    def _read_message(self) -> str:
+        buffer = self._buffer
+        if not self._in_message:
+            match = self._MESSAGE_KEY.search(buffer, self._pos)
+            if match is None:
+                return ""
+            self._pos = match.end()
+            self._in_message = True
+
+        out: list[str] = []
+        i = self._pos
+        while i < len(buffer):
+            char = buffer[i]
+            if char == '"':
+                self._mode = "done"
+                i += 1
+                break
+            if char != "\\":
+                out.append(char)
+                i += 1
+                continue
+            if i + 1 >= len(buffer):
+                break
+            escape = buffer[i + 1]
+            if escape != "u":
+                out.append(self._ESCAPES.get(escape, escape))
+                i += 2
+                continue
+            decoded, consumed = self._decode_unicode(buffer, i)
+            if consumed == 0:
+                break
+            out.append(decoded)
+            i += consumed
+        self._pos = i
+        return "".join(out)
+
+    @staticmethod
+    def _decode_unicode(buffer: str, start: int) -> tuple[str, int]:
+        """Decode a ``\\uXXXX`` escape (or surrogate pair) at ``start``.
+
+        Returns:
+            Tuple of (decoded text, characters consumed); 0 consumed means the
+            escape is not complete yet
+        """
+        if start + 6 > len(buffer):
+            return "", 0
+        try:
+            code = int(buffer[start + 2 : start + 6], 16)
+        except ValueError:
+            return "\ufffd", 6
+        if 0xD800 <= code <= 0xDBFF:
+            if start + 12 > len(buffer):
+                return "", 0
+            if buffer[start + 6 : start + 8] == "\\u":
+                try:
+                    low = int(buffer[start + 8 : start + 12], 16)
+                except ValueError:
+                    low = 0
+                if 0xDC00 <= low <= 0xDFFF:
+                    return chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)), 12
+            return "\ufffd", 6
+        if 0xDC00 <= code <= 0xDFFF:
+            return "\ufffd", 6
+        return chr(code), 6
+
+
 # =============================================================================
 # Service Implementation
 # =============================================================================
@@ -236,8 +440,19 @@ class CoachingSessionService:
 
     It does NOT contain any configuration itself - everything comes from
     external sources following the single-shot engine pattern.
+
+    With incremental extraction enabled, each non-final turn schedules a
+    background task that folds the new messages into the session's partial
+    result, so completion only has to validate it (or update it with the last
+    few messages) instead of extracting from the whole transcript.
     """
 
+    # Sessions read per query when building the topic status dashboard
+    TOPIC_STATUS_PAGE_SIZE = 100
+
+    # Background extractions per session, shared by the per-request service instances
+    _pending_extractions: ClassVar[dict[str, asyncio.Task[PartialResult | None]]] = {}
+
     def __init__(
         self,
         *,
@@ -246,6 +461,8 @@ class CoachingSessionService:
         s3_prompt_storage: S3PromptStorage,
         template_processor: TemplateParameterProcessor | None,
         provider_factory: LLMProviderFactory,
+        incremental_extraction: bool = False,
+        extraction_wait_seconds: float = 5.0,
     ) -> None:
         """Initialize the coaching session service.
 
@@ -255,12 +472,17 @@ class CoachingSessionService:
             s3_prompt_storage: Storage for loading templates from S3
             template_processor: Processor for resolving parameters (None in worker mode)
             provider_factory: Factory for LLM provider/model resolution
+            incremental_extraction: Refresh a partial result in the background after each turn
+            extraction_wait_seconds: How long completion waits for a running
+                background extraction before updating the stored partial itself
         """
         self.session_repository = session_repository
         self.topic_repository = topic_repository
         self.s3_prompt_storage = s3_prompt_storage
         self.template_processor = template_processor
         self.provider_factory = provider_factory
+        self.incremental_extraction = incremental_extraction
+        self.extraction_wait_seconds = extraction_wait_seconds
 
         # Build topic index for quick lookup
         self._topic_index: dict[str, TopicDefinition] = {}
@@ -405,7 +627,8 @@ class CoachingSessionService:
     def _render_template(self, template: str, context: dict[str, Any]) -> str:
         """Render template with context values.
 
-        Supports both {{param}} (Jinja2-style) and {param} placeholders.
+        Supports both {{param}} (Jinja2-style) and {param} placeholders. Any
+        {param} is substituted, even next to another brace (e.g. {param}}).
 
         Args:
             template: Template string with placeholders
@@ -414,18 +637,9 @@ class CoachingSessionService:
         Returns:
             Rendered template string
         """
-        result = template
-
-        # Replace double-brace placeholders {{param}}
-        for key, value in context.items():
-            result = result.replace(f"{{{{{key}}}}}", str(value))
-
-        # Replace single-brace placeholders {param}
-        for key, value in context.items():
-            # Use word boundary matching to avoid partial replacements
-            result = re.sub(rf"\{{{key}\}}", str(value), result)
-
-        return result
+        return compile_template(template, lenient=True).render(
+            {k: str(v) for k, v in context.items()}
+        )
 
     # =========================================================================
     # Session Lifecycle - Initiate
@@ -813,13 +1027,13 @@ class CoachingSessionService:
             system_preview=rendered_system[:150] + "...",
         )
 
-        # Build messages with history
-        history = session.get_messages_for_llm(max_messages=20)
-        messages = [
-            {"role": "system", "content": rendered_system},
-            *history,
-            {"role": "user", "content": rendered_resume},
-        ]
+        # Build messages with as much history as the model's input budget allows
+        messages = self._build_context_messages(
+            session=session,
+            system_prompt=rendered_system,
+            llm_topic=llm_topic,
+            new_message=rendered_resume,
+        )
 
         # Execute LLM
         llm_response, response_metadata = await self._execute_llm_call(
@@ -869,9 +1083,9 @@ class CoachingSessionService:
             Formatted conversation history string
 
         Note:
-            No truncation is applied to individual messages. The message count
-            is already limited by get_messages_for_llm(max_messages=20) and
-            LLMs have sufficient context windows (200K+ tokens) to handle this.
+            No truncation is applied to individual messages. The history sent
+            alongside is packed into the model's input budget by
+            _build_context_messages.
         """
         if not messages:
             return "This is the start of the conversation."
@@ -916,6 +1130,78 @@ class CoachingSessionService:
             SessionIdleTimeoutError: If session has timed out
             MaxTurnsReachedError: If max turns exceeded
         """
+        turn = await self.prepare_message_turn(
+            session_id=session_id,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            user_message=user_message,
+        )
+
+        # Execute LLM
+        llm_response, response_metadata = await self._execute_llm_call(
+            messages=turn.messages,
+            llm_topic=turn.llm_topic,
+        )
+
+        return await self.complete_message_turn(turn, llm_response, response_metadata)
+
+    async def stream_message(
+        self,
+        *,
+        session_id: str,
+        tenant_id: str,
+        user_id: str,
+        user_message: str,
+    ) -> AsyncIterator[str | MessageResponse]:
+        """Send a user message and stream the coach response.
+
+        Convenience wrapper around ``prepare_message_turn`` and
+        ``stream_message_turn``. Callers that need to report validation errors
+        before the stream starts (e.g. HTTP routes) should call those directly.
+
+        Args:
+            session_id: Session identifier
+            tenant_id: Tenant identifier
+            user_id: User identifier
+            user_message: User's message content
+
+        Yields:
+            Message text chunks, then the final MessageResponse
+        """
+        turn = await self.prepare_message_turn(
+            session_id=session_id,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            user_message=user_message,
+        )
+        async for item in self.stream_message_turn(turn):
+            yield item
+
+    async def prepare_message_turn(
+        self,
+        *,
+        session_id: str,
+        tenant_id: str,
+        user_id: str,
+        user_message: str,
+    ) -> PreparedMessageTurn:
+        """Validate a user message and build the LLM prompt for the coach reply.
+
+        Args:
+            session_id: Session identifier
+            tenant_id: Tenant identifier
+            user_id: User identifier
+            user_message: User's message content
+
+        Returns:
+            PreparedMessageTurn ready for a blocking or streaming LLM call
+
+        Raises:
+            SessionNotFoundError: If session not found
+            SessionAccessDeniedError: If user doesn't own session
+            SessionNotActiveError: If session is not active
+            MaxTurnsReachedError: If max turns exceeded
+        """
         logger.info(
             "coaching_service.send_message",
             session_id=session_id,
@@ -956,15 +1242,103 @@ class CoachingSessionService:
             if structured_instructions:
                 rendered_system = f"{rendered_system}\n\n{structured_instructions}"
 
-        # Get history and build messages
-        history = session.get_messages_for_llm(max_messages=30)
-        messages = [{"role": "system", "content": rendered_system}, *history]
+        # Get history and build messages (the latest user message is always kept)
+        messages = self._build_context_messages(
+            session=session,
+            system_prompt=rendered_system,
+            llm_topic=llm_topic,
+        )
 
-        # Execute LLM
-        llm_response, response_metadata = await self._execute_llm_call(
-            messages=messages,
+        return PreparedMessageTurn(
+            session=session,
+            endpoint_def=endpoint_def,
             llm_topic=llm_topic,
+            messages=messages,
+        )
+
+    async def stream_message_turn(
+        self,
+        turn: PreparedMessageTurn,
+    ) -> AsyncIterator[str | MessageResponse]:
+        """Stream the coach reply for a prepared turn.
+
+        Yields the coach message text as the LLM generates it, then the final
+        MessageResponse once the full reply has been parsed and persisted. The
+        session is only written after the stream completes, so an abandoned
+        stream leaves the stored session unchanged.
+
+        Args:
+            turn: Turn returned by ``prepare_message_turn``
+
+        Yields:
+            Message text chunks, then the final MessageResponse
+        """
+        start_time = time.perf_counter()
+        call = self._resolve_llm_call(messages=turn.messages, llm_topic=turn.llm_topic)
+        extractor = MessageStreamExtractor()
+        chunks: list[str] = []
+        usage: dict[str, int] = {}
+
+        stream = call.provider.generate_stream(
+            messages=call.messages,
+            model=call.model_name,
+            temperature=call.temperature,
+            max_tokens=call.max_tokens,
+            system_prompt=call.system_prompt,
+            usage=usage,
+        )
+        # Close the provider stream promptly if our consumer goes away
+        async with aclosing(stream):
+            async for chunk in stream:
+                chunks.append(chunk)
+                text = extractor.feed(chunk)
+                if text:
+                    yield text
+
+        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
+        content = "".join(chunks)
+        if not content.strip():
+            logger.warning(
+                "coaching_service.empty_llm_stream",
+                model_code=call.model_code,
+                fallback_used=True,
+            )
+            content = self._get_fallback_message("error")
+
+        logger.info(
+            "coaching_service.llm_stream_completed",
+            model_code=call.model_code,
+            model_name=call.model_name,
+            chunk_count=len(chunks),
+            processing_time_ms=processing_time_ms,
         )
+        call.record_token_usage(turn.llm_topic.topic_id, usage)
+
+        metadata = ResponseMetadata(
+            model=call.model_name,
+            processing_time_ms=processing_time_ms,
+            tokens_used=usage.get("total_tokens", 0),
+        )
+        yield await self.complete_message_turn(turn, content, metadata)
+
+    async def complete_message_turn(
+        self,
+        turn: PreparedMessageTurn,
+        llm_response: str,
+        response_metadata: ResponseMetadata,
+    ) -> MessageResponse:
+        """Record the coach reply for a turn and persist the session.
+
+        Args:
+            turn: Turn returned by ``prepare_message_turn``
+            llm_response: Full raw LLM reply
+            response_metadata: Metadata about the LLM call
+
+        Returns:
+            MessageResponse with coach's response (and extracted result if final)
+        """
+        session = turn.session
+        session_id = str(session.session_id)
 
         # Parse response for completion signal
         coach_message, is_final = self._parse_llm_response(llm_response)
@@ -987,8 +1361,8 @@ class CoachingSessionService:
             )
             completion_response = await self._extract_and_complete(
                 session=session,
-                endpoint_def=endpoint_def,
-                llm_topic=llm_topic,
+                endpoint_def=turn.endpoint_def,
+                llm_topic=turn.llm_topic,
             )
             return MessageResponse(
                 session_id=session_id,
@@ -1002,6 +1376,9 @@ class CoachingSessionService:
                 metadata=response_metadata,
             )
 
+        if self.incremental_extraction and turn.endpoint_def.result_model:
+            self._schedule_partial_extraction(session, turn.endpoint_def, turn.llm_topic)
+
         return MessageResponse(
             session_id=session_id,
             message=coach_message,
@@ -1014,6 +1391,182 @@ class CoachingSessionService:
             metadata=response_metadata,
         )
 
+    def _schedule_partial_extraction(
+        self,
+        session: CoachingSession,
+        endpoint_def: TopicDefinition,
+        llm_topic: LLMTopic,
+    ) -> None:
+        """Fold the session's new messages into its partial result in the background.
+
+        Tasks for one session are chained: each waits for the previous one, so
+        every extraction only sends the messages the last one did not cover.
+        """
+        session_id = str(session.session_id)
+        previous = self._running_extraction(session_id)
+        base = self._stored_partial_result(session)
+        task = asyncio.create_task(
+            self._refresh_partial_result(
+                session_id=session_id,
+                messages=list(session.messages),
+                endpoint_def=endpoint_def,
+                llm_topic=llm_topic,
+                base=base,
+                previous=previous,
+            )
+        )
+        self._pending_extractions[session_id] = task
+        task.add_done_callback(lambda done: self._forget_extraction(session_id, done))
+
+    async def wait_for_partial_extraction(self, session_id: str) -> None:
+        """Wait for the session's background extraction to finish, if one runs.
+
+        Callers on Lambda await this before their invocation returns, since the
+        container freezes with any still-pending task and the extraction would
+        otherwise only progress during a later invocation, if ever.
+
+        Args:
+            session_id: Session whose extraction to wait for
+        """
+        task = self._running_extraction(session_id)
+        if task is not None:
+            await asyncio.wait({task})
+
+    @staticmethod
+    def _stored_partial_result(session: CoachingSession) -> PartialResult | None:
+        """Get the partial result persisted on the session, if any."""
+        if session.partial_result is None:
+            return None
+        return PartialResult(session.partial_result, session.partial_result_message_count)
+
+    def _running_extraction(self, session_id: str) -> asyncio.Task[PartialResult | None] | None:
+        """Get the session's background extraction if it runs on this event loop."""
+        task = self._pending_extractions.get(session_id)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            return None
+        return task
+
+    def _forget_extraction(self, session_id: str, task: asyncio.Task[PartialResult | None]) -> None:
+        if self._pending_extractions.get(session_id) is task:
+            del self._pending_extractions[session_id]
+
+    async def _refresh_partial_result(
+        self,
+        *,
+        session_id: str,
+        messages: list[CoachingMessage],
+        endpoint_def: TopicDefinition,
+        llm_topic: LLMTopic,
+        base: PartialResult | None,
+        previous: asyncio.Task[PartialResult | None] | None,
+    ) -> PartialResult | None:
+        """Update and store a partial result covering ``messages``.
+
+        Returns:
+            The newest partial result available, or None if there is none
+        """
+        if previous is not None:
+            await asyncio.wait({previous})
+            newer = None if previous.cancelled() else previous.result()
+            if newer is not None and (base is None or newer.message_count > base.message_count):
+                base = newer
+
+        if base is not None and base.message_count >= len(messages):
+            return base
+
+        try:
+            result = await self._extract_partial_result(
+                messages=messages,
+                endpoint_def=endpoint_def,
+                llm_topic=llm_topic,
+                base=base,
+            )
+            if result is None:
+                return base
+            partial = PartialResult(result, len(messages))
+            stored = await self.session_repository.update_partial_result(
+                session_id, partial.result, partial.message_count
+            )
+        except Exception as e:
+            logger.warning(
+                "coaching_service.partial_extraction_failed",
+                session_id=session_id,
+                error=str(e),
+            )
+            return base
+
+        logger.info(
+            "coaching_service.partial_extraction_completed",
+            session_id=session_id,
+            message_count=partial.message_count,
+            new_messages=partial.message_count - (base.message_count if base else 0),
+            stored=stored,
+        )
+        return partial
+
+    async def _extract_partial_result(
+        self,
+        *,
+        messages: list[CoachingMessage],
+        endpoint_def: TopicDefinition,
+        llm_topic: LLMTopic,
+        base: PartialResult | None,
+    ) -> dict[str, Any] | None:
+        """Extract a result from the messages ``base`` does not cover yet.
+
+        Returns:
+            The updated result, or None if the response was not a JSON object
+        """
+        result_model = get_coaching_result_model(endpoint_def.result_model or "")
+        if result_model is None:
+            return None
+        schema_json = get_schema_artifacts(result_model).json_schema_text
+
+        if base is None:
+            prompt = EXTRACTION_PROMPT_TEMPLATE.format(result_schema_json=schema_json)
+            new_messages = messages
+            heading = "Conversation"
+        else:
+            prompt = INCREMENTAL_EXTRACTION_PROMPT_TEMPLATE.format(
+                result_schema_json=schema_json,
+                current_result_json=json.dumps(base.result, indent=2),
+            )
+            new_messages = messages[base.message_count :]
+            heading = "New Messages"
+
+        conversation_text = self._format_conversation_for_extraction(new_messages)
+        llm_response = await self._run_extraction(
+            prompt=f"{prompt}\n\n## {heading}\n{conversation_text}",
+            llm_topic=llm_topic,
+        )
+        try:
+            result = json.loads(llm_response)
+        except json.JSONDecodeError:
+            return None
+        return result if isinstance(result, dict) else None
+
+    async def _await_partial_result(self, session: CoachingSession) -> PartialResult | None:
+        """Get the newest partial result, waiting briefly for a running extraction."""
+        session_id = str(session.session_id)
+        partial = self._stored_partial_result(session)
+        task = self._running_extraction(session_id)
+        if task is None:
+            return partial
+
+        done, _ = await asyncio.wait({task}, timeout=self.extraction_wait_seconds)
+        newer = task.result() if done and not task.cancelled() else None
+        if not done:
+            logger.info(
+                "coaching_service.partial_extraction_wait_timeout",
+                session_id=session_id,
+                wait_seconds=self.extraction_wait_seconds,
+            )
+            # Completion covers the rest; a late write fails the active-status condition
+            task.cancel()
+        if newer is not None and (partial is None or newer.message_count > partial.message_count):
+            return newer
+        return partial
+
     async def _load_and_validate_session(
         self,
         *,
@@ -1269,23 +1822,121 @@ class CoachingSessionService:
 
         result_model = get_coaching_result_model(endpoint_def.result_model)
 
-        # Format conversation for extraction
-        conversation_text = self._format_conversation_for_extraction(session.messages)
+        extracted: dict[str, Any] | None = None
+        if self.incremental_extraction and result_model is not None:
+            extracted = await self._complete_from_partial_result(
+                session=session,
+                endpoint_def=endpoint_def,
+                llm_topic=llm_topic,
+                result_model=result_model,
+            )
 
-        # Generate extraction prompt dynamically
-        if result_model is not None:
-            schema = result_model.model_json_schema()
-            schema_json = json.dumps(schema, indent=2)
-        else:
-            schema_json = "{}"
+        if extracted is None:
+            # Format conversation for extraction
+            conversation_text = self._format_conversation_for_extraction(session.messages)
+
+            # Generate extraction prompt dynamically
+            if result_model is not None:
+                schema_json = get_schema_artifacts(result_model).json_schema_text
+            else:
+                schema_json = "{}"
+
+            extraction_prompt = EXTRACTION_PROMPT_TEMPLATE.format(
+                result_schema_json=schema_json,
+            )
+
+            # Add conversation history
+            full_prompt = f"{extraction_prompt}\n\n## Conversation\n{conversation_text}"
+
+            llm_response = await self._run_extraction(prompt=full_prompt, llm_topic=llm_topic)
+
+            # Parse extraction result
+            extracted = self._parse_extraction_result(llm_response, result_model)
+
+        # Complete session
+        session.complete(result=extracted, extraction_model=endpoint_def.result_model)
+        await self.session_repository.update(session)
 
-        extraction_prompt = EXTRACTION_PROMPT_TEMPLATE.format(
-            result_schema_json=schema_json,
+        logger.info(
+            "coaching_service.session_completed",
+            session_id=str(session.session_id),
+            has_result=bool(extracted),
+            result_keys=list(extracted.keys()) if isinstance(extracted, dict) else None,
         )
 
-        # Add conversation history
-        full_prompt = f"{extraction_prompt}\n\n## Conversation\n{conversation_text}"
+        return SessionCompletionResponse(
+            session_id=str(session.session_id),
+            status=ConversationStatus.COMPLETED,
+            result=extracted,
+        )
 
+    async def _complete_from_partial_result(
+        self,
+        *,
+        session: CoachingSession,
+        endpoint_def: TopicDefinition,
+        llm_topic: LLMTopic,
+        result_model: type[BaseModel],
+    ) -> dict[str, Any] | None:
+        """Finish the session's partial result and validate it.
+
+        Messages the partial result does not cover yet (usually just the final
+        exchange) are folded in with one small incremental extraction.
+
+        Returns:
+            The validated result, or None to fall back to a full extraction
+        """
+        session_id = str(session.session_id)
+        partial = await self._await_partial_result(session)
+        if partial is None:
+            return None
+
+        new_messages = len(session.messages) - partial.message_count
+        result: dict[str, Any] | None = partial.result
+        if new_messages > 0:
+            try:
+                result = await self._extract_partial_result(
+                    messages=session.messages,
+                    endpoint_def=endpoint_def,
+                    llm_topic=llm_topic,
+                    base=partial,
+                )
+            except Exception as e:
+                logger.warning(
+                    "coaching_service.partial_completion_failed",
+                    session_id=session_id,
+                    error=str(e),
+                )
+                return None
+
+        try:
+            validated = result_model.model_validate(result)
+        except ValidationError as e:
+            logger.info(
+                "coaching_service.partial_result_rejected",
+                session_id=session_id,
+                error=str(e),
+            )
+            return None
+
+        logger.info(
+            "coaching_service.completed_from_partial_result",
+            session_id=session_id,
+            covered_messages=partial.message_count,
+            new_messages=new_messages,
+        )
+        return dict(validated.model_dump())
+
+    async def _run_extraction(self, *, prompt: str, llm_topic: LLMTopic) -> str:
+        """Run an extraction prompt on the topic's extraction model.
+
+        Args:
+            prompt: Extraction prompt including the conversation text
+            llm_topic: Runtime config
+
+        Returns:
+            Raw LLM response (should be JSON)
+        """
         # Execute extraction LLM call (lower temperature)
         # Use extraction_model_code (defaults to Haiku) - it's 3-5x faster than Sonnet
         # This optimization reduces extraction time from 15-20s to 3-5s, keeping total time under API Gateway's 30s limit
@@ -1322,7 +1973,7 @@ class CoachingSessionService:
                 "content": "You are extracting structured data from a coaching conversation. "
                 "Return ONLY valid JSON matching the schema.",
             },
-            {"role": "user", "content": full_prompt},
+            {"role": "user", "content": prompt},
         ]
 
         llm_response, _ = await self._execute_llm_call(
@@ -1330,26 +1981,7 @@ class CoachingSessionService:
             llm_topic=extraction_topic,
             temperature_override=0.3,
         )
-
-        # Parse extraction result
-        extracted = self._parse_extraction_result(llm_response, result_model)
-
-        # Complete session
-        session.complete(result=extracted, extraction_model=endpoint_def.result_model)
-        await self.session_repository.update(session)
-
-        logger.info(
-            "coaching_service.session_completed",
-            session_id=str(session.session_id),
-            has_result=bool(extracted),
-            result_keys=list(extracted.keys()) if isinstance(extracted, dict) else None,
-        )
-
-        return SessionCompletionResponse(
-            session_id=str(session.session_id),
-            status=ConversationStatus.COMPLETED,
-            result=extracted,
-        )
+        return llm_response
 
     def _format_conversation_for_extraction(self, messages: list[CoachingMessage]) -> str:
         """Format conversation messages for extraction prompt.
@@ -1531,36 +2163,45 @@ class CoachingSessionService:
         user_id: str,
         include_completed: bool = False,
         limit: int = 20,
-    ) -> list[SessionSummary]:
-        """List sessions for a user.
+        cursor: str | None = None,
+    ) -> SessionSummaryPage:
+        """List sessions for a user, one page at a time.
 
         Args:
             tenant_id: Tenant identifier
             user_id: User identifier
             include_completed: Whether to include completed sessions
             limit: Maximum number of sessions to return
+            cursor: next_cursor of the previous page
 
         Returns:
-            List of SessionSummary objects
+            SessionSummaryPage with the summaries and the next page's cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid
         """
-        sessions = await self.session_repository.list_by_tenant_user(
-            user_id=user_id,
+        page = await self.session_repository.list_summaries_by_tenant_user(
             tenant_id=tenant_id,
+            user_id=user_id,
             include_completed=include_completed,
             limit=limit,
+            cursor=cursor,
         )
 
-        return [
-            SessionSummary(
-                session_id=str(s.session_id),
-                topic_id=s.topic_id,
-                status=s.status,
-                turn_count=s.get_turn_count(),
-                created_at=s.created_at.isoformat(),
-                updated_at=s.updated_at.isoformat(),
-            )
-            for s in sessions
-        ]
+        return SessionSummaryPage(
+            sessions=[
+                SessionSummary(
+                    session_id=str(s.session_id),
+                    topic_id=s.topic_id,
+                    status=s.status,
+                    turn_count=s.turn_count,
+                    created_at=s.created_at.isoformat(),
+                    updated_at=s.updated_at.isoformat(),
+                )
+                for s in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
 
     async def get_topics_with_status(
         self,
@@ -1593,14 +2234,23 @@ class CoachingSessionService:
         # Get all available topics from registry
         all_topics = list_coaching_topics()
 
-        # Get user's sessions to determine status
-        user_sessions = await self.session_repository.list_by_tenant_user(
-            tenant_id=tenant_id,
-            user_id=user_id,
-        )
+        # Get summaries of all the user's sessions to determine status
+        user_sessions: list[CoachingSessionSummary] = []
+        cursor: str | None = None
+        while True:
+            page = await self.session_repository.list_summaries_by_tenant_user(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                limit=self.TOPIC_STATUS_PAGE_SIZE,
+                cursor=cursor,
+            )
+            user_sessions.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
 
         # Build a map of topic_id -> latest session
-        topic_sessions: dict[str, CoachingSession] = {}
+        topic_sessions: dict[str, CoachingSessionSummary] = {}
         for session in user_sessions:
             topic_id = session.topic_id
             if topic_id not in topic_sessions:
@@ -1737,18 +2387,130 @@ class CoachingSessionService:
         Returns:
             Tuple of (response_content, metadata)
         """
-        import time
+        start_time = time.perf_counter()
+        call = self._resolve_llm_call(
+            messages=messages,
+            llm_topic=llm_topic,
+            temperature_override=temperature_override,
+            user_tier=user_tier,
+        )
+
+        response = await call.provider.generate(
+            messages=call.messages,
+            model=call.model_name,
+            temperature=call.temperature,
+            max_tokens=call.max_tokens,
+            system_prompt=call.system_prompt,
+        )
+
+        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
+
+        logger.info(
+            "coaching_service.llm_call_completed",
+            model_code=call.model_code,
+            model_name=call.model_name,
+            tokens_used=response.usage.get("total_tokens", 0),
+            processing_time_ms=processing_time_ms,
+        )
+        call.record_token_usage(llm_topic.topic_id, response.usage)
+
+        metadata = ResponseMetadata(
+            model=response.model,
+            processing_time_ms=processing_time_ms,
+            tokens_used=response.usage.get("total_tokens", 0),
+        )
+
+        # Validate response and add fallback for empty content
+        content = response.content
+        if not content or not content.strip():
+            fallback = self._get_fallback_message(response.finish_reason)
+            logger.warning(
+                "coaching_service.empty_llm_response",
+                finish_reason=response.finish_reason,
+                model_code=call.model_code,
+                fallback_used=True,
+            )
+            content = fallback
+
+        return str(content), metadata
+
+    @staticmethod
+    def _select_model_code(llm_topic: LLMTopic, user_tier: TierLevel | None) -> str:
+        """Select the topic's model for a tier (ULTIMATE when no tier is given)."""
+        return llm_topic.get_model_code_for_tier(user_tier or TierLevel.ULTIMATE)
+
+    def _build_context_messages(
+        self,
+        *,
+        session: CoachingSession,
+        system_prompt: str,
+        llm_topic: LLMTopic,
+        new_message: str | None = None,
+        user_tier: TierLevel | None = None,
+    ) -> list[dict[str, str]]:
+        """Build system + history (+ new message) packed into the model's input budget.
+
+        Args:
+            session: Session whose messages form the history
+            system_prompt: Rendered system prompt
+            llm_topic: Topic config (selects the model and output tokens)
+            new_message: Message sent after the history, if not already in it
+            user_tier: User's subscription tier (for model selection)
+
+        Returns:
+            Messages for _execute_llm_call / _resolve_llm_call
+        """
+        model_code = self._select_model_code(llm_topic, user_tier)
+        model = MODEL_REGISTRY.get(model_code)
+        max_output_tokens = llm_topic.max_tokens
+        if model is not None:
+            max_output_tokens = min(max_output_tokens, model.max_tokens)
+
+        window = get_context_window_builder().build(
+            model=model,
+            system_prompt=system_prompt,
+            history=session.get_messages_for_llm(max_messages=len(session.messages)),
+            max_output_tokens=max_output_tokens,
+            new_message=new_message,
+            keep_last=new_message is None,
+        )
+
+        messages = [{"role": "system", "content": window.system_prompt or ""}, *window.history]
+        if new_message is not None:
+            messages.append({"role": "user", "content": new_message})
+        return messages
+
+    def _resolve_llm_call(
+        self,
+        *,
+        messages: list[dict[str, str]],
+        llm_topic: LLMTopic,
+        temperature_override: float | None = None,
+        user_tier: TierLevel | None = None,
+    ) -> _ResolvedLLMCall:
+        """Resolve provider, model and request arguments for an LLM call.
 
-        from coaching.src.core.constants import TierLevel
+        Args:
+            messages: Messages to send to LLM (system message passed separately)
+            llm_topic: Topic config with model settings
+            temperature_override: Optional temperature override
+            user_tier: User's subscription tier (for model selection)
+
+        Returns:
+            _ResolvedLLMCall shared by blocking and streaming calls
+
+        Raises:
+            RuntimeError: If the provider for the topic's model cannot be resolved
+        """
         from coaching.src.domain.ports.llm_provider_port import LLMMessage
+        from coaching.src.infrastructure.llm.hedging import HedgePolicy
 
         temperature = temperature_override or llm_topic.temperature
-        start_time = time.perf_counter()
 
         # Select model based on user tier, default to ULTIMATE for backward compatibility
         if user_tier is None:
             user_tier = TierLevel.ULTIMATE
-        model_code = llm_topic.get_model_code_for_tier(user_tier)
+        model_code = self._select_model_code(llm_topic, user_tier)
 
         logger.debug(
             "coaching_service.executing_llm_call",
@@ -1762,7 +2524,13 @@ class CoachingSessionService:
         # This properly resolves model_code (e.g., "CLAUDE_3_5_SONNET") to
         # provider instance and actual model name (e.g., "us.anthropic.claude-3-5-sonnet-...")
         try:
-            provider, model_name = self.provider_factory.get_provider_for_model(model_code)
+            provider, model_name = self.provider_factory.get_provider_for_model(
+                model_code,
+                fallback_model_codes=llm_topic.get_fallback_model_codes(),
+                hedge_policy=HedgePolicy.from_config(
+                    llm_topic.topic_id, llm_topic.additional_config
+                ),
+            )
         except Exception as e:
             logger.error(
                 "coaching_service.provider_resolution_failed",
@@ -1784,7 +2552,6 @@ class CoachingSessionService:
             else:
                 llm_messages.append(LLMMessage(role=role, content=content))
 
-        # Execute using the provider's generate method.
         # Guardrail: cap requested max_tokens by the selected model's hard limit
         # from MODEL_REGISTRY to prevent provider ValidationException errors.
         requested_max_tokens = llm_topic.max_tokens
@@ -1800,44 +2567,17 @@ class CoachingSessionService:
                 model_limit=model_config.max_tokens,
             )
 
-        response = await provider.generate(
+        return _ResolvedLLMCall(
+            provider=provider,
+            model_code=model_code,
+            model_name=model_name,
             messages=llm_messages,
-            model=model_name,
+            system_prompt=system_prompt,
             temperature=temperature,
             max_tokens=effective_max_tokens,
-            system_prompt=system_prompt,
+            user_tier=user_tier,
         )
 
-        processing_time_ms = int((time.perf_counter() - start_time) * 1000)
-
-        logger.info(
-            "coaching_service.llm_call_completed",
-            model_code=model_code,
-            model_name=model_name,
-            tokens_used=response.usage.get("total_tokens", 0),
-            processing_time_ms=processing_time_ms,
-        )
-
-        metadata = ResponseMetadata(
-            model=response.model,
-            processing_time_ms=processing_time_ms,
-            tokens_used=response.usage.get("total_tokens", 0),
-        )
-
-        # Validate response and add fallback for empty content
-        content = response.content
-        if not content or not content.strip():
-            fallback = self._get_fallback_message(response.finish_reason)
-            logger.warning(
-                "coaching_service.empty_llm_response",
-                finish_reason=response.finish_reason,
-                model_code=model_code,
-                fallback_used=True,
-            )
-            content = fallback
-
-        return content, metadata
-
     def _get_fallback_message(self, finish_reason: str) -> str:
         """Get appropriate fallback message based on LLM failure reason.
 
@@ -24,6 +24,7 @@ from coaching.src.models.responses import (
     InsightResponse,
     InsightsSummaryResponse,
 )
+from coaching.src.services.insights_snapshot_store import InsightsSnapshotStore
 from shared.models.schemas import PaginatedResponse, PaginationMeta
 
 logger = structlog.get_logger()
@@ -49,13 +50,14 @@ class InsightsService:
        - Frontend fetches from .NET API (not Python)
        - No LLM call, reads persisted insights
 
-    No Caching:
-    -----------
-    This service does NOT cache insights because:
-    - Insights are generated on explicit user request only
-    - .NET backend handles all persistence
-    - Frontend fetches from .NET, not from this service
-    - Each generation should use fresh, real-time data
+    Snapshots:
+    ----------
+    Business data is always fetched fresh, but the LLM generation is stored
+    as a snapshot keyed by tenant + a fingerprint of that data (see
+    InsightsSnapshotStore). Later pages, filter changes and the summary are
+    served from the snapshot while the data is unchanged and the snapshot is
+    within its validity window. Pass ``force_refresh=True`` to regenerate.
+    Persistence of insights remains the responsibility of the .NET backend.
     """
 
     def __init__(
@@ -65,12 +67,14 @@ class InsightsService:
         llm_service: Any,  # LLMService - avoiding circular import
         tenant_id: str,
         user_id: str,
+        snapshot_store: InsightsSnapshotStore | None = None,
     ):
         self.conversation_repo = conversation_repo
         self.business_api_client = business_api_client
         self.llm_service = llm_service
         self.tenant_id = tenant_id
         self.user_id = user_id
+        self.snapshot_store = snapshot_store
 
     async def get_insights(
         self,
@@ -79,6 +83,7 @@ class InsightsService:
         category: str | None = None,
         priority: str | None = None,
         status: str | None = None,
+        force_refresh: bool = False,
     ) -> PaginatedResponse[InsightResponse]:
         """Alias for generate_insights for backward compatibility."""
         return await self.generate_insights(
@@ -87,6 +92,7 @@ class InsightsService:
             category=category,
             priority=priority,
             status=status,
+            force_refresh=force_refresh,
         )
 
     async def generate_insights(
@@ -96,18 +102,24 @@ class InsightsService:
         category: str | None = None,
         priority: str | None = None,
         status: str | None = None,
+        force_refresh: bool = False,
     ) -> PaginatedResponse[InsightResponse]:
-        """Generate fresh coaching insights using LLM.
-
-        This method ALWAYS generates new insights from real-time business data.
-        No caching - each call fetches fresh data and calls the LLM.
+        """Generate coaching insights using LLM.
 
         Steps:
         1. Fetch real-time business data from .NET APIs
-        2. Generate insights using LLM
+        2. Generate insights using LLM, or reuse the snapshot for unchanged data
         3. Apply filters (category, priority, status)
         4. Paginate results
         5. Return to frontend (frontend persists via .NET)
+
+        Args:
+            page: Page number (1-based)
+            page_size: Items per page
+            category: Optional category filter
+            priority: Optional priority filter
+            status: Optional status filter
+            force_refresh: Regenerate even if a valid snapshot exists
         """
         logger.info(
             "Generating fresh insights",
@@ -134,8 +146,10 @@ class InsightsService:
                     pagination=PaginationMeta(page=page, limit=page_size, total=0, total_pages=0),
                 )
 
-            # Generate insights with LLM
-            insights_list = await self._generate_insights_with_llm(business_data)
+            # Generate insights with LLM (or reuse the snapshot)
+            insights_list = await self._get_or_generate_insights(
+                business_data, force_refresh=force_refresh
+            )
 
             # Apply filters
             filtered_insights = self._apply_filters(insights_list, category, priority, status)
@@ -197,11 +211,17 @@ class InsightsService:
         # In a real implementation, this would update the insight status in the database
         logger.info(f"Insight {insight_id} acknowledged by user {user_id}")
 
-    async def get_insights_summary(self, user_id: str) -> InsightsSummaryResponse:
+    async def get_insights_summary(
+        self, user_id: str, force_refresh: bool = False
+    ) -> InsightsSummaryResponse:
         """Get insights summary with counts by category and priority.
 
-        Note: This generates fresh insights. For viewing persisted insights,
-        frontend should call .NET backend directly.
+        Note: Counts come from the same insights snapshot as generate_insights.
+        For viewing persisted insights, frontend should call .NET backend directly.
+
+        Args:
+            user_id: User requesting the summary
+            force_refresh: Regenerate even if a valid snapshot exists
         """
         logger.info("Generating insights summary", user_id=user_id, tenant_id=self.tenant_id)
 
@@ -217,7 +237,9 @@ class InsightsService:
                     recent_activity=[],
                 )
 
-            insights_list = await self._generate_insights_with_llm(business_data)
+            insights_list = await self._get_or_generate_insights(
+                business_data, force_refresh=force_refresh
+            )
 
             # Count by category
             by_category: dict[str, int] = {}
@@ -255,6 +277,20 @@ class InsightsService:
                 recent_activity=[],
             )
 
+    async def _get_or_generate_insights(
+        self, business_data: BusinessDataContext, *, force_refresh: bool = False
+    ) -> list[Insight]:
+        """Get insights from the snapshot store, generating them on a miss."""
+        if self.snapshot_store is None:
+            return await self._generate_insights_with_llm(business_data)
+
+        return await self.snapshot_store.get_or_generate(
+            tenant_id=self.tenant_id,
+            fingerprint=self.snapshot_store.fingerprint(business_data),
+            generate=lambda: self._generate_insights_with_llm(business_data),
+            force_refresh=force_refresh,
+        )
+
     async def _fetch_business_data(self) -> BusinessDataContext:
         """Fetch business data from all .NET API endpoints in parallel."""
         logger.info("Fetching business data", tenant_id=self.tenant_id)
@@ -0,0 +1,294 @@
+"""Snapshot store for generated insights.
+
+Generating insights costs one LLM call over the tenant's business data, but
+the result is then paged, filtered and summarized by follow-up requests that
+would otherwise each regenerate it. This store keeps the generated insights
+as a snapshot:
+
+- Keys are tenant + a fingerprint of the fetched business data, so a change in
+  the underlying data naturally produces a new snapshot
+- Snapshots expire after a validity window (TTL) and are LRU-evicted
+- Concurrent generations for the same key are coalesced (single-flight)
+- ``force_refresh`` regenerates and replaces the snapshot
+- Empty results (insufficient data or LLM failure) are never stored
+
+Snapshots hold whichever insight model the caller generates: ``Insight`` for
+InsightsService, ``InsightResponse`` for the topic-driven ``/insights/generate``
+route (keyed on its rendered prompts, which contain only the business data).
+
+The store is per process; the validity window bounds staleness across
+instances.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, TypeVar, cast
+
+import structlog
+from coaching.src.models.insights import BusinessDataContext
+from pydantic import BaseModel
+
+logger = structlog.get_logger()
+
+T = TypeVar("T", bound=BaseModel)
+
+# Fields that change on every fetch without the data itself changing
+_FINGERPRINT_EXCLUDE = {"collected_at"}
+
+
+@dataclass(frozen=True)
+class InsightsSnapshot:
+    """Insights generated from one version of a tenant's business data.
+
+    Insight objects are shared between requests served from the snapshot and
+    must be treated as read-only.
+    """
+
+    tenant_id: str
+    fingerprint: str
+    insights: tuple[BaseModel, ...]
+    generated_at: datetime
+    expires_at: float  # time.monotonic() deadline
+
+
+class InsightsSnapshotStore:
+    """In-memory TTL store of insight snapshots with single-flight generation."""
+
+    def __init__(self, *, ttl_seconds: float = 900.0, max_entries: int = 512) -> None:
+        """Initialize the store.
+
+        Args:
+            ttl_seconds: Validity window of a snapshot
+            max_entries: Maximum snapshots kept before LRU eviction
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, InsightsSnapshot] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[list[Any]]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._refreshes = 0
+
+    @staticmethod
+    def fingerprint(business_data: BusinessDataContext) -> str:
+        """Compute a stable fingerprint of fetched business data.
+
+        Args:
+            business_data: Data the insights are generated from
+
+        Returns:
+            Hex digest that changes whenever the data changes
+        """
+        payload = business_data.model_dump(mode="json", exclude=_FINGERPRINT_EXCLUDE)
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def fingerprint_prompts(*prompts: str) -> str:
+        """Compute a fingerprint of rendered prompts.
+
+        Args:
+            prompts: Rendered prompt texts the insights are generated from
+
+        Returns:
+            Hex digest that changes whenever any prompt changes
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for prompt in prompts:
+            encoded = prompt.encode("utf-8")
+            digest.update(len(encoded).to_bytes(8, "big"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _key(tenant_id: str, fingerprint: str) -> str:
+        return f"{tenant_id}|{fingerprint}"
+
+    def get(self, tenant_id: str, fingerprint: str) -> InsightsSnapshot | None:
+        """Get a valid snapshot without generating.
+
+        Args:
+            tenant_id: Tenant the insights belong to
+            fingerprint: Business data fingerprint
+
+        Returns:
+            The snapshot, or None if missing or expired
+        """
+        key = self._key(tenant_id, fingerprint)
+        snapshot = self._entries.get(key)
+        if snapshot is None:
+            return None
+        if snapshot.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return snapshot
+
+    def put(
+        self, tenant_id: str, fingerprint: str, insights: Sequence[BaseModel]
+    ) -> InsightsSnapshot:
+        """Store a snapshot, replacing any existing one for the key.
+
+        Args:
+            tenant_id: Tenant the insights belong to
+            fingerprint: Business data fingerprint
+            insights: Generated insights
+
+        Returns:
+            The stored snapshot
+        """
+        snapshot = InsightsSnapshot(
+            tenant_id=tenant_id,
+            fingerprint=fingerprint,
+            insights=tuple(insights),
+            generated_at=datetime.now(UTC),
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        if self.max_entries <= 0:
+            return snapshot
+        key = self._key(tenant_id, fingerprint)
+        self._entries[key] = snapshot
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return snapshot
+
+    async def get_or_generate(
+        self,
+        *,
+        tenant_id: str,
+        fingerprint: str,
+        generate: Callable[[], Awaitable[list[T]]],
+        force_refresh: bool = False,
+    ) -> list[T]:
+        """Return snapshot insights or generate them, coalescing concurrent generations.
+
+        Args:
+            tenant_id: Tenant the insights belong to
+            fingerprint: Business data fingerprint
+            generate: Coroutine factory performing the LLM generation
+            force_refresh: Ignore any existing snapshot and regenerate
+
+        Returns:
+            Insights (a new list; the Insight objects may be shared)
+        """
+        key = self._key(tenant_id, fingerprint)
+
+        if force_refresh:
+            self._refreshes += 1
+        else:
+            snapshot = self.get(tenant_id, fingerprint)
+            if snapshot is not None:
+                self._hits += 1
+                logger.debug(
+                    "insights_snapshot.hit",
+                    tenant_id=tenant_id,
+                    fingerprint=fingerprint,
+                    count=len(snapshot.insights),
+                )
+                return cast(list[T], list(snapshot.insights))
+
+            loop = asyncio.get_running_loop()
+            inflight = self._inflight.get(key)
+            if inflight is not None and inflight.get_loop() is loop:
+                self._coalesced += 1
+                try:
+                    return list(await asyncio.shield(inflight))
+                except asyncio.CancelledError:
+                    if not inflight.cancelled():
+                        raise
+                    # The leading generation was cancelled; generate on our own behalf
+
+        self._misses += 1
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[Any]] = loop.create_future()
+        # Mark exceptions as retrieved when nobody else is waiting
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+
+        try:
+            insights = await generate()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+        else:
+            future.set_result(insights)
+            if insights:
+                self.put(tenant_id, fingerprint, insights)
+                logger.info(
+                    "insights_snapshot.stored",
+                    tenant_id=tenant_id,
+                    fingerprint=fingerprint,
+                    count=len(insights),
+                    forced=force_refresh,
+                )
+            return list(insights)
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def invalidate(self, tenant_id: str) -> int:
+        """Drop all snapshots for a tenant.
+
+        Args:
+            tenant_id: Tenant whose insights are stale
+
+        Returns:
+            Number of snapshots removed
+        """
+        keys = [key for key, snapshot in self._entries.items() if snapshot.tenant_id == tenant_id]
+        for key in keys:
+            del self._entries[key]
+        logger.info("insights_snapshot.invalidated", tenant_id=tenant_id, removed=len(keys))
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all snapshots."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get store counters (hits, misses, coalesced, forced refreshes, size)."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "refreshes": self._refreshes,
+            "size": len(self._entries),
+        }
+
+
+_store: InsightsSnapshotStore | None = None
+
+
+def get_insights_snapshot_store() -> InsightsSnapshotStore | None:
+    """Get the process-wide insights snapshot store, or None when disabled in settings."""
+    global _store
+    from coaching.src.core.config_multitenant import settings
+
+    if not settings.insights_snapshot_enabled:
+        return None
+    if _store is None:
+        _store = InsightsSnapshotStore(
+            ttl_seconds=settings.insights_snapshot_ttl_seconds,
+            max_entries=settings.insights_snapshot_max_entries,
+        )
+    return _store
+
+
+__all__ = [
+    "InsightsSnapshot",
+    "InsightsSnapshotStore",
+    "get_insights_snapshot_store",
+]
@@ -1,21 +1,25 @@
 """LLM service for AI coaching interactions."""
 
+from __future__ import annotations
+
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from coaching.src.core.llm_models import DEFAULT_MODEL_ID
-from coaching.src.llm.providers.manager import ProviderManager
 from coaching.src.services.llm_service_adapter import LLMServiceAdapter
 from coaching.src.services.llm_template_service import (
     LLMTemplateService,
     TemplateNotFoundError,
 )
 from coaching.src.services.prompt_service import PromptService
-from coaching.src.workflows.orchestrator import WorkflowOrchestrator
 
 from ..models.llm_models import BusinessContextForLLM, LLMResponse, SessionOutcomes
 
+if TYPE_CHECKING:
+    from coaching.src.llm.providers.manager import ProviderManager
+    from coaching.src.workflows.orchestrator import WorkflowOrchestrator
+
 logger = structlog.get_logger()
 
 
@@ -6,13 +6,17 @@ LangGraph-based workflow system, ensuring backward compatibility while enabling
 multi-provider support and advanced workflow capabilities.
 """
 
-from typing import Any, cast
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
 
 import structlog
 from coaching.src.core.llm_models import DEFAULT_MODEL_ID
-from coaching.src.llm.providers.manager import ProviderManager
 from coaching.src.workflows.base import WorkflowState, WorkflowType
-from coaching.src.workflows.orchestrator import WorkflowOrchestrator
+
+if TYPE_CHECKING:
+    from coaching.src.llm.providers.manager import ProviderManager
+    from coaching.src.workflows.orchestrator import WorkflowOrchestrator
 
 logger = structlog.get_logger(__name__)
 
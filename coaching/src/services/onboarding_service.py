@@ -1,8 +1,14 @@
 """Onboarding service for AI-powered onboarding assistance."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import structlog
-from coaching.src.services.llm_service import LLMService
-from coaching.src.services.website_analysis_service import WebsiteAnalysisService
+
+if TYPE_CHECKING:
+    from coaching.src.services.llm_service import LLMService
+    from coaching.src.services.website_analysis_service import WebsiteAnalysisService
 
 logger = structlog.get_logger()
 
@@ -25,9 +31,12 @@ class OnboardingService:
             website_analysis_service: Optional service for website analysis
         """
         self.llm_service = llm_service
-        self.website_analysis_service = website_analysis_service or WebsiteAnalysisService(
-            llm_service=llm_service
-        )
+        if website_analysis_service is None:
+            # Deferred: the scraping stack (bs4/lxml) is only needed for onboarding
+            from coaching.src.services.website_analysis_service import WebsiteAnalysisService
+
+            website_analysis_service = WebsiteAnalysisService(llm_service=llm_service)
+        self.website_analysis_service = website_analysis_service
         logger.info("Onboarding service initialized")
 
     async def get_suggestions(
@@ -2,22 +2,42 @@
 
 This service handles storing and retrieving prompt markdown files from S3,
 following the path structure: prompts/{topic_id}/{prompt_type}.md
+
+Prompt bodies rarely change, so retrieved prompts are kept in a bounded
+in-process cache and revalidated against S3 with conditional GETs
+(If-None-Match) once the revalidation interval has elapsed.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 import boto3
 import structlog
 from botocore.exceptions import ClientError
 from coaching.src.domain.exceptions.topic_exceptions import S3StorageError
+from coaching.src.infrastructure.aws_io import run_aws_call
 
 if TYPE_CHECKING:
     from mypy_boto3_s3 import S3Client
 
 logger = structlog.get_logger()
 
+DEFAULT_PROMPT_CACHE_MAX_ENTRIES = 256
+DEFAULT_PROMPT_CACHE_REVALIDATE_SECONDS = 60.0
+
+
+@dataclass
+class _CachedPrompt:
+    """Prompt content cached together with its S3 ETag."""
+
+    content: str
+    etag: str | None
+    validated_at: float
+
 
 class S3PromptStorage:
     """Service for storing and retrieving prompt content in S3.
@@ -31,17 +51,121 @@ class S3PromptStorage:
     Example:
         prompts/core_values/system.md
         prompts/revenue_analysis/user.md
+
+    Caching:
+        Prompts are cached per (topic_id, prompt_type) in a bounded LRU.
+        Entries younger than ``cache_revalidate_seconds`` are served without
+        contacting S3; older entries are revalidated with a conditional GET
+        using the stored ETag. ``save_prompt`` and ``delete_prompt`` invalidate
+        the affected entry immediately. Set ``cache_max_entries`` to 0 to
+        disable caching.
     """
 
-    def __init__(self, *, bucket_name: str, s3_client: S3Client | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        bucket_name: str,
+        s3_client: S3Client | None = None,
+        cache_max_entries: int = DEFAULT_PROMPT_CACHE_MAX_ENTRIES,
+        cache_revalidate_seconds: float = DEFAULT_PROMPT_CACHE_REVALIDATE_SECONDS,
+    ) -> None:
         """Initialize S3 prompt storage.
 
         Args:
             bucket_name: S3 bucket name for prompt storage
             s3_client: Optional S3 client (for testing), creates new client if None
+            cache_max_entries: Maximum number of prompts kept in memory (0 disables caching)
+            cache_revalidate_seconds: Age after which a cached prompt is revalidated
+                against S3 with a conditional GET
         """
         self.bucket_name = bucket_name
         self.s3_client: S3Client = s3_client or boto3.client("s3")
+        self.cache_max_entries = max(0, cache_max_entries)
+        self.cache_revalidate_seconds = cache_revalidate_seconds
+        self._cache: OrderedDict[tuple[str, str], _CachedPrompt] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_revalidations = 0
+        # Bumped on every save/delete; a read that overlapped one is not cached
+        self._write_generation = 0
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether the in-process prompt cache is enabled."""
+        return self.cache_max_entries > 0
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """Get prompt cache counters.
+
+        Returns:
+            Dictionary with hits, misses, revalidations (304 responses) and size.
+            Revalidated entries count as hits because the body was not re-downloaded.
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "revalidations": self._cache_revalidations,
+            "size": len(self._cache),
+        }
+
+    def invalidate_cache(
+        self, *, topic_id: str | None = None, prompt_type: str | None = None
+    ) -> int:
+        """Drop cached prompts.
+
+        Args:
+            topic_id: Only drop entries for this topic (all topics if None)
+            prompt_type: Only drop entries of this prompt type (all types if None)
+
+        Returns:
+            Number of entries removed
+        """
+        keys = [
+            key
+            for key in self._cache
+            if (topic_id is None or key[0] == topic_id)
+            and (prompt_type is None or key[1] == prompt_type)
+        ]
+        for key in keys:
+            del self._cache[key]
+        return len(keys)
+
+    def _drop_written(self, cache_key: tuple[str, str]) -> None:
+        """Drop the entry for a prompt being written and discard overlapping reads."""
+        self._write_generation += 1
+        self._cache.pop(cache_key, None)
+
+    def _store_in_cache(self, cache_key: tuple[str, str], content: str, etag: str | None) -> None:
+        """Insert or refresh a cache entry, evicting the least recently used one if full."""
+        if not self.cache_enabled:
+            return
+        self._cache[cache_key] = _CachedPrompt(
+            content=content, etag=etag, validated_at=time.monotonic()
+        )
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def _read_object(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Fetch an object and read its body (blocking; runs on the AWS I/O pool).
+
+        The streaming body is read in the worker thread as well, since reading
+        it is part of the network round-trip.
+        """
+        response = self.s3_client.get_object(**request)
+        return {
+            "Body": response["Body"].read().decode("utf-8"),
+            "ETag": response.get("ETag"),
+        }
+
+    @staticmethod
+    def _is_not_modified(error: ClientError) -> bool:
+        """Check whether a ClientError is an HTTP 304 from a conditional GET."""
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return status == 304 or error.response.get("Error", {}).get("Code") in (
+            "304",
+            "NotModified",
+        )
 
     def _build_key(self, *, topic_id: str, prompt_type: str) -> str:
         """Build S3 key for prompt.
@@ -76,9 +200,13 @@ class S3PromptStorage:
             S3StorageError: If save operation fails
         """
         key = self._build_key(topic_id=topic_id, prompt_type=prompt_type)
+        cache_key = (topic_id, prompt_type)
+        self._drop_written(cache_key)
 
         try:
-            self.s3_client.put_object(
+            await run_aws_call(
+                "s3",
+                self.s3_client.put_object,
                 Bucket=self.bucket_name,
                 Key=key,
                 Body=content.encode("utf-8"),
@@ -88,6 +216,8 @@ class S3PromptStorage:
                     "prompt_type": prompt_type,
                 },
             )
+            # A get_prompt during the write may have cached the old body
+            self._drop_written(cache_key)
 
             logger.info(
                 "Prompt saved to S3",
@@ -135,6 +265,10 @@ class S3PromptStorage:
     ) -> str | None:
         """Get prompt content from S3.
 
+        Served from the in-process cache while the entry is fresh; stale entries
+        are revalidated with a conditional GET so unchanged prompts are not
+        re-downloaded.
+
         Args:
             topic_id: Topic identifier
             prompt_type: Prompt type (system, user, assistant, function)
@@ -146,10 +280,26 @@ class S3PromptStorage:
             S3StorageError: If retrieval operation fails (excluding not found)
         """
         key = self._build_key(topic_id=topic_id, prompt_type=prompt_type)
+        cache_key = (topic_id, prompt_type)
+        cached = self._cache.get(cache_key)
+
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            if time.monotonic() - cached.validated_at < self.cache_revalidate_seconds:
+                self._cache_hits += 1
+                return cached.content
+
+        request: dict[str, Any] = {"Bucket": self.bucket_name, "Key": key}
+        if cached is not None and cached.etag:
+            request["IfNoneMatch"] = cached.etag
+        generation = self._write_generation
 
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            content: str = response["Body"].read().decode("utf-8")
+            response = await run_aws_call("s3", self._read_object, request)
+            content: str = response["Body"]
+            self._cache_misses += 1
+            if generation == self._write_generation:
+                self._store_in_cache(cache_key, content, response.get("ETag"))
 
             logger.debug(
                 "Prompt retrieved from S3",
@@ -160,6 +310,14 @@ class S3PromptStorage:
             return content
 
         except ClientError as e:
+            if cached is not None and self._is_not_modified(e):
+                if generation == self._write_generation:
+                    cached.validated_at = time.monotonic()
+                self._cache_hits += 1
+                self._cache_revalidations += 1
+                return cached.content
+
+            self._cache.pop(cache_key, None)
             error_code = e.response["Error"]["Code"]
             if error_code == "NoSuchKey":
                 logger.debug(
@@ -216,9 +374,13 @@ class S3PromptStorage:
             S3StorageError: If delete operation fails
         """
         key = self._build_key(topic_id=topic_id, prompt_type=prompt_type)
+        cache_key = (topic_id, prompt_type)
+        self._drop_written(cache_key)
 
         try:
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
+            await run_aws_call("s3", self.s3_client.delete_object, Bucket=self.bucket_name, Key=key)
+            # A get_prompt during the delete may have cached the old body
+            self._drop_written(cache_key)
 
             logger.info(
                 "Prompt deleted from S3",
@@ -272,7 +434,9 @@ class S3PromptStorage:
         prefix = f"prompts/{topic_id}/"
 
         try:
-            response = self.s3_client.list_objects_v2(
+            response = await run_aws_call(
+                "s3",
+                self.s3_client.list_objects_v2,
                 Bucket=self.bucket_name,
                 Prefix=prefix,
             )
@@ -341,7 +505,7 @@ class S3PromptStorage:
         key = self._build_key(topic_id=topic_id, prompt_type=prompt_type)
 
         try:
-            self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+            await run_aws_call("s3", self.s3_client.head_object, Bucket=self.bucket_name, Key=key)
             return True
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
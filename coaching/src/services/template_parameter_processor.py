@@ -11,11 +11,16 @@ This service is the core of the parameter retrieval architecture. It:
 Key Design Principles:
 - Only fetch data for parameters ACTUALLY used in the template
 - Group API calls by retrieval method (minimize external calls)
+- Run independent retrieval methods concurrently (bounded fan-out, per-method
+  timeout); a method whose requires_from_payload value is provided by another
+  scheduled method waits for that method and receives the value
 - Support both payload-provided and enriched parameters
 - Clear separation between what's needed vs how to get it
 """
 
+import asyncio
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -27,9 +32,11 @@ from coaching.src.core.parameter_registry import (
 )
 from coaching.src.core.retrieval_method_registry import (
     RetrievalContext,
+    RetrievalMethodDefinition,
     get_retrieval_method,
     get_retrieval_method_definition,
 )
+from coaching.src.core.template_compiler import compile_template
 from coaching.src.infrastructure.external.business_api_client import BusinessApiClient
 
 logger = structlog.get_logger()
@@ -40,6 +47,10 @@ logger = structlog.get_logger()
 PARAMETER_PATTERN_DOUBLE = re.compile(r"\{\{([a-zA-Z_][a-zA-Z0-9_]*)\}\}")
 PARAMETER_PATTERN_SINGLE = re.compile(r"(?<!\{)\{([a-zA-Z_][a-zA-Z0-9_]*)\}(?!\})")
 
+# Enrichment fan-out defaults (overridable per processor)
+DEFAULT_MAX_CONCURRENT_RETRIEVALS = 5
+DEFAULT_RETRIEVAL_TIMEOUT_SECONDS = 10.0
+
 
 @dataclass
 class ParameterExtractionResult:
@@ -49,11 +60,13 @@ class ParameterExtractionResult:
         parameters: Dictionary of parameter_name -> value
         missing_required: List of required parameters that couldn't be resolved
         warnings: Non-fatal issues encountered during processing
+        method_latencies_ms: Wall time of each retrieval method call, in milliseconds
     """
 
     parameters: dict[str, Any] = field(default_factory=dict)
     missing_required: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    method_latencies_ms: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -85,13 +98,24 @@ class TemplateParameterProcessor:
     6. Return complete parameter set for template substitution
     """
 
-    def __init__(self, business_api_client: BusinessApiClient) -> None:
+    def __init__(
+        self,
+        business_api_client: BusinessApiClient,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_RETRIEVALS,
+        method_timeout_seconds: float | None = DEFAULT_RETRIEVAL_TIMEOUT_SECONDS,
+    ) -> None:
         """Initialize the processor.
 
         Args:
             business_api_client: Client for Business API calls
+            max_concurrency: Maximum retrieval methods running at the same time
+            method_timeout_seconds: Time budget for a single retrieval method
+                (None disables the timeout)
         """
         self.business_api_client = business_api_client
+        self.max_concurrency = max(1, max_concurrency)
+        self.method_timeout_seconds = method_timeout_seconds
 
     def extract_parameters_from_template(self, template: str) -> set[str]:
         """Extract all parameter names from a template string.
@@ -105,11 +129,8 @@ class TemplateParameterProcessor:
         Returns:
             Set of unique parameter names found in template
         """
-        # First try double braces (Jinja2-style) - preferred
-        double_matches = PARAMETER_PATTERN_DOUBLE.findall(template)
-        # Also check single braces for backward compatibility
-        single_matches = PARAMETER_PATTERN_SINGLE.findall(template)
-        return set(double_matches) | set(single_matches)
+        # Reuses the cached parse shared with prompt rendering
+        return set(compile_template(template).parameter_names)
 
     async def process_template_parameters(
         self,
@@ -212,6 +233,7 @@ class TemplateParameterProcessor:
                 payload=payload,
                 user_id=user_id,
                 tenant_id=tenant_id,
+                latencies_ms=result.method_latencies_ms,
             )
             result.parameters.update(enriched)
 
@@ -229,6 +251,7 @@ class TemplateParameterProcessor:
             resolved_count=len(result.parameters),
             missing_required=result.missing_required,
             warning_count=len(result.warnings),
+            method_latencies_ms=result.method_latencies_ms,
         )
 
         return result
@@ -255,102 +278,262 @@ class TemplateParameterProcessor:
 
         return grouped
 
+    def _build_dependency_graph(
+        self,
+        method_names: list[str],
+        payload: dict[str, Any],
+    ) -> dict[str, set[str]]:
+        """Find which retrieval methods depend on the output of others.
+
+        A method depends on another scheduled method when one of its
+        requires_from_payload keys is missing from the payload but listed in
+        the other method's provides_params.
+
+        Args:
+            method_names: Retrieval methods scheduled for this request
+            payload: Original request payload
+
+        Returns:
+            Dictionary of method_name -> names of methods it must wait for
+        """
+        definitions: dict[str, RetrievalMethodDefinition | None] = {
+            name: get_retrieval_method_definition(name) for name in method_names
+        }
+        graph: dict[str, set[str]] = {name: set() for name in method_names}
+
+        for name, method_def in definitions.items():
+            if not method_def:
+                continue
+            for key in method_def.requires_from_payload:
+                if key in payload:
+                    continue
+                for other, other_def in definitions.items():
+                    if other != name and other_def and key in other_def.provides_params:
+                        graph[name].add(other)
+
+        return graph
+
+    def _order_methods(self, graph: dict[str, set[str]]) -> list[str]:
+        """Topologically order methods so dependencies are scheduled first.
+
+        Dependencies that form a cycle are dropped (with a warning) so the
+        affected methods still run; they will be skipped later if their
+        payload requirements are still unmet.
+
+        Args:
+            graph: Dependency graph from _build_dependency_graph (modified in place)
+
+        Returns:
+            Method names in dependency order
+        """
+        ordered: list[str] = []
+        remaining = {name: set(deps) for name, deps in graph.items()}
+
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                logger.warning(
+                    "template_processor.dependency_cycle",
+                    methods=sorted(remaining),
+                )
+                for name in remaining:
+                    graph[name] -= set(remaining)
+                ready = list(remaining)
+
+            for name in ready:
+                ordered.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+        return ordered
+
     async def _enrich_parameters(
         self,
         params_by_method: dict[str, list[ParameterRequirement]],
         payload: dict[str, Any],
         user_id: str,
         tenant_id: str,
+        *,
+        latencies_ms: dict[str, float] | None = None,
     ) -> dict[str, Any]:
         """Call retrieval methods and extract parameter values.
 
+        Independent methods run concurrently, bounded by max_concurrency and
+        individually limited by method_timeout_seconds. Methods that need a
+        value produced by another method wait for it first.
+
         Args:
             params_by_method: Parameters grouped by retrieval method
             payload: Original request payload
             user_id: Current user ID
             tenant_id: Current tenant ID
+            latencies_ms: Optional dictionary populated with per-method latency
 
         Returns:
             Dictionary of extracted parameter values
         """
         result: dict[str, Any] = {}
 
-        # Create retrieval context
-        context = RetrievalContext(
-            client=self.business_api_client,
-            tenant_id=tenant_id,
-            user_id=user_id,
-            payload=payload,
-        )
-
-        for method_name, requirements in params_by_method.items():
-            # Get the retrieval method
-            method = get_retrieval_method(method_name)
-            if not method:
-                logger.warning(
-                    "template_processor.unknown_method",
-                    method=method_name,
-                    params=[r.name for r in requirements],
+        graph = self._build_dependency_graph(list(params_by_method), payload)
+        order = self._order_methods(graph)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks: dict[str, asyncio.Task[dict[str, Any] | None]] = {}
+
+        for method_name in order:
+            upstream = [tasks[dep] for dep in graph[method_name]]
+            tasks[method_name] = asyncio.create_task(
+                self._run_retrieval_method(
+                    method_name=method_name,
+                    requirements=params_by_method[method_name],
+                    upstream=dict(zip(graph[method_name], upstream, strict=True)),
+                    payload=payload,
+                    user_id=user_id,
+                    tenant_id=tenant_id,
+                    semaphore=semaphore,
+                    result=result,
+                    latencies_ms=latencies_ms,
                 )
-                continue
+            )
 
-            # Check if method has required payload params
-            method_def = get_retrieval_method_definition(method_name)
-            if method_def and method_def.requires_from_payload:
-                missing = [p for p in method_def.requires_from_payload if p not in payload]
-                if missing:
-                    logger.warning(
-                        "template_processor.missing_payload_params",
-                        method=method_name,
-                        missing=missing,
-                    )
-                    continue
+        if tasks:
+            await asyncio.gather(*tasks.values())
 
-            # Call the retrieval method ONCE
-            try:
-                logger.debug(
-                    "template_processor.calling_method",
-                    method=method_name,
-                    params=[r.name for r in requirements],
-                )
+        return result
+
+    async def _run_retrieval_method(
+        self,
+        *,
+        method_name: str,
+        requirements: list[ParameterRequirement],
+        upstream: dict[str, asyncio.Task[dict[str, Any] | None]],
+        payload: dict[str, Any],
+        user_id: str,
+        tenant_id: str,
+        semaphore: asyncio.Semaphore,
+        result: dict[str, Any],
+        latencies_ms: dict[str, float] | None,
+    ) -> dict[str, Any] | None:
+        """Run one retrieval method and extract its parameters into result.
 
-                method_result = await method(context)
+        Args:
+            method_name: Retrieval method to call
+            requirements: Parameters this method should provide
+            upstream: Tasks of methods this one depends on
+            payload: Original request payload
+            user_id: Current user ID
+            tenant_id: Current tenant ID
+            semaphore: Shared fan-out limiter
+            result: Shared dictionary receiving extracted values
+            latencies_ms: Optional dictionary receiving the call latency
 
-                # Extract individual parameter values from the result
-                for req in requirements:
-                    if req.definition:
-                        value = self._extract_value(
-                            method_result,
-                            req.definition.extraction_path,
-                            req.name,
-                        )
+        Returns:
+            Raw method result (used by dependent methods), or None if skipped/failed
+        """
+        # Get the retrieval method
+        method = get_retrieval_method(method_name)
+        if not method:
+            logger.warning(
+                "template_processor.unknown_method",
+                method=method_name,
+                params=[r.name for r in requirements],
+            )
+            return None
+
+        # Feed values produced by upstream methods into this method's payload
+        method_payload = payload
+        method_def = get_retrieval_method_definition(method_name)
+        if upstream and method_def:
+            upstream_results = await asyncio.gather(*upstream.values())
+            method_payload = dict(payload)
+            for key in method_def.requires_from_payload:
+                if key in method_payload:
+                    continue
+                definition = get_parameter_definition(key)
+                path = definition.extraction_path if definition else ""
+                for upstream_result in upstream_results:
+                    if upstream_result:
+                        value = self._extract_value(upstream_result, path, key)
                         if value is not None:
-                            # Serialize value to handle datetime and other non-JSON types
-                            serialized = self._serialize_value(value)
-                            logger.debug(
-                                "template_processor.value_serialized",
-                                param=req.name,
-                                original_type=type(value).__name__,
-                                serialized_type=type(serialized).__name__,
-                                has_datetime=self._contains_datetime(value),
-                            )
-                            result[req.name] = serialized
-                        elif req.definition.default is not None:
-                            result[req.name] = req.definition.default
+                            method_payload[key] = value
+                            break
 
-            except Exception as e:
-                logger.error(
-                    "template_processor.method_failed",
+        # Check if method has required payload params
+        if method_def and method_def.requires_from_payload:
+            missing = [p for p in method_def.requires_from_payload if p not in method_payload]
+            if missing:
+                logger.warning(
+                    "template_processor.missing_payload_params",
                     method=method_name,
-                    error=str(e),
-                    exc_info=True,
+                    missing=missing,
                 )
+                return None
+
+        context = RetrievalContext(
+            client=self.business_api_client,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            payload=method_payload,
+        )
+
+        # Call the retrieval method ONCE
+        async with semaphore:
+            logger.debug(
+                "template_processor.calling_method",
+                method=method_name,
+                params=[r.name for r in requirements],
+            )
+            started = time.perf_counter()
+            try:
+                method_result = await asyncio.wait_for(
+                    method(context), timeout=self.method_timeout_seconds
+                )
+            except Exception as e:
+                if isinstance(e, TimeoutError):
+                    logger.error(
+                        "template_processor.method_timeout",
+                        method=method_name,
+                        timeout_seconds=self.method_timeout_seconds,
+                    )
+                else:
+                    logger.error(
+                        "template_processor.method_failed",
+                        method=method_name,
+                        error=str(e),
+                        exc_info=True,
+                    )
                 # Apply defaults for failed retrieval
                 for req in requirements:
                     if req.definition and req.definition.default is not None:
                         result[req.name] = req.definition.default
+                return None
+            finally:
+                if latencies_ms is not None:
+                    latencies_ms[method_name] = round((time.perf_counter() - started) * 1000, 1)
 
-        return result
+        # Extract individual parameter values from the result
+        for req in requirements:
+            if req.definition:
+                value = self._extract_value(
+                    method_result,
+                    req.definition.extraction_path,
+                    req.name,
+                )
+                if value is not None:
+                    # Serialize value to handle datetime and other non-JSON types
+                    serialized = self._serialize_value(value)
+                    logger.debug(
+                        "template_processor.value_serialized",
+                        param=req.name,
+                        original_type=type(value).__name__,
+                        serialized_type=type(serialized).__name__,
+                        has_datetime=self._contains_datetime(value),
+                    )
+                    result[req.name] = serialized
+                elif req.definition.default is not None:
+                    result[req.name] = req.definition.default
+
+        return method_result
 
     def _contains_datetime(self, value: Any) -> bool:
         """Check if a value contains any datetime objects.
@@ -455,25 +638,18 @@ class TemplateParameterProcessor:
             Template with parameters substituted
         """
 
-        def replace_param(match: re.Match[str]) -> str:
-            param_name = match.group(1)
-            value = parameters.get(param_name)
+        values: dict[str, str] = {}
+        for name, value in parameters.items():
             if value is None:
                 # Leave placeholder as-is if no value
-                return match.group(0)
+                continue
             # Convert to string for substitution
             if isinstance(value, list):
-                return ", ".join(str(v) for v in value)
-            if isinstance(value, dict):
-                # For dicts, we might want JSON or a summary
-                return str(value)
-            return str(value)
-
-        # First substitute double braces (Jinja2-style)
-        result = PARAMETER_PATTERN_DOUBLE.sub(replace_param, template)
-        # Then substitute single braces (Python-style, backward compat)
-        result = PARAMETER_PATTERN_SINGLE.sub(replace_param, result)
-        return result
+                values[name] = ", ".join(str(v) for v in value)
+            else:
+                values[name] = str(value)
+
+        return compile_template(template).render(values)
 
 
 __all__ = [
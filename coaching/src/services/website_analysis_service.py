@@ -4,14 +4,16 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import html2text
 import requests
 import structlog
 from bs4 import BeautifulSoup
-from coaching.src.llm.providers.manager import ProviderManager
+
+if TYPE_CHECKING:
+    from coaching.src.llm.providers.manager import ProviderManager
 
 logger = structlog.get_logger()
 
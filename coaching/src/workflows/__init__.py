@@ -6,14 +6,40 @@ This module provides workflow orchestration capabilities using LangGraph:
 - Single-shot analysis workflows
 - Multi-step coaching processes
 - State management and persistence
+
+Exports are resolved lazily so that importing the workflow types does not
+load LangGraph; it is imported when a workflow graph is first built.
 """
 
-from .analysis_workflow import AnalysisWorkflow
-from .analysis_workflow_template import AnalysisWorkflowTemplate
-from .base import BaseWorkflow, WorkflowConfig, WorkflowState, WorkflowType
-from .coaching_workflow import CoachingWorkflow
-from .conversation_workflow_template import ConversationWorkflowTemplate
-from .orchestrator import WorkflowOrchestrator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .analysis_workflow import AnalysisWorkflow
+    from .analysis_workflow_template import AnalysisWorkflowTemplate
+    from .base import BaseWorkflow, WorkflowConfig, WorkflowState, WorkflowType
+    from .coaching_workflow import CoachingWorkflow
+    from .conversation_workflow_template import ConversationWorkflowTemplate
+    from .orchestrator import WorkflowOrchestrator
+else:
+
+    def __getattr__(name: str) -> object:
+        """Lazy import exports at runtime."""
+        if name in _EXPORT_MAP:
+            module = __import__(_EXPORT_MAP[name], fromlist=[name])
+            return getattr(module, name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    _EXPORT_MAP = {
+        "AnalysisWorkflow": "coaching.src.workflows.analysis_workflow",
+        "AnalysisWorkflowTemplate": "coaching.src.workflows.analysis_workflow_template",
+        "BaseWorkflow": "coaching.src.workflows.base",
+        "CoachingWorkflow": "coaching.src.workflows.coaching_workflow",
+        "ConversationWorkflowTemplate": "coaching.src.workflows.conversation_workflow_template",
+        "WorkflowConfig": "coaching.src.workflows.base",
+        "WorkflowOrchestrator": "coaching.src.workflows.orchestrator",
+        "WorkflowState": "coaching.src.workflows.base",
+        "WorkflowType": "coaching.src.workflows.base",
+    }
 
 __all__ = [
     "AnalysisWorkflow",
@@ -10,11 +10,11 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
-from langgraph.graph import StateGraph
 from pydantic import BaseModel, ConfigDict, Field
 
 if TYPE_CHECKING:
     from coaching.src.llm.providers.manager import ProviderManager
+    from langgraph.graph import StateGraph
 
 
 class WorkflowType(str, Enum):
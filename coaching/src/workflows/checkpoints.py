@@ -0,0 +1,154 @@
+"""Workflow checkpoints: compact state serialization and bounded storage.
+
+Workflow state is checkpointed in two tiers:
+
+- In process, in ``LRUDict`` maps bounded by ``WORKFLOW_STATE_MAX_ENTRIES``,
+  so long-lived containers stay flat in memory however many workflows they
+  have served
+- In a ``CheckpointBackend`` shared by all instances (``CacheService`` on
+  Redis, or ``InMemoryCheckpointBackend`` as a local stand-in), from which
+  evicted or unknown workflows are restored on resume
+
+Checkpoints are stored as compact JSON: fields still at their defaults are
+omitted and ``deserialize_state`` restores them.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar
+
+from coaching.src.workflows.base import WorkflowState
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUDict(OrderedDict[K, V]):
+    """Dict that evicts its least recently used entries beyond ``max_entries``.
+
+    Reads through ``[]`` and writes count as uses; ``get``, ``in`` and
+    iteration do not.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize an empty dict.
+
+        Args:
+            max_entries: Maximum entries kept (at least one)
+        """
+        self.max_entries = max(1, max_entries)
+        super().__init__()
+
+    def __getitem__(self, key: K) -> V:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if key in self:
+            self.move_to_end(key)
+        super().__setitem__(key, value)
+        while len(self) > self.max_entries:
+            del self[next(iter(self))]
+
+
+def serialize_state(state: WorkflowState) -> dict[str, Any]:
+    """Convert a workflow state to a compact JSON-compatible checkpoint.
+
+    Args:
+        state: Workflow state to checkpoint
+
+    Returns:
+        Checkpoint data without the fields that still have their defaults
+    """
+    return state.model_dump(mode="json", exclude_defaults=True)
+
+
+def deserialize_state(data: dict[str, Any]) -> WorkflowState:
+    """Restore a workflow state from a checkpoint.
+
+    Also accepts full ``model_dump()`` output written before checkpoints
+    were compacted.
+
+    Args:
+        data: Checkpoint data
+
+    Returns:
+        The workflow state
+    """
+    return WorkflowState.model_validate(data)
+
+
+class CheckpointBackend(Protocol):
+    """Durable workflow state storage shared by all instances."""
+
+    async def save_workflow_state(self, workflow_id: str, state_data: dict[str, Any]) -> Any:
+        """Store the checkpoint of a workflow, replacing any previous one."""
+        ...
+
+    async def load_workflow_state(self, workflow_id: str) -> dict[str, Any] | None:
+        """Load the checkpoint of a workflow, or None if there is none."""
+        ...
+
+
+class InMemoryCheckpointBackend:
+    """Per-process CheckpointBackend for local development and tests.
+
+    Checkpoints are kept encoded, as a shared store would hold them, and
+    expire after ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 86400.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty backend.
+
+        Args:
+            ttl_seconds: How long a checkpoint is kept after it was saved
+            clock: Time source in seconds
+        """
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._checkpoints: dict[str, tuple[str, float]] = {}
+
+    async def save_workflow_state(self, workflow_id: str, state_data: dict[str, Any]) -> bool:
+        """Store the checkpoint of a workflow."""
+        now = self._clock()
+        # Drop expired checkpoints so the stand-in stays bounded as well
+        expired = [key for key, (_, expires) in self._checkpoints.items() if expires <= now]
+        for key in expired:
+            del self._checkpoints[key]
+        encoded = json.dumps(state_data, separators=(",", ":"))
+        self._checkpoints[workflow_id] = (encoded, now + self.ttl_seconds)
+        return True
+
+    async def load_workflow_state(self, workflow_id: str) -> dict[str, Any] | None:
+        """Load the checkpoint of a workflow, or None if missing or expired."""
+        entry = self._checkpoints.get(workflow_id)
+        if entry is None:
+            return None
+        encoded, expires = entry
+        if expires <= self._clock():
+            del self._checkpoints[workflow_id]
+            return None
+        data: dict[str, Any] = json.loads(encoded)
+        return data
+
+    def __len__(self) -> int:
+        return len(self._checkpoints)
+
+
+__all__ = [
+    "CheckpointBackend",
+    "InMemoryCheckpointBackend",
+    "LRUDict",
+    "deserialize_state",
+    "serialize_state",
+]
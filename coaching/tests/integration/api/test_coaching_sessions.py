@@ -14,6 +14,7 @@ from coaching.src.api.routes.coaching_sessions import (
 )
 from coaching.src.core.constants import ConversationStatus, MessageRole
 from coaching.src.domain.entities.coaching_session import CoachingSession
+from coaching.src.domain.exceptions.session_exceptions import InvalidCursorError
 from coaching.src.services.coaching_session_service import (
     CoachingSessionService,
     InvalidTopicError,
@@ -23,6 +24,7 @@ from coaching.src.services.coaching_session_service import (
     SessionResponse,
     SessionStateResponse,
     SessionSummary,
+    SessionSummaryPage,
     TopicStatus,
     TopicsWithStatusResponse,
 )
@@ -172,7 +174,9 @@ def mock_coaching_session_service(
     )
     service.complete_session = AsyncMock(return_value=mock_completion_response)
     service.get_session = AsyncMock(return_value=mock_session_details)
-    service.list_user_sessions = AsyncMock(return_value=[mock_session_summary])
+    service.list_user_sessions = AsyncMock(
+        return_value=SessionSummaryPage(sessions=[mock_session_summary])
+    )
     service.get_topics_with_status = AsyncMock(
         return_value=TopicsWithStatusResponse(
             topics=[
@@ -501,6 +505,34 @@ class TestListSessions:
         assert response.status_code == 200
         mock_coaching_session_service.list_user_sessions.assert_called_once()
 
+    def test_list_sessions_invalid_cursor(self, client, mock_coaching_session_service):
+        """An undecodable cursor is a 400 INVALID_CURSOR."""
+        mock_coaching_session_service.list_user_sessions.side_effect = InvalidCursorError()
+
+        response = client.get(
+            "/api/v1/ai/coaching/sessions",
+            params={"cursor": "???"},
+            headers={"Authorization": "Bearer test_token"},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "INVALID_CURSOR"
+
+    def test_list_sessions_bad_stored_data_is_server_error(
+        self, client, mock_coaching_session_service
+    ):
+        """Other value errors are not reported as a bad cursor."""
+        mock_coaching_session_service.list_user_sessions.side_effect = ValueError(
+            "Invalid isoformat string: 'garbage'"
+        )
+
+        response = client.get(
+            "/api/v1/ai/coaching/sessions",
+            headers={"Authorization": "Bearer test_token"},
+        )
+
+        assert response.status_code == 500
+
 
 class TestErrorHandling:
     """Tests for error handling across endpoints."""
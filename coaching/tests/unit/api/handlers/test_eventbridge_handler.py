@@ -192,3 +192,60 @@ class TestHandleEventBridgeEvent:
 
         assert result["statusCode"] == 400
         assert "Unknown event type" in result["body"]
+
+    def test_routes_business_data_changed(self) -> None:
+        """Test that business.data.changed invalidates the tenant's cached data."""
+        event: dict[str, Any] = {
+            "source": "purposepath.business",
+            "detail-type": "business.data.changed",
+            "detail": {"tenantId": "tenant-456", "endpoints": ["user_goals"]},
+        }
+
+        with patch(
+            "coaching.src.infrastructure.external.business_api_cache.invalidate_business_data",
+            return_value=3,
+        ) as mock_invalidate:
+            result = handle_eventbridge_event(event, None)
+
+        assert result["statusCode"] == 200
+        mock_invalidate.assert_called_once_with(
+            "tenant-456", endpoints=["user_goals"], user_id=None
+        )
+
+    def test_business_data_changed_requires_tenant(self) -> None:
+        """Test that business.data.changed without tenantId is rejected."""
+        event: dict[str, Any] = {
+            "source": "purposepath.business",
+            "detail-type": "business.data.changed",
+            "detail": {},
+        }
+
+        result = handle_eventbridge_event(event, None)
+
+        assert result["statusCode"] == 400
+
+    def test_routes_session_sweep(self) -> None:
+        """Test that coaching.sessions.sweep runs the inactive-session sweeper."""
+        from coaching.src.infrastructure.repositories.dynamodb_coaching_session_repository import (
+            InactiveSessionSweepResult,
+        )
+
+        event: dict[str, Any] = {
+            "source": "purposepath.ai",
+            "detail-type": "coaching.sessions.sweep",
+            "detail": {"inactivityThresholdMinutes": 45},
+        }
+        repository = AsyncMock()
+        repository.pause_inactive_sessions.return_value = InactiveSessionSweepResult(
+            examined=5, paused=4, skipped=1
+        )
+
+        with patch(
+            "coaching.src.api.dependencies.coaching_message_job.get_session_repository",
+            AsyncMock(return_value=repository),
+        ):
+            result = handle_eventbridge_event(event, None)
+
+        assert result["statusCode"] == 200
+        assert result["processed"] == 5
+        repository.pause_inactive_sessions.assert_awaited_once_with(inactivity_threshold_minutes=45)
@@ -4,9 +4,12 @@ Tests for the generic single-shot AI execution endpoint (POST /ai/execute),
 schema discovery (GET /ai/schemas), and topic listing (GET /ai/topics).
 """
 
+import json
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from coaching.src.api.dependencies.ai_engine import get_unified_ai_engine
 from coaching.src.api.main import app
 from coaching.src.api.models.ai_execute import (
     GenericAIRequest,
@@ -19,6 +22,7 @@ from coaching.src.core.constants import TopicCategory, TopicType
 from coaching.src.core.topic_registry import TopicDefinition
 from fastapi import status
 from fastapi.testclient import TestClient
+from pydantic import BaseModel
 
 pytestmark = pytest.mark.unit
 
@@ -380,6 +384,93 @@ class TestExecuteAIEndpoint:
         assert "not configured" in response.json()["detail"].lower()
 
 
+class TestExecuteAIStreamEndpoint:
+    """Test POST /ai/execute/stream endpoint."""
+
+    @pytest.fixture
+    def single_shot_topic(self) -> TopicDefinition:
+        return TopicDefinition(
+            endpoint_path="/test",
+            http_method="POST",
+            topic_id="test_topic",
+            response_model="StreamTestResponse",
+            topic_type=TopicType.SINGLE_SHOT,
+            category=TopicCategory.ONBOARDING,
+            description="Test topic",
+            is_active=True,
+        )
+
+    @patch("coaching.src.api.routes.ai_execute.get_response_model")
+    @patch("coaching.src.api.routes.ai_execute.get_required_parameter_names_for_topic")
+    @patch("coaching.src.api.routes.ai_execute.get_endpoint_by_topic_id")
+    def test_stream_emits_tokens_then_result(
+        self,
+        mock_get_endpoint: MagicMock,
+        mock_get_required: MagicMock,
+        mock_get_response: MagicMock,
+        client: TestClient,
+        mock_unified_ai_engine: MagicMock,
+        single_shot_topic: TopicDefinition,
+    ) -> None:
+        """Test tokens are streamed as SSE events followed by the full response."""
+
+        class StreamTestResponse(BaseModel):
+            answer: str
+
+        async def fake_stream(
+            _prepared: object, usage: dict[str, int]
+        ) -> AsyncIterator[str | BaseModel]:
+            yield '{"answer": '
+            yield '"42"}'
+            usage["total_tokens"] = 57
+            yield StreamTestResponse(answer="42")
+
+        mock_get_endpoint.return_value = single_shot_topic
+        mock_get_required.return_value = set()
+        mock_get_response.return_value = StreamTestResponse
+        mock_unified_ai_engine.prepare_single_shot = AsyncMock(return_value=MagicMock())
+        mock_unified_ai_engine.stream_single_shot = fake_stream
+
+        app.dependency_overrides[get_unified_ai_engine] = lambda: mock_unified_ai_engine
+        try:
+            response = client.post(
+                "/api/v1/ai/execute/stream",
+                json={"topic_id": "test_topic", "parameters": {}},
+            )
+        finally:
+            app.dependency_overrides.pop(get_unified_ai_engine, None)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [block for block in response.text.split("\n\n") if block]
+        assert [block.split("\n")[0] for block in events] == [
+            "event: token",
+            "event: token",
+            "event: result",
+        ]
+        result = json.loads(events[-1].split("data: ", 1)[1])
+        assert result["data"] == {"answer": "42"}
+        assert result["schema_ref"] == "StreamTestResponse"
+        assert result["metadata"]["tokens_used"] == 57
+
+    @patch("coaching.src.api.routes.ai_execute.get_endpoint_by_topic_id")
+    def test_stream_topic_not_found(
+        self,
+        mock_get_endpoint: MagicMock,
+        client: TestClient,
+    ) -> None:
+        """Test validation errors are returned before the stream starts."""
+        mock_get_endpoint.return_value = None
+
+        response = client.post(
+            "/api/v1/ai/execute/stream",
+            json={"topic_id": "nonexistent", "parameters": {}},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert "not found" in response.json()["detail"].lower()
+
+
 class TestSchemasEndpoint:
     """Test GET /ai/schemas endpoints."""
 
@@ -0,0 +1,118 @@
+"""Unit tests for the streaming coaching message route."""
+
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from coaching.src.api.routes.coaching_sessions import SendMessageRequest, send_message_stream
+from coaching.src.core.constants import ConversationStatus
+from coaching.src.domain.exceptions.session_exceptions import (
+    MaxTurnsReachedError,
+    SessionNotFoundError,
+)
+from coaching.src.services.coaching_session_service import MessageResponse
+from fastapi import HTTPException
+from shared.models.multitenant import RequestContext, UserRole
+
+
+@pytest.fixture
+def context() -> RequestContext:
+    return RequestContext(user_id="user-123", tenant_id="tenant-123", role=UserRole.MEMBER)
+
+
+async def _read_body(response: object) -> str:
+    chunks = [chunk async for chunk in response.body_iterator]  # type: ignore[attr-defined]
+    return "".join(c if isinstance(c, str) else c.decode() for c in chunks)
+
+
+@pytest.mark.asyncio
+async def test_send_message_stream_emits_tokens_then_message(context: RequestContext) -> None:
+    """Tokens are sent as they arrive, followed by the final message response."""
+    turn = MagicMock()
+    final = MessageResponse(
+        session_id="sess-123",
+        message="Hello there",
+        status=ConversationStatus.ACTIVE,
+        turn=2,
+        max_turns=10,
+        message_count=4,
+    )
+
+    async def fake_stream(_turn: object) -> AsyncIterator[str | MessageResponse]:
+        yield "Hello "
+        yield "there"
+        yield final
+
+    service = MagicMock()
+    service.prepare_message_turn = AsyncMock(return_value=turn)
+    service.stream_message_turn = fake_stream
+    service.wait_for_partial_extraction = AsyncMock()
+
+    response = await send_message_stream(
+        request=SendMessageRequest(session_id="sess-123", message="Hi"),
+        context=context,
+        service=service,
+    )
+
+    assert response.media_type == "text/event-stream"
+    body = await _read_body(response)
+    assert body.index('event: token\ndata: {"text":"Hello "}') < body.index("event: message")
+    assert '"message":"Hello there"' in body
+    assert '"message_count":4' in body
+    service.prepare_message_turn.assert_awaited_once_with(
+        session_id="sess-123",
+        tenant_id="tenant-123",
+        user_id="user-123",
+        user_message="Hi",
+    )
+    service.wait_for_partial_extraction.assert_awaited_once_with("sess-123")
+
+
+@pytest.mark.asyncio
+async def test_send_message_stream_reports_mid_stream_failure(context: RequestContext) -> None:
+    """A failure after streaming starts is reported as an error event."""
+
+    async def failing_stream(_turn: object) -> AsyncIterator[str]:
+        yield "Partial"
+        raise RuntimeError("model unavailable")
+
+    service = MagicMock()
+    service.prepare_message_turn = AsyncMock(return_value=MagicMock())
+    service.stream_message_turn = failing_stream
+
+    response = await send_message_stream(
+        request=SendMessageRequest(session_id="sess-123", message="Hi"),
+        context=context,
+        service=service,
+    )
+
+    body = await _read_body(response)
+    assert "event: token" in body
+    assert "event: error" in body
+    assert '"code":"STREAM_FAILED"' in body
+    assert "model unavailable" not in body
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error", "expected_status"),
+    [
+        (SessionNotFoundError(session_id="sess-123"), 422),
+        (MaxTurnsReachedError(session_id="sess-123", current_turn=10, max_turns=10), 422),
+    ],
+)
+async def test_send_message_stream_validation_errors_are_http_errors(
+    context: RequestContext, error: Exception, expected_status: int
+) -> None:
+    """Errors raised before streaming starts keep the regular HTTP mapping."""
+    service = MagicMock()
+    service.prepare_message_turn = AsyncMock(side_effect=error)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await send_message_stream(
+            request=SendMessageRequest(session_id="sess-123", message="Hi"),
+            context=context,
+            service=service,
+        )
+
+    assert exc_info.value.status_code == expected_status
@@ -0,0 +1,127 @@
+"""Unit tests for the insights generation route."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from coaching.src.api.models.auth import UserContext
+from coaching.src.api.routes.insights import generate_coaching_insights
+from coaching.src.models.responses import InsightMetadata, InsightResponse
+from coaching.src.services.insights_snapshot_store import InsightsSnapshotStore
+from shared.models.schemas import PaginatedResponse, PaginationMeta
+
+
+@pytest.fixture
+def user() -> UserContext:
+    return UserContext(user_id="user-123", tenant_id="tenant-123")
+
+
+def _insight(index: int, category: str = "strategy") -> InsightResponse:
+    return InsightResponse(
+        title=f"Insight {index}",
+        description="A description long enough to be useful.",
+        category=category,
+        priority="high",
+        metadata=InsightMetadata(
+            conversation_count=0, business_impact="high", effort_required="low"
+        ),
+    )
+
+
+def _handler(insights: list[InsightResponse], user_prompt: str = "Goals: [...]") -> MagicMock:
+    prepared = MagicMock(
+        topic_id="insights_generation",
+        rendered_system_prompt="You are a coach.",
+        rendered_user_prompt=user_prompt,
+    )
+    handler = MagicMock()
+    handler.prepare_single_shot = AsyncMock(return_value=prepared)
+    handler.complete_single_shot = AsyncMock(
+        return_value=PaginatedResponse(
+            success=True,
+            data=insights,
+            pagination=PaginationMeta(page=1, limit=20, total=len(insights), total_pages=1),
+        )
+    )
+    return handler
+
+
+async def _generate(
+    handler: MagicMock, user: UserContext, **query: object
+) -> PaginatedResponse[InsightResponse]:
+    params: dict[str, object] = {
+        "page": 1,
+        "page_size": 20,
+        "category": None,
+        "priority": None,
+        "status": None,
+        "force_refresh": False,
+    }
+    params.update(query)
+    return await generate_coaching_insights(
+        **params,  # type: ignore[arg-type]
+        user=user,
+        handler=handler,
+        jwt_token=None,
+    )
+
+
+class TestGenerateCoachingInsights:
+    """Tests for serving /insights/generate from the snapshot store."""
+
+    @pytest.mark.asyncio
+    async def test_pages_and_filters_share_one_generation(self, user: UserContext) -> None:
+        """Later pages and filter changes are served from the snapshot."""
+        insights = [_insight(i) for i in range(3)] + [_insight(3, category="finance")]
+        handler = _handler(insights)
+        store = InsightsSnapshotStore()
+
+        with patch(
+            "coaching.src.api.routes.insights.get_insights_snapshot_store", return_value=store
+        ):
+            first = await _generate(handler, user, page_size=2)
+            second = await _generate(handler, user, page=2, page_size=2)
+            finance = await _generate(handler, user, category="finance")
+
+        assert [i.title for i in first.data] == ["Insight 0", "Insight 1"]
+        assert [i.title for i in second.data] == ["Insight 2", "Insight 3"]
+        assert first.pagination.total == 4
+        assert first.pagination.total_pages == 2
+        assert [i.title for i in finance.data] == ["Insight 3"]
+        handler.complete_single_shot.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_changed_data_or_force_refresh_regenerates(self, user: UserContext) -> None:
+        """A different rendered prompt (changed data) or force_refresh generates again."""
+        store = InsightsSnapshotStore()
+        handler = _handler([_insight(0)])
+        changed = _handler([_insight(1)], user_prompt="Goals: [new goal]")
+
+        with patch(
+            "coaching.src.api.routes.insights.get_insights_snapshot_store", return_value=store
+        ):
+            await _generate(handler, user)
+            await _generate(handler, user, force_refresh=True)
+            result = await _generate(changed, user)
+
+        assert handler.complete_single_shot.await_count == 2
+        assert [i.title for i in result.data] == ["Insight 1"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_store_generates_per_request(self, user: UserContext) -> None:
+        """Without a snapshot store the handler generates on every request."""
+        handler = MagicMock()
+        handler.handle_single_shot = AsyncMock(
+            return_value=PaginatedResponse(
+                success=True,
+                data=[],
+                pagination=PaginationMeta(page=1, limit=20, total=0, total_pages=0),
+            )
+        )
+
+        with patch(
+            "coaching.src.api.routes.insights.get_insights_snapshot_store", return_value=None
+        ):
+            await _generate(handler, user)
+            await _generate(handler, user)
+
+        assert handler.handle_single_shot.await_count == 2
@@ -0,0 +1,90 @@
+"""Unit tests for JWT validation in the auth dependencies."""
+
+import time
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+from coaching.src.api import auth
+from coaching.src.infrastructure.jwt_secret_provider import JwtSecretProvider
+from fastapi import HTTPException
+from jose import jwt
+
+ALGORITHM = auth.settings.jwt_algorithm
+
+
+def _token(secret: str, **claims: object) -> str:
+    payload = {
+        "sub": "user-1",
+        "tenant_id": "tenant-1",
+        "iss": auth.settings.jwt_issuer,
+        "aud": auth.settings.jwt_audience,
+        "exp": int(time.time()) + 600,
+        **claims,
+    }
+    return str(jwt.encode(payload, secret, algorithm=ALGORITHM))
+
+
+@pytest.fixture
+def secrets() -> Iterator[list[str]]:
+    """Install a provider backed by a mutable secret list (last item is current)."""
+    values = ["secret-1"]
+    provider = JwtSecretProvider(lambda: values[-1], min_refresh_interval_seconds=0)
+    with (
+        patch.object(auth, "_jwt_secret_provider", provider),
+        patch.object(auth.settings, "jwt_secret", None),
+        patch.object(auth.settings, "stage", "prod"),
+    ):
+        auth._claims_cache.clear()
+        yield values
+        auth._claims_cache.clear()
+
+
+@pytest.mark.asyncio
+class TestDecodeToken:
+    """Tests for token decoding with cached secret and claims."""
+
+    async def test_valid_token(self, secrets: list[str]) -> None:
+        """A valid token yields the request context."""
+        context = await auth.get_current_context(f"Bearer {_token('secret-1')}")
+
+        assert context.user_id == "user-1"
+        assert context.tenant_id == "tenant-1"
+
+    async def test_claims_are_cached(self, secrets: list[str]) -> None:
+        """Repeat validations of the same token skip signature verification."""
+        token = _token("secret-1")
+        await auth.get_current_user(f"Bearer {token}")
+
+        with patch.object(auth, "_verify_token", side_effect=AssertionError) as verify:
+            user = await auth.get_current_user(f"Bearer {token}")
+
+        verify.assert_not_called()
+        assert user.user_id == "user-1"
+
+    async def test_expired_claims_are_not_served_from_cache(self, secrets: list[str]) -> None:
+        """Cached claims are dropped once the token expires."""
+        token = _token("secret-1", exp=int(time.time()) - 1)
+        auth._claims_cache.put(token, {"sub": "user-1", "exp": int(time.time()) - 1})
+
+        assert auth._claims_cache.get(token) is None
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.get_current_context(f"Bearer {token}")
+        assert exc_info.value.status_code == 401
+
+    async def test_rotated_secret_is_refreshed_once(self, secrets: list[str]) -> None:
+        """A signature failure after rotation reloads the secret and succeeds."""
+        auth._get_jwt_secret()
+        secrets.append("secret-2")
+
+        context = await auth.get_current_context(f"Bearer {_token('secret-2')}")
+
+        assert context.user_id == "user-1"
+        assert auth.get_jwt_secret_provider().load_count == 2
+
+    async def test_invalid_signature_rejected(self, secrets: list[str]) -> None:
+        """Tokens signed with an unknown secret are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.get_current_context(f"Bearer {_token('other-secret')}")
+
+        assert exc_info.value.status_code == 401
@@ -0,0 +1,113 @@
+"""Unit tests for the Lambda entry point and its cold-start import budget."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from coaching.src.api import lambda_entry
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+
+# Generous defaults; override per environment (e.g. slower CI runners)
+ENTRY_BUDGET_MS = float(os.environ.get("COLD_IMPORT_BUDGET_ENTRY_MS", "1500"))
+APP_BUDGET_MS = float(os.environ.get("COLD_IMPORT_BUDGET_APP_MS", "6000"))
+
+# Modules an EventBridge-only cold start must not load
+HEAVY_MODULES = [
+    "fastapi",
+    "coaching.src.api.main",
+    "coaching.src.api.routes",
+    "coaching.src.services.coaching_session_service",
+    "langchain_core",
+    "langgraph",
+    "bs4",
+    "anthropic",
+    "openai",
+]
+
+
+def _cold_import(module: str) -> tuple[float, set[str]]:
+    """Import a module in a fresh interpreter, returning (import ms, loaded modules)."""
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = (time.perf_counter() - start) * 1000\n"
+        "print(json.dumps({'ms': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT), "COLD_START_MODE": "lazy"}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    payload = json.loads(result.stdout.strip().splitlines()[-1])
+    return payload["ms"], set(payload["modules"])
+
+
+class TestColdImport:
+    """Cold import checks run in a subprocess so sys.modules starts empty."""
+
+    def test_eventbridge_path_skips_http_app(self) -> None:
+        elapsed_ms, modules = _cold_import("coaching.src.api.lambda_entry")
+
+        loaded = [name for name in HEAVY_MODULES if name in modules]
+        assert loaded == []
+        assert elapsed_ms < ENTRY_BUDGET_MS
+
+    def test_http_app_import_budget(self) -> None:
+        elapsed_ms, modules = _cold_import("coaching.src.api.main")
+
+        assert "coaching.src.api.routes" in modules
+        # Provider SDKs and LangGraph load with the first request that needs them
+        assert "langgraph" not in modules
+        assert "bs4" not in modules
+        assert elapsed_ms < APP_BUDGET_MS
+
+
+class TestHandler:
+    """Tests for event routing."""
+
+    def test_eventbridge_event_does_not_load_http_handler(self) -> None:
+        event: dict[str, Any] = {"source": "purposepath.ai", "detail-type": "ai.job.created"}
+
+        with (
+            patch.object(lambda_entry, "is_eventbridge_event", return_value=True),
+            patch.object(
+                lambda_entry, "handle_eventbridge_event", return_value={"statusCode": 200}
+            ) as handle,
+            patch.object(lambda_entry, "get_http_handler") as get_http,
+        ):
+            result = lambda_entry.handler(event, None)
+
+        assert result == {"statusCode": 200}
+        handle.assert_called_once_with(event, None)
+        get_http.assert_not_called()
+
+    def test_http_event_uses_cached_http_handler(self) -> None:
+        http_handler = MagicMock(return_value={"statusCode": 200})
+        event = {"httpMethod": "GET", "path": "/api/v1/health"}
+
+        with (
+            patch.object(lambda_entry, "is_eventbridge_event", return_value=False),
+            patch.object(lambda_entry, "_http_handler", http_handler),
+        ):
+            first = lambda_entry.handler(event, None)
+            second = lambda_entry.handler(event, None)
+
+        assert first == second == {"statusCode": 200}
+        assert http_handler.call_count == 2
+
+    def test_lambda_handler_reexports_entry_point(self) -> None:
+        from coaching import lambda_handler
+
+        assert lambda_handler.handler is lambda_entry.handler
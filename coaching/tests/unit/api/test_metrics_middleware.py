@@ -0,0 +1,63 @@
+"""Unit tests for per-request metrics flushing."""
+
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+from coaching.src.api.middleware.metrics import MetricsFlushMiddleware
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from shared.observability.metrics import (
+    EMFMetrics,
+    InMemoryMetricsSink,
+    get_metrics,
+    set_metrics,
+)
+
+
+@pytest.fixture
+def sink() -> Iterator[InMemoryMetricsSink]:
+    """Install an in-memory EMF collector as the global metrics instance."""
+    sink = InMemoryMetricsSink()
+    set_metrics(EMFMetrics(sink=sink))
+    yield sink
+    set_metrics(None)
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """App with a plain and a streaming route that record metrics."""
+    app = FastAPI()
+    app.add_middleware(MetricsFlushMiddleware)
+
+    @app.get("/plain")
+    async def plain() -> dict[str, str]:
+        get_metrics().record_success("Plain")
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def body() -> AsyncIterator[str]:
+            yield "data: 1\n\n"
+            get_metrics().record_success("Stream")
+            yield "data: 2\n\n"
+
+        return StreamingResponse(body(), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+def test_metrics_are_flushed_after_request(client: TestClient, sink: InMemoryMetricsSink) -> None:
+    client.get("/plain")
+
+    assert sink.values("PlainSuccess") == [1.0]
+
+
+def test_metrics_recorded_while_streaming_are_flushed(
+    client: TestClient, sink: InMemoryMetricsSink
+) -> None:
+    """Metrics recorded after the headers were sent still go out with the request."""
+    response = client.get("/stream")
+
+    assert response.text == "data: 1\n\ndata: 2\n\n"
+    assert sink.values("StreamSuccess") == [1.0]
@@ -0,0 +1,288 @@
+"""Unit tests for the rate limiting middleware and its backends."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from coaching.src.api.middleware.rate_limit_backends import (
+    InMemoryTokenStore,
+    LocalRateLimitBackend,
+    RateLimit,
+    RedisTokenStore,
+    SharedRateLimitBackend,
+    TokenBucket,
+)
+from coaching.src.api.middleware.rate_limiting import RateLimitingMiddleware
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FailingStore:
+    """Shared store that is always unavailable."""
+
+    async def take(self, key: str, limit: RateLimit, count: int) -> tuple[int, int]:
+        raise ConnectionError("store down")
+
+
+class TestTokenBucket:
+    """Tests for the token bucket."""
+
+    def test_fractional_refills_accumulate(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=2, refill_rate=2.0, clock=clock)
+        assert bucket.consume(2)
+
+        # Each step adds half a token; two steps make one whole token
+        clock.now += 0.25
+        assert not bucket.consume()
+        clock.now += 0.25
+        assert bucket.consume()
+
+    def test_seconds_until(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=10, refill_rate=2.0, clock=clock)
+        bucket.consume(10)
+
+        assert bucket.seconds_until(4) == pytest.approx(2.0)
+
+
+class TestLocalBackend:
+    """Tests for the bounded per-process backend."""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_bounds_buckets(self) -> None:
+        backend = LocalRateLimitBackend(max_buckets=2)
+        limit = RateLimit(capacity=5, refill_rate=0.0)
+
+        await backend.acquire("a", limit)
+        await backend.acquire("b", limit)
+        await backend.acquire("a", limit)
+        await backend.acquire("c", limit)
+
+        assert backend.get_stats() == {"buckets": 2, "evictions": 1}
+        # "a" was recently used and kept its spent tokens
+        assert (await backend.acquire("a", limit)).remaining == 2
+
+    @pytest.mark.asyncio
+    async def test_refilled_idle_buckets_are_dropped(self) -> None:
+        clock = FakeClock()
+        backend = LocalRateLimitBackend(max_buckets=100, clock=clock)
+        limit = RateLimit(capacity=5, refill_rate=1.0)
+
+        await backend.acquire("idle", limit)
+        clock.now += 10
+        await backend.acquire("active", limit)
+
+        assert backend.get_stats()["buckets"] == 1
+
+    @pytest.mark.asyncio
+    async def test_denied_request_reports_retry_after(self) -> None:
+        backend = LocalRateLimitBackend(clock=FakeClock())
+        limit = RateLimit(capacity=5, refill_rate=0.5)
+
+        assert (await backend.acquire("k", limit, cost=5)).allowed
+        decision = await backend.acquire("k", limit, cost=2)
+
+        assert not decision.allowed
+        assert decision.retry_after_seconds == pytest.approx(4.0)
+
+
+class TestSharedBackend:
+    """Tests for leased shared limits."""
+
+    @pytest.mark.asyncio
+    async def test_tokens_are_leased_in_growing_batches(self) -> None:
+        clock = FakeClock()
+        store = InMemoryTokenStore(clock=clock)
+        backend = SharedRateLimitBackend(store, lease_size=5, clock=clock)
+        limit = RateLimit(capacity=100, refill_rate=0.0)
+
+        results = [await backend.acquire("k", limit) for _ in range(10)]
+
+        # Batches of 1, 2, 4 and then lease_size
+        assert all(r.allowed for r in results)
+        assert store.calls == 4
+        assert backend.get_stats()["lease_hits"] == 6
+
+    @pytest.mark.asyncio
+    async def test_spaced_requests_take_only_their_cost(self) -> None:
+        """One request per lease TTL leaves no unspent tokens to expire."""
+        clock = FakeClock()
+        store = InMemoryTokenStore(clock=clock)
+        backend = SharedRateLimitBackend(store, lease_size=10, lease_ttl_seconds=1.0, clock=clock)
+        limit = RateLimit(capacity=100, refill_rate=0.0)
+
+        for _ in range(3):
+            await backend.acquire("k", limit, cost=3)
+            clock.now += 2
+
+        assert (await store.take("ratelimit:k", limit, 0))[1] == 100 - 9
+
+    @pytest.mark.asyncio
+    async def test_expired_unspent_lease_shrinks_next_batch(self) -> None:
+        clock = FakeClock()
+        store = InMemoryTokenStore(clock=clock)
+        backend = SharedRateLimitBackend(store, lease_size=8, lease_ttl_seconds=1.0, clock=clock)
+        limit = RateLimit(capacity=100, refill_rate=0.0)
+
+        for _ in range(4):
+            await backend.acquire("k", limit)
+        # Batches 1, 2 and 4 were leased; 3 tokens of the last one are left
+        clock.now += 2
+        await backend.acquire("k", limit)
+
+        assert (await store.take("ratelimit:k", limit, 0))[1] == 100 - 9
+
+    @pytest.mark.asyncio
+    async def test_limit_is_shared_across_instances(self) -> None:
+        clock = FakeClock()
+        store = InMemoryTokenStore(clock=clock)
+        first = SharedRateLimitBackend(store, lease_size=2, clock=clock)
+        second = SharedRateLimitBackend(store, lease_size=2, clock=clock)
+        limit = RateLimit(capacity=6, refill_rate=0.0)
+
+        allowed = 0
+        for _ in range(5):
+            allowed += (await first.acquire("k", limit)).allowed
+            allowed += (await second.acquire("k", limit)).allowed
+
+        assert allowed == 6
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_goes_back_to_store(self) -> None:
+        clock = FakeClock()
+        store = InMemoryTokenStore(clock=clock)
+        backend = SharedRateLimitBackend(store, lease_size=5, lease_ttl_seconds=1.0, clock=clock)
+        limit = RateLimit(capacity=100, refill_rate=0.0)
+
+        await backend.acquire("k", limit)
+        clock.now += 2
+        await backend.acquire("k", limit)
+
+        assert store.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_large_cost_leases_enough_tokens(self) -> None:
+        store = InMemoryTokenStore(clock=FakeClock())
+        backend = SharedRateLimitBackend(store, lease_size=2, clock=FakeClock())
+        limit = RateLimit(capacity=10, refill_rate=0.0)
+
+        decision = await backend.acquire("k", limit, cost=5)
+
+        assert decision.allowed
+        assert decision.remaining == 5
+
+    @pytest.mark.asyncio
+    async def test_store_failure_falls_back_to_local(self) -> None:
+        fallback = LocalRateLimitBackend()
+        backend = SharedRateLimitBackend(FailingStore(), fallback=fallback)
+
+        decision = await backend.acquire("k", RateLimit(capacity=3, refill_rate=1.0))
+
+        assert decision.allowed
+        assert backend.get_stats()["store_errors"] == 1
+        assert fallback.get_stats()["buckets"] == 1
+
+
+class TestRedisTokenStore:
+    """Tests for the Redis store wiring."""
+
+    @pytest.mark.asyncio
+    async def test_take_runs_script_with_bucket_parameters(self) -> None:
+        script = MagicMock(return_value=[3, 7])
+        client = MagicMock()
+        client.register_script.return_value = script
+        store = RedisTokenStore(lambda: client)
+
+        granted, remaining = await store.take("ratelimit:k", RateLimit(10, 2.0), 3)
+        await store.take("ratelimit:k", RateLimit(10, 2.0), 3)
+
+        assert (granted, remaining) == (3, 7)
+        client.register_script.assert_called_once()
+        script.assert_called_with(keys=["ratelimit:k"], args=[10, 2.0, 3, 6000])
+
+
+def _client(**kwargs: object) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/api/v1/ai/execute/{job_id}")
+    async def status(job_id: str) -> dict[str, str]:
+        return {"job_id": job_id}
+
+    @app.post("/api/v1/ai/execute")
+    async def execute() -> dict[str, str]:
+        return {"ok": "yes"}
+
+    app.add_middleware(RateLimitingMiddleware, **kwargs)  # type: ignore[arg-type]
+    return TestClient(app)
+
+
+class TestMiddleware:
+    """Tests for request costing and responses."""
+
+    def test_expensive_requests_spend_more_tokens(self) -> None:
+        client = _client(
+            default_capacity=10,
+            default_refill_rate=0.001,
+            endpoint_costs={"POST /api/v1/ai/execute": 4},
+        )
+        headers = {"Authorization": "Bearer token-1"}
+
+        assert client.get("/api/v1/ai/execute/j1", headers=headers).status_code == 200
+        first = client.post("/api/v1/ai/execute", headers=headers)
+        second = client.post("/api/v1/ai/execute", headers=headers)
+        third = client.post("/api/v1/ai/execute", headers=headers)
+
+        assert first.headers["X-RateLimit-Remaining"] == "5"
+        assert second.status_code == 200
+        assert third.status_code == 429
+        assert int(third.headers["Retry-After"]) >= 1
+        # The last token still admits a cheap request
+        assert client.get("/api/v1/ai/execute/j1", headers=headers).status_code == 200
+
+    def test_clients_have_separate_buckets(self) -> None:
+        client = _client(default_capacity=1, default_refill_rate=0.001)
+
+        assert client.post("/api/v1/ai/execute", headers={"Authorization": "Bearer a"}).is_success
+        assert client.post("/api/v1/ai/execute", headers={"Authorization": "Bearer b"}).is_success
+        assert (
+            client.post("/api/v1/ai/execute", headers={"Authorization": "Bearer a"}).status_code
+            == 429
+        )
+
+    def test_anonymous_requests_are_not_limited(self) -> None:
+        client = _client(default_capacity=1, default_refill_rate=0.001)
+
+        responses = [client.post("/api/v1/ai/execute") for _ in range(3)]
+
+        assert all(r.status_code == 200 for r in responses)
+
+    def test_cost_rule_matching(self) -> None:
+        middleware = RateLimitingMiddleware(
+            MagicMock(),
+            endpoint_costs={"/api/v1/ai": 2, "POST /api/v1/ai/execute": 5},
+        )
+
+        assert middleware.resolve_cost("POST", "/api/v1/ai/execute-async") == 5
+        assert middleware.resolve_cost("GET", "/api/v1/ai/execute/j1") == 2
+        assert middleware.resolve_cost("GET", "/api/v1/health") == 1
+
+    def test_cost_rules_are_relative_to_the_api_prefix(self) -> None:
+        middleware = RateLimitingMiddleware(
+            MagicMock(),
+            endpoint_costs={"POST /ai/execute": 5, "POST /ai/coaching/message": 3},
+            cost_path_prefix="/api/v2/",
+        )
+
+        assert middleware.resolve_cost("POST", "/api/v2/ai/execute") == 5
+        assert middleware.resolve_cost("POST", "/api/v2/ai/coaching/message") == 3
+        assert middleware.resolve_cost("POST", "/ai/execute") == 1
@@ -0,0 +1,153 @@
+"""Unit tests for the single-shot result cache."""
+
+from unittest.mock import patch
+
+import pytest
+from coaching.src.application.ai_engine.result_cache import (
+    LLMResultCache,
+    ResultCacheMode,
+    topic_cache_ttl,
+)
+from coaching.src.domain.entities.llm_topic import LLMTopic
+from coaching.src.domain.ports.llm_provider_port import LLMResponse
+from pydantic import BaseModel
+
+
+class Answer(BaseModel):
+    """Sample response model."""
+
+    items: list[str]
+
+
+def _key(**overrides: object) -> str:
+    params: dict[str, object] = {
+        "model_code": "gpt-4",
+        "temperature": 0.7,
+        "max_tokens": 100,
+        "system_prompt": "system",
+        "user_prompt": "user",
+        "response_schema": {"type": "object"},
+        "response_model": Answer,
+    }
+    params.update(overrides)
+    return LLMResultCache.make_key(**params)  # type: ignore[arg-type]
+
+
+def _response() -> LLMResponse:
+    return LLMResponse(
+        content='{"items": ["a"]}',
+        model="gpt-4",
+        usage={"total_tokens": 10},
+        finish_reason="stop",
+        provider="openai",
+    )
+
+
+def _topic(config: dict[str, object]) -> LLMTopic:
+    return LLMTopic(
+        topic_id="t",
+        topic_name="T",
+        topic_type="single_shot",
+        category="analysis",
+        description="",
+        basic_model_code="gpt-4",
+        premium_model_code="gpt-4",
+        temperature=0.7,
+        max_tokens=100,
+        is_active=True,
+        prompts=[],
+        additional_config=config,
+    )
+
+
+class TestMakeKey:
+    """Tests for request keys."""
+
+    def test_identical_requests_share_a_key(self) -> None:
+        assert _key() == _key()
+
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"model_code": "claude"},
+            {"temperature": 0.2},
+            {"max_tokens": 200},
+            {"system_prompt": "other"},
+            {"user_prompt": "other"},
+            {"response_schema": None},
+        ],
+    )
+    def test_any_input_change_changes_the_key(self, override: dict[str, object]) -> None:
+        assert _key(**override) != _key()
+
+
+class TestLLMResultCache:
+    """Tests for storage, expiry and eviction."""
+
+    def test_hit_returns_a_private_copy(self) -> None:
+        cache = LLMResultCache()
+        cache.put("tenant", "k", Answer(items=["a"]), _response(), ttl_seconds=60)
+
+        first = cache.get("tenant", "k")
+        assert first is not None
+        first.result.items.append("mutated")  # type: ignore[attr-defined]
+
+        second = cache.get("tenant", "k")
+        assert second is not None
+        assert second.result == Answer(items=["a"])
+
+    def test_scopes_are_isolated(self) -> None:
+        cache = LLMResultCache()
+        cache.put("tenant-a", "k", Answer(items=["a"]), _response(), ttl_seconds=60)
+
+        assert cache.get("tenant-b", "k") is None
+        assert cache.invalidate("tenant-a") == 1
+        assert cache.get("tenant-a", "k") is None
+
+    def test_entries_expire(self) -> None:
+        cache = LLMResultCache()
+        with patch("time.monotonic", return_value=100.0):
+            cache.put("s", "k", Answer(items=[]), _response(), ttl_seconds=10)
+        with patch("time.monotonic", return_value=109.0):
+            assert cache.get("s", "k") is not None
+        with patch("time.monotonic", return_value=110.0):
+            assert cache.get("s", "k") is None
+
+        assert cache.get_stats() == {"hits": 1, "misses": 1, "stores": 1, "size": 0}
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = LLMResultCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.put("s", key, Answer(items=[key]), _response(), ttl_seconds=60)
+        cache.get("s", "a")
+        cache.put("s", "c", Answer(items=["c"]), _response(), ttl_seconds=60)
+
+        assert cache.get("s", "b") is None
+        assert cache.get("s", "a") is not None
+        assert cache.get("s", "c") is not None
+
+
+class TestTopicConfig:
+    """Tests for per-topic opt-in."""
+
+    def test_topics_are_not_cached_by_default(self) -> None:
+        assert topic_cache_ttl(_topic({}), 3600) is None
+
+    def test_topic_ttl_overrides_default(self) -> None:
+        topic = _topic({"result_cache_enabled": True, "result_cache_ttl_seconds": 120})
+
+        assert topic_cache_ttl(topic, 3600) == 120
+        assert topic_cache_ttl(_topic({"result_cache_enabled": True}), 3600) == 3600
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, ResultCacheMode.USE),
+        ("max-age=0", ResultCacheMode.USE),
+        ("no-cache", ResultCacheMode.REFRESH),
+        ("No-Store, no-cache", ResultCacheMode.BYPASS),
+    ],
+)
+def test_cache_control_mapping(header: str | None, expected: ResultCacheMode) -> None:
+    assert ResultCacheMode.from_cache_control(header) is expected
@@ -2,6 +2,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from coaching.src.application.ai_engine.response_serializer import ResponseSerializer
+from coaching.src.application.ai_engine.result_cache import LLMResultCache, ResultCacheMode
 from coaching.src.application.ai_engine.unified_ai_engine import (
     ParameterValidationError,
     PromptRenderError,
@@ -9,7 +10,7 @@ from coaching.src.application.ai_engine.unified_ai_engine import (
     UnifiedAIEngine,
     UnifiedAIEngineError,
 )
-from coaching.src.core.constants import CoachingTopic, MessageRole
+from coaching.src.core.constants import CoachingTopic, MessageRole, TierLevel
 from coaching.src.core.types import ConversationId, TenantId, UserId
 from coaching.src.domain.entities.conversation import Conversation
 from coaching.src.domain.entities.llm_topic import LLMTopic
@@ -145,6 +146,86 @@ async def test_execute_single_shot_success(
     )
 
 
+@pytest.mark.asyncio
+async def test_execute_single_shot_records_token_metrics(
+    engine,
+    mock_topic_repo,
+    mock_s3_storage,
+    mock_llm_provider,
+    mock_response_serializer,
+    sample_topic,
+):
+    mock_topic_repo.get.return_value = sample_topic
+    mock_s3_storage.get_prompt.side_effect = ["System prompt content", "User prompt content"]
+    mock_llm_provider.generate.return_value = LLMResponse(
+        content='{"result": "success"}',
+        model="gpt-4",
+        usage={"prompt_tokens": 7, "completion_tokens": 3, "total_tokens": 10},
+        finish_reason="stop",
+        provider="openai",
+    )
+    mock_response_serializer.serialize.return_value = SampleResponseModel(result="success")
+
+    with patch(
+        "coaching.src.application.ai_engine.unified_ai_engine.get_metrics"
+    ) as mock_get_metrics:
+        await engine.execute_single_shot(
+            topic_id="test_topic",
+            parameters={"param1": "value1"},
+            response_model=SampleResponseModel,
+            user_tier=TierLevel.PREMIUM,
+        )
+
+    mock_get_metrics.return_value.record_llm_tokens.assert_called_once_with(
+        model=sample_topic.get_model_code_for_tier(TierLevel.PREMIUM),
+        prompt_tokens=7,
+        completion_tokens=3,
+        total_tokens=10,
+        topic="test_topic",
+        tenant_tier=TierLevel.PREMIUM.value,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_single_shot_yields_tokens_then_result(
+    engine,
+    mock_topic_repo,
+    mock_s3_storage,
+    mock_llm_provider,
+    mock_response_serializer,
+    sample_topic,
+):
+    mock_topic_repo.get.return_value = sample_topic
+    mock_s3_storage.get_prompt.side_effect = ["System prompt content", "User prompt content"]
+
+    async def fake_stream(*_args, usage, **_kwargs):
+        for chunk in ['{"result": ', '"success"}']:
+            yield chunk
+        usage["total_tokens"] = 21
+
+    mock_llm_provider.generate_stream = fake_stream
+    expected_result = SampleResponseModel(result="success")
+    mock_response_serializer.serialize.return_value = expected_result
+
+    prepared = await engine.prepare_single_shot(
+        topic_id="test_topic",
+        parameters={"param1": "value1"},
+        response_model=SampleResponseModel,
+    )
+    usage: dict[str, int] = {}
+    items = [item async for item in engine.stream_single_shot(prepared, usage)]
+
+    assert items == ['{"result": ', '"success"}', expected_result]
+    assert usage == {"total_tokens": 21}
+    assert "User prompt content" in prepared.rendered_user_prompt
+    mock_response_serializer.serialize.assert_called_once_with(
+        ai_response='{"result": "success"}',
+        response_model=SampleResponseModel,
+        topic_id="test_topic",
+    )
+    mock_llm_provider.generate.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_execute_single_shot_topic_not_found(
     engine,
@@ -448,3 +529,144 @@ async def test_complete_conversation(
 
     # Assert
     mock_conversation_repo.save.assert_called_once_with(sample_conversation)
+
+
+def test_build_message_history_token_budget(engine, sample_conversation):
+    for i in range(4):
+        role = MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT
+        sample_conversation.add_message(role, f"{i}" * 40)  # 10 + 4 overhead tokens each
+
+    unbounded = engine._build_message_history(sample_conversation, "next")
+    budgeted = engine._build_message_history(sample_conversation, "next", max_history_tokens=30)
+
+    assert len(unbounded) == 5
+    assert [m.content[0] for m in budgeted] == ["2", "3", "n"]
+
+
+def test_build_message_history_uses_model_input_budget(engine, sample_conversation):
+    for i in range(6):
+        role = MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT
+        sample_conversation.add_message(role, f"{i}" * 4000)  # ~1000 tokens each
+
+    # CLAUDE_3_HAIKU: 200k context; reserving 197k output (+1k margin) leaves ~2k input
+    messages = engine._build_message_history(
+        sample_conversation,
+        "next",
+        model_code="CLAUDE_3_HAIKU",
+        max_output_tokens=197000,
+    )
+
+    assert [m.content[0] for m in messages] == ["5", "n"]
+
+
+@pytest.fixture
+def cached_engine(
+    mock_topic_repo,
+    mock_s3_storage,
+    mock_provider_factory,
+    mock_response_serializer,
+    mock_llm_provider,
+    sample_topic,
+):
+    sample_topic.additional_config = {"result_cache_enabled": True}
+    mock_topic_repo.get.return_value = sample_topic
+    mock_s3_storage.get_prompt.side_effect = lambda **kwargs: f"{kwargs['prompt_type']} prompt"
+    mock_llm_provider.generate.return_value = LLMResponse(
+        content='{"result": "success"}',
+        model="gpt-4",
+        usage={"total_tokens": 10},
+        finish_reason="stop",
+        provider="openai",
+    )
+    mock_response_serializer.serialize.return_value = SampleResponseModel(result="success")
+    return UnifiedAIEngine(
+        topic_repo=mock_topic_repo,
+        s3_storage=mock_s3_storage,
+        provider_factory=mock_provider_factory,
+        response_serializer=mock_response_serializer,
+        result_cache=LLMResultCache(),
+    )
+
+
+async def _run_cached(engine, tenant_id="tenant-1", cache_mode=ResultCacheMode.USE):
+    return await engine.execute_single_shot_debug(
+        topic_id="test_topic",
+        parameters={"param1": "value1"},
+        response_model=SampleResponseModel,
+        tenant_id=tenant_id,
+        cache_mode=cache_mode,
+    )
+
+
+@pytest.mark.asyncio
+async def test_result_cache_hit_skips_llm_and_serializer(
+    cached_engine, mock_llm_provider, mock_response_serializer
+):
+    first = await _run_cached(cached_engine)
+    second = await _run_cached(cached_engine)
+
+    assert not first.cache_hit
+    assert second.cache_hit
+    assert second.serialized_response == first.serialized_response
+    assert second.llm_response.usage == {"total_tokens": 10}
+    mock_llm_provider.generate.assert_called_once()
+    mock_response_serializer.serialize.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_result_cache_modes(cached_engine, mock_llm_provider):
+    await _run_cached(cached_engine, cache_mode=ResultCacheMode.BYPASS)
+    assert cached_engine.result_cache.get_stats()["size"] == 0
+
+    await _run_cached(cached_engine)
+    refreshed = await _run_cached(cached_engine, cache_mode=ResultCacheMode.REFRESH)
+
+    assert not refreshed.cache_hit
+    assert mock_llm_provider.generate.call_count == 3
+    assert cached_engine.result_cache.get_stats()["stores"] == 2
+
+
+@pytest.mark.asyncio
+async def test_result_cache_is_tenant_scoped(cached_engine, mock_llm_provider):
+    await _run_cached(cached_engine, tenant_id="tenant-1")
+    other = await _run_cached(cached_engine, tenant_id="tenant-2")
+
+    assert not other.cache_hit
+    assert mock_llm_provider.generate.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_result_cache_ignores_topics_that_did_not_opt_in(
+    cached_engine, sample_topic, mock_llm_provider
+):
+    sample_topic.additional_config = {}
+
+    await _run_cached(cached_engine)
+    second = await _run_cached(cached_engine)
+
+    assert not second.cache_hit
+    assert mock_llm_provider.generate.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_single_shot_replays_cached_result(cached_engine, mock_llm_provider):
+    mock_llm_provider.provider_name = "openai"
+
+    async def fake_stream(*_args, **_kwargs):
+        yield '{"result": "success"}'
+
+    mock_llm_provider.generate_stream = fake_stream
+
+    async def stream():
+        prepared = await cached_engine.prepare_single_shot(
+            topic_id="test_topic",
+            parameters={"param1": "value1"},
+            response_model=SampleResponseModel,
+            tenant_id="tenant-1",
+        )
+        return [item async for item in cached_engine.stream_single_shot(prepared)]
+
+    await stream()
+    replayed = await stream()
+
+    assert replayed == ['{"result":"success"}', SampleResponseModel(result="success")]
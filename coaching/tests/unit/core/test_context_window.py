@@ -0,0 +1,142 @@
+"""Unit tests for the context window builder."""
+
+from collections.abc import Sequence
+
+from coaching.src.core.context_window import SUMMARY_HEADING, ContextWindowBuilder
+from coaching.src.core.llm_models import MODEL_REGISTRY
+
+
+def _history(count: int, chars: int = 40) -> list[dict[str, str]]:
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"{i}" * chars}
+        for i in range(count)
+    ]
+
+
+class TestInputBudget:
+    """Tests for model-derived budgets."""
+
+    def test_budget_reserves_output_and_margin(self) -> None:
+        builder = ContextWindowBuilder(safety_margin_tokens=1000)
+        model = MODEL_REGISTRY["GPT_4O"]
+
+        assert builder.input_budget(model, 4000) == model.input_token_limit - 5000
+
+    def test_output_limited_models_use_context_window(self) -> None:
+        model = MODEL_REGISTRY["CLAUDE_3_SONNET"]
+
+        assert model.max_tokens == 4096
+        assert model.input_token_limit == 200000
+
+    def test_unknown_model_uses_default(self) -> None:
+        builder = ContextWindowBuilder(default_context_tokens=10000, safety_margin_tokens=0)
+
+        assert builder.input_budget(None, 2000) == 8000
+
+
+class TestBuild:
+    """Tests for packing history."""
+
+    def test_everything_fits(self) -> None:
+        builder = ContextWindowBuilder()
+        history = _history(4)
+
+        window = builder.build(
+            model=MODEL_REGISTRY["GPT_4O"],
+            system_prompt="You are a coach.",
+            history=history,
+            max_output_tokens=2000,
+            new_message="Hello",
+        )
+
+        assert window.history == history
+        assert window.dropped == 0
+        assert window.system_prompt == "You are a coach."
+        assert window.history_tokens == 4 * 14
+
+    def test_history_bound_keeps_newest(self) -> None:
+        builder = ContextWindowBuilder(max_history_tokens=30)
+
+        window = builder.build(
+            model=None, system_prompt=None, history=_history(5), max_output_tokens=0
+        )
+
+        assert [m["content"][0] for m in window.history] == ["3", "4"]
+        assert window.dropped == 3
+
+    def test_system_prompt_and_new_message_consume_budget(self) -> None:
+        builder = ContextWindowBuilder(default_context_tokens=100, safety_margin_tokens=0)
+
+        window = builder.build(
+            model=None,
+            system_prompt="s" * 120,  # 34 tokens with overhead
+            history=_history(5),
+            max_output_tokens=20,
+            new_message="n" * 16,  # 8 tokens with overhead
+        )
+
+        # 100 - 20 - 34 - 8 = 38 tokens of history -> two 14-token messages
+        assert len(window.history) == 2
+        assert window.input_tokens <= window.budget_tokens
+
+    def test_keep_last_keeps_oversized_latest_message(self) -> None:
+        builder = ContextWindowBuilder(max_history_tokens=10)
+
+        window = builder.build(
+            model=None,
+            system_prompt=None,
+            history=_history(3, chars=400),
+            max_output_tokens=0,
+            keep_last=True,
+        )
+
+        assert [m["content"][0] for m in window.history] == ["2"]
+
+    def test_cached_token_counts_are_used(self) -> None:
+        builder = ContextWindowBuilder(max_history_tokens=20, message_overhead_tokens=0)
+
+        window = builder.build(
+            model=None,
+            system_prompt=None,
+            history=_history(3),
+            max_output_tokens=0,
+            token_counts=[100, 15, 5],
+        )
+
+        assert [m["content"][0] for m in window.history] == ["1", "2"]
+
+    def test_summary_of_dropped_messages(self) -> None:
+        builder = ContextWindowBuilder(max_history_tokens=40)
+        summarized: list[int] = []
+
+        def summarize(dropped: Sequence[dict[str, str]]) -> str:
+            summarized.append(len(dropped))
+            return f"{len(dropped)} earlier messages"
+
+        window = builder.build(
+            model=None,
+            system_prompt="System",
+            history=_history(6),
+            max_output_tokens=0,
+            summarize=summarize,
+        )
+
+        # 40 tokens: 2 messages (28) leave room for the summary (~8 tokens)
+        assert window.dropped == 4
+        assert window.summary == "4 earlier messages"
+        assert window.system_prompt == f"System\n\n{SUMMARY_HEADING}\n4 earlier messages"
+        assert summarized == [4]
+
+    def test_summary_not_requested_when_nothing_dropped(self) -> None:
+        builder = ContextWindowBuilder()
+
+        window = builder.build(
+            model=None,
+            system_prompt="System",
+            history=_history(2),
+            max_output_tokens=0,
+            summarize=lambda _: "unused",
+        )
+
+        assert window.summary is None
+        assert window.system_prompt == "System"
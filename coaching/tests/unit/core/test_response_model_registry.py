@@ -0,0 +1,90 @@
+"""Unit tests for response schema artifacts in the response model registry."""
+
+import json
+
+import pytest
+from coaching.src.core.response_model_registry import (
+    RESPONSE_FORMAT_INSTRUCTIONS,
+    RESPONSE_MODEL_REGISTRY,
+    ResponseSchemaArtifacts,
+    clear_schema_artifacts,
+    get_response_schema,
+    get_schema_artifacts,
+)
+from pydantic import BaseModel, Field
+
+
+class _Item(BaseModel):
+    label: str = Field(..., description="Item label")
+    score: int = 0
+
+
+class _Report(BaseModel):
+    title: str = Field(..., alias="reportTitle", min_length=1)
+    items: list[_Item] = Field(default_factory=list)
+    primary: _Item | None = None
+
+
+@pytest.fixture(autouse=True)
+def _fresh_artifacts() -> None:
+    clear_schema_artifacts()
+
+
+class TestSchemaArtifacts:
+    """Tests for get_schema_artifacts."""
+
+    def test_artifacts_are_memoized_per_model(self) -> None:
+        first = get_schema_artifacts(_Report)
+        second = get_schema_artifacts(_Report)
+
+        assert isinstance(first, ResponseSchemaArtifacts)
+        assert first is second
+        assert get_schema_artifacts(_Item) is not first
+
+    def test_accessors_return_independent_copies(self) -> None:
+        artifacts = get_schema_artifacts(_Report)
+
+        schema = artifacts.json_schema()
+        schema["properties"].clear()
+        strict = artifacts.strict_schema()
+        strict["additionalProperties"] = True
+
+        assert artifacts.json_schema()["properties"]
+        assert artifacts.strict_schema()["additionalProperties"] is False
+
+    def test_json_schema_matches_pydantic(self) -> None:
+        artifacts = get_schema_artifacts(_Report)
+
+        assert artifacts.json_schema() == _Report.model_json_schema(by_alias=True)
+        assert "reportTitle" in artifacts.json_schema()["properties"]
+
+    def test_strict_schema_closes_nested_objects(self) -> None:
+        strict = get_schema_artifacts(_Report).strict_schema()
+
+        assert strict["additionalProperties"] is False
+        assert strict["title"] == "_Report"
+        item_def = strict["$defs"]["_Item"]
+        assert item_def["additionalProperties"] is False
+        assert item_def["required"] == ["label", "score"]
+
+    def test_format_instructions_embed_prompt_schema(self) -> None:
+        artifacts = get_schema_artifacts(_Report)
+
+        assert artifacts.format_instructions == RESPONSE_FORMAT_INSTRUCTIONS.format(
+            schema=artifacts.prompt_schema_json
+        )
+        prompt_schema = json.loads(artifacts.prompt_schema_json)
+        assert "$defs" not in prompt_schema
+        assert prompt_schema["properties"]["items"]["items"]["properties"]["label"] == {
+            "type": "string",
+            "description": "Item label",
+        }
+
+    @pytest.mark.parametrize("model_name", sorted(RESPONSE_MODEL_REGISTRY))
+    def test_registered_models_build_artifacts(self, model_name: str) -> None:
+        model = RESPONSE_MODEL_REGISTRY[model_name]
+        artifacts = get_schema_artifacts(model)
+
+        assert artifacts.model_name == model.__name__
+        assert get_response_schema(model_name) == artifacts.json_schema()
+        json.loads(artifacts.strict_schema_text)
@@ -0,0 +1,163 @@
+"""Unit tests for the compiled prompt-template engine."""
+
+import re
+
+import pytest
+from coaching.src.core.template_compiler import (
+    LENIENT_PLACEHOLDER_PATTERN,
+    TemplateCache,
+    compile_template,
+    parse_template,
+    render_template,
+)
+from coaching.src.core.topic_seed_data import list_all_seed_data
+
+
+def _legacy_substitute(template: str, params: dict[str, str]) -> str:
+    """Previous per-parameter replace/regex implementation, used as the reference."""
+    result = template
+    for name, value in params.items():
+        result = result.replace(f"{{{{{name}}}}}", value)
+    for name, value in params.items():
+        pattern = r"(?<!\{)\{" + re.escape(name) + r"\}(?!\})"
+        result = re.sub(pattern, value.replace("\\", "\\\\"), result)
+    return result
+
+
+def _legacy_session_substitute(template: str, params: dict[str, str]) -> str:
+    """Previous CoachingSessionService._render_template, the reference for lenient mode."""
+    result = template
+    for key, value in params.items():
+        result = result.replace(f"{{{{{key}}}}}", value)
+    for key, value in params.items():
+        result = re.sub(rf"\{{{key}\}}", value, result)
+    return result
+
+
+def _seeded_templates() -> list[str]:
+    templates: list[str] = []
+    for seed in list_all_seed_data():
+        templates.extend(t for t in (seed.default_system_prompt, seed.default_user_prompt) if t)
+    return templates
+
+
+class TestParseTemplate:
+    """Tests for parsing templates into segments."""
+
+    def test_parses_both_brace_styles(self) -> None:
+        """Test double and single brace placeholders are both recognized."""
+        compiled = parse_template("Hi {{name}}, welcome to {company}!")
+
+        assert compiled.literals == ("Hi ", ", welcome to ", "!")
+        assert [p.name for p in compiled.placeholders] == ["name", "company"]
+        assert compiled.parameter_names == frozenset({"name", "company"})
+
+    def test_ignores_non_placeholders(self) -> None:
+        """Test JSON braces and invalid names are treated as literal text."""
+        compiled = parse_template('Return {"key": 1} or {{ spaced }} or {1abc}')
+
+        assert compiled.placeholders == ()
+        assert compiled.literals == ('Return {"key": 1} or {{ spaced }} or {1abc}',)
+
+    def test_template_without_placeholders(self) -> None:
+        """Test a plain template renders unchanged."""
+        assert parse_template("No params here").render({"x": "1"}) == "No params here"
+
+
+class TestRender:
+    """Tests for rendering compiled templates."""
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "Hello {{name}}!",
+            "Hello {name}!",
+            "{{a}}{{b}}{a}{b}",
+            "Keep {{missing}} and {missing}",
+            "Nested {{{name}}} braces",
+            "Half {{name} and {name}} braces",
+            "Path C:\\{name}\\dir",
+            "Repeated {{name}} {{name}} {name}",
+        ],
+    )
+    def test_matches_legacy_substitution(self, template: str) -> None:
+        """Test rendering matches the previous substitution for typical templates."""
+        params = {"name": "Ada", "a": "1", "b": "2", "unused": "x"}
+
+        assert compile_template(template).render(params) == _legacy_substitute(template, params)
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "Hello {{name}} and {name}!",
+            "Nested {{{name}}} braces",
+            "Half {{name} and {name}} braces",
+            "Keep {{missing}} and {missing}}",
+            'JSON {"a": {a}}',
+        ],
+    )
+    def test_lenient_matches_legacy_session_substitution(self, template: str) -> None:
+        """Test lenient mode substitutes {name} next to other braces, as the session renderer did."""
+        params = {"name": "Ada", "a": "1"}
+
+        rendered = compile_template(template, lenient=True).render(params)
+
+        assert rendered == _legacy_session_substitute(template, params)
+
+    @pytest.mark.parametrize("template", _seeded_templates())
+    def test_seeded_templates_render_as_before(self, template: str) -> None:
+        """Test every seeded prompt renders exactly as the previous implementations did."""
+        names = {a or b for a, b in LENIENT_PLACEHOLDER_PATTERN.findall(template)}
+        params = {name: f"<{name} value>" for name in names}
+
+        assert compile_template(template).render(params) == _legacy_substitute(template, params)
+        assert compile_template(template, lenient=True).render(
+            params
+        ) == _legacy_session_substitute(template, params)
+
+    def test_values_are_inserted_verbatim(self) -> None:
+        """Test backslashes and placeholder-like text in values are not interpreted."""
+        rendered = render_template("{{a}} / {{b}}", {"a": "\\1 {{b}}", "b": "B"})
+
+        assert rendered == "\\1 {{b}} / B"
+
+
+class TestTemplateCache:
+    """Tests for the content-hash template cache."""
+
+    def test_same_content_is_parsed_once(self) -> None:
+        """Test equal template text hits the cache even for different string objects."""
+        cache = TemplateCache()
+        text = "Hello {{name}}"
+
+        first = cache.compile(text)
+        second = cache.compile("".join(["Hello ", "{{name}}"]))
+
+        assert first is second
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_lenient_parse_is_cached_separately(self) -> None:
+        """Test the same text compiled in both modes keeps two parses."""
+        cache = TemplateCache()
+
+        strict = cache.compile("{name}}")
+        lenient = cache.compile("{name}}", lenient=True)
+
+        assert strict.parameter_names == frozenset()
+        assert lenient.parameter_names == frozenset({"name"})
+        assert len(cache) == 2
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the cache stays within its size limit."""
+        cache = TemplateCache(max_entries=2)
+        a = cache.compile("{{a}}")
+        cache.compile("{{b}}")
+        cache.compile("{{a}}")  # refresh a
+        cache.compile("{{c}}")  # evicts b
+
+        assert len(cache) == 2
+        assert cache.compile("{{a}}") is a
+        misses = cache.misses
+        cache.compile("{{b}}")
+        assert cache.misses == misses + 1
@@ -0,0 +1,48 @@
+"""Unit tests for token budgeting helpers."""
+
+import pytest
+from coaching.src.core.token_budget import (
+    estimate_tokens,
+    find_cut_index,
+    prefix_sums,
+    select_recent_within_budget,
+)
+
+
+class TestTokenBudget:
+    """Tests for prefix-sum cut point selection."""
+
+    def test_estimate_tokens(self) -> None:
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcdefgh") == 2
+
+    def test_prefix_sums(self) -> None:
+        assert prefix_sums([3, 1, 2]) == [0, 3, 4, 6]
+
+    @pytest.mark.parametrize(
+        ("counts", "budget", "expected"),
+        [
+            ([5, 5, 5], 15, 0),
+            ([5, 5, 5], 14, 1),
+            ([5, 5, 5], 10, 1),
+            ([5, 5, 5], 9, 2),
+            ([5, 5, 5], 0, 3),
+            ([1, 0, 0, 7], 7, 1),
+        ],
+    )
+    def test_find_cut_index(self, counts: list[int], budget: int, expected: int) -> None:
+        assert find_cut_index(prefix_sums(counts), budget) == expected
+
+    @pytest.mark.parametrize("budget", range(0, 40))
+    def test_cut_matches_linear_scan(self, budget: int) -> None:
+        counts = [4, 9, 1, 0, 6, 3, 8]
+        expected = next(
+            (i for i in range(len(counts) + 1) if sum(counts[i:]) <= budget), len(counts)
+        )
+
+        assert find_cut_index(prefix_sums(counts), budget) == expected
+
+    def test_select_recent_keeps_last_message(self) -> None:
+        assert select_recent_within_budget([5, 50], 10) == 1
+        assert select_recent_within_budget([5, 50], 10, keep_last=False) == 2
+        assert select_recent_within_budget([], 10) == 0
@@ -364,6 +364,36 @@ class TestCoachingSessionLLMFormatting:
         # Should be the last 10 messages
         assert "34" in messages[-1]["content"]  # Last message index
 
+    def test_get_messages_for_llm_token_budget(self) -> None:
+        """Test that a token budget drops the oldest messages first."""
+        session = CoachingSession.create(
+            tenant_id="tenant_123",
+            topic_id="core_values",
+            user_id="user_456",
+        )
+        for i in range(6):
+            if i % 2 == 0:
+                session.add_user_message(f"{i}" * 40)  # 10 estimated tokens
+            else:
+                session.add_assistant_message(f"{i}" * 40)
+
+        messages = session.get_messages_for_llm(max_tokens=35)
+
+        assert [m["content"][0] for m in messages] == ["3", "4", "5"]
+
+    def test_get_messages_for_llm_token_budget_keeps_latest(self) -> None:
+        """Test that the most recent message is kept even if it exceeds the budget."""
+        session = CoachingSession.create(
+            tenant_id="tenant_123",
+            topic_id="core_values",
+            user_id="user_456",
+        )
+        session.add_user_message("x" * 400)
+
+        messages = session.get_messages_for_llm(max_tokens=10)
+
+        assert len(messages) == 1
+
 
 class TestCoachingSessionCompletionEstimate:
     """Tests for completion estimation."""
@@ -0,0 +1,157 @@
+"""Unit tests for the tenant-scoped Business API response cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from coaching.src.infrastructure.external.business_api_cache import BusinessApiCache
+from coaching.src.infrastructure.external.business_api_client import BusinessApiClient
+
+
+@pytest.mark.asyncio
+class TestBusinessApiCache:
+    """Tests for BusinessApiCache."""
+
+    async def test_hit_returns_cached_copy(self) -> None:
+        """Second call is served from cache and callers get independent copies."""
+        cache = BusinessApiCache()
+        fetch = AsyncMock(return_value={"goals": [1, 2]})
+
+        first = await cache.get_or_fetch(tenant_id="t1", endpoint="user_goals", fetch=fetch)
+        first["goals"].append(3)
+        second = await cache.get_or_fetch(tenant_id="t1", endpoint="user_goals", fetch=fetch)
+
+        assert second == {"goals": [1, 2]}
+        assert fetch.await_count == 1
+        assert cache.get_stats()["hits"] == 1
+
+    async def test_keys_are_tenant_scoped(self) -> None:
+        """Different tenants never share entries."""
+        cache = BusinessApiCache()
+        fetch = AsyncMock(side_effect=[{"t": 1}, {"t": 2}])
+
+        a = await cache.get_or_fetch(tenant_id="t1", endpoint="roles", fetch=fetch)
+        b = await cache.get_or_fetch(tenant_id="t2", endpoint="roles", fetch=fetch)
+
+        assert (a, b) == ({"t": 1}, {"t": 2})
+
+    async def test_expired_entry_is_refetched(self) -> None:
+        """Entries past their endpoint TTL are fetched again."""
+        cache = BusinessApiCache(endpoint_ttls={"roles": 0.0})
+        fetch = AsyncMock(return_value=[])
+
+        await cache.get_or_fetch(tenant_id="t1", endpoint="roles", fetch=fetch)
+        await cache.get_or_fetch(tenant_id="t1", endpoint="roles", fetch=fetch)
+
+        assert fetch.await_count == 2
+
+    async def test_concurrent_fetches_are_coalesced(self) -> None:
+        """Concurrent misses for the same key issue one request."""
+        cache = BusinessApiCache()
+        calls = 0
+        release = asyncio.Event()
+
+        async def fetch() -> dict[str, int]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"n": 1}
+
+        tasks = [
+            asyncio.create_task(cache.get_or_fetch(tenant_id="t1", endpoint="people", fetch=fetch))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert results == [{"n": 1}] * 5
+        assert cache.get_stats()["coalesced"] == 4
+
+    async def test_errors_are_not_cached(self) -> None:
+        """A failed fetch is retried on the next call."""
+        cache = BusinessApiCache()
+        fetch = AsyncMock(side_effect=[RuntimeError("boom"), {"ok": True}])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch(tenant_id="t1", endpoint="roles", fetch=fetch)
+        result = await cache.get_or_fetch(tenant_id="t1", endpoint="roles", fetch=fetch)
+
+        assert result == {"ok": True}
+
+    async def test_invalidate_by_endpoint_and_user(self) -> None:
+        """Invalidation can target endpoints and users within a tenant."""
+        cache = BusinessApiCache()
+        fetch = AsyncMock(return_value={})
+        await cache.get_or_fetch(tenant_id="t1", endpoint="user_goals", fetch=fetch, user_id="u1")
+        await cache.get_or_fetch(tenant_id="t1", endpoint="user_goals", fetch=fetch, user_id="u2")
+        await cache.get_or_fetch(tenant_id="t1", endpoint="roles", fetch=fetch)
+        await cache.get_or_fetch(tenant_id="t2", endpoint="roles", fetch=fetch)
+
+        assert cache.invalidate("t1", endpoints=["user_goals"], user_id="u1") == 1
+        assert cache.invalidate("t1") == 2
+        assert cache.get_stats()["size"] == 1
+
+    async def test_inflight_fetch_not_stored_after_invalidation(self) -> None:
+        """Data fetched before an invalidation is not cached."""
+        cache = BusinessApiCache()
+        release = asyncio.Event()
+
+        async def slow_fetch() -> dict[str, str]:
+            await release.wait()
+            return {"v": "stale"}
+
+        task = asyncio.create_task(
+            cache.get_or_fetch(tenant_id="t1", endpoint="roles", fetch=slow_fetch)
+        )
+        await asyncio.sleep(0)
+        cache.invalidate("t1")
+        release.set()
+        assert await task == {"v": "stale"}
+
+        assert cache.get_stats()["size"] == 0
+
+    async def test_lru_eviction(self) -> None:
+        """Oldest entries are evicted beyond max_entries."""
+        cache = BusinessApiCache(max_entries=2)
+        fetch = AsyncMock(return_value={})
+        for tenant in ("t1", "t2", "t3"):
+            await cache.get_or_fetch(tenant_id=tenant, endpoint="roles", fetch=fetch)
+
+        assert cache.get_stats()["size"] == 2
+
+
+@pytest.mark.asyncio
+class TestBusinessApiClientCaching:
+    """Tests for the cache integration on BusinessApiClient read methods."""
+
+    @staticmethod
+    def _client(cache: BusinessApiCache | None) -> tuple[BusinessApiClient, AsyncMock]:
+        http = AsyncMock()
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"data": {"profile": {}}}
+        response.raise_for_status = Mock()
+        http.get = AsyncMock(return_value=response)
+        client = BusinessApiClient(base_url="https://api.test.com", jwt_token="t", cache=cache)
+        client.client = http
+        return client, http
+
+    async def test_cached_method_fetches_once(self) -> None:
+        """Repeated calls for the same tenant hit the API once."""
+        client, http = self._client(BusinessApiCache())
+
+        await client.get_business_foundation("tenant-1")
+        await client.get_business_foundation(tenant_id="tenant-1")
+
+        assert http.get.await_count == 1
+
+    async def test_no_cache_calls_through(self) -> None:
+        """Without a cache every call reaches the API."""
+        client, http = self._client(None)
+
+        await client.get_business_foundation("tenant-1")
+        await client.get_business_foundation("tenant-1")
+
+        assert http.get.await_count == 2
@@ -0,0 +1,65 @@
+"""Unit tests for the shared HTTP client pool."""
+
+import pytest
+from coaching.src.infrastructure.external.business_api_client import BusinessApiClient
+from coaching.src.infrastructure.external.http_client_pool import (
+    close_shared_http_clients,
+    get_shared_http_client,
+    is_shared_http_client,
+)
+
+
+class TestSharedHttpClientPool:
+    """Tests for get_shared_http_client and close_shared_http_clients."""
+
+    @pytest.mark.asyncio
+    async def test_same_client_reused_for_same_base_url(self) -> None:
+        """Test repeated lookups return the same pooled client."""
+        first = get_shared_http_client(base_url="https://api.example.com/")
+        second = get_shared_http_client(base_url="https://api.example.com")
+
+        assert first is second
+        assert is_shared_http_client(first)
+        await close_shared_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_distinct_clients_per_configuration(self) -> None:
+        """Test different base URLs or timeouts get separate clients."""
+        a = get_shared_http_client(base_url="https://a.example.com")
+        b = get_shared_http_client(base_url="https://b.example.com")
+        c = get_shared_http_client(base_url="https://a.example.com", timeout=5)
+
+        assert len({id(a), id(b), id(c)}) == 3
+        assert await close_shared_http_clients() == 3
+        assert a.is_closed and b.is_closed and c.is_closed
+
+    def test_requires_running_loop(self) -> None:
+        """Test the pool is only available inside an event loop."""
+        with pytest.raises(RuntimeError):
+            get_shared_http_client(base_url="https://api.example.com")
+
+
+class TestBusinessApiClientPooling:
+    """Tests for BusinessApiClient use of the shared pool."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_connections_but_not_tokens(self) -> None:
+        """Test per-request clients share the pool while keeping their own JWT."""
+        alice = BusinessApiClient(base_url="https://api.example.com", jwt_token="alice")
+        bob = BusinessApiClient(base_url="https://api.example.com", jwt_token="bob")
+
+        assert alice.client is bob.client
+        assert alice._get_headers("t1")["Authorization"] == "Bearer alice"
+        assert bob._get_headers("t1")["Authorization"] == "Bearer bob"
+        await close_shared_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_shared_client_open(self) -> None:
+        """Test closing a per-request client does not close the pool."""
+        client = BusinessApiClient(base_url="https://api.example.com", jwt_token="t")
+        pooled = client.client
+
+        await client.close()
+
+        assert not pooled.is_closed
+        await close_shared_http_clients()
@@ -0,0 +1,251 @@
+"""Unit tests for hedged LLM requests."""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock
+
+import pytest
+from coaching.src.domain.ports.llm_provider_port import LLMMessage, LLMResponse
+from coaching.src.infrastructure.llm.hedging import (
+    HedgeBudget,
+    HedgedLLMProvider,
+    HedgePolicy,
+)
+from coaching.src.infrastructure.llm.routing import (
+    CircuitState,
+    FailoverLLMProvider,
+    LLMRouter,
+    ProviderRoute,
+)
+from shared.observability.metrics import (
+    EMFMetrics,
+    InMemoryMetricsSink,
+    flush_metrics,
+    set_metrics,
+)
+
+MESSAGES = [LLMMessage(role="user", content="Hi")]
+
+
+@pytest.fixture
+def sink() -> Iterator[InMemoryMetricsSink]:
+    sink = InMemoryMetricsSink()
+    set_metrics(EMFMetrics(sink=sink))
+    yield sink
+    set_metrics(None)
+
+
+def _route(name: str, delay: float = 0.0, error: Exception | None = None) -> ProviderRoute:
+    provider = AsyncMock()
+    provider.calls = []
+
+    async def generate(**kwargs: object) -> LLMResponse:
+        provider.calls.append(kwargs)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            provider.cancelled = True
+            raise
+        if error is not None:
+            raise error
+        return LLMResponse(
+            content=f"from {name}", model=name, usage={}, finish_reason="stop", provider="bedrock"
+        )
+
+    provider.generate.side_effect = generate
+    provider.cancelled = False
+    return ProviderRoute(provider, "bedrock", name.upper(), name)
+
+
+def _budget(credits: float = 10.0) -> HedgeBudget:
+    return HedgeBudget(ratio=credits, burst=credits)
+
+
+def _hedged(
+    primary: ProviderRoute,
+    hedge: ProviderRoute,
+    budget: HedgeBudget | None = None,
+    delay_ms: float = 10.0,
+) -> HedgedLLMProvider:
+    return HedgedLLMProvider(
+        primary,
+        hedge,
+        HedgePolicy(topic_id="alignment_check", delay_ms=delay_ms),
+        LLMRouter(),
+        budget or _budget(),
+        min_delay_ms=0.0,
+    )
+
+
+class TestHedgePolicy:
+    """Tests for per-topic configuration."""
+
+    def test_topics_opt_in(self) -> None:
+        assert HedgePolicy.from_config("t", {}) is None
+
+        policy = HedgePolicy.from_config(
+            "t", {"hedge_enabled": True, "hedge_model_code": "GPT_5_MINI"}
+        )
+
+        assert policy == HedgePolicy(topic_id="t", percentile=90.0, model_code="GPT_5_MINI")
+
+    def test_delay_follows_observed_percentile(self) -> None:
+        primary = _route("claude")
+        router = LLMRouter(min_latency_samples=10)
+        provider = HedgedLLMProvider(
+            primary, primary, HedgePolicy(topic_id="t"), router, _budget(), default_delay_ms=2500
+        )
+        assert provider.hedge_delay_seconds() == 2.5
+
+        for latency in range(1, 101):
+            router.latency(primary.key).add(latency * 10.0)
+
+        assert provider.hedge_delay_seconds() == pytest.approx(0.9)
+
+
+class TestHedgeBudget:
+    """Tests for the extra-spend cap."""
+
+    def test_hedges_are_earned_per_request(self) -> None:
+        budget = HedgeBudget(ratio=0.25, burst=1.0)
+
+        spent = []
+        for _ in range(8):
+            budget.earn()
+            spent.append(budget.try_spend())
+
+        assert spent.count(True) == 2
+
+
+class TestHedgedProvider:
+    """Tests for racing the primary and the hedge."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self, sink: InMemoryMetricsSink) -> None:
+        primary, hedge = _route("claude"), _route("gpt")
+        provider = _hedged(primary, hedge, delay_ms=1000)
+
+        response = await provider.generate(MESSAGES, model="claude")
+
+        assert response.content == "from claude"
+        assert response.metadata["hedge"] == {"fired": False}
+        assert hedge.provider.calls == []
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_loses_to_hedge_and_is_cancelled(
+        self, sink: InMemoryMetricsSink
+    ) -> None:
+        primary, hedge = _route("claude", delay=5.0), _route("gpt")
+        provider = _hedged(primary, hedge)
+
+        response = await provider.generate(MESSAGES, model="claude")
+        flush_metrics()
+
+        assert response.content == "from gpt"
+        assert response.metadata["hedge"]["won"] is True
+        assert hedge.provider.calls[0]["model"] == "gpt"
+        assert primary.provider.cancelled is True
+        assert provider.stats.win_rate == 1.0
+        assert sink.values("LLM_HedgeFired", Topic="alignment_check") == [1.0]
+        assert sink.values("LLM_HedgeWon", Topic="alignment_check") == [1.0]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_primary_is_sampled_at_its_elapsed_time(
+        self, sink: InMemoryMetricsSink
+    ) -> None:
+        """A losing primary still feeds the window the hedge delay comes from."""
+        primary, hedge = _route("claude", delay=5.0), _route("gpt", delay=0.05)
+        router = LLMRouter()
+        provider = HedgedLLMProvider(
+            primary,
+            hedge,
+            HedgePolicy(topic_id="alignment_check", delay_ms=10.0),
+            router,
+            _budget(),
+            min_delay_ms=0.0,
+            record_primary_latency=False,
+        )
+
+        await provider.generate(MESSAGES, model="claude")
+
+        window = router.latency(primary.key)
+        assert len(window) == 1
+        assert window.percentile(100) >= 60.0
+
+    @pytest.mark.asyncio
+    async def test_primary_can_still_win_after_hedging(self, sink: InMemoryMetricsSink) -> None:
+        primary, hedge = _route("claude", delay=0.05), _route("gpt", delay=5.0)
+        provider = _hedged(primary, hedge)
+
+        response = await provider.generate(MESSAGES, model="claude")
+
+        assert response.content == "from claude"
+        assert response.metadata["hedge"]["won"] is False
+        assert hedge.provider.cancelled is True
+        assert provider.stats.fired == 1
+        assert provider.stats.won == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_falls_back_to_primary(self, sink: InMemoryMetricsSink) -> None:
+        primary = _route("claude", delay=0.05)
+        hedge = _route("gpt", error=ConnectionError("down"))
+        provider = _hedged(primary, hedge)
+
+        response = await provider.generate(MESSAGES, model="claude")
+
+        assert response.content == "from claude"
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_waits_for_primary(self, sink: InMemoryMetricsSink) -> None:
+        primary, hedge = _route("claude", delay=0.05), _route("gpt")
+        provider = _hedged(primary, hedge, budget=HedgeBudget(ratio=0.0))
+
+        response = await provider.generate(MESSAGES, model="claude")
+
+        assert response.content == "from claude"
+        assert response.metadata["hedge"]["budget_exhausted"] is True
+        assert hedge.provider.calls == []
+        assert provider.stats.budget_exhausted == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_failover_loser_releases_its_trial(
+        self, sink: InMemoryMetricsSink
+    ) -> None:
+        now = [1000.0]
+        router = LLMRouter(failure_threshold=1, recovery_seconds=10, clock=lambda: now[0])
+        claude = _route("claude", delay=5.0)
+        router.record_failure(claude)
+        now[0] += 10
+        # The primary is a failover chain whose only route is on a half-open trial
+        primary = ProviderRoute(
+            FailoverLLMProvider([claude], router), "bedrock", "CLAUDE", "claude"
+        )
+        provider = HedgedLLMProvider(
+            primary,
+            _route("gpt"),
+            HedgePolicy(topic_id="alignment_check", delay_ms=10.0),
+            router,
+            _budget(),
+            min_delay_ms=0.0,
+            record_primary_latency=False,
+        )
+
+        response = await provider.generate(MESSAGES, model="claude")
+
+        assert response.content == "from gpt"
+        assert claude.provider.cancelled is True
+        assert router.breaker(claude.key).can_attempt()
+
+        # The route recovers on its next call instead of being skipped forever
+        claude.provider.generate.side_effect = None
+        claude.provider.generate.return_value = LLMResponse(
+            content="from claude",
+            model="claude",
+            usage={},
+            finish_reason="stop",
+            provider="bedrock",
+        )
+        recovered = await provider.generate(MESSAGES, model="claude")
+
+        assert recovered.content == "from claude"
+        assert router.breaker(claude.key).state is CircuitState.CLOSED
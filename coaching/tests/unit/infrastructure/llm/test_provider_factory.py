@@ -14,10 +14,12 @@ from coaching.src.infrastructure.llm.exceptions import (
     ModelNotFoundError,
     ProviderNotConfiguredError,
 )
+from coaching.src.infrastructure.llm.hedging import HedgedLLMProvider, HedgePolicy
 from coaching.src.infrastructure.llm.provider_factory import (
     LLMProviderFactory,
     get_provider_factory,
 )
+from coaching.src.infrastructure.llm.routing import FailoverLLMProvider, LLMRouter
 
 
 @pytest.fixture
@@ -162,6 +164,71 @@ class TestGetProviderForModel:
         assert "OPENAI_API_KEY" in exc_info.value.missing_config
 
 
+class TestFailoverRouting:
+    """Test fallback model chains."""
+
+    @patch("coaching.src.infrastructure.llm.provider_factory.get_openai_api_key")
+    def test_fallbacks_wrap_provider_in_failover(
+        self,
+        mock_get_api_key: MagicMock,
+        factory: LLMProviderFactory,
+        mock_settings: MagicMock,
+    ) -> None:
+        """Test configured fallbacks produce a failover provider sharing one router."""
+        mock_get_api_key.return_value = "sk-test-key"
+        mock_settings.llm_failover_enabled = True
+        factory._router = LLMRouter()
+
+        provider, model_name = factory.get_provider_for_model(
+            "CLAUDE_3_5_HAIKU", fallback_model_codes=["GPT_5_MINI", "CLAUDE_3_5_HAIKU"]
+        )
+
+        assert isinstance(provider, FailoverLLMProvider)
+        assert model_name == MODEL_REGISTRY["CLAUDE_3_5_HAIKU"].model_name
+        assert [r.model_code for r in provider.routes] == ["CLAUDE_3_5_HAIKU", "GPT_5_MINI"]
+        assert provider.router is factory.router
+
+    @patch("coaching.src.infrastructure.llm.provider_factory.get_openai_api_key")
+    def test_unusable_fallbacks_are_skipped(
+        self,
+        mock_get_api_key: MagicMock,
+        factory: LLMProviderFactory,
+        mock_settings: MagicMock,
+    ) -> None:
+        """Test unconfigured or unknown fallbacks leave the plain provider."""
+        mock_get_api_key.return_value = None
+        mock_settings.llm_failover_enabled = True
+
+        provider, _ = factory.get_provider_for_model(
+            "CLAUDE_3_5_HAIKU", fallback_model_codes=["GPT_5_MINI", "NOT_A_MODEL"]
+        )
+
+        assert provider.provider_name == "bedrock"
+        assert not isinstance(provider, FailoverLLMProvider)
+
+    def test_hedge_policy_wraps_provider(
+        self,
+        factory: LLMProviderFactory,
+        mock_settings: MagicMock,
+    ) -> None:
+        """Test a hedge policy yields a hedged provider with shared per-topic stats."""
+        mock_settings.llm_hedging_enabled = True
+        mock_settings.llm_hedge_budget_ratio = 0.1
+        mock_settings.llm_hedge_budget_burst = 10.0
+        mock_settings.llm_hedge_default_delay_ms = 3000.0
+        mock_settings.llm_hedge_min_delay_ms = 100.0
+        factory._router = LLMRouter()
+        policy = HedgePolicy(topic_id="alignment_check", model_code="CLAUDE_3_5_SONNET_V2")
+
+        first, _ = factory.get_provider_for_model("CLAUDE_3_5_HAIKU", hedge_policy=policy)
+        second, _ = factory.get_provider_for_model("CLAUDE_3_5_HAIKU", hedge_policy=policy)
+
+        assert isinstance(first, HedgedLLMProvider)
+        assert first.hedge.model_code == "CLAUDE_3_5_SONNET_V2"
+        assert first.budget is second.budget
+        assert factory.get_hedge_stats()["alignment_check"] is second.stats
+
+
 class TestGetModelInfo:
     """Test get_model_info method."""
 
@@ -0,0 +1,266 @@
+"""Unit tests for LLM failover routing and circuit breakers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from coaching.src.domain.ports.llm_provider_port import LLMMessage, LLMResponse
+from coaching.src.infrastructure.llm.routing import (
+    AllRoutesFailedError,
+    CircuitBreaker,
+    CircuitState,
+    FailoverLLMProvider,
+    LatencyWindow,
+    LLMRouter,
+    ProviderRoute,
+)
+
+MESSAGES = [LLMMessage(role="user", content="Hi")]
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _route(provider_type: str, model_code: str, provider: object | None = None) -> ProviderRoute:
+    if provider is None:
+        provider = AsyncMock()
+        provider.generate.return_value = LLMResponse(
+            content=f"from {provider_type}",
+            model=model_code.lower(),
+            usage={},
+            finish_reason="stop",
+            provider=provider_type,
+        )
+    return ProviderRoute(provider, provider_type, model_code, model_code.lower())
+
+
+class TestCircuitBreaker:
+    """Tests for breaker state transitions."""
+
+    def test_opens_after_threshold_and_half_opens_after_recovery(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+        clock.now += 10
+        assert breaker.allow_request()
+        # Only one trial call while half-open
+        assert not breaker.allow_request()
+
+    def test_failed_trial_reopens_and_success_closes(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=10, clock=clock)
+        breaker.record_failure()
+
+        clock.now += 10
+        breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+        clock.now += 10
+        breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+
+class TestLatencyRouting:
+    """Tests for p95 tracking and route ordering."""
+
+    def test_p95_uses_nearest_rank(self) -> None:
+        window = LatencyWindow(size=100)
+        for value in range(1, 101):
+            window.add(float(value))
+
+        assert window.p95() == 95.0
+
+    def test_window_keeps_recent_samples(self) -> None:
+        window = LatencyWindow(size=3)
+        for value in (900.0, 10.0, 20.0, 30.0):
+            window.add(value)
+
+        assert window.p95() == 30.0
+
+    def test_routes_ordered_by_measured_p95(self) -> None:
+        router = LLMRouter(min_latency_samples=2)
+        bedrock, openai, vertex = (
+            _route("bedrock", "CLAUDE_3_5_HAIKU"),
+            _route("openai", "GPT_5_MINI"),
+            _route("google_vertex", "GEMINI_2_5_FLASH"),
+        )
+        for _ in range(2):
+            router.record_success(bedrock, 3000)
+            router.record_success(vertex, 800)
+        # One sample is not enough to rank a route
+        router.record_success(openai, 10)
+
+        ordered = router.order([bedrock, openai, vertex])
+
+        assert [r.provider_type for r in ordered] == ["google_vertex", "bedrock", "openai"]
+
+
+class TestFailoverProvider:
+    """Tests for failover across routes."""
+
+    @pytest.mark.asyncio
+    async def test_fails_over_and_records_route(self) -> None:
+        primary = _route("bedrock", "CLAUDE_3_5_HAIKU")
+        primary.provider.generate.side_effect = RuntimeError("ThrottlingException")
+        fallback = _route("openai", "GPT_5_MINI")
+        provider = FailoverLLMProvider([primary, fallback], LLMRouter())
+
+        response = await provider.generate(MESSAGES, model=primary.model_name)
+
+        assert response.content == "from openai"
+        fallback.provider.generate.assert_awaited_once()
+        assert fallback.provider.generate.call_args.kwargs["model"] == "gpt_5_mini"
+        routing = response.metadata["routing"]
+        assert routing["provider"] == "openai"
+        assert routing["failover"] is True
+        assert routing["attempts"] == [
+            {
+                "provider": "bedrock",
+                "model_code": "CLAUDE_3_5_HAIKU",
+                "error": "RuntimeError",
+                "skipped": False,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_route(self) -> None:
+        router = LLMRouter(failure_threshold=1)
+        primary = _route("bedrock", "CLAUDE_3_5_HAIKU")
+        fallback = _route("openai", "GPT_5_MINI")
+        router.record_failure(primary)
+        provider = FailoverLLMProvider([primary, fallback], router)
+
+        response = await provider.generate(MESSAGES, model=primary.model_name)
+
+        primary.provider.generate.assert_not_awaited()
+        assert response.metadata["routing"]["failover"] is False
+        assert response.metadata["routing"]["attempts"][0]["skipped"] is True
+
+    @pytest.mark.asyncio
+    async def test_slow_route_times_out_to_next(self) -> None:
+        async def slow(**_kwargs: object) -> LLMResponse:
+            await asyncio.sleep(1)
+            raise AssertionError("should have timed out")
+
+        primary = _route("openai", "GPT_5_MINI")
+        primary.provider.generate.side_effect = slow
+        fallback = _route("bedrock", "CLAUDE_3_5_HAIKU")
+        provider = FailoverLLMProvider([primary, fallback], LLMRouter(attempt_timeout_seconds=0.01))
+
+        response = await provider.generate(MESSAGES, model=primary.model_name)
+
+        assert response.provider == "bedrock"
+        assert response.metadata["routing"]["attempts"][0]["error"] == "timeout"
+
+    @pytest.mark.asyncio
+    async def test_caller_errors_are_not_failed_over(self) -> None:
+        router = LLMRouter(failure_threshold=1)
+        primary = _route("bedrock", "CLAUDE_3_5_HAIKU")
+        primary.provider.generate.side_effect = ValueError("Temperature must be between")
+        fallback = _route("openai", "GPT_5_MINI")
+        provider = FailoverLLMProvider([primary, fallback], router)
+
+        with pytest.raises(ValueError):
+            await provider.generate(MESSAGES, model=primary.model_name)
+
+        fallback.provider.generate.assert_not_awaited()
+        assert router.breaker(primary.key).state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_all_routes_failing_raises(self) -> None:
+        routes = [_route("bedrock", "CLAUDE_3_5_HAIKU"), _route("openai", "GPT_5_MINI")]
+        for route in routes:
+            route.provider.generate.side_effect = ConnectionError("down")
+        provider = FailoverLLMProvider(routes, LLMRouter())
+
+        with pytest.raises(AllRoutesFailedError) as exc_info:
+            await provider.generate(MESSAGES, model="ignored")
+
+        assert len(exc_info.value.attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_fails_over_before_first_token(self) -> None:
+        async def broken(**_kwargs: object):  # type: ignore[no-untyped-def]
+            raise RuntimeError("ServiceUnavailable")
+            yield ""  # pragma: no cover
+
+        async def working(**_kwargs: object):  # type: ignore[no-untyped-def]
+            for chunk in ("a", "b"):
+                yield chunk
+
+        primary = _route("bedrock", "CLAUDE_3_5_HAIKU", MagicMock(generate_stream=broken))
+        fallback = _route("openai", "GPT_5_MINI", MagicMock(generate_stream=working))
+        provider = FailoverLLMProvider([primary, fallback], LLMRouter())
+
+        chunks = [c async for c in provider.generate_stream(MESSAGES, model="ignored")]
+
+        assert chunks == ["a", "b"]
+        assert provider.router.get_stats()["bedrock/CLAUDE_3_5_HAIKU"]["samples"] == 0
+
+    @pytest.mark.asyncio
+    async def test_half_open_route_skipped_then_recovers(self) -> None:
+        clock = FakeClock()
+        router = LLMRouter(
+            failure_threshold=1, recovery_seconds=10, min_latency_samples=1, clock=clock
+        )
+        primary = _route("bedrock", "CLAUDE_3_5_HAIKU")
+        fallback = _route("openai", "GPT_5_MINI")
+        # The measured fallback is ordered ahead of the half-open primary
+        router.record_success(fallback, 100)
+        router.record_failure(primary)
+        clock.now += 10
+        provider = FailoverLLMProvider([primary, fallback], router)
+
+        first = await provider.generate(MESSAGES, model=primary.model_name)
+
+        assert first.provider == "openai"
+        primary.provider.generate.assert_not_awaited()
+        # The unused route must not hold on to its half-open trial
+        assert router.breaker(primary.key).can_attempt()
+
+        fallback.provider.generate.side_effect = ConnectionError("down")
+        second = await provider.generate(MESSAGES, model=primary.model_name)
+
+        assert second.provider == "bedrock"
+        assert router.breaker(primary.key).state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_is_released(self) -> None:
+        clock = FakeClock()
+        router = LLMRouter(failure_threshold=1, recovery_seconds=10, clock=clock)
+        called = asyncio.Event()
+
+        async def hang(**_kwargs: object) -> LLMResponse:
+            called.set()
+            await asyncio.sleep(10)
+            raise AssertionError("should have been cancelled")
+
+        primary = _route("bedrock", "CLAUDE_3_5_HAIKU")
+        primary.provider.generate.side_effect = hang
+        router.record_failure(primary)
+        clock.now += 10
+        provider = FailoverLLMProvider([primary], router)
+
+        task = asyncio.create_task(provider.generate(MESSAGES, model=primary.model_name))
+        await called.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert router.breaker(primary.key).state is CircuitState.HALF_OPEN
+        assert router.breaker(primary.key).can_attempt()
@@ -0,0 +1,434 @@
+"""Unit tests for append-only message storage in the coaching session repository."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from coaching.src.core.constants import ConversationStatus, MessageRole
+from coaching.src.domain.entities.coaching_session import CoachingMessage, CoachingSession
+from coaching.src.domain.exceptions.session_exceptions import InvalidCursorError
+from coaching.src.infrastructure.repositories.dynamodb_coaching_session_repository import (
+    DynamoDBCoachingSessionRepository,
+)
+
+
+class ConditionalCheckFailedError(Exception):
+    """Stand-in for the boto3 ConditionalCheckFailedException."""
+
+
+@pytest.fixture
+def tables() -> dict[str, MagicMock]:
+    return {"sessions": MagicMock(), "messages": MagicMock()}
+
+
+@pytest.fixture
+def mock_dynamodb_resource(tables: dict[str, MagicMock]) -> MagicMock:
+    resource = MagicMock()
+    resource.Table.side_effect = lambda name: tables[name]
+    resource.meta.client.exceptions.ConditionalCheckFailedException = ConditionalCheckFailedError
+    return resource
+
+
+@pytest.fixture
+def repository(mock_dynamodb_resource: MagicMock) -> DynamoDBCoachingSessionRepository:
+    return DynamoDBCoachingSessionRepository(
+        mock_dynamodb_resource, "sessions", messages_table_name="messages"
+    )
+
+
+def _session(message_count: int) -> CoachingSession:
+    session = CoachingSession.create(tenant_id="tenant-1", topic_id="core_values", user_id="user-1")
+    for i in range(message_count):
+        role = MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT
+        session.messages.append(CoachingMessage(role=role, content=f"message {i}"))
+    return session
+
+
+def _message_item(session_id: str, seq: int) -> dict[str, object]:
+    return {
+        "session_id": session_id,
+        "seq": seq,
+        "role": "user",
+        "content": f"message {seq}",
+        "timestamp": datetime.now(UTC).isoformat(),
+        "metadata": {},
+    }
+
+
+@pytest.mark.asyncio
+class TestAppendOnlyMessages:
+    """Tests for the messages-table storage mode."""
+
+    async def test_update_appends_only_new_messages(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """A turn writes just the new messages and one header update_item."""
+        session = _session(6)
+        tables["messages"].query.return_value = {"Items": [{"seq": 3}]}
+
+        await repository.update(session)
+
+        puts = tables["messages"].put_item.call_args_list
+        assert [c.kwargs["Item"]["seq"] for c in puts] == [4, 5]
+        assert all(
+            c.kwargs["ConditionExpression"] == "attribute_not_exists(session_id)" for c in puts
+        )
+        tables["sessions"].get_item.assert_not_called()
+        tables["sessions"].put_item.assert_not_called()
+
+        update_kwargs = tables["sessions"].update_item.call_args.kwargs
+        assert update_kwargs["ConditionExpression"] == "attribute_exists(session_id)"
+        names = update_kwargs["ExpressionAttributeNames"]
+        written = {
+            names[f"#f{key[2:]}"]: value
+            for key, value in update_kwargs["ExpressionAttributeValues"].items()
+        }
+        assert "messages" not in written
+        assert written["message_count"] == 6
+        assert "REMOVE" in update_kwargs["UpdateExpression"]
+        # Messages of an active session have no TTL and none is set afterwards
+        assert all("ttl" not in c.kwargs["Item"] for c in puts)
+        tables["messages"].update_item.assert_not_called()
+
+    async def test_new_messages_follow_the_loaded_count_despite_seq_gaps(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """Messages after those loaded are appended even if stored seqs have gaps."""
+        session = _session(4)
+        session._stored_message_count = 2
+        tables["messages"].query.return_value = {"Items": [{"seq": 9}]}
+
+        await repository.update(session)
+
+        puts = tables["messages"].put_item.call_args_list
+        assert [(c.kwargs["Item"]["seq"], c.kwargs["Item"]["content"]) for c in puts] == [
+            (10, "message 2"),
+            (11, "message 3"),
+        ]
+
+    async def test_completed_session_messages_expire_with_the_header(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """Ending a session stamps the header's TTL on every message item."""
+        session = _session(2)
+        session.complete(result={}, extraction_model=None)
+        sid = str(session.session_id)
+        tables["messages"].query.side_effect = [
+            {"Items": [{"seq": 1}]},
+            {"Items": [{"session_id": sid, "seq": 0}, {"session_id": sid, "seq": 1}]},
+        ]
+
+        await repository.update(session)
+
+        header = tables["sessions"].update_item.call_args.kwargs
+        header_ttl = next(
+            value
+            for key, value in header["ExpressionAttributeValues"].items()
+            if header["ExpressionAttributeNames"][f"#f{key[2:]}"] == "ttl"
+        )
+        updates = tables["messages"].update_item.call_args_list
+        assert [c.kwargs["Key"]["seq"] for c in updates] == [0, 1]
+        assert all(c.kwargs["ExpressionAttributeValues"] == {":ttl": header_ttl} for c in updates)
+
+    async def test_resumed_session_messages_lose_their_ttl(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """An active session whose items were stamped while paused has the TTL removed."""
+        session = _session(2)
+        sid = str(session.session_id)
+        tables["messages"].query.side_effect = [
+            {"Items": [{"seq": 1, "ttl": 1}]},
+            {"Items": [{"session_id": sid, "seq": 0}, {"session_id": sid, "seq": 1}]},
+        ]
+
+        await repository.update(session)
+
+        updates = tables["messages"].update_item.call_args_list
+        assert len(updates) == 2
+        assert all(c.kwargs["UpdateExpression"] == "REMOVE #ttl" for c in updates)
+
+    async def test_update_missing_session_raises(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """A failed header condition surfaces as ValueError like the legacy path."""
+        tables["messages"].query.return_value = {"Items": []}
+        tables["sessions"].update_item.side_effect = ConditionalCheckFailedError()
+
+        with pytest.raises(ValueError, match="Session not found"):
+            await repository.update(_session(1))
+
+    async def test_legacy_session_is_migrated_on_update(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """Sessions with inline messages get all messages written on first update."""
+        tables["messages"].query.return_value = {"Items": []}
+
+        await repository.update(_session(3))
+
+        assert tables["messages"].put_item.call_count == 3
+
+    async def test_create_writes_header_without_messages(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """New sessions store messages as items and a count on the header."""
+        tables["sessions"].query.return_value = {"Items": []}
+        tables["messages"].query.return_value = {"Items": []}
+
+        await repository.create(_session(1))
+
+        header = tables["sessions"].put_item.call_args.kwargs["Item"]
+        assert "messages" not in header
+        assert header["message_count"] == 1
+        assert tables["messages"].put_item.call_count == 1
+
+    async def test_get_hydrates_messages_with_pagination(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """Reading a session loads its message items across pages."""
+        session = _session(0)
+        header = repository._to_dynamodb_item(session)
+        del header["messages"]
+        header["message_count"] = 3
+        sid = str(session.session_id)
+        tables["sessions"].get_item.return_value = {"Item": header}
+        tables["messages"].query.side_effect = [
+            {"Items": [_message_item(sid, 0), _message_item(sid, 1)], "LastEvaluatedKey": {"k": 1}},
+            {"Items": [_message_item(sid, 2)]},
+        ]
+
+        loaded = await repository.get_by_id_for_tenant(sid, "tenant-1")
+
+        assert loaded is not None
+        assert [m.content for m in loaded.messages] == ["message 0", "message 1", "message 2"]
+        assert loaded.status == ConversationStatus.ACTIVE
+
+
+@pytest.mark.asyncio
+class TestInlineMessages:
+    """Tests for the default inline storage mode."""
+
+    async def test_update_writes_messages_on_the_item(self, tables: dict[str, MagicMock]) -> None:
+        """Without a messages table the session item carries the messages."""
+        resource = MagicMock()
+        resource.Table.side_effect = lambda name: tables[name]
+        repository = DynamoDBCoachingSessionRepository(resource, "sessions")
+        session = _session(2)
+        session.partial_result = {"values": []}
+        session.partial_result_message_count = 1
+
+        await repository.update(session)
+
+        update_kwargs = tables["sessions"].update_item.call_args.kwargs
+        assert update_kwargs["ConditionExpression"] == "attribute_exists(session_id)"
+        names = update_kwargs["ExpressionAttributeNames"]
+        written = {
+            names[f"#f{key[2:]}"]: value
+            for key, value in update_kwargs["ExpressionAttributeValues"].items()
+        }
+        assert len(written["messages"]) == 2
+        assert "ttl" in written
+        assert "message_count" not in written
+        # A full put would revert a newer partial stored by the background extraction
+        assert "partial_result" not in names.values()
+        tables["sessions"].get_item.assert_not_called()
+        tables["sessions"].put_item.assert_not_called()
+        tables["messages"].put_item.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestInactiveSessionSweep:
+    """Tests for the activity-index backed inactive-session sweeper."""
+
+    async def test_active_sessions_are_indexed(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """Only active sessions carry the sparse index key."""
+        session = _session(0)
+        assert repository._to_dynamodb_item(session)["active_shard"].startswith("ACTIVE#")
+
+        session.pause()
+        tables["messages"].query.return_value = {"Items": []}
+        await repository.save(session)
+
+        update_expression = tables["sessions"].update_item.call_args.kwargs["UpdateExpression"]
+        names = tables["sessions"].update_item.call_args.kwargs["ExpressionAttributeNames"]
+        removed = [
+            names[token.strip(" ,")] for token in update_expression.split("REMOVE")[1].split()
+        ]
+        assert "active_shard" in removed
+
+    async def test_sweep_pages_all_shards_and_counts(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """Every shard is paged through and paused/skipped sessions are counted."""
+        pages: dict[str, list[dict[str, object]]] = {
+            "ACTIVE#0": [
+                {
+                    "Items": [{"session_id": "s1"}, {"session_id": "s2"}],
+                    "LastEvaluatedKey": {"k": 1},
+                },
+                {"Items": [{"session_id": "s3"}]},
+            ],
+        }
+
+        def query(**kwargs: object) -> dict[str, object]:
+            shard = kwargs["KeyConditionExpression"].get_expression()["values"][0]
+            shard_key = shard.get_expression()["values"][1]
+            shard_pages = pages.get(shard_key, [])
+            return shard_pages.pop(0) if shard_pages else {"Items": []}
+
+        def update_item(**kwargs: dict[str, str]) -> None:
+            if kwargs["Key"]["session_id"] == "s2":
+                raise ConditionalCheckFailedError()
+
+        tables["sessions"].query.side_effect = query
+        tables["sessions"].update_item.side_effect = update_item
+        tables["messages"].query.return_value = {"Items": []}
+
+        result = await repository.pause_inactive_sessions(inactivity_threshold_minutes=30)
+
+        assert (result.examined, result.paused, result.skipped, result.failed) == (3, 2, 1, 0)
+        assert tables["sessions"].query.call_count == repository.ACTIVE_INDEX_SHARDS + 1
+        tables["sessions"].scan.assert_not_called()
+        condition = tables["sessions"].update_item.call_args.kwargs["ConditionExpression"]
+        assert "last_activity_at < :threshold" in condition
+        # Each paused session's message items are given the header's TTL
+        assert tables["messages"].query.call_count == 2
+
+
+@pytest.mark.asyncio
+class TestPartialResults:
+    """Tests for speculative extraction results."""
+
+    async def test_partial_result_is_written_only_if_newer(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """The write is conditional on an active session and a lower message count."""
+        stored = await repository.update_partial_result("s1", {"values": []}, 4)
+
+        update_kwargs = tables["sessions"].update_item.call_args.kwargs
+        assert stored is True
+        assert update_kwargs["ExpressionAttributeValues"][":count"] == 4
+        assert "partial_result_message_count < :count" in update_kwargs["ConditionExpression"]
+
+        tables["sessions"].update_item.side_effect = ConditionalCheckFailedError()
+        assert await repository.update_partial_result("s1", {"values": []}, 2) is False
+
+    async def test_turn_updates_do_not_touch_partial_result(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """Header updates leave the partial result to the background extraction."""
+        session = _session(2)
+        session.partial_result = {"values": []}
+        session.partial_result_message_count = 1
+        tables["messages"].query.return_value = {"Items": []}
+
+        await repository.update(session)
+
+        names = tables["sessions"].update_item.call_args.kwargs["ExpressionAttributeNames"]
+        assert "partial_result" not in names.values()
+        assert "partial_result_message_count" not in names.values()
+        item = repository._to_dynamodb_item(session)
+        restored = repository._from_dynamodb_item(item)
+        assert (restored.partial_result, restored.partial_result_message_count) == (
+            {"values": []},
+            1,
+        )
+
+
+def _summary_item(session_id: str, **overrides: object) -> dict[str, object]:
+    now = datetime.now(UTC).isoformat()
+    item: dict[str, object] = {
+        "session_id": session_id,
+        "tenant_id": "tenant-1",
+        "user_id": "user-1",
+        "topic_id": "core_values",
+        "status": "active",
+        "turn_count": 3,
+        "created_at": now,
+        "updated_at": now,
+    }
+    item.update(overrides)
+    return item
+
+
+@pytest.mark.asyncio
+class TestSessionSummaries:
+    """Tests for the projected session listing."""
+
+    async def test_reads_projection_and_pages_until_limit(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """Only summary attributes are read and filtered pages are followed."""
+        tables["sessions"].query.side_effect = [
+            {"Items": [_summary_item("s1")], "LastEvaluatedKey": {"session_id": "s1"}},
+            {"Items": [_summary_item("s2"), _summary_item("s3")], "LastEvaluatedKey": {"k": 1}},
+        ]
+
+        page = await repository.list_summaries_by_tenant_user("tenant-1", "user-1", limit=2)
+
+        assert [s.session_id for s in page.items] == ["s1", "s2"]
+        assert page.items[0].turn_count == 3
+        first_query = tables["sessions"].query.call_args_list[0].kwargs
+        projected = first_query["ExpressionAttributeNames"].values()
+        assert "messages" not in projected and "context" not in projected
+        assert "FilterExpression" in first_query
+        tables["messages"].query.assert_not_called()
+
+        # The cursor resumes after the last returned item, for the caller's keys only
+        tables["sessions"].query.side_effect = [{"Items": [_summary_item("s3")]}]
+        next_page = await repository.list_summaries_by_tenant_user(
+            "tenant-1", "user-1", limit=2, cursor=page.next_cursor
+        )
+
+        assert tables["sessions"].query.call_args.kwargs["ExclusiveStartKey"] == {
+            "session_id": "s2",
+            "tenant_id": "tenant-1",
+            "user_id": "user-1",
+        }
+        assert [s.session_id for s in next_page.items] == ["s3"]
+        assert next_page.next_cursor is None
+
+    async def test_legacy_items_without_turn_count_are_loaded(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """Sessions written before turn_count was stored fall back to a full read."""
+        session = _session(4)
+        item = _summary_item(str(session.session_id))
+        del item["turn_count"]
+        tables["sessions"].query.return_value = {"Items": [item]}
+        tables["sessions"].get_item.return_value = {"Item": repository._to_dynamodb_item(session)}
+
+        page = await repository.list_summaries_by_tenant_user("tenant-1", "user-1")
+
+        assert page.items[0].turn_count == 2
+
+    async def test_turn_count_backfill_stores_missing_counts(
+        self, repository: DynamoDBCoachingSessionRepository, tables: dict[str, MagicMock]
+    ) -> None:
+        """The backfill scans for items without turn_count and stores it once."""
+        session = _session(4)
+        session_id = str(session.session_id)
+        tables["sessions"].scan.side_effect = [
+            {"Items": [{"session_id": session_id}], "LastEvaluatedKey": {"k": 1}},
+            {"Items": [{"session_id": session_id}]},
+        ]
+        tables["sessions"].get_item.return_value = {"Item": repository._to_dynamodb_item(session)}
+        # The second write finds the count already stored by a concurrent update
+        tables["sessions"].update_item.side_effect = [None, ConditionalCheckFailedError()]
+
+        updated = await repository.backfill_turn_count(total_segments=1)
+
+        assert updated == 1
+        scan_kwargs = tables["sessions"].scan.call_args_list[0].kwargs
+        assert scan_kwargs["FilterExpression"] == "attribute_not_exists(turn_count)"
+        update_kwargs = tables["sessions"].update_item.call_args.kwargs
+        assert update_kwargs["ExpressionAttributeValues"] == {":count": 2}
+        assert update_kwargs["ConditionExpression"] == "attribute_not_exists(turn_count)"
+
+    async def test_invalid_cursor_raises(
+        self, repository: DynamoDBCoachingSessionRepository
+    ) -> None:
+        """Malformed cursors are rejected before querying."""
+        with pytest.raises(InvalidCursorError):
+            await repository.list_summaries_by_tenant_user("tenant-1", "user-1", cursor="???")
@@ -0,0 +1,185 @@
+"""Unit tests for the non-blocking AWS I/O executor."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+from coaching.src.infrastructure.aws_io import AwsIOExecutor
+
+
+@pytest.fixture
+def executor() -> Iterator[AwsIOExecutor]:
+    """Create an executor with small per-service limits."""
+    io = AwsIOExecutor(service_limits={"s3": 1, "dynamodb": 4}, default_limit=2)
+    yield io
+    io.shutdown()
+
+
+class TestAwsIOExecutor:
+    """Tests for AwsIOExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_runs_call_off_event_loop_thread(self, executor: AwsIOExecutor) -> None:
+        """Test the blocking call runs on a worker thread and returns its result."""
+        loop_thread = threading.get_ident()
+
+        def blocking(x: int, *, y: int) -> tuple[int, int]:
+            return threading.get_ident(), x + y
+
+        thread_id, result = await executor.run("dynamodb", blocking, 1, y=2)
+
+        assert result == 3
+        assert thread_id != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_overlap(self, executor: AwsIOExecutor) -> None:
+        """Test calls within the service limit run concurrently."""
+        start = time.monotonic()
+        await asyncio.gather(*(executor.run("dynamodb", time.sleep, 0.1) for _ in range(4)))
+
+        assert time.monotonic() - start < 0.35
+
+    @pytest.mark.asyncio
+    async def test_service_limit_is_enforced(self, executor: AwsIOExecutor) -> None:
+        """Test a service never exceeds its concurrency limit."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def tracked() -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*(executor.run("s3", tracked) for _ in range(5)))
+
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate(self, executor: AwsIOExecutor) -> None:
+        """Test exceptions raised by the call reach the awaiting coroutine."""
+
+        def failing() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await executor.run("s3", failing)
+
+    def test_limits(self, executor: AwsIOExecutor) -> None:
+        """Test configured and default limits."""
+        assert executor.get_limit("s3") == 1
+        assert executor.get_limit("dynamodb") == 4
+        assert executor.get_limit("secretsmanager") == 2
+
+
+class TestAwsIOStreamIteration:
+    """Tests for AwsIOExecutor.iterate."""
+
+    @pytest.mark.asyncio
+    async def test_yields_items_in_order_off_loop_thread(self, executor: AwsIOExecutor) -> None:
+        """Test items are read on a worker thread and delivered in order."""
+        loop_thread = threading.get_ident()
+        reader_threads: set[int] = set()
+
+        def events() -> Iterator[int]:
+            for i in range(5):
+                reader_threads.add(threading.get_ident())
+                yield i
+
+        items = [item async for item in executor.iterate("bedrock-runtime", events())]
+
+        assert items == [0, 1, 2, 3, 4]
+        assert loop_thread not in reader_threads
+
+    @pytest.mark.asyncio
+    async def test_slow_reads_do_not_block_event_loop(self, executor: AwsIOExecutor) -> None:
+        """Test other coroutines keep running while the reader waits on the stream."""
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        def slow_events() -> Iterator[str]:
+            for token in ("a", "b", "c"):
+                time.sleep(0.05)
+                yield token
+
+        task = asyncio.create_task(ticker())
+        try:
+            items = [item async for item in executor.iterate("bedrock-runtime", slow_events())]
+        finally:
+            task.cancel()
+
+        assert items == ["a", "b", "c"]
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_reader_waits_for_slow_consumer(self, executor: AwsIOExecutor) -> None:
+        """Test the reader never runs more than max_buffered items ahead."""
+        produced = 0
+
+        def events() -> Iterator[int]:
+            nonlocal produced
+            for i in range(20):
+                produced += 1
+                yield i
+
+        stream = executor.iterate("bedrock-runtime", events(), max_buffered=2)
+        first = await stream.__anext__()
+        await asyncio.sleep(0.05)
+
+        assert first == 0
+        # One consumed, two buffered, plus the item the reader is holding
+        assert produced <= 4
+        rest = [item async for item in stream]
+        assert rest == list(range(1, 20))
+
+    @pytest.mark.asyncio
+    async def test_early_stop_closes_stream_and_releases_reader(
+        self, executor: AwsIOExecutor
+    ) -> None:
+        """Test abandoning the iterator closes the underlying stream."""
+        closed = threading.Event()
+        reader_done = threading.Event()
+
+        def endless() -> Iterator[int]:
+            try:
+                i = 0
+                while not closed.is_set():
+                    yield i
+                    i += 1
+            finally:
+                reader_done.set()
+
+        stream = executor.iterate("bedrock-runtime", endless(), max_buffered=1, close=closed.set)
+        async for item in stream:
+            if item == 2:
+                break
+        await stream.aclose()
+
+        assert closed.is_set()
+        assert await asyncio.to_thread(reader_done.wait, 1.0)
+
+    @pytest.mark.asyncio
+    async def test_reader_exceptions_propagate(self, executor: AwsIOExecutor) -> None:
+        """Test errors raised while reading reach the consumer after earlier items."""
+
+        def failing() -> Iterator[int]:
+            yield 1
+            raise ConnectionError("stream reset")
+
+        received: list[int] = []
+        with pytest.raises(ConnectionError, match="stream reset"):
+            async for item in executor.iterate("bedrock-runtime", failing()):
+                received.append(item)
+
+        assert received == [1]
@@ -0,0 +1,70 @@
+"""Unit tests for the cached JWT secret provider."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+from coaching.src.infrastructure.jwt_secret_provider import JwtSecretProvider
+
+
+class TestJwtSecretProvider:
+    """Tests for JwtSecretProvider."""
+
+    def test_secret_is_cached(self) -> None:
+        """The loader is called once while the secret is fresh."""
+        loader = Mock(return_value="s1")
+        provider = JwtSecretProvider(loader, ttl_seconds=60, refresh_ahead_seconds=0)
+
+        assert provider.get_secret() == "s1"
+        assert provider.get_secret() == "s1"
+        assert loader.call_count == 1
+
+    def test_expired_secret_is_reloaded(self) -> None:
+        """A secret past its TTL is loaded again."""
+        loader = Mock(side_effect=["s1", "s2"])
+        provider = JwtSecretProvider(loader, ttl_seconds=0, refresh_ahead_seconds=0)
+
+        assert provider.get_secret() == "s1"
+        assert provider.get_secret() == "s2"
+
+    def test_failed_reload_keeps_previous_secret(self) -> None:
+        """If reloading fails the cached secret is still served."""
+        loader = Mock(side_effect=["s1", RuntimeError("throttled")])
+        provider = JwtSecretProvider(loader, ttl_seconds=0, refresh_ahead_seconds=0)
+
+        assert provider.get_secret() == "s1"
+        assert provider.get_secret() == "s1"
+
+    def test_initial_failure_raises(self) -> None:
+        """Without a cached secret, loader errors propagate."""
+        provider = JwtSecretProvider(Mock(side_effect=RuntimeError("down")))
+
+        with pytest.raises(RuntimeError):
+            provider.get_secret()
+
+    def test_background_refresh_before_expiry(self) -> None:
+        """Within the refresh-ahead window the secret is reloaded in the background."""
+        loader = Mock(side_effect=["s1", "s2"])
+        provider = JwtSecretProvider(
+            loader, ttl_seconds=60, refresh_ahead_seconds=60, min_refresh_interval_seconds=0
+        )
+
+        assert provider.get_secret() == "s1"
+        # Served from cache while the refresh runs
+        assert provider.get_secret() == "s1"
+
+        deadline = time.monotonic() + 2
+        while provider.load_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert provider.get_secret() == "s2"
+
+    def test_refresh_detects_rotation_and_is_rate_limited(self) -> None:
+        """Forced refresh reports a changed secret and is rate limited."""
+        loader = Mock(side_effect=["old", "new", "newer"])
+        provider = JwtSecretProvider(loader, min_refresh_interval_seconds=60)
+        provider.get_secret()
+
+        assert provider.refresh() is True
+        assert provider.get_secret() == "new"
+        assert provider.refresh() is False
+        assert loader.call_count == 2
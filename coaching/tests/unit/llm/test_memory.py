@@ -0,0 +1,78 @@
+"""Unit tests for ConversationMemory token accounting."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from coaching.src.llm.memory import ConversationMemory
+
+
+@pytest.fixture(autouse=True)
+def word_tokenizer() -> Iterator[None]:
+    """One token per whitespace-separated word keeps the arithmetic readable."""
+    encoding = MagicMock()
+    encoding.encode.side_effect = str.split
+    with patch("coaching.src.llm.memory.tiktoken.get_encoding", return_value=encoding):
+        yield
+
+
+def _memory(limit: int = 100) -> ConversationMemory:
+    return ConversationMemory(max_token_limit=limit)
+
+
+class TestConversationMemoryTokens:
+    """Tests for incremental token counts and trimming."""
+
+    def test_running_total_tracks_messages(self) -> None:
+        memory = _memory()
+        memory.add_message("user", "one two three")
+        memory.add_message("assistant", "four five")
+
+        assert memory.total_tokens == 5
+        assert memory._count_total_tokens() == 5
+
+    def test_messages_are_encoded_once(self) -> None:
+        memory = _memory(limit=1000)
+        with patch.object(memory, "_count_tokens", wraps=memory._count_tokens) as count:
+            for i in range(20):
+                memory.add_message("user", f"message {i}")
+
+        assert count.call_count == 20
+
+    def test_trim_keeps_recent_messages_within_target(self) -> None:
+        memory = _memory(limit=40)
+        for i in range(10):
+            memory.add_message("user" if i % 2 == 0 else "assistant", f"goals message {i} a b c")
+
+        assert memory.total_tokens <= 40
+        assert memory.messages[-1]["content"].startswith("goals message 9")
+        assert memory.summary
+        assert memory.total_tokens == len(memory.summary.split()) + sum(
+            len(m["content"].split()) for m in memory.messages
+        )
+
+    def test_oversized_single_message_is_kept(self) -> None:
+        memory = _memory(limit=5)
+        memory.add_message("user", " ".join(["word"] * 20))
+
+        assert len(memory.messages) == 1
+        assert memory.summary == ""
+
+    def test_get_messages_for_llm_with_budget(self) -> None:
+        memory = _memory(limit=1000)
+        for i in range(5):
+            memory.add_message("user", f"m{i} x x x x")
+
+        messages = memory.get_messages_for_llm(max_tokens=10)
+
+        assert [m["content"][:2] for m in messages] == ["m3", "m4"]
+
+    def test_round_trip_preserves_counts(self) -> None:
+        memory = _memory()
+        memory.add_message("user", "one two three")
+        data = memory.to_dict()
+
+        restored = ConversationMemory.from_dict(data)
+
+        assert restored._token_counts == [3]
+        assert restored.messages == memory.messages
@@ -0,0 +1,238 @@
+"""Unit tests for LangGraph orchestrator state bounds, checkpoints and graph reuse."""
+
+from typing import Any
+
+import pytest
+from coaching.src.llm.workflow_orchestrator import (
+    AdvancedStateManager,
+    LangGraphWorkflowOrchestrator,
+)
+from coaching.src.workflows.base import (
+    BaseWorkflow,
+    WorkflowConfig,
+    WorkflowState,
+    WorkflowStatus,
+    WorkflowType,
+)
+from coaching.src.workflows.checkpoints import InMemoryCheckpointBackend
+
+
+class _CompiledGraph:
+    async def ainvoke(self, state: dict[str, Any]) -> dict[str, Any]:
+        history = state.get("conversation_history", [])
+        return {
+            **state,
+            "conversation_history": [*history, {"role": "assistant", "content": "Tell me more"}],
+            "status": WorkflowStatus.WAITING_INPUT.value,
+        }
+
+
+class _Graph:
+    def compile(self) -> _CompiledGraph:
+        return _CompiledGraph()
+
+
+class CountingWorkflow(BaseWorkflow):
+    """Workflow with a stub graph that counts graph builds."""
+
+    builds = 0
+
+    @property
+    def workflow_type(self) -> WorkflowType:
+        return WorkflowType.CONVERSATIONAL_COACHING
+
+    @property
+    def workflow_steps(self) -> list[str]:
+        return ["reply"]
+
+    async def build_graph(self) -> Any:
+        type(self).builds += 1
+        return _Graph()
+
+    async def create_initial_state(self, user_input: dict[str, Any]) -> WorkflowState:
+        return WorkflowState(
+            workflow_id=user_input["workflow_id"],
+            workflow_type=self.workflow_type,
+            user_id=user_input["user_id"],
+            conversation_history=user_input["messages"],
+            metadata=user_input["metadata"],
+        )
+
+    async def validate_state(self, state: WorkflowState) -> bool:
+        return True
+
+
+@pytest.fixture
+def backend() -> InMemoryCheckpointBackend:
+    CountingWorkflow.builds = 0
+    return InMemoryCheckpointBackend()
+
+
+def _orchestrator(
+    backend: InMemoryCheckpointBackend | None, max_workflows: int = 10
+) -> LangGraphWorkflowOrchestrator:
+    orchestrator = LangGraphWorkflowOrchestrator(
+        cache_service=backend, max_workflows=max_workflows, max_compiled_graphs=4
+    )
+    orchestrator.register_workflow(WorkflowType.CONVERSATIONAL_COACHING, CountingWorkflow)
+    return orchestrator
+
+
+async def _start(orchestrator: LangGraphWorkflowOrchestrator, **kwargs: Any) -> WorkflowState:
+    return await orchestrator.start_workflow(
+        WorkflowType.CONVERSATIONAL_COACHING, "user-1", {"content": "Hi"}, **kwargs
+    )
+
+
+class TestCompiledGraphCache:
+    """Tests for reusing compiled workflows."""
+
+    @pytest.mark.asyncio
+    async def test_graph_is_built_once_per_configuration(
+        self, backend: InMemoryCheckpointBackend
+    ) -> None:
+        orchestrator = _orchestrator(backend)
+
+        await _start(orchestrator)
+        await _start(orchestrator)
+        assert CountingWorkflow.builds == 1
+
+        config = WorkflowConfig(
+            workflow_type=WorkflowType.CONVERSATIONAL_COACHING, custom_config={"max_turns": 3}
+        )
+        await _start(orchestrator, config=config)
+        assert CountingWorkflow.builds == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_configuration_is_isolated_from_caller(
+        self, backend: InMemoryCheckpointBackend
+    ) -> None:
+        orchestrator = _orchestrator(backend)
+        config = WorkflowConfig(workflow_type=WorkflowType.CONVERSATIONAL_COACHING)
+
+        await _start(orchestrator, config=config)
+        config.custom_config["max_turns"] = 1
+
+        workflow = next(iter(orchestrator._compiled_workflows.values()))
+        assert workflow.config.custom_config == {}
+
+
+class TestBoundedState:
+    """Tests for bounded in-memory state and restores from checkpoints."""
+
+    @pytest.mark.asyncio
+    async def test_memory_stays_bounded(self, backend: InMemoryCheckpointBackend) -> None:
+        orchestrator = _orchestrator(backend, max_workflows=2)
+
+        for _ in range(5):
+            await _start(orchestrator)
+
+        assert len(orchestrator._active_workflows) == 2
+        assert len(orchestrator._workflow_states) == 2
+        assert len(orchestrator._state_manager._local_state_cache) == 2
+        assert len(backend) == 5
+
+    @pytest.mark.asyncio
+    async def test_evicted_workflow_resumes_from_checkpoint(
+        self, backend: InMemoryCheckpointBackend
+    ) -> None:
+        orchestrator = _orchestrator(backend, max_workflows=1)
+        first = await _start(orchestrator)
+        await _start(orchestrator)
+        assert first.workflow_id not in orchestrator._workflow_states
+
+        state = await orchestrator.continue_workflow(first.workflow_id, {"content": "Growth"})
+
+        assert state.workflow_id == first.workflow_id
+        assert [message["content"] for message in state.conversation_history] == [
+            "Hi",
+            "Tell me more",
+            "Growth",
+            "Tell me more",
+        ]
+        assert CountingWorkflow.builds == 1
+
+    @pytest.mark.asyncio
+    async def test_workflow_resumes_on_another_instance(
+        self, backend: InMemoryCheckpointBackend
+    ) -> None:
+        started = await _start(_orchestrator(backend))
+
+        state = await _orchestrator(backend).continue_workflow(
+            started.workflow_id, {"content": "Growth"}
+        )
+
+        assert len(state.conversation_history) == 4
+
+    @pytest.mark.asyncio
+    async def test_unknown_workflow_raises(self, backend: InMemoryCheckpointBackend) -> None:
+        with pytest.raises(KeyError, match="Workflow not found"):
+            await _orchestrator(backend).continue_workflow("missing", {"content": "Hi"})
+
+    @pytest.mark.asyncio
+    async def test_default_backend_restores_evicted_workflows(self) -> None:
+        orchestrator = _orchestrator(None, max_workflows=1)
+        first = await _start(orchestrator)
+        await _start(orchestrator)
+
+        state = await orchestrator.continue_workflow(first.workflow_id, {"content": "Growth"})
+
+        assert isinstance(orchestrator.cache_service, InMemoryCheckpointBackend)
+        assert len(state.conversation_history) == 4
+
+    @pytest.mark.asyncio
+    async def test_state_of_evicted_workflow_is_restored(
+        self, backend: InMemoryCheckpointBackend
+    ) -> None:
+        orchestrator = _orchestrator(backend, max_workflows=1)
+        first = await _start(orchestrator)
+        await _start(orchestrator)
+
+        state = await orchestrator.get_workflow_state(first.workflow_id)
+
+        assert state is not None
+        assert state.workflow_id == first.workflow_id
+        assert await orchestrator.get_workflow_state("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_cancel_restores_and_checkpoints(
+        self, backend: InMemoryCheckpointBackend
+    ) -> None:
+        orchestrator = _orchestrator(backend, max_workflows=1)
+        first = await _start(orchestrator)
+        await _start(orchestrator)
+
+        assert await orchestrator.cancel_workflow(first.workflow_id) is True
+        assert await orchestrator.cancel_workflow(first.workflow_id) is False
+        assert await orchestrator.cancel_workflow("missing") is False
+
+        # Another instance sees the cancellation and cannot continue the workflow
+        other = _orchestrator(backend)
+        state = await other.get_workflow_state(first.workflow_id)
+        assert state is not None
+        assert state.status == WorkflowStatus.CANCELLED.value
+        with pytest.raises(ValueError, match="cannot be continued"):
+            await other.continue_workflow(first.workflow_id, {"content": "Growth"})
+
+
+class TestAdvancedStateManager:
+    """Tests for checkpointing through the state manager."""
+
+    @pytest.mark.asyncio
+    async def test_evicted_state_loads_from_backend(
+        self, backend: InMemoryCheckpointBackend
+    ) -> None:
+        manager = AdvancedStateManager(backend, max_entries=1)
+        states = [
+            WorkflowState(
+                workflow_id=f"wf-{index}",
+                workflow_type=WorkflowType.CONVERSATIONAL_COACHING,
+                user_id="user-1",
+            )
+            for index in range(2)
+        ]
+        for state in states:
+            await manager.save_state(state.workflow_id, state)
+
+        assert list(manager._local_state_cache) == ["wf-1"]
+        assert await manager.load_state("wf-0") == states[0]
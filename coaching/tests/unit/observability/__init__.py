@@ -0,0 +1,3 @@
+"""Unit tests for shared observability."""
+
+__all__: list[str] = []  # Test package, no exports
@@ -0,0 +1,166 @@
+"""Unit tests for buffered metrics collectors."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from shared.observability.metrics import (
+    CloudWatchMetrics,
+    EMFMetrics,
+    InMemoryMetricsSink,
+    MetricAggregator,
+    flush_metrics,
+    get_metrics,
+    set_metrics,
+    stdout_sink,
+)
+
+
+@pytest.fixture
+def sink() -> InMemoryMetricsSink:
+    """Collect EMF documents in memory."""
+    return InMemoryMetricsSink()
+
+
+class TestMetricAggregator:
+    """Tests for in-process aggregation."""
+
+    def test_counts_are_summed_and_latencies_kept(self) -> None:
+        aggregator = MetricAggregator()
+        aggregator.add("Hits", 1.0, "Count", {"A": "1"})
+        aggregator.add("Hits", 2.0, "Count", {"A": "1"})
+        aggregator.add("Latency", 10.0, "Milliseconds", {"A": "1"})
+        aggregator.add("Latency", 30.0, "Milliseconds", {"A": "1"})
+
+        metrics = {m.name: m.values for m in aggregator.drain()}
+
+        assert metrics == {"Hits": [3.0], "Latency": [10.0, 30.0]}
+        assert len(aggregator) == 0
+
+    def test_dimension_order_does_not_split_series(self) -> None:
+        aggregator = MetricAggregator()
+        aggregator.add("Hits", 1.0, "Count", {"A": "1", "B": "2"})
+        aggregator.add("Hits", 1.0, "Count", {"B": "2", "A": "1"})
+
+        assert len(aggregator.drain()) == 1
+
+
+class TestEMFMetrics:
+    """Tests for Embedded Metric Format output."""
+
+    def test_nothing_is_written_until_flush(self, sink: InMemoryMetricsSink) -> None:
+        metrics = EMFMetrics(sink=sink)
+
+        metrics.record_cache_hit("business_api")
+        assert sink.documents == []
+
+        metrics.flush()
+        assert sink.values("CacheHit", CacheType="business_api") == [1.0]
+
+    def test_document_structure(self, sink: InMemoryMetricsSink) -> None:
+        metrics = EMFMetrics(namespace="PurposePath/Test", sink=sink)
+
+        metrics.record_latency("Execute", 120.0, {"Topic": "alignment_check"})
+        metrics.flush()
+
+        document = sink.documents[0]
+        directive = document["_aws"]["CloudWatchMetrics"][0]
+        assert directive["Namespace"] == "PurposePath/Test"
+        assert directive["Dimensions"] == [["Environment", "Service", "Topic"]]
+        assert directive["Metrics"] == [{"Name": "ExecuteLatency", "Unit": "Milliseconds"}]
+        assert document["Topic"] == "alignment_check"
+        assert document["ExecuteLatency"] == 120.0
+
+    def test_llm_tokens_use_high_resolution_dimensions(self, sink: InMemoryMetricsSink) -> None:
+        metrics = EMFMetrics(high_resolution=True, sink=sink)
+
+        metrics.record_llm_tokens(
+            "CLAUDE_3_5_SONNET", 100, 20, 120, topic="alignment_check", tenant_tier="pro"
+        )
+        metrics.record_llm_tokens(
+            "CLAUDE_3_5_SONNET", 50, 10, 60, topic="alignment_check", tenant_tier="pro"
+        )
+        metrics.flush()
+
+        assert len(sink.documents) == 1
+        assert sink.values(
+            "LLM_TotalTokens", Model="CLAUDE_3_5_SONNET", Topic="alignment_check", TenantTier="pro"
+        ) == [180.0]
+        assert all(d.get("StorageResolution") == 1 for d in sink.metric_definitions())
+
+    def test_metrics_with_many_values_span_documents(self, sink: InMemoryMetricsSink) -> None:
+        metrics = EMFMetrics(sink=sink)
+
+        for i in range(150):
+            metrics.record_latency("Query", float(i))
+        metrics.flush()
+
+        assert len(sink.documents) == 2
+        assert len(sink.values("QueryLatency")) == 150
+
+    def test_buffer_bound_triggers_flush(self, sink: InMemoryMetricsSink) -> None:
+        metrics = EMFMetrics(sink=sink, max_buffered=3)
+
+        for _ in range(3):
+            metrics.record_success("Job")
+
+        assert sink.values("JobSuccess") == [3.0]
+
+    def test_sink_errors_are_swallowed(self) -> None:
+        metrics = EMFMetrics(sink=MagicMock(side_effect=OSError("closed")))
+        metrics.record_success("Job")
+
+        metrics.flush()
+
+        assert len(metrics.aggregator) == 0
+
+    def test_stdout_sink_writes_json_lines(self, capsys: pytest.CaptureFixture[str]) -> None:
+        stdout_sink({"_aws": {}, "Metric": 1})
+
+        assert json.loads(capsys.readouterr().out) == {"_aws": {}, "Metric": 1}
+
+
+class TestCloudWatchMetrics:
+    """Tests for the batched CloudWatch API backend."""
+
+    def test_flush_sends_one_batched_call(self) -> None:
+        client = MagicMock()
+        with patch("boto3.client", return_value=client):
+            metrics = CloudWatchMetrics(namespace="PurposePath/Test")
+
+        metrics.record_latency("Execute", 10.0)
+        metrics.record_latency("Execute", 20.0)
+        metrics.record_cache_miss("prompt")
+        client.put_metric_data.assert_not_called()
+
+        metrics.flush()
+
+        client.put_metric_data.assert_called_once()
+        data = client.put_metric_data.call_args.kwargs["MetricData"]
+        assert {d["MetricName"]: d["Values"] for d in data} == {
+            "ExecuteLatency": [10.0, 20.0],
+            "CacheMiss": [1.0],
+        }
+
+
+class TestGlobalMetrics:
+    """Tests for the process-wide collector."""
+
+    def test_emf_is_the_default_backend(self) -> None:
+        set_metrics(None)
+        try:
+            with patch.dict("os.environ", {}, clear=False) as env:
+                env.pop("METRICS_BACKEND", None)
+                assert isinstance(get_metrics(), EMFMetrics)
+        finally:
+            set_metrics(None)
+
+    def test_flush_metrics_flushes_global_instance(self, sink: InMemoryMetricsSink) -> None:
+        set_metrics(EMFMetrics(sink=sink))
+        try:
+            get_metrics().record_success("Invocation")
+            flush_metrics()
+        finally:
+            set_metrics(None)
+
+        assert sink.values("InvocationSuccess") == [1.0]
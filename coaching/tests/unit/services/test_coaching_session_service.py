@@ -12,7 +12,10 @@ Test Cases per spec (section 10.1):
     - test_complete_triggers_extraction
 """
 
+import json
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
+from typing import Any, ClassVar
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -22,7 +25,11 @@ from coaching.src.core.topic_registry import (
     TopicDefinition,
 )
 from coaching.src.core.types import SessionId, TenantId, UserId
-from coaching.src.domain.entities.coaching_session import CoachingSession
+from coaching.src.domain.entities.coaching_session import (
+    CoachingSession,
+    CoachingSessionSummary,
+    CoachingSessionSummaryPage,
+)
 from coaching.src.domain.entities.llm_topic import LLMTopic
 from coaching.src.domain.exceptions import (
     MaxTurnsReachedError,
@@ -34,6 +41,7 @@ from coaching.src.services.coaching_session_service import (
     CoachingSessionService,
     InvalidTopicError,
     MessageResponse,
+    MessageStreamExtractor,
     ResponseMetadata,
     SessionCompletionResponse,
     SessionResponse,
@@ -527,6 +535,8 @@ class TestCoachingSessionService:
         mock_endpoint = MagicMock()
         mock_endpoint.result_model = None
         mock_topic = MagicMock()
+        mock_topic.max_tokens = 2000
+        mock_topic.get_model_code_for_tier.return_value = "CLAUDE_3_5_SONNET"
 
         service._load_topic_config = AsyncMock(return_value=(mock_endpoint, mock_topic))
         service._load_template = AsyncMock(return_value="test template")
@@ -626,6 +636,88 @@ class TestCoachingSessionService:
                 user_message="One more message",
             )
 
+    @pytest.mark.asyncio
+    async def test_stream_message_streams_text_and_persists_on_completion(
+        self,
+        service: CoachingSessionService,
+        mock_session_repository: AsyncMock,
+        mock_topic_repository: AsyncMock,
+        mock_s3_prompt_storage: AsyncMock,
+        mock_provider_factory: Mock,
+        sample_endpoint_definition: TopicDefinition,
+        sample_llm_topic: LLMTopic,
+        sample_session: CoachingSession,
+    ) -> None:
+        """Test streaming yields message text, then persists and returns the response."""
+        service._topic_index["core_values"] = sample_endpoint_definition
+        mock_session_repository.get_by_id_for_tenant.return_value = sample_session
+        mock_topic_repository.get.return_value = sample_llm_topic
+        mock_s3_prompt_storage.get_prompt.return_value = "You are a coaching assistant."
+
+        persisted_during_stream: list[bool] = []
+
+        async def fake_stream(usage: dict[str, int], **_kwargs: object) -> AsyncIterator[str]:
+            for chunk in ['{"mess', 'age": "Tell me ', 'more.\\nWhy?"', ', "is_final": false}']:
+                persisted_during_stream.append(mock_session_repository.update.called)
+                yield chunk
+            usage["total_tokens"] = 42
+
+        provider, _ = mock_provider_factory.get_provider_for_model.return_value
+        provider.generate_stream = fake_stream
+
+        with patch(
+            "coaching.src.services.coaching_session_service.get_metrics"
+        ) as mock_get_metrics:
+            items = [
+                item
+                async for item in service.stream_message(
+                    session_id="test-session-123",
+                    tenant_id="tenant-123",
+                    user_id="user-123",
+                    user_message="I value honesty.",
+                )
+            ]
+
+        *tokens, final = items
+        assert "".join(str(t) for t in tokens) == "Tell me more.\nWhy?"
+        assert isinstance(final, MessageResponse)
+        assert final.message == "Tell me more.\nWhy?"
+        assert final.is_final is False
+        assert final.metadata is not None
+        assert final.metadata.tokens_used == 42
+        assert not any(persisted_during_stream)
+        mock_session_repository.update.assert_called_once_with(sample_session)
+        assert sample_session.messages[-1].content == "Tell me more.\nWhy?"
+        record_llm_tokens = mock_get_metrics.return_value.record_llm_tokens
+        record_llm_tokens.assert_called_once()
+        assert record_llm_tokens.call_args.kwargs["total_tokens"] == 42
+        assert record_llm_tokens.call_args.kwargs["topic"] == sample_llm_topic.topic_id
+
+    @pytest.mark.asyncio
+    async def test_prepare_message_turn_max_turns_reached(
+        self,
+        service: CoachingSessionService,
+        mock_session_repository: AsyncMock,
+        mock_topic_repository: AsyncMock,
+        sample_endpoint_definition: TopicDefinition,
+        sample_llm_topic: LLMTopic,
+        sample_session: CoachingSession,
+    ) -> None:
+        """Test turn limits are enforced before any LLM call is made."""
+        service._topic_index["core_values"] = sample_endpoint_definition
+        sample_session.max_turns = 1
+        sample_session.add_user_message("First")
+        mock_session_repository.get_by_id_for_tenant.return_value = sample_session
+        mock_topic_repository.get.return_value = sample_llm_topic
+
+        with pytest.raises(MaxTurnsReachedError):
+            await service.prepare_message_turn(
+                session_id="test-session-123",
+                tenant_id="tenant-123",
+                user_id="user-123",
+                user_message="Second",
+            )
+
     # =========================================================================
     # complete_session Tests
     # =========================================================================
@@ -833,6 +925,248 @@ class TestCoachingSessionService:
                 user_id="different-user",
             )
 
+    # =========================================================================
+    # Session listing Tests
+    # =========================================================================
+
+    @staticmethod
+    def _summary(
+        session_id: str, topic_id: str, status: ConversationStatus
+    ) -> CoachingSessionSummary:
+        now = datetime.now(UTC)
+        return CoachingSessionSummary(
+            session_id=SessionId(session_id),
+            topic_id=topic_id,
+            status=status,
+            turn_count=2,
+            created_at=now,
+            updated_at=now,
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_user_sessions_returns_page_with_cursor(
+        self,
+        service: CoachingSessionService,
+        mock_session_repository: AsyncMock,
+    ) -> None:
+        """Summaries are listed without loading sessions and carry the next cursor."""
+        mock_session_repository.list_summaries_by_tenant_user.return_value = (
+            CoachingSessionSummaryPage(
+                items=[self._summary("s1", "core_values", ConversationStatus.ACTIVE)],
+                next_cursor="next",
+            )
+        )
+
+        page = await service.list_user_sessions(
+            tenant_id="tenant-123", user_id="user-123", limit=1, cursor="current"
+        )
+
+        assert [s.session_id for s in page.sessions] == ["s1"]
+        assert page.sessions[0].turn_count == 2
+        assert page.next_cursor == "next"
+        list_kwargs = mock_session_repository.list_summaries_by_tenant_user.call_args.kwargs
+        assert list_kwargs["cursor"] == "current"
+
+    @pytest.mark.asyncio
+    async def test_topics_with_status_reads_every_summary_page(
+        self,
+        service: CoachingSessionService,
+        mock_session_repository: AsyncMock,
+    ) -> None:
+        """Topic statuses come from all summary pages, not just the first."""
+        mock_session_repository.list_summaries_by_tenant_user.side_effect = [
+            CoachingSessionSummaryPage(
+                items=[self._summary("s1", "core_values", ConversationStatus.ACTIVE)],
+                next_cursor="page-2",
+            ),
+            CoachingSessionSummaryPage(
+                items=[self._summary("s2", "purpose", ConversationStatus.PAUSED)]
+            ),
+        ]
+
+        response = await service.get_topics_with_status(tenant_id="tenant-123", user_id="user-123")
+
+        statuses = {t.topic_id: (t.status, t.session_id) for t in response.topics}
+        assert statuses["core_values"] == ("in_progress", "s1")
+        assert statuses["purpose"] == ("paused", "s2")
+        assert mock_session_repository.list_summaries_by_tenant_user.await_count == 2
+
+    # =========================================================================
+    # Incremental extraction Tests
+    # =========================================================================
+
+    VALID_RESULT: ClassVar[dict[str, Any]] = {
+        "values": [
+            {
+                "name": "Integrity",
+                "description": "Doing what we say we will do.",
+                "importance": "It builds trust with customers.",
+            }
+        ],
+        "summary": "Integrity anchors every decision the team makes, big or small, every day.",
+    }
+
+    @staticmethod
+    def _llm_response(content: str) -> Mock:
+        response = Mock()
+        response.content = content
+        response.model = "claude-3-haiku"
+        response.usage = {"total_tokens": 50}
+        response.finish_reason = "stop"
+        return response
+
+    @pytest.fixture
+    def incremental_service(
+        self,
+        service: CoachingSessionService,
+        mock_session_repository: AsyncMock,
+        mock_topic_repository: AsyncMock,
+        mock_s3_prompt_storage: AsyncMock,
+        sample_endpoint_definition: TopicDefinition,
+        sample_llm_topic: LLMTopic,
+        sample_session: CoachingSession,
+    ) -> CoachingSessionService:
+        """Service with incremental extraction enabled and a loaded session."""
+        service.incremental_extraction = True
+        service._topic_index["core_values"] = sample_endpoint_definition
+        mock_session_repository.get_by_id_for_tenant.return_value = sample_session
+        mock_topic_repository.get.return_value = sample_llm_topic
+        mock_s3_prompt_storage.get_prompt.return_value = "You are a coach."
+        return service
+
+    @pytest.mark.asyncio
+    async def test_turn_refreshes_partial_result_in_background(
+        self,
+        incremental_service: CoachingSessionService,
+        mock_session_repository: AsyncMock,
+        mock_provider_factory: Mock,
+    ) -> None:
+        """A non-final turn schedules an extraction that stores the partial result."""
+        provider = mock_provider_factory.get_provider_for_model.return_value[0]
+        provider.generate.side_effect = [
+            self._llm_response("Tell me more about integrity."),
+            self._llm_response(json.dumps(self.VALID_RESULT)),
+        ]
+
+        response = await incremental_service.send_message(
+            session_id="test-session-123",
+            tenant_id="tenant-123",
+            user_id="user-123",
+            user_message="I value integrity.",
+        )
+        assert "test-session-123" in CoachingSessionService._pending_extractions
+        await incremental_service.wait_for_partial_extraction("test-session-123")
+
+        assert response.is_final is False
+        mock_session_repository.update_partial_result.assert_awaited_once_with(
+            "test-session-123", self.VALID_RESULT, 3
+        )
+        assert "test-session-123" not in CoachingSessionService._pending_extractions
+
+    @pytest.mark.asyncio
+    async def test_completion_returns_covering_partial_without_llm_call(
+        self,
+        incremental_service: CoachingSessionService,
+        mock_session_repository: AsyncMock,
+        mock_provider_factory: Mock,
+        sample_session: CoachingSession,
+    ) -> None:
+        """A partial result covering every message is validated and returned."""
+        sample_session.partial_result = self.VALID_RESULT
+        sample_session.partial_result_message_count = len(sample_session.messages)
+        provider = mock_provider_factory.get_provider_for_model.return_value[0]
+
+        response = await incremental_service.complete_session(
+            session_id="test-session-123",
+            tenant_id="tenant-123",
+            user_id="user-123",
+        )
+
+        assert response.result == self.VALID_RESULT
+        provider.generate.assert_not_awaited()
+        assert sample_session.extracted_result == self.VALID_RESULT
+        mock_session_repository.update.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_completion_extracts_only_uncovered_messages(
+        self,
+        incremental_service: CoachingSessionService,
+        mock_provider_factory: Mock,
+        sample_session: CoachingSession,
+    ) -> None:
+        """Messages after the partial result are folded in with an incremental prompt."""
+        sample_session.partial_result = {"values": [], "summary": ""}
+        sample_session.partial_result_message_count = 1
+        sample_session.add_user_message("Integrity matters most to me.")
+        sample_session.add_assistant_message("Great, let's capture that.")
+        provider = mock_provider_factory.get_provider_for_model.return_value[0]
+        provider.generate.return_value = self._llm_response(json.dumps(self.VALID_RESULT))
+
+        response = await incremental_service.complete_session(
+            session_id="test-session-123",
+            tenant_id="tenant-123",
+            user_id="user-123",
+        )
+
+        assert response.result == self.VALID_RESULT
+        prompt = str(provider.generate.call_args.kwargs["messages"])
+        assert "## New Messages" in prompt
+        assert "Integrity matters most to me." in prompt
+        assert "discover your core values" not in prompt
+
+    @pytest.mark.asyncio
+    async def test_invalid_partial_falls_back_to_full_extraction(
+        self,
+        incremental_service: CoachingSessionService,
+        mock_provider_factory: Mock,
+        sample_session: CoachingSession,
+    ) -> None:
+        """A partial result failing validation is replaced by a full extraction."""
+        sample_session.partial_result = {"values": []}
+        sample_session.partial_result_message_count = len(sample_session.messages)
+        provider = mock_provider_factory.get_provider_for_model.return_value[0]
+        provider.generate.return_value = self._llm_response(json.dumps(self.VALID_RESULT))
+
+        response = await incremental_service.complete_session(
+            session_id="test-session-123",
+            tenant_id="tenant-123",
+            user_id="user-123",
+        )
+
+        assert response.result == self.VALID_RESULT
+        prompt = str(provider.generate.call_args.kwargs["messages"])
+        assert "## Conversation" in prompt
+        assert "discover your core values" in prompt
+
+    @pytest.mark.asyncio
+    async def test_failed_incremental_completion_falls_back_to_full_extraction(
+        self,
+        incremental_service: CoachingSessionService,
+        mock_provider_factory: Mock,
+        sample_session: CoachingSession,
+    ) -> None:
+        """An error in the incremental extraction falls back to a full extraction."""
+        sample_session.partial_result = {"values": [], "summary": ""}
+        sample_session.partial_result_message_count = 1
+        sample_session.add_user_message("Integrity matters most to me.")
+        provider = mock_provider_factory.get_provider_for_model.return_value[0]
+        provider.generate.side_effect = [
+            RuntimeError("ThrottlingException"),
+            self._llm_response(json.dumps(self.VALID_RESULT)),
+        ]
+
+        response = await incremental_service.complete_session(
+            session_id="test-session-123",
+            tenant_id="tenant-123",
+            user_id="user-123",
+        )
+
+        assert response.result == self.VALID_RESULT
+        assert provider.generate.await_count == 2
+        prompt = str(provider.generate.call_args.kwargs["messages"])
+        assert "## Conversation" in prompt
+        assert "Integrity matters most to me." in prompt
+
 
 class TestResponseMetadata:
     """Tests for ResponseMetadata model."""
@@ -1159,3 +1493,45 @@ class TestLLMResponseParsing:
             == "It has been a privilege to walk through this discovery process with you, Tamatha. Your values paint a picture of someone who has fought hard to reclaim their voice and independence."
         )
         assert is_final is True
+
+
+class TestMessageStreamExtractor:
+    """Tests for incremental extraction of the coach message from a stream."""
+
+    @staticmethod
+    def _feed_all(chunks: list[str]) -> str:
+        extractor = MessageStreamExtractor()
+        return "".join(extractor.feed(chunk) for chunk in chunks)
+
+    def test_json_reply_char_by_char(self) -> None:
+        """Only the message field is emitted, whatever the chunk boundaries."""
+        reply = '{"message": "Hi \\"there\\"\\n\\u00e9", "is_final": false}'
+        assert self._feed_all(list(reply)) == 'Hi "there"\n\u00e9'
+
+    def test_fenced_json_reply(self) -> None:
+        """Markdown code fences around the JSON are skipped."""
+        chunks = ["```", "json\n", '{"message": "Hello', ' world"}\n', "```"]
+        assert self._feed_all(chunks) == "Hello world"
+
+    def test_surrogate_pair_split_across_chunks(self) -> None:
+        """Escaped surrogate pairs decode once both halves arrive."""
+        chunks = ['{"message": "\\ud83d', '\\ude00!"}']
+        assert self._feed_all(chunks) == "\U0001f600!"
+
+    def test_plain_text_reply_passes_through(self) -> None:
+        """Non-JSON replies are streamed unchanged."""
+        assert self._feed_all(["  Sure, ", "let's talk."]) == "  Sure, let's talk."
+
+    def test_matches_parse_llm_response(self) -> None:
+        """Streamed text equals the message parsed from the full reply."""
+        reply = '{"message": "Great work!", "is_final": true, "result": {"a": 1}}'
+        with patch.object(CoachingSessionService, "_build_topic_index"):
+            service = CoachingSessionService(
+                session_repository=AsyncMock(),
+                topic_repository=AsyncMock(),
+                s3_prompt_storage=AsyncMock(),
+                template_processor=AsyncMock(),
+                provider_factory=Mock(),
+            )
+        message, _ = service._parse_llm_response(reply)
+        assert self._feed_all([reply[:7], reply[7:20], reply[20:]]) == message
@@ -0,0 +1,164 @@
+"""Unit tests for InsightsSnapshotStore."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from coaching.src.models.insights import (
+    BusinessDataContext,
+    Insight,
+    InsightCategory,
+    InsightPriority,
+)
+from coaching.src.services.insights_snapshot_store import InsightsSnapshotStore
+
+
+def _insight(title: str = "Insight") -> Insight:
+    return Insight(
+        id=title.lower().replace(" ", "-"),
+        tenant_id="t1",
+        title=title,
+        description="Description must be long enough to pass validation rules.",
+        category=InsightCategory.STRATEGY,
+        priority=InsightPriority.HIGH,
+        expires_at=datetime.now(UTC) + timedelta(hours=24),
+    )
+
+
+def _business_data(**overrides: object) -> BusinessDataContext:
+    data: dict[str, object] = {"tenant_id": "tenant-1", "foundation": {"vision": "V"}}
+    data.update(overrides)
+    return BusinessDataContext.model_validate(data)
+
+
+class TestFingerprint:
+    """Tests for business data fingerprints."""
+
+    def test_ignores_collection_time(self) -> None:
+        first = _business_data(collected_at=datetime.now(UTC))
+        second = _business_data(collected_at=datetime.now(UTC) + timedelta(minutes=5))
+
+        assert InsightsSnapshotStore.fingerprint(first) == InsightsSnapshotStore.fingerprint(second)
+
+    def test_changes_with_data(self) -> None:
+        first = _business_data(goals=[{"id": "g1", "progress": 50}])
+        second = _business_data(goals=[{"id": "g1", "progress": 60}])
+
+        assert InsightsSnapshotStore.fingerprint(first) != InsightsSnapshotStore.fingerprint(second)
+
+
+class TestGetOrGenerate:
+    """Tests for snapshot reuse and regeneration."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_snapshot_until_forced(self) -> None:
+        store = InsightsSnapshotStore()
+        calls = 0
+
+        async def generate() -> list[Insight]:
+            nonlocal calls
+            calls += 1
+            return [_insight(f"Insight {calls}")]
+
+        first = await store.get_or_generate(tenant_id="t1", fingerprint="f", generate=generate)
+        second = await store.get_or_generate(tenant_id="t1", fingerprint="f", generate=generate)
+        forced = await store.get_or_generate(
+            tenant_id="t1", fingerprint="f", generate=generate, force_refresh=True
+        )
+        after = await store.get_or_generate(tenant_id="t1", fingerprint="f", generate=generate)
+
+        assert calls == 2
+        assert first[0] is second[0]
+        assert forced[0].title == "Insight 2"
+        assert after[0] is forced[0]
+        assert store.get_stats()["refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_keys_are_tenant_scoped(self) -> None:
+        store = InsightsSnapshotStore()
+        store.put("t1", "f", [_insight()])
+
+        assert store.get("t1", "f") is not None
+        assert store.get("t2", "f") is None
+
+    @pytest.mark.asyncio
+    async def test_empty_results_are_not_stored(self) -> None:
+        store = InsightsSnapshotStore()
+
+        async def generate() -> list[Insight]:
+            return []
+
+        await store.get_or_generate(tenant_id="t1", fingerprint="f", generate=generate)
+
+        assert store.get("t1", "f") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_generations_are_coalesced(self) -> None:
+        store = InsightsSnapshotStore()
+        release = asyncio.Event()
+        calls = 0
+
+        async def generate() -> list[Insight]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [_insight()]
+
+        tasks = [
+            asyncio.create_task(
+                store.get_or_generate(tenant_id="t1", fingerprint="f", generate=generate)
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert all(len(r) == 1 for r in results)
+        assert store.get_stats()["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_stored(self) -> None:
+        store = InsightsSnapshotStore()
+
+        async def generate() -> list[Insight]:
+            raise RuntimeError("LLM unavailable")
+
+        with pytest.raises(RuntimeError):
+            await store.get_or_generate(tenant_id="t1", fingerprint="f", generate=generate)
+        assert store.get("t1", "f") is None
+
+
+class TestExpiryAndEviction:
+    """Tests for the validity window and size bound."""
+
+    def test_expired_snapshot_is_dropped(self) -> None:
+        store = InsightsSnapshotStore(ttl_seconds=10.0)
+        with patch("coaching.src.services.insights_snapshot_store.time.monotonic") as clock:
+            clock.return_value = 100.0
+            store.put("t1", "f", [_insight()])
+            clock.return_value = 111.0
+
+            assert store.get("t1", "f") is None
+        assert store.get_stats()["size"] == 0
+
+    def test_lru_eviction(self) -> None:
+        store = InsightsSnapshotStore(max_entries=2)
+        store.put("t1", "a", [_insight()])
+        store.put("t1", "b", [_insight()])
+        store.get("t1", "a")
+        store.put("t1", "c", [_insight()])
+
+        assert store.get("t1", "a") is not None
+        assert store.get("t1", "b") is None
+
+    def test_invalidate_tenant(self) -> None:
+        store = InsightsSnapshotStore()
+        store.put("t1", "a", [_insight()])
+        store.put("t1", "b", [_insight()])
+        store.put("t2", "a", [_insight()])
+
+        assert store.invalidate("t1") == 2
+        assert store.get("t2", "a") is not None
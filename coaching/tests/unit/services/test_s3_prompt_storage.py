@@ -1,5 +1,7 @@
 """Unit tests for S3PromptStorage service."""
 
+import asyncio
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -248,3 +250,164 @@ class TestS3PromptStorageExists:
         )
 
         assert result is False
+
+
+class TestS3PromptStorageCache:
+    """Tests for the in-process prompt cache."""
+
+    @staticmethod
+    def _object(content: str, etag: str = '"v1"') -> dict[str, object]:
+        return {"Body": MagicMock(read=lambda: content.encode("utf-8")), "ETag": etag}
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_served_from_cache(
+        self,
+        storage: S3PromptStorage,
+        mock_s3_client: MagicMock,
+    ) -> None:
+        """Test repeated reads within the revalidation interval skip S3."""
+        mock_s3_client.get_object.return_value = self._object("cached")
+
+        first = await storage.get_prompt(topic_id="t", prompt_type="system")
+        second = await storage.get_prompt(topic_id="t", prompt_type="system")
+
+        assert first == second == "cached"
+        mock_s3_client.get_object.assert_called_once()
+        stats = storage.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidated_with_etag(
+        self,
+        mock_s3_client: MagicMock,
+    ) -> None:
+        """Test stale entries send If-None-Match and reuse content on 304."""
+        storage = S3PromptStorage(
+            bucket_name="test-bucket",
+            s3_client=mock_s3_client,
+            cache_revalidate_seconds=0,
+        )
+        mock_s3_client.get_object.return_value = self._object("v1 body")
+        await storage.get_prompt(topic_id="t", prompt_type="system")
+
+        mock_s3_client.get_object.return_value = None
+        mock_s3_client.get_object.side_effect = ClientError(
+            {
+                "Error": {"Code": "304", "Message": "Not Modified"},
+                "ResponseMetadata": {"HTTPStatusCode": 304},
+            },
+            "GetObject",
+        )
+        result = await storage.get_prompt(topic_id="t", prompt_type="system")
+
+        assert result == "v1 body"
+        assert mock_s3_client.get_object.call_args.kwargs["IfNoneMatch"] == '"v1"'
+        assert storage.get_cache_stats()["revalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_refreshed_when_changed(
+        self,
+        mock_s3_client: MagicMock,
+    ) -> None:
+        """Test a changed object replaces the cached content."""
+        storage = S3PromptStorage(
+            bucket_name="test-bucket",
+            s3_client=mock_s3_client,
+            cache_revalidate_seconds=0,
+        )
+        mock_s3_client.get_object.return_value = self._object("old")
+        await storage.get_prompt(topic_id="t", prompt_type="system")
+
+        mock_s3_client.get_object.return_value = self._object("new", etag='"v2"')
+        result = await storage.get_prompt(topic_id="t", prompt_type="system")
+
+        assert result == "new"
+        assert storage.get_cache_stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_save_and_delete_invalidate_entry(
+        self,
+        storage: S3PromptStorage,
+        mock_s3_client: MagicMock,
+    ) -> None:
+        """Test writes drop the cached entry immediately."""
+        mock_s3_client.get_object.return_value = self._object("old")
+        await storage.get_prompt(topic_id="t", prompt_type="system")
+
+        await storage.save_prompt(topic_id="t", prompt_type="system", content="new")
+        assert storage.get_cache_stats()["size"] == 0
+
+        mock_s3_client.get_object.return_value = self._object("new", etag='"v2"')
+        assert await storage.get_prompt(topic_id="t", prompt_type="system") == "new"
+
+        await storage.delete_prompt(topic_id="t", prompt_type="system")
+        assert storage.get_cache_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_read_overlapping_save_is_not_cached(
+        self,
+        storage: S3PromptStorage,
+        mock_s3_client: MagicMock,
+    ) -> None:
+        """Test a read that returns the old body during a save does not re-cache it."""
+        written = threading.Event()
+
+        def slow_get_object(**_: object) -> dict[str, object]:
+            # Resolve with the pre-save body only after the write has landed
+            assert written.wait(timeout=5)
+            return self._object("old")
+
+        mock_s3_client.get_object.side_effect = slow_get_object
+        mock_s3_client.put_object.side_effect = lambda **_: written.set()
+
+        results = await asyncio.gather(
+            storage.get_prompt(topic_id="t", prompt_type="system"),
+            storage.save_prompt(topic_id="t", prompt_type="system", content="new"),
+        )
+        assert results[0] == "old"
+        assert storage.get_cache_stats()["size"] == 0
+
+        mock_s3_client.get_object.side_effect = None
+        mock_s3_client.get_object.return_value = self._object("new", etag='"v2"')
+        assert await storage.get_prompt(topic_id="t", prompt_type="system") == "new"
+        assert mock_s3_client.get_object.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(
+        self,
+        mock_s3_client: MagicMock,
+    ) -> None:
+        """Test least recently used entries are evicted beyond the limit."""
+        storage = S3PromptStorage(
+            bucket_name="test-bucket",
+            s3_client=mock_s3_client,
+            cache_max_entries=2,
+        )
+        mock_s3_client.get_object.return_value = self._object("body")
+
+        for topic in ("a", "b", "c"):
+            await storage.get_prompt(topic_id=topic, prompt_type="system")
+
+        assert storage.get_cache_stats()["size"] == 2
+        assert storage.invalidate_cache(topic_id="a") == 0
+        assert storage.invalidate_cache(topic_id="c") == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(
+        self,
+        mock_s3_client: MagicMock,
+    ) -> None:
+        """Test cache_max_entries=0 always reads from S3."""
+        storage = S3PromptStorage(
+            bucket_name="test-bucket",
+            s3_client=mock_s3_client,
+            cache_max_entries=0,
+        )
+        mock_s3_client.get_object.return_value = self._object("body")
+
+        await storage.get_prompt(topic_id="t", prompt_type="system")
+        await storage.get_prompt(topic_id="t", prompt_type="system")
+
+        assert mock_s3_client.get_object.call_count == 2
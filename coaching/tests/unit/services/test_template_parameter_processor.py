@@ -9,12 +9,17 @@ Tests the core template processing functionality:
 - Parameter substitution
 """
 
+import asyncio
+import time
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from coaching.src.core.parameter_registry import ParameterDefinition, ParameterType
-from coaching.src.core.retrieval_method_registry import RetrievalContext
+from coaching.src.core.retrieval_method_registry import (
+    RetrievalContext,
+    RetrievalMethodDefinition,
+)
 from coaching.src.services.template_parameter_processor import (
     PARAMETER_PATTERN_DOUBLE,
     PARAMETER_PATTERN_SINGLE,
@@ -586,6 +591,158 @@ class TestEnrichParameters:
             assert "something" not in result
 
 
+def _string_requirement(name: str, method: str, default: Any = None) -> ParameterRequirement:
+    return ParameterRequirement(
+        name=name,
+        definition=ParameterDefinition(
+            name=name,
+            param_type=ParameterType.STRING,
+            retrieval_method=method,
+            default=default,
+        ),
+    )
+
+
+class TestConcurrentEnrichment:
+    """Tests for concurrent, dependency-aware retrieval execution."""
+
+    @pytest.mark.asyncio
+    async def test_independent_methods_run_concurrently(
+        self, mock_business_client: MagicMock
+    ) -> None:
+        """Test: Independent methods overlap instead of running serially."""
+        processor = TemplateParameterProcessor(mock_business_client, max_concurrency=3)
+
+        async def slow_method(ctx: RetrievalContext) -> dict[str, Any]:
+            await asyncio.sleep(0.1)
+            return {"a": "A", "b": "B", "c": "C"}
+
+        params_by_method = {
+            f"method_{name}": [_string_requirement(name, f"method_{name}")]
+            for name in ("a", "b", "c")
+        }
+        latencies: dict[str, float] = {}
+
+        with (
+            patch(
+                "coaching.src.services.template_parameter_processor.get_retrieval_method",
+                return_value=slow_method,
+            ),
+            patch(
+                "coaching.src.services.template_parameter_processor.get_retrieval_method_definition",
+                return_value=None,
+            ),
+        ):
+            start = time.perf_counter()
+            result = await processor._enrich_parameters(
+                params_by_method=params_by_method,
+                payload={},
+                user_id="user-1",
+                tenant_id="tenant-1",
+                latencies_ms=latencies,
+            )
+            elapsed = time.perf_counter() - start
+
+        assert result == {"a": "A", "b": "B", "c": "C"}
+        assert elapsed < 0.25
+        assert set(latencies) == set(params_by_method)
+        assert all(ms >= 90 for ms in latencies.values())
+
+    @pytest.mark.asyncio
+    async def test_timeout_applies_default(self, mock_business_client: MagicMock) -> None:
+        """Test: A method exceeding its budget is abandoned and defaults apply."""
+        processor = TemplateParameterProcessor(mock_business_client, method_timeout_seconds=0.05)
+
+        async def hanging_method(ctx: RetrievalContext) -> dict[str, Any]:
+            await asyncio.sleep(1)
+            return {"vision": "late"}
+
+        with (
+            patch(
+                "coaching.src.services.template_parameter_processor.get_retrieval_method",
+                return_value=hanging_method,
+            ),
+            patch(
+                "coaching.src.services.template_parameter_processor.get_retrieval_method_definition",
+                return_value=None,
+            ),
+        ):
+            result = await processor._enrich_parameters(
+                params_by_method={
+                    "slow": [_string_requirement("vision", "slow", default="Default vision")]
+                },
+                payload={},
+                user_id="user-1",
+                tenant_id="tenant-1",
+            )
+
+        assert result == {"vision": "Default vision"}
+
+    @pytest.mark.asyncio
+    async def test_dependent_method_receives_upstream_value(
+        self, mock_business_client: MagicMock
+    ) -> None:
+        """Test: A method requiring a value produced by another waits for it."""
+        processor = TemplateParameterProcessor(mock_business_client)
+        calls: list[str] = []
+
+        async def get_strategy(ctx: RetrievalContext) -> dict[str, Any]:
+            calls.append("strategy")
+            return {"strategy_name": "Grow", "goal_id": "goal-42"}
+
+        async def get_goal(ctx: RetrievalContext) -> dict[str, Any]:
+            calls.append(f"goal:{ctx.payload['goal_id']}")
+            return {"goal_title": "Goal 42"}
+
+        methods = {"get_strategy": get_strategy, "get_goal": get_goal}
+        definitions = {
+            "get_strategy": RetrievalMethodDefinition(
+                name="get_strategy",
+                description="",
+                provides_params=("strategy_name", "goal_id"),
+            ),
+            "get_goal": RetrievalMethodDefinition(
+                name="get_goal",
+                description="",
+                provides_params=("goal_title",),
+                requires_from_payload=("goal_id",),
+            ),
+        }
+
+        with (
+            patch(
+                "coaching.src.services.template_parameter_processor.get_retrieval_method",
+                side_effect=methods.get,
+            ),
+            patch(
+                "coaching.src.services.template_parameter_processor.get_retrieval_method_definition",
+                side_effect=definitions.get,
+            ),
+        ):
+            result = await processor._enrich_parameters(
+                params_by_method={
+                    "get_goal": [_string_requirement("goal_title", "get_goal")],
+                    "get_strategy": [_string_requirement("strategy_name", "get_strategy")],
+                },
+                payload={},
+                user_id="user-1",
+                tenant_id="tenant-1",
+            )
+
+        assert calls == ["strategy", "goal:goal-42"]
+        assert result == {"goal_title": "Goal 42", "strategy_name": "Grow"}
+
+    def test_dependency_cycle_is_broken(self, processor: TemplateParameterProcessor) -> None:
+        """Test: Cyclic dependencies are dropped so every method is scheduled."""
+        graph = {"a": {"b"}, "b": {"a"}, "c": set()}
+
+        order = processor._order_methods(graph)
+
+        assert order[0] == "c"
+        assert set(order) == {"a", "b", "c"}
+        assert graph == {"a": set(), "b": set(), "c": set()}
+
+
 # =============================================================================
 # Test: ParameterExtractionResult dataclass
 # =============================================================================
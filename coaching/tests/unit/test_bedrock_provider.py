@@ -1,6 +1,6 @@
 """Unit tests for BedrockLLMProvider."""
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from coaching.src.domain.ports.llm_provider_port import LLMMessage
@@ -319,6 +319,25 @@ class TestBedrockProviderMultipleModels:
             assert result is not None
             assert result.content == "Test response"
 
+    async def test_generate_runs_on_bedrock_runtime_pool(
+        self, provider: BedrockLLMProvider
+    ) -> None:
+        """Test that converse runs on the bounded bedrock-runtime pool."""
+        # Arrange
+        messages = [LLMMessage(role="user", content="Hello")]
+        run_aws_call = AsyncMock(return_value=provider.bedrock_client.converse.return_value)
+
+        # Act
+        with patch("coaching.src.infrastructure.llm.bedrock_provider.run_aws_call", run_aws_call):
+            result = await provider.generate(
+                messages=messages, model="anthropic.claude-3-sonnet-20240229-v1:0"
+            )
+
+        # Assert
+        assert result.content == "Test response"
+        args = run_aws_call.await_args.args
+        assert args == ("bedrock-runtime", provider.bedrock_client.converse)
+
 
 @pytest.mark.unit
 class TestBedrockProviderConfiguration:
@@ -449,3 +468,182 @@ class TestInferenceProfileResolution:
         apac_provider = BedrockLLMProvider(Mock(), region="ap-southeast-1")
         resolved = apac_provider._resolve_model_id("anthropic.claude-3-5-sonnet-20241022-v2:0")
         assert resolved.startswith("apac.")
+
+
+@pytest.mark.unit
+class TestBedrockProviderStreaming:
+    """Test generate_stream consumption of the Converse event stream."""
+
+    @pytest.mark.asyncio
+    async def test_generate_stream_yields_text_deltas(self) -> None:
+        """Test text deltas are yielded and other events ignored."""
+        events = [
+            {"messageStart": {"role": "assistant"}},
+            {"contentBlockDelta": {"delta": {"text": "Hello"}}},
+            {"contentBlockDelta": {"delta": {"text": " world"}}},
+            {"messageStop": {"stopReason": "end_turn"}},
+            {"metadata": {"usage": {"inputTokens": 12, "outputTokens": 3, "totalTokens": 15}}},
+        ]
+        mock_client = Mock()
+        mock_client.converse_stream.return_value = {"stream": events}
+        provider = BedrockLLMProvider(bedrock_client=mock_client)
+        usage: dict[str, int] = {}
+
+        tokens = [
+            token
+            async for token in provider.generate_stream(
+                messages=[LLMMessage(role="user", content="Hi")],
+                model="anthropic.claude-3-haiku-20240307-v1:0",
+                usage=usage,
+            )
+        ]
+
+        assert tokens == ["Hello", " world"]
+        assert usage["total_tokens"] == 15
+        mock_client.converse_stream.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_generate_stream_closes_stream_when_consumer_stops(self) -> None:
+        """Test the HTTP event stream is closed if the consumer disconnects early."""
+
+        class FakeEventStream:
+            def __init__(self) -> None:
+                self.closed = False
+
+            def __iter__(self):  # type: ignore[no-untyped-def]
+                while not self.closed:
+                    yield {"contentBlockDelta": {"delta": {"text": "tok"}}}
+
+            def close(self) -> None:
+                self.closed = True
+
+        stream = FakeEventStream()
+        mock_client = Mock()
+        mock_client.converse_stream.return_value = {"stream": stream}
+        provider = BedrockLLMProvider(bedrock_client=mock_client, stream_buffer_size=2)
+
+        tokens = provider.generate_stream(
+            messages=[LLMMessage(role="user", content="Hi")],
+            model="anthropic.claude-3-haiku-20240307-v1:0",
+        )
+        assert await tokens.__anext__() == "tok"
+        await tokens.aclose()
+
+        assert stream.closed is True
+
+
+@pytest.mark.unit
+class TestBedrockPromptCaching:
+    """Test cache point placement on system prompts and conversation history."""
+
+    MODEL = "anthropic.claude-sonnet-4-5-20250929-v1:0"
+
+    @staticmethod
+    def _conversation(turns: int, chars: int = 8000) -> list[LLMMessage]:
+        messages = []
+        for i in range(turns):
+            messages.append(LLMMessage(role="user", content=f"question {i} " + "q" * chars))
+            messages.append(LLMMessage(role="assistant", content=f"answer {i} " + "a" * chars))
+        messages.append(LLMMessage(role="user", content="next question"))
+        return messages
+
+    @staticmethod
+    def _provider(response: dict[str, object] | None = None) -> tuple[BedrockLLMProvider, Mock]:
+        client = Mock()
+        client.converse.return_value = response or {
+            "output": {"message": {"content": [{"text": "ok"}]}},
+            "usage": {"inputTokens": 10, "outputTokens": 5},
+            "stopReason": "end_turn",
+        }
+        return BedrockLLMProvider(bedrock_client=client, region="us-east-1"), client
+
+    @staticmethod
+    def _cached_indexes(request: dict[str, object]) -> list[int]:
+        messages = request["messages"]
+        assert isinstance(messages, list)
+        return [
+            i
+            for i, message in enumerate(messages)
+            if any("cachePoint" in block for block in message["content"])
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cache_points_follow_latest_assistant_turns(self) -> None:
+        provider, client = self._provider()
+
+        await provider.generate(
+            messages=self._conversation(turns=3),
+            model=self.MODEL,
+            system_prompt="s" * 8000,
+        )
+
+        request = client.converse.call_args.kwargs
+        assert "cachePoint" in request["system"][-1]
+        # Turns are (user, assistant) pairs; the new user message stays uncached
+        assert self._cached_indexes(request) == [3, 5]
+
+    def test_cache_points_stay_within_request_limit(self) -> None:
+        provider, _ = self._provider()
+        messages = provider._build_converse_messages(self._conversation(turns=4))
+        system = [{"text": "s"}, {"cachePoint": {"type": "default"}}] * 3
+
+        provider._add_message_cache_points(messages, "us." + self.MODEL, system)
+
+        assert self._cached_indexes({"messages": messages}) == [7]
+
+    def test_short_prefix_and_unsupported_models_are_not_cached(self) -> None:
+        provider, _ = self._provider()
+        short = provider._build_converse_messages(self._conversation(turns=2, chars=100))
+        provider._add_message_cache_points(short, self.MODEL, [])
+        llama = provider._build_converse_messages(self._conversation(turns=2))
+        provider._add_message_cache_points(llama, "meta.llama3-70b-instruct-v1:0", [])
+
+        assert self._cached_indexes({"messages": short}) == []
+        assert self._cached_indexes({"messages": llama}) == []
+
+    @pytest.mark.asyncio
+    async def test_access_denied_retries_without_any_cache_points(self) -> None:
+        provider, client = self._provider()
+        ok = client.converse.return_value
+        client.converse.side_effect = [
+            Exception("AccessDeniedException: prompt caching is not enabled"),
+            ok,
+        ]
+
+        response = await provider.generate(
+            messages=self._conversation(turns=2),
+            model=self.MODEL,
+            system_prompt="s" * 8000,
+        )
+
+        assert response.content == "ok"
+        retry = client.converse.call_args.kwargs
+        assert self._cached_indexes(retry) == []
+        assert retry["system"] == [{"text": "s" * 8000}]
+
+    @pytest.mark.asyncio
+    async def test_usage_reports_cache_tokens(self) -> None:
+        provider, _ = self._provider(
+            {
+                "output": {"message": {"content": [{"text": "ok"}]}},
+                "usage": {
+                    "inputTokens": 20,
+                    "outputTokens": 5,
+                    "cacheReadInputTokens": 3000,
+                    "cacheWriteInputTokens": 400,
+                },
+                "stopReason": "end_turn",
+            }
+        )
+
+        response = await provider.generate(
+            messages=[LLMMessage(role="user", content="Hi")], model=self.MODEL
+        )
+
+        assert response.usage == {
+            "prompt_tokens": 20,
+            "completion_tokens": 5,
+            "total_tokens": 25,
+            "cache_read_tokens": 3000,
+            "cache_write_tokens": 400,
+        }
@@ -7,6 +7,7 @@ from coaching.src.infrastructure.repositories.dynamodb_conversation_repository i
     DynamoDBConversationRepository,
 )
 from coaching.src.services.insights_service import BusinessDataContext, InsightsService
+from coaching.src.services.insights_snapshot_store import InsightsSnapshotStore
 from coaching.src.services.llm_service import LLMService
 from shared.models.schemas import PaginatedResponse
 
@@ -314,3 +315,67 @@ async def test_pagination(insights_service, mock_llm_service):
     result3 = await insights_service.generate_insights(page=3, page_size=2)
     assert len(result3.data) == 1
     assert result3.pagination.page == 3
+
+
+@pytest.fixture
+def snapshot_service(mock_repo, mock_business_client, mock_llm_service):
+    mock_llm_service.generate_single_shot_analysis.return_value = {
+        "response": json.dumps(
+            {
+                "insights": [
+                    {
+                        "title": f"Insight {i}",
+                        "description": "Description must be long enough to pass validation rules.",
+                        "category": "strategy" if i % 2 else "operations",
+                        "priority": "high",
+                        "suggested_actions": [],
+                    }
+                    for i in range(5)
+                ]
+            }
+        )
+    }
+    return InsightsService(
+        conversation_repo=mock_repo,
+        business_api_client=mock_business_client,
+        llm_service=mock_llm_service,
+        tenant_id="tenant-123",
+        user_id="user-123",
+        snapshot_store=InsightsSnapshotStore(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_pages_filters_and_summary_reuse_snapshot(snapshot_service, mock_llm_service):
+    page1 = await snapshot_service.generate_insights(page=1, page_size=2)
+    page2 = await snapshot_service.generate_insights(page=2, page_size=2)
+    filtered = await snapshot_service.generate_insights(category="strategy")
+    summary = await snapshot_service.get_insights_summary("user-123")
+
+    assert mock_llm_service.generate_single_shot_analysis.await_count == 1
+    assert page1.pagination.total == 5
+    assert {i.id for i in page1.data}.isdisjoint({i.id for i in page2.data})
+    assert filtered.pagination.total == 2
+    assert summary.total_insights == 5
+
+
+@pytest.mark.asyncio
+async def test_force_refresh_regenerates(snapshot_service, mock_llm_service):
+    await snapshot_service.generate_insights()
+    await snapshot_service.generate_insights(force_refresh=True)
+    await snapshot_service.get_insights_summary("user-123", force_refresh=True)
+
+    assert mock_llm_service.generate_single_shot_analysis.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_changed_business_data_regenerates(
+    snapshot_service, mock_llm_service, mock_business_client
+):
+    await snapshot_service.generate_insights()
+    mock_business_client.get_user_goals.return_value = [
+        {"id": "1", "title": "Goal 1", "status": "active", "progress": 75}
+    ]
+    await snapshot_service.generate_insights()
+
+    assert mock_llm_service.generate_single_shot_analysis.await_count == 2
@@ -0,0 +1,96 @@
+"""Unit tests for workflow checkpoints."""
+
+import pytest
+from coaching.src.workflows.base import WorkflowState, WorkflowStatus, WorkflowType
+from coaching.src.workflows.checkpoints import (
+    InMemoryCheckpointBackend,
+    LRUDict,
+    deserialize_state,
+    serialize_state,
+)
+
+
+def _state(**overrides: object) -> WorkflowState:
+    data: dict[str, object] = {
+        "workflow_id": "wf-1",
+        "workflow_type": WorkflowType.CONVERSATIONAL_COACHING,
+        "user_id": "user-1",
+    }
+    data.update(overrides)
+    return WorkflowState(**data)
+
+
+class TestLRUDict:
+    """Tests for the bounded mapping."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        entries: LRUDict[str, int] = LRUDict(2)
+        entries["a"] = 1
+        entries["b"] = 2
+        assert entries["a"] == 1  # "b" is now least recently used
+
+        entries["c"] = 3
+
+        assert list(entries) == ["a", "c"]
+
+    def test_overwrite_does_not_evict(self) -> None:
+        entries: LRUDict[str, int] = LRUDict(2)
+        entries["a"] = 1
+        entries["b"] = 2
+        entries["a"] = 10
+
+        assert dict(entries) == {"b": 2, "a": 10}
+
+
+class TestSerialization:
+    """Tests for compact state checkpoints."""
+
+    def test_defaults_are_omitted_and_restored(self) -> None:
+        state = _state(
+            status=WorkflowStatus.WAITING_INPUT,
+            conversation_history=[{"role": "user", "content": "Hi"}],
+        )
+
+        data = serialize_state(state)
+
+        assert data == {
+            "workflow_id": "wf-1",
+            "workflow_type": "conversational_coaching",
+            "user_id": "user-1",
+            "status": "waiting_input",
+            "conversation_history": [{"role": "user", "content": "Hi"}],
+        }
+        assert deserialize_state(data) == state
+
+    def test_full_dumps_are_still_readable(self) -> None:
+        state = _state(results={"values": ["growth"]})
+
+        assert deserialize_state(state.model_dump()) == state
+
+
+class TestInMemoryCheckpointBackend:
+    """Tests for the local stand-in backend."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_expiry(self) -> None:
+        now = [0.0]
+        backend = InMemoryCheckpointBackend(ttl_seconds=10.0, clock=lambda: now[0])
+        data = serialize_state(_state())
+
+        await backend.save_workflow_state("wf-1", data)
+        assert await backend.load_workflow_state("wf-1") == data
+
+        now[0] = 10.0
+        assert await backend.load_workflow_state("wf-1") is None
+        assert await backend.load_workflow_state("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_saving_drops_expired_checkpoints(self) -> None:
+        now = [0.0]
+        backend = InMemoryCheckpointBackend(ttl_seconds=10.0, clock=lambda: now[0])
+        await backend.save_workflow_state("old", serialize_state(_state(workflow_id="old")))
+
+        now[0] = 20.0
+        await backend.save_workflow_state("new", serialize_state(_state(workflow_id="new")))
+
+        assert len(backend) == 1
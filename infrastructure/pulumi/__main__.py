@@ -61,6 +61,8 @@ coaching_sessions_table = aws.dynamodb.Table(
         aws.dynamodb.TableAttributeArgs(name="user_id", type="S"),
         aws.dynamodb.TableAttributeArgs(name="tenant_id", type="S"),
         aws.dynamodb.TableAttributeArgs(name="topic_id", type="S"),
+        aws.dynamodb.TableAttributeArgs(name="active_shard", type="S"),
+        aws.dynamodb.TableAttributeArgs(name="last_activity_at", type="S"),
     ],
     global_secondary_indexes=[
         # GSI for tenant + topic queries (one active session per tenant per topic)
@@ -77,11 +79,34 @@ coaching_sessions_table = aws.dynamodb.Table(
             range_key="user_id",
             projection_type="ALL",
         ),
+        # Sparse GSI of active sessions by last activity (inactive-session sweeper)
+        aws.dynamodb.TableGlobalSecondaryIndexArgs(
+            name="active-activity-index",
+            hash_key="active_shard",
+            range_key="last_activity_at",
+            projection_type="KEYS_ONLY",
+        ),
     ],
     point_in_time_recovery=aws.dynamodb.TablePointInTimeRecoveryArgs(enabled=True),
     tags={**common_tags, "Name": "coaching_sessions", "Purpose": "Session-Tracking"},
 )
 
+# Append-only coaching session messages (one item per message)
+coaching_session_messages_table = aws.dynamodb.Table(
+    "coaching-session-messages",
+    name=f"purposepath-coaching-session-messages-{stack}",
+    billing_mode="PAY_PER_REQUEST",
+    hash_key="session_id",
+    range_key="seq",
+    attributes=[
+        aws.dynamodb.TableAttributeArgs(name="session_id", type="S"),
+        aws.dynamodb.TableAttributeArgs(name="seq", type="N"),
+    ],
+    ttl=aws.dynamodb.TableTtlArgs(attribute_name="ttl", enabled=True),
+    point_in_time_recovery=aws.dynamodb.TablePointInTimeRecoveryArgs(enabled=True),
+    tags={**common_tags, "Name": "coaching_session_messages", "Purpose": "Session-Messages"},
+)
+
 # Topic definitions table (master data consumed by coaching service runtime)
 topics_table = aws.dynamodb.Table(
     "topics",
@@ -182,6 +207,7 @@ pulumi.export(
     {
         "conversations": f"purposepath-coaching-conversations-{stack}",
         "sessions": f"purposepath-coaching-sessions-{stack}",
+        "sessionMessages": f"purposepath-coaching-session-messages-{stack}",
         "topics": f"purposepath-topics-{stack}",
     },
 )
@@ -198,6 +224,7 @@ pulumi.export(
     {
         "conversations": conversations_table.arn,
         "sessions": coaching_sessions_table.arn,
+        "sessionMessages": coaching_session_messages_table.arn,
         "topics": topics_table.arn,
     },
 )
@@ -1,14 +1,25 @@
 """Observability module for monitoring, tracing, and metrics."""
 
 from shared.observability.logging import configure_logging, get_logger
-from shared.observability.metrics import CloudWatchMetrics, MetricsCollector
+from shared.observability.metrics import (
+    CloudWatchMetrics,
+    EMFMetrics,
+    InMemoryMetricsSink,
+    MetricsCollector,
+    flush_metrics,
+    get_metrics,
+)
 from shared.observability.tracing import XRayTracer, trace_function
 
 __all__ = [
     "CloudWatchMetrics",
+    "EMFMetrics",
+    "InMemoryMetricsSink",
     "MetricsCollector",
     "XRayTracer",
     "configure_logging",
+    "flush_metrics",
     "get_logger",
+    "get_metrics",
     "trace_function",
 ]
@@ -1,75 +1,127 @@
-"""CloudWatch metrics collection for production observability."""
+"""CloudWatch metrics collection for production observability.
 
+Metrics are aggregated in process and flushed in batches, normally once at the
+end of each request or Lambda invocation (``flush_metrics``), so recording a
+data point never makes a network call on the request path.
+
+Backends:
+- ``EMFMetrics`` (default): writes CloudWatch Embedded Metric Format (EMF)
+  documents as JSON lines to stdout. Lambda ships stdout to CloudWatch Logs,
+  which extracts the metrics, so there is no API call at all.
+- ``CloudWatchMetrics``: batched ``put_metric_data`` calls, for processes
+  whose stdout is not collected by CloudWatch Logs.
+
+Select the backend with ``METRICS_BACKEND`` (``emf`` or ``cloudwatch``).
+Tests can pass an ``InMemoryMetricsSink`` to ``EMFMetrics`` to assert on
+emitted documents.
+"""
+
+import json
 import os
-from datetime import datetime
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
 
-import boto3
 import structlog
-from botocore.exceptions import ClientError
 
 logger = structlog.get_logger()
 
+# Standard dimension names for LLM metrics
+DIMENSION_TOPIC = "Topic"
+DIMENSION_MODEL = "Model"
+DIMENSION_TENANT_TIER = "TenantTier"
 
-class MetricsCollector:
-    """Base metrics collector interface."""
+# EMF allows at most 100 values per metric per document
+EMF_MAX_VALUES = 100
+# PutMetricData accepts at most 1000 metric data items per call
+CLOUDWATCH_MAX_DATUMS = 1000
+# Distinct values per datum in PutMetricData (Values/Counts arrays)
+CLOUDWATCH_MAX_VALUES = 150
 
-    def record_metric(
-        self,
-        metric_name: str,
-        value: float,
-        unit: str = "Count",
-        dimensions: dict[str, str] | None = None,
-    ) -> None:
-        """Record a metric."""
-        raise NotImplementedError
+DimensionKey = tuple[tuple[str, str], ...]
 
 
-class CloudWatchMetrics(MetricsCollector):
-    """
-    CloudWatch metrics collector for production monitoring.
+@dataclass
+class AggregatedMetric:
+    """Values recorded for one metric and dimension set since the last flush.
 
-    Features:
-    - Automatic batching of metric data
-    - Namespace isolation by environment
-    - Standard dimensions (Service, Environment, Stage)
-    - Error handling and logging
+    ``Count`` metrics are summed; other units keep every value so percentile
+    statistics stay correct.
     """
 
-    def __init__(
+    name: str
+    unit: str
+    dimensions: DimensionKey
+    storage_resolution: int
+    values: list[float] = field(default_factory=list)
+
+    def add(self, value: float) -> None:
+        """Add a data point."""
+        if self.unit == "Count" and self.values:
+            self.values[0] += value
+        else:
+            self.values.append(value)
+
+
+class MetricAggregator:
+    """Thread-safe in-process buffer of metric values, drained on flush."""
+
+    def __init__(self) -> None:
+        """Initialize an empty aggregator."""
+        self._lock = threading.Lock()
+        self._metrics: dict[tuple[str, str, DimensionKey, int], AggregatedMetric] = {}
+        self._pending = 0
+
+    def add(
         self,
-        namespace: str | None = None,
-        service_name: str = "PurposePath-Coaching",
-        enabled: bool = True,
-    ):
+        name: str,
+        value: float,
+        unit: str,
+        dimensions: dict[str, str],
+        storage_resolution: int = 60,
+    ) -> int:
+        """Buffer a data point.
+
+        Returns:
+            Number of data points buffered since the last drain
         """
-        Initialize CloudWatch metrics collector.
+        dims = tuple(sorted(dimensions.items()))
+        key = (name, unit, dims, storage_resolution)
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = AggregatedMetric(name, unit, dims, storage_resolution)
+                self._metrics[key] = metric
+            metric.add(value)
+            self._pending += 1
+            return self._pending
+
+    def drain(self) -> list[AggregatedMetric]:
+        """Remove and return everything buffered."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            self._metrics = {}
+            self._pending = 0
+        return metrics
+
+    def __len__(self) -> int:
+        """Get the number of buffered data points."""
+        return self._pending
 
-        Args:
-            namespace: CloudWatch namespace (defaults to env-based)
-            service_name: Service name for dimensions
-            enabled: Whether metrics collection is enabled
-        """
-        self.enabled = enabled
-        self.service_name = service_name
-        self.stage = os.getenv("STAGE", "dev")
 
-        # Default namespace based on environment
-        self.namespace = namespace or f"PurposePath/{self.stage.capitalize()}"
+class MetricsCollector:
+    """Base metrics collector interface.
 
-        # Initialize CloudWatch client if enabled
-        self.cloudwatch = None
-        if self.enabled:
-            try:
-                self.cloudwatch = boto3.client("cloudwatch")
-                logger.info(
-                    "CloudWatch metrics initialized",
-                    namespace=self.namespace,
-                    service=self.service_name,
-                    stage=self.stage,
-                )
-            except Exception as e:
-                logger.error("Failed to initialize CloudWatch client", error=str(e))
-                self.enabled = False
+    Subclasses implement ``record_metric`` (and ``flush`` when they buffer);
+    the helpers below build on it.
+    """
+
+    #: Record latency and LLM metrics at 1-second resolution
+    high_resolution: bool = False
 
     def record_metric(
         self,
@@ -77,70 +129,13 @@ class CloudWatchMetrics(MetricsCollector):
         value: float,
         unit: str = "Count",
         dimensions: dict[str, str] | None = None,
+        high_resolution: bool = False,
     ) -> None:
-        """
-        Record a metric to CloudWatch.
-
-        Args:
-            metric_name: Name of the metric
-            value: Metric value
-            unit: Metric unit (Count, Seconds, Milliseconds, etc.)
-            dimensions: Additional dimensions for the metric
-        """
-        if not self.enabled or not self.cloudwatch:
-            logger.debug(
-                "Metrics collection disabled or unavailable",
-                metric=metric_name,
-                value=value,
-            )
-            return
-
-        try:
-            # Build dimensions
-            metric_dimensions = [
-                {"Name": "Service", "Value": self.service_name},
-                {"Name": "Environment", "Value": self.stage},
-            ]
-
-            if dimensions:
-                for key, val in dimensions.items():
-                    metric_dimensions.append({"Name": key, "Value": val})
-
-            # Put metric data
-            self.cloudwatch.put_metric_data(
-                Namespace=self.namespace,
-                MetricData=[
-                    {
-                        "MetricName": metric_name,
-                        "Value": value,
-                        "Unit": unit,
-                        "Timestamp": datetime.utcnow(),
-                        "Dimensions": metric_dimensions,
-                    }
-                ],
-            )
-
-            logger.debug(
-                "Metric recorded",
-                metric=metric_name,
-                value=value,
-                unit=unit,
-                dimensions=dimensions,
-            )
+        """Record a metric."""
+        raise NotImplementedError
 
-        except ClientError as e:
-            logger.error(
-                "Failed to record CloudWatch metric",
-                metric=metric_name,
-                error=str(e),
-                error_code=e.response.get("Error", {}).get("Code"),
-            )
-        except Exception as e:
-            logger.error(
-                "Unexpected error recording metric",
-                metric=metric_name,
-                error=str(e),
-            )
+    def flush(self) -> None:
+        """Publish buffered metrics (no-op for unbuffered collectors)."""
 
     def record_latency(
         self,
@@ -154,6 +149,7 @@ class CloudWatchMetrics(MetricsCollector):
             value=latency_ms,
             unit="Milliseconds",
             dimensions=dimensions,
+            high_resolution=self.high_resolution,
         )
 
     def record_error(
@@ -163,7 +159,7 @@ class CloudWatchMetrics(MetricsCollector):
         dimensions: dict[str, str] | None = None,
     ) -> None:
         """Record an error occurrence."""
-        error_dimensions = dimensions or {}
+        error_dimensions = dict(dimensions or {})
         if error_type:
             error_dimensions["ErrorType"] = error_type
 
@@ -193,13 +189,22 @@ class CloudWatchMetrics(MetricsCollector):
         prompt_tokens: int,
         completion_tokens: int,
         total_tokens: int,
+        topic: str | None = None,
+        tenant_tier: str | None = None,
     ) -> None:
-        """Record LLM token usage."""
-        dimensions = {"Model": model}
+        """Record LLM token usage, optionally per topic and tenant tier."""
+        dimensions = llm_dimensions(model=model, topic=topic, tenant_tier=tenant_tier)
+        high_resolution = self.high_resolution
 
-        self.record_metric("LLM_PromptTokens", float(prompt_tokens), "Count", dimensions)
-        self.record_metric("LLM_CompletionTokens", float(completion_tokens), "Count", dimensions)
-        self.record_metric("LLM_TotalTokens", float(total_tokens), "Count", dimensions)
+        self.record_metric(
+            "LLM_PromptTokens", float(prompt_tokens), "Count", dimensions, high_resolution
+        )
+        self.record_metric(
+            "LLM_CompletionTokens", float(completion_tokens), "Count", dimensions, high_resolution
+        )
+        self.record_metric(
+            "LLM_TotalTokens", float(total_tokens), "Count", dimensions, high_resolution
+        )
 
     def record_cache_hit(self, cache_type: str) -> None:
         """Record a cache hit."""
@@ -220,16 +225,329 @@ class CloudWatchMetrics(MetricsCollector):
         )
 
 
+def llm_dimensions(
+    *, model: str | None = None, topic: str | None = None, tenant_tier: str | None = None
+) -> dict[str, str]:
+    """Build the standard LLM metric dimensions, skipping unknown values."""
+    dimensions: dict[str, str] = {}
+    if topic:
+        dimensions[DIMENSION_TOPIC] = topic
+    if model:
+        dimensions[DIMENSION_MODEL] = model
+    if tenant_tier:
+        dimensions[DIMENSION_TENANT_TIER] = tenant_tier
+    return dimensions
+
+
+class _BufferedMetrics(MetricsCollector):
+    """Common buffering for collectors that publish on flush."""
+
+    def __init__(
+        self,
+        namespace: str | None,
+        service_name: str,
+        enabled: bool,
+        high_resolution: bool,
+        max_buffered: int,
+    ) -> None:
+        self.enabled = enabled
+        self.service_name = service_name
+        self.stage = os.getenv("STAGE", "dev")
+        self.namespace = namespace or f"PurposePath/{self.stage.capitalize()}"
+        self.high_resolution = high_resolution
+        self.max_buffered = max_buffered
+        self.aggregator = MetricAggregator()
+
+    def record_metric(
+        self,
+        metric_name: str,
+        value: float,
+        unit: str = "Count",
+        dimensions: dict[str, str] | None = None,
+        high_resolution: bool = False,
+    ) -> None:
+        """
+        Buffer a metric until the next flush.
+
+        Args:
+            metric_name: Name of the metric
+            value: Metric value
+            unit: Metric unit (Count, Seconds, Milliseconds, etc.)
+            dimensions: Additional dimensions for the metric
+            high_resolution: Store at 1-second resolution
+        """
+        if not self.enabled:
+            logger.debug("Metrics collection disabled", metric=metric_name, value=value)
+            return
+
+        metric_dimensions = {"Service": self.service_name, "Environment": self.stage}
+        if dimensions:
+            metric_dimensions.update(dimensions)
+
+        pending = self.aggregator.add(
+            metric_name, value, unit, metric_dimensions, 1 if high_resolution else 60
+        )
+        # Bound memory in long-lived processes that never reach a flush point
+        if pending >= self.max_buffered:
+            self.flush()
+
+    def flush(self) -> None:
+        """Publish and clear buffered metrics; errors are logged, never raised."""
+        metrics = self.aggregator.drain()
+        if not metrics:
+            return
+        try:
+            self._publish(metrics)
+        except Exception as e:
+            logger.error("metrics.flush_failed", error=str(e), metric_count=len(metrics))
+
+    def _publish(self, metrics: list[AggregatedMetric]) -> None:
+        raise NotImplementedError
+
+
+MetricsSink = Callable[[dict[str, Any]], None]
+
+
+def stdout_sink(document: dict[str, Any]) -> None:
+    """Write an EMF document as one JSON line to stdout."""
+    sys.stdout.write(json.dumps(document, separators=(",", ":")) + "\n")
+    sys.stdout.flush()
+
+
+class InMemoryMetricsSink:
+    """EMF sink collecting documents in memory for test assertions."""
+
+    def __init__(self) -> None:
+        """Initialize an empty sink."""
+        self.documents: list[dict[str, Any]] = []
+
+    def __call__(self, document: dict[str, Any]) -> None:
+        """Collect a document."""
+        self.documents.append(document)
+
+    def values(self, metric_name: str, **dimensions: str) -> list[float]:
+        """Get all values emitted for a metric whose dimensions include ``dimensions``."""
+        found: list[float] = []
+        for document in self.documents:
+            if metric_name not in document:
+                continue
+            if any(document.get(key) != value for key, value in dimensions.items()):
+                continue
+            value = document[metric_name]
+            found.extend(value if isinstance(value, list) else [value])
+        return found
+
+    def metric_definitions(self) -> list[dict[str, Any]]:
+        """Get the EMF metric definitions across all documents."""
+        return [
+            definition
+            for document in self.documents
+            for directive in document["_aws"]["CloudWatchMetrics"]
+            for definition in directive["Metrics"]
+        ]
+
+    def clear(self) -> None:
+        """Drop collected documents."""
+        self.documents.clear()
+
+
+class EMFMetrics(_BufferedMetrics):
+    """
+    Embedded Metric Format collector writing structured logs to stdout.
+
+    Features:
+    - No network calls: CloudWatch Logs extracts metrics from the log lines
+    - In-process aggregation, one document per dimension set on flush
+    - Standard dimensions (Service, Environment) plus Topic/Model/TenantTier
+    - Optional high-resolution (1 second) storage
+    """
+
+    def __init__(
+        self,
+        namespace: str | None = None,
+        service_name: str = "PurposePath-Coaching",
+        enabled: bool = True,
+        high_resolution: bool = False,
+        max_buffered: int = 1000,
+        sink: MetricsSink | None = None,
+    ):
+        """
+        Initialize EMF metrics collector.
+
+        Args:
+            namespace: CloudWatch namespace (defaults to env-based)
+            service_name: Service name for dimensions
+            enabled: Whether metrics collection is enabled
+            high_resolution: Record latency and LLM metrics at 1-second resolution
+            max_buffered: Data points buffered before an automatic flush
+            sink: Document writer (defaults to stdout)
+        """
+        super().__init__(namespace, service_name, enabled, high_resolution, max_buffered)
+        self.sink = sink or stdout_sink
+
+    def _publish(self, metrics: list[AggregatedMetric]) -> None:
+        by_dimensions: dict[DimensionKey, list[AggregatedMetric]] = {}
+        for metric in metrics:
+            by_dimensions.setdefault(metric.dimensions, []).append(metric)
+
+        timestamp = int(time.time() * 1000)
+        for dimensions, group in by_dimensions.items():
+            offset = 0
+            while True:
+                # Metrics with more than EMF_MAX_VALUES values span several documents
+                chunk = [
+                    (metric, metric.values[offset : offset + EMF_MAX_VALUES])
+                    for metric in group
+                    if len(metric.values) > offset
+                ]
+                if not chunk:
+                    break
+                self.sink(self._document(timestamp, dimensions, chunk))
+                offset += EMF_MAX_VALUES
+
+    def _document(
+        self,
+        timestamp: int,
+        dimensions: DimensionKey,
+        chunk: list[tuple[AggregatedMetric, list[float]]],
+    ) -> dict[str, Any]:
+        definitions = []
+        document: dict[str, Any] = dict(dimensions)
+        for metric, values in chunk:
+            definition: dict[str, Any] = {"Name": metric.name, "Unit": metric.unit}
+            if metric.storage_resolution == 1:
+                definition["StorageResolution"] = 1
+            definitions.append(definition)
+            document[metric.name] = values[0] if len(values) == 1 else values
+        document["_aws"] = {
+            "Timestamp": timestamp,
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": self.namespace,
+                    "Dimensions": [[name for name, _ in dimensions]],
+                    "Metrics": definitions,
+                }
+            ],
+        }
+        return document
+
+
+class CloudWatchMetrics(_BufferedMetrics):
+    """
+    CloudWatch metrics collector for production monitoring.
+
+    Features:
+    - Automatic batching of metric data (one put_metric_data per flush)
+    - Namespace isolation by environment
+    - Standard dimensions (Service, Environment, Stage)
+    - Error handling and logging
+    """
+
+    def __init__(
+        self,
+        namespace: str | None = None,
+        service_name: str = "PurposePath-Coaching",
+        enabled: bool = True,
+        high_resolution: bool = False,
+        max_buffered: int = 1000,
+    ):
+        """
+        Initialize CloudWatch metrics collector.
+
+        Args:
+            namespace: CloudWatch namespace (defaults to env-based)
+            service_name: Service name for dimensions
+            enabled: Whether metrics collection is enabled
+            high_resolution: Record latency and LLM metrics at 1-second resolution
+            max_buffered: Data points buffered before an automatic flush
+        """
+        super().__init__(namespace, service_name, enabled, high_resolution, max_buffered)
+
+        # Initialize CloudWatch client if enabled
+        self.cloudwatch: Any = None
+        if self.enabled:
+            try:
+                import boto3
+
+                self.cloudwatch = boto3.client("cloudwatch")
+                logger.info(
+                    "CloudWatch metrics initialized",
+                    namespace=self.namespace,
+                    service=self.service_name,
+                    stage=self.stage,
+                )
+            except Exception as e:
+                logger.error("Failed to initialize CloudWatch client", error=str(e))
+                self.enabled = False
+
+    def _publish(self, metrics: list[AggregatedMetric]) -> None:
+        if self.cloudwatch is None:
+            return
+        timestamp = datetime.now(UTC)
+        datums: list[dict[str, Any]] = []
+        for metric in metrics:
+            for offset in range(0, len(metric.values), CLOUDWATCH_MAX_VALUES):
+                datums.append(
+                    {
+                        "MetricName": metric.name,
+                        "Values": metric.values[offset : offset + CLOUDWATCH_MAX_VALUES],
+                        "Unit": metric.unit,
+                        "Timestamp": timestamp,
+                        "StorageResolution": metric.storage_resolution,
+                        "Dimensions": [
+                            {"Name": name, "Value": value} for name, value in metric.dimensions
+                        ],
+                    }
+                )
+        for offset in range(0, len(datums), CLOUDWATCH_MAX_DATUMS):
+            self.cloudwatch.put_metric_data(
+                Namespace=self.namespace,
+                MetricData=datums[offset : offset + CLOUDWATCH_MAX_DATUMS],
+            )
+        logger.debug("metrics.published", datums=len(datums), namespace=self.namespace)
+
+
 # Global metrics instance (lazy initialization)
-_metrics_instance: CloudWatchMetrics | None = None
+_metrics_instance: MetricsCollector | None = None
 
 
-def get_metrics() -> CloudWatchMetrics:
-    """Get or create global metrics instance."""
+def get_metrics() -> MetricsCollector:
+    """Get or create the global metrics instance (backend from METRICS_BACKEND)."""
     global _metrics_instance
     if _metrics_instance is None:
-        _metrics_instance = CloudWatchMetrics()
+        high_resolution = os.getenv("METRICS_HIGH_RESOLUTION", "false").lower() == "true"
+        if os.getenv("METRICS_BACKEND", "emf").lower() == "cloudwatch":
+            _metrics_instance = CloudWatchMetrics(high_resolution=high_resolution)
+        else:
+            _metrics_instance = EMFMetrics(high_resolution=high_resolution)
     return _metrics_instance
 
 
-__all__ = ["CloudWatchMetrics", "MetricsCollector", "get_metrics"]
+def set_metrics(metrics: MetricsCollector | None) -> None:
+    """Replace the global metrics instance (None resets to lazy creation)."""
+    global _metrics_instance
+    _metrics_instance = metrics
+
+
+def flush_metrics() -> None:
+    """Flush the global metrics instance, if one was created."""
+    if _metrics_instance is not None:
+        _metrics_instance.flush()
+
+
+__all__ = [
+    "DIMENSION_MODEL",
+    "DIMENSION_TENANT_TIER",
+    "DIMENSION_TOPIC",
+    "AggregatedMetric",
+    "CloudWatchMetrics",
+    "EMFMetrics",
+    "InMemoryMetricsSink",
+    "MetricAggregator",
+    "MetricsCollector",
+    "flush_metrics",
+    "get_metrics",
+    "llm_dimensions",
+    "set_metrics",
+    "stdout_sink",
+]